@@ -6,6 +6,7 @@ import signal
 import socket
 import threading
 from dataclasses import dataclass
+from pathlib import Path
 
 from backend.core.android_deployment import (
     CommandAndroidReleaseValidator,
@@ -34,7 +35,7 @@ from backend.core.codex_implementation import (
     CommandImplementationValidator,
 )
 from backend.core.codex_planning import CodexPlanningExecutor
-from backend.core.agent_state import RepositoryScope
+from backend.core.agent_state import RepositoryScope, RunPhase
 from backend.services.agent_worker_service import DatabaseAgentQueue
 
 
@@ -73,6 +74,7 @@ class AgentWorkerSettings:
     executor_name: str
     worker_id: str
     poll_seconds: int
+    idle_wait_seconds: int
     lease_seconds: int
     heartbeat_seconds: int
     max_attempts: int
@@ -101,6 +103,8 @@ class AgentWorkerSettings:
     deployment_backup_root: str | None
     deployment_pg_dump_binary: str | None
     deployment_pg_restore_binary: str | None
+    deployment_backup_jobs: int
+    deployment_backup_schema_scope: bool
     deployment_validator: str | None
     deployment_runtime_helper: str | None
     deployment_github_sync_helper: str | None
@@ -269,6 +273,7 @@ class AgentWorkerSettings:
             executor_name=executor_name,
             worker_id=worker_id,
             poll_seconds=_positive_int("REMIHUB_AGENT_POLL_SECONDS", 5),
+            idle_wait_seconds=_positive_int("REMIHUB_AGENT_IDLE_WAIT_SECONDS", 60),
             lease_seconds=lease_seconds,
             heartbeat_seconds=heartbeat_seconds,
             max_attempts=_positive_int("REMIHUB_AGENT_MAX_ATTEMPTS", 3),
@@ -396,6 +401,13 @@ class AgentWorkerSettings:
                 and deployment_pg_restore_binary.strip()
                 else None
             ),
+            deployment_backup_jobs=_positive_int(
+                "REMIHUB_AGENT_DEPLOYMENT_BACKUP_JOBS",
+                4,
+            ),
+            deployment_backup_schema_scope=_boolean(
+                "REMIHUB_AGENT_DEPLOYMENT_BACKUP_SCHEMA_SCOPE"
+            ),
             deployment_validator=(
                 deployment_validator.strip()
                 if deployment_validator and deployment_validator.strip()
@@ -676,6 +688,7 @@ def build_executor(
         validator = SandboxBackendValidator(
             validation_command=settings.deployment_validator,
             timeout_seconds=settings.deployment_timeout_seconds,
+            cache_root=Path(settings.deployment_artifact_root) / ".validation-cache",
         )
         database = PostgresDeploymentDatabase(
             config_path=settings.deployment_database_config,
@@ -684,6 +697,8 @@ def build_executor(
             pg_dump_binary=settings.deployment_pg_dump_binary,
             pg_restore_binary=settings.deployment_pg_restore_binary,
             command_timeout_seconds=settings.deployment_timeout_seconds,
+            backup_jobs=settings.deployment_backup_jobs,
+            backup_schema_scope=settings.deployment_backup_schema_scope,
         )
         qa_history_reader = None
         if settings.environment == "production":
@@ -757,14 +772,7 @@ def run_worker(settings: AgentWorkerSettings) -> None:
         logger.info("Agent worker run-once complete: processed=%s", processed)
         return
 
-    stop_event = threading.Event()
-
-    def request_stop(signum, _frame):
-        logger.info("Agent worker received signal %s", signum)
-        stop_event.set()
-
-    signal.signal(signal.SIGTERM, request_stop)
-    signal.signal(signal.SIGINT, request_stop)
+    stop_event = _install_stop_handlers()
 
     logger.info(
         "Agent worker started: worker=%s executor=%s environment=%s",
@@ -776,11 +784,54 @@ def run_worker(settings: AgentWorkerSettings) -> None:
     while not stop_event.is_set():
         processed = worker.process_once()
         if not processed:
-            stop_event.wait(settings.poll_seconds)
+            _wait_for_claimable_run(
+                worker.queue,
+                settings,
+                allowed_phases=executor.allowed_phases,
+                stop_event=stop_event,
+            )
 
+    _close_queue(worker.queue)
     logger.info("Agent worker stopped")
 
 
+def _wait_for_claimable_run(
+    queue,
+    settings: AgentWorkerSettings,
+    *,
+    allowed_phases: frozenset[RunPhase],
+    stop_event: threading.Event,
+) -> None:
+    wait = getattr(queue, "wait_for_claimable_run", None)
+    if wait is None:
+        stop_event.wait(settings.poll_seconds)
+        return
+    wait(
+        allowed_phases=allowed_phases,
+        idle_seconds=settings.idle_wait_seconds,
+        retry_seconds=settings.poll_seconds,
+        should_stop=stop_event.is_set,
+    )
+
+
+def _close_queue(queue) -> None:
+    close = getattr(queue, "close", None)
+    if close is not None:
+        close()
+
+
+def _install_stop_handlers() -> threading.Event:
+    stop_event = threading.Event()
+
+    def request_stop(signum, _frame):
+        logger.info("Agent worker received signal %s", signum)
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+    return stop_event
+
+
 def main() -> None:
     logging.basicConfig(
         level=logging.INFO,
@@ -10,9 +10,11 @@ import stat
 import subprocess
 import tarfile
 import tempfile
+import threading
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path, PurePosixPath
@@ -25,6 +27,8 @@ from backend.core.agent_state import (
     RunPhase,
     require_backend_repository_scope,
 )
+from backend.core.agent_stage_timing import StageTimeline
+from backend.core.agent_test_impact import select_impacted_tests
 from backend.core.agent_worker import (
     AgentTemporarilyBlockedError,
     AgentWorkerConfigurationError,
@@ -32,6 +36,7 @@ from backend.core.agent_worker import (
     DeploymentSource,
     ExecutionResult,
 )
+from backend.core.web_precompression import precompress_tree
 from backend.database import migration_runner
 
 
@@ -84,6 +89,10 @@ class ValidationEvidence:
     stdout_sha256: str
     stdout_tail: str
     stderr_tail: str
+    # None means the whole suite ran.
+    selected_tests: tuple[str, ...] | None = None
+    tree_sha: str | None = None
+    cached: bool = False
 
 
 @dataclass(frozen=True)
@@ -107,6 +116,14 @@ class BackupEvidence:
     path: str
     size_bytes: int
     sha256: str
+    # "custom" is a single streamed file; "directory" is a parallel dump whose
+    # sha256 covers a canonical manifest of per-file digests.
+    format: str = "custom"
+    jobs: int = 1
+    # Empty when the whole database was dumped.
+    schemas: tuple[str, ...] = ()
+    dump_ms: int = 0
+    verify_ms: int = 0
 
 
 @dataclass(frozen=True)
@@ -139,6 +156,7 @@ class DeploymentCandidate:
     migrations_applied: tuple[str, ...] = ()
     database_backup: dict | None = None
     rollback_performed: bool = False
+    stage_timeline: dict | None = None
 
 
 GITHUB_SYNC_LOCAL_INCOMPLETE = "local_deployment_incomplete"
@@ -227,7 +245,12 @@ def deployment_recovery_metadata(
 
 
 class BackendValidator(Protocol):
-    def validate(self, candidate_worktree: Path) -> ValidationEvidence: ...
+    def validate(
+        self,
+        candidate_worktree: Path,
+        *,
+        changed_files: tuple[str, ...] = (),
+    ) -> ValidationEvidence: ...
 
 
 class FrontendArtifactBuilder(Protocol):
@@ -251,7 +274,13 @@ class DeploymentDatabase(Protocol):
 
     def pending_versions(self, migrations_dir: Path) -> tuple[str, ...]: ...
 
-    def backup(self, *, card_id: str, deployment_run_id: str) -> BackupEvidence: ...
+    def backup(
+        self,
+        *,
+        card_id: str,
+        deployment_run_id: str,
+        schemas: tuple[str, ...] | None = None,
+    ) -> BackupEvidence: ...
 
     def upgrade(
         self,
@@ -333,12 +362,26 @@ class BackendGitHubSynchronizer(Protocol):
     ) -> dict[str, Any]: ...
 
 
+# Bump when the meaning of a cached validation result changes.
+VALIDATION_CACHE_VERSION = 1
+
+
 class SandboxBackendValidator:
+    """
+    Run the isolated backend validator over a candidate worktree.
+
+    Only the tests that import the changed modules run when that selection
+    is safe (see select_impacted_tests). Passing results are cached by git
+    tree and validator identity, so an identical tree is never validated
+    twice; a full-suite result also satisfies any narrower selection.
+    """
+
     def __init__(
         self,
         *,
         validation_command: str | Path,
         timeout_seconds: int = 900,
+        cache_root: str | Path | None = None,
     ):
         command = Path(validation_command).expanduser()
         if not command.is_absolute():
@@ -353,12 +396,29 @@ class SandboxBackendValidator:
             raise ValueError("timeout_seconds must be at least 1")
         self.validation_command = command.resolve()
         self.timeout_seconds = timeout_seconds
+        self.cache_root = Path(cache_root) if cache_root is not None else None
+
+    def validate(
+        self,
+        candidate_worktree: Path,
+        *,
+        changed_files: tuple[str, ...] = (),
+    ) -> ValidationEvidence:
+        selected_tests = select_impacted_tests(candidate_worktree, changed_files)
+        tree_sha = self._clean_tree_sha(candidate_worktree)
+        cache_path = self._cache_path(tree_sha)
+        cached = self._cached_evidence(cache_path, selected_tests)
+        if cached is not None:
+            return cached
 
-    def validate(self, candidate_worktree: Path) -> ValidationEvidence:
         started = time.monotonic()
         try:
             result = subprocess.run(
-                [str(self.validation_command), str(candidate_worktree)],
+                [
+                    str(self.validation_command),
+                    str(candidate_worktree),
+                    *(selected_tests or ()),
+                ],
                 check=False,
                 capture_output=True,
                 encoding="utf-8",
@@ -378,11 +438,15 @@ class SandboxBackendValidator:
         stdout = result.stdout
         stderr = result.stderr
         evidence = ValidationEvidence(
-            command=f"{self.validation_command} {candidate_worktree}",
+            command=" ".join(
+                [str(self.validation_command), str(candidate_worktree), *(selected_tests or ())]
+            ),
             duration_ms=duration_ms,
             stdout_sha256=hashlib.sha256(stdout.encode("utf-8")).hexdigest(),
             stdout_tail=_tail(stdout, 8000),
             stderr_tail=_tail(stderr, 8000),
+            selected_tests=selected_tests,
+            tree_sha=tree_sha,
         )
         if result.returncode != 0:
             detail = evidence.stderr_tail or evidence.stdout_tail
@@ -390,8 +454,96 @@ class SandboxBackendValidator:
             raise DeploymentValidationError(
                 f"Backend compile/test validation failed{suffix}"
             )
+        self._store_evidence(cache_path, evidence)
         return evidence
 
+    def _clean_tree_sha(self, candidate_worktree: Path) -> str | None:
+        if self.cache_root is None:
+            return None
+        environment = {
+            "HOME": "/nonexistent",
+            "LANG": os.environ.get("LANG", "C.UTF-8"),
+            "PATH": "/usr/bin:/bin",
+            "GIT_CONFIG_NOSYSTEM": "1",
+            "GIT_TERMINAL_PROMPT": "0",
+        }
+        try:
+            tree = subprocess.run(
+                ["git", "-C", str(candidate_worktree), "rev-parse", "--verify", "HEAD^{tree}"],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=environment,
+                timeout=60,
+            ).stdout.strip()
+            status = subprocess.run(
+                ["git", "-C", str(candidate_worktree), "status", "--porcelain", "--untracked-files=all"],
+                check=True,
+                capture_output=True,
+                text=True,
+                env=environment,
+                timeout=60,
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        # A dirty worktree is not described by its tree, so it is never cached.
+        if status.strip() or not re.fullmatch(r"[0-9a-f]{40}", tree):
+            return None
+        return tree
+
+    def _cache_path(self, tree_sha: str | None) -> Path | None:
+        if self.cache_root is None or tree_sha is None:
+            return None
+        key = hashlib.sha256(
+            _canonical_json_bytes(
+                {
+                    "cache_version": VALIDATION_CACHE_VERSION,
+                    "tree_sha": tree_sha,
+                    "validator_sha256": _sha256_file(self.validation_command),
+                }
+            )
+        ).hexdigest()
+        return self.cache_root / f"{key}.json"
+
+    @staticmethod
+    def _cached_evidence(
+        cache_path: Path | None,
+        selected_tests: tuple[str, ...] | None,
+    ) -> ValidationEvidence | None:
+        if cache_path is None or cache_path.is_symlink() or not cache_path.is_file():
+            return None
+        try:
+            raw = json.loads(cache_path.read_text(encoding="utf-8"))
+            covered = raw["selected_tests"]
+            if covered is not None:
+                if selected_tests is None or not set(selected_tests) <= set(covered):
+                    return None
+                covered = tuple(covered)
+            return ValidationEvidence(
+                command=raw["command"],
+                duration_ms=raw["duration_ms"],
+                stdout_sha256=raw["stdout_sha256"],
+                stdout_tail=raw["stdout_tail"],
+                stderr_tail=raw["stderr_tail"],
+                selected_tests=covered,
+                tree_sha=raw["tree_sha"],
+                cached=True,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_evidence(self, cache_path: Path | None, evidence: ValidationEvidence) -> None:
+        if cache_path is None:
+            return
+        try:
+            cache_path.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+            temporary = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            temporary.write_bytes(_canonical_json_bytes(asdict(evidence)))
+            temporary.replace(cache_path)
+        except OSError:
+            # Validation passed; a missing cache entry only costs a rerun.
+            pass
+
 
 FRONTEND_WEB_POLICY = {
     "node_version": "v22.22.2",
@@ -409,6 +561,15 @@ FRONTEND_WEB_POLICY = {
     "directory_mode": 0o755,
     "file_mode": 0o644,
 }
+# Installed dependency trees shared by builds with the same lockfile. It lives
+# below the artifact root so staging trees can hardlink into it.
+FRONTEND_NODE_MODULES_DIRECTORY = ".node-modules"
+# Content-addressed dist files shared by every deployment's manifest.
+FRONTEND_BLOB_DIRECTORY = ".blobs"
+# Archives are reassembled from blobs on demand, so old ones are dropped.
+FRONTEND_ARCHIVE_RETENTION_SECONDS = 7 * 24 * 60 * 60
+# Unreferenced blobs younger than this may belong to a build in progress.
+FRONTEND_BLOB_GRACE_SECONDS = 24 * 60 * 60
 
 
 def frontend_web_changed(changed_files: tuple[str, ...]) -> bool:
@@ -493,31 +654,273 @@ def _frontend_artifact_manifest(
     return manifest
 
 
-def _write_deterministic_frontend_archive(
-    dist_root: Path,
+def _node_modules_fingerprint(root: Path) -> str:
+    """
+    Hash the metadata of every entry in an installed node_modules tree.
+
+    Stat-level data is cheap to recheck before each reuse. Store files are
+    read-only, so changing one in place also changes its mode or mtime.
+    """
+    if root.is_symlink() or not root.is_dir():
+        raise DeploymentValidationError("Installed frontend dependencies are missing")
+    digest = hashlib.sha256()
+    for directory, names, files in os.walk(root, topdown=True, followlinks=False):
+        names.sort()
+        files.sort()
+        current = Path(directory)
+        for name in names + files:
+            child = current / name
+            metadata = child.lstat()
+            relative = child.relative_to(root).as_posix()
+            if stat.S_ISLNK(metadata.st_mode):
+                record = ("link", relative, os.readlink(child))
+            elif stat.S_ISDIR(metadata.st_mode):
+                record = ("directory", relative)
+            elif stat.S_ISREG(metadata.st_mode):
+                record = (
+                    "file",
+                    relative,
+                    metadata.st_size,
+                    metadata.st_mtime_ns,
+                    stat.S_IMODE(metadata.st_mode),
+                )
+            else:
+                raise DeploymentValidationError(
+                    "Installed frontend dependencies contain a special file"
+                )
+            digest.update(_canonical_json_bytes(record))
+    return digest.hexdigest()
+
+
+def _freeze_tree(root: Path) -> None:
+    for directory, _names, files in os.walk(root, topdown=True, followlinks=False):
+        current = Path(directory)
+        for name in files:
+            child = current / name
+            if not child.is_symlink():
+                os.chmod(child, stat.S_IMODE(child.lstat().st_mode) & ~0o222)
+
+
+def _link_tree(source: Path, destination: Path) -> int:
+    """Recreate source at destination with hardlinked files and real directories."""
+    destination.mkdir(mode=0o755)
+    linked = 0
+    for directory, names, files in os.walk(source, topdown=True, followlinks=False):
+        current = Path(directory)
+        target_directory = destination / current.relative_to(source)
+        for name in names + files:
+            child = current / name
+            target = target_directory / name
+            if child.is_symlink():
+                os.symlink(os.readlink(child), target)
+            elif child.is_dir():
+                target.mkdir(mode=0o755)
+            else:
+                try:
+                    os.link(child, target)
+                except OSError:
+                    # Another filesystem or a link limit; fall back to a copy.
+                    shutil.copy2(child, target)
+                linked += 1
+    return linked
+
+
+def _write_frontend_archive(
     archive_path: Path,
     manifest: dict[str, Any],
+    open_entry,
 ) -> None:
     with tarfile.open(archive_path, "w", format=tarfile.PAX_FORMAT) as archive:
         for entry in manifest["entries"]:
-            source = dist_root / entry["path"]
-            info = archive.gettarinfo(str(source), arcname=entry["path"])
+            info = tarfile.TarInfo(entry["path"])
             info.mtime = FRONTEND_WEB_POLICY["archive_mtime"]
             info.uid = FRONTEND_WEB_POLICY["archive_uid"]
             info.gid = FRONTEND_WEB_POLICY["archive_gid"]
             info.uname = FRONTEND_WEB_POLICY["archive_uname"]
             info.gname = FRONTEND_WEB_POLICY["archive_gname"]
-            info.pax_headers = {}
             if entry["type"] == "directory":
+                info.type = tarfile.DIRTYPE
                 info.mode = FRONTEND_WEB_POLICY["directory_mode"]
                 archive.addfile(info)
             else:
                 info.mode = FRONTEND_WEB_POLICY["file_mode"]
-                with source.open("rb") as file_object:
+                info.size = entry["size"]
+                with open_entry(entry) as file_object:
                     archive.addfile(info, file_object)
     os.chmod(archive_path, 0o640)
 
 
+def _write_deterministic_frontend_archive(
+    dist_root: Path,
+    archive_path: Path,
+    manifest: dict[str, Any],
+) -> None:
+    _write_frontend_archive(
+        archive_path,
+        manifest,
+        lambda entry: (dist_root / entry["path"]).open("rb"),
+    )
+
+
+class FrontendBlobStore:
+    """
+    Store frontend dist files once, keyed by their SHA-256.
+
+    Deployment manifests reference blobs by the hashes they already record,
+    so an asset unchanged between deployments occupies disk once. Archives
+    are assembled from blobs when an install needs one.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def path(self, sha256: str) -> Path:
+        return self.root / "sha256" / sha256[:2] / sha256
+
+    def store_dist(self, dist_root: Path, manifest: dict[str, Any]) -> dict[str, Any]:
+        stored = reused = stored_bytes = reused_bytes = 0
+        for entry in manifest["entries"]:
+            if entry["type"] != "file":
+                continue
+            if self._put(dist_root / entry["path"], entry["sha256"]):
+                stored += 1
+                stored_bytes += entry["size"]
+            else:
+                reused += 1
+                reused_bytes += entry["size"]
+        return {
+            "stored_files": stored,
+            "stored_bytes": stored_bytes,
+            "reused_files": reused,
+            "reused_bytes": reused_bytes,
+        }
+
+    def missing(self, manifest: dict[str, Any]) -> list[str]:
+        return [
+            entry["sha256"]
+            for entry in manifest["entries"]
+            if entry["type"] == "file" and not self.path(entry["sha256"]).is_file()
+        ]
+
+    def assemble_archive(self, manifest: dict[str, Any], archive_path: Path) -> None:
+        if self.missing(manifest):
+            raise DeploymentValidationError("Frontend artifact blobs are missing")
+        temporary = archive_path.with_name(f".{archive_path.name}.{os.getpid()}.tmp")
+        try:
+            _write_frontend_archive(
+                temporary,
+                manifest,
+                lambda entry: self.path(entry["sha256"]).open("rb"),
+            )
+            temporary.replace(archive_path)
+        finally:
+            temporary.unlink(missing_ok=True)
+
+    def collect_garbage(
+        self,
+        referenced: set[str],
+        *,
+        now: float,
+        grace_seconds: int = FRONTEND_BLOB_GRACE_SECONDS,
+    ) -> dict[str, int]:
+        removed = removed_bytes = 0
+        for blob in self.root.glob("sha256/*/*"):
+            if blob.name in referenced or blob.name.startswith("."):
+                continue
+            try:
+                metadata = blob.lstat()
+                if now - metadata.st_mtime < grace_seconds:
+                    continue
+                blob.unlink()
+            except OSError:
+                continue
+            removed += 1
+            removed_bytes += metadata.st_size
+        return {"removed_blobs": removed, "removed_bytes": removed_bytes}
+
+    def _put(self, source: Path, sha256: str) -> bool:
+        target = self.path(sha256)
+        if target.is_file() and not target.is_symlink():
+            # Refresh the mtime so garbage collection sees a live reference.
+            os.utime(target)
+            return False
+        target.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+        temporary = target.with_name(f".{sha256}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            shutil.copyfile(source, temporary)
+            if _sha256_file(temporary) != sha256:
+                raise DeploymentValidationError("Frontend artifact file changed while stored")
+            os.chmod(temporary, 0o440)
+            temporary.replace(target)
+        finally:
+            temporary.unlink(missing_ok=True)
+        return True
+
+
+def _frontend_manifest_paths(artifact_root: Path) -> list[Path]:
+    return sorted(artifact_root.glob("*/*/frontend-web/*/*manifest.json"))
+
+
+def collect_frontend_artifact_garbage(
+    artifact_root: Path,
+    *,
+    now: float | None = None,
+    archive_retention_seconds: int = FRONTEND_ARCHIVE_RETENTION_SECONDS,
+    blob_grace_seconds: int = FRONTEND_BLOB_GRACE_SECONDS,
+) -> dict[str, Any]:
+    """
+    Drop old assembled archives and blobs no manifest references.
+
+    An archive is only dropped when every blob it needs is stored, so it can
+    be assembled again. Blob collection is skipped entirely if any manifest
+    cannot be read, because its references would be unknown.
+    """
+    now = time.time() if now is None else now
+    store = FrontendBlobStore(artifact_root / FRONTEND_BLOB_DIRECTORY)
+    referenced: set[str] = set()
+    removed_archives = 0
+    for manifest_path in _frontend_manifest_paths(artifact_root):
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            hashes = {
+                entry["sha256"]
+                for entry in manifest["entries"]
+                if entry["type"] == "file"
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return {"status": "skipped", "reason": f"unreadable manifest: {manifest_path}"}
+        referenced.update(hashes)
+        archive_path = manifest_path.parent / "dist.tar"
+        if manifest_path.name != "manifest.json" or archive_path.is_symlink():
+            continue
+        try:
+            expired = now - archive_path.stat().st_mtime >= archive_retention_seconds
+        except OSError:
+            continue
+        if expired and not store.missing(manifest):
+            archive_path.unlink()
+            removed_archives += 1
+    return {
+        "status": "collected",
+        "removed_archives": removed_archives,
+        **store.collect_garbage(referenced, now=now, grace_seconds=blob_grace_seconds),
+    }
+
+
+def ensure_frontend_archive(artifact_root: Path, artifact: FrontendArtifactEvidence) -> None:
+    """Reassemble an artifact's archive from blobs if it was collected."""
+    if artifact.archive_path is None or artifact.manifest_path is None:
+        return
+    archive_path = Path(artifact.archive_path)
+    if archive_path.is_file():
+        return
+    manifest = json.loads(Path(artifact.manifest_path).read_text(encoding="utf-8"))
+    FrontendBlobStore(artifact_root / FRONTEND_BLOB_DIRECTORY).assemble_archive(
+        manifest,
+        archive_path,
+    )
+
+
 def verify_frontend_archive(
     *,
     archive_path: Path,
@@ -611,6 +1014,7 @@ class LocalFrontendArtifactBuilder:
         deployment_control: str | Path = "/usr/local/libexec/remihub-backend-deployment-control",
         sudo_binary: str | Path = "/usr/bin/sudo",
         environment: str | None = None,
+        node_modules_root: str | Path | None = None,
     ):
         if timeout_seconds < 1:
             raise ValueError("timeout_seconds must be at least 1")
@@ -618,6 +1022,9 @@ class LocalFrontendArtifactBuilder:
         self.node_binary = Path(node_binary)
         self.npm_binary = Path(npm_binary)
         self.cache_root = Path(cache_root)
+        self.node_modules_root = (
+            Path(node_modules_root) if node_modules_root is not None else None
+        )
         self.deployment_control = Path(deployment_control)
         self.sudo_binary = Path(sudo_binary)
         self.environment = environment or os.environ.get(
@@ -663,49 +1070,184 @@ class LocalFrontendArtifactBuilder:
         artifact_directory.mkdir(mode=0o750, parents=True, exist_ok=True)
         if artifact_directory.is_symlink():
             raise DeploymentValidationError("Frontend artifact directory is unsafe")
-        first = self._build_once(
-            candidate_worktree=candidate_worktree,
-            frontend_root=frontend_root,
-            lockfile_sha256=lockfile_sha256,
-            candidate_commit=candidate_commit,
-            artifact_directory=artifact_directory,
-            label="build-1",
-        )
-        second = self._build_once(
-            candidate_worktree=candidate_worktree,
+        cache_verification = self._verify_prepared_cache(lockfile_sha256)
+        node_modules, dependency_evidence = self._prepared_node_modules(
             frontend_root=frontend_root,
             lockfile_sha256=lockfile_sha256,
-            candidate_commit=candidate_commit,
-            artifact_directory=artifact_directory,
-            label="build-2",
+            store_root=self.node_modules_root or artifact_root / FRONTEND_NODE_MODULES_DIRECTORY,
         )
+        blob_store = FrontendBlobStore(artifact_root / FRONTEND_BLOB_DIRECTORY)
+        # The two reproducibility builds share nothing but read-only inputs,
+        # so they run side by side in their own staging trees.
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="frontend-build") as executor:
+            builds = [
+                executor.submit(
+                    self._build_once,
+                    frontend_root=frontend_root,
+                    node_modules=node_modules,
+                    blob_store=blob_store,
+                    lockfile_sha256=lockfile_sha256,
+                    candidate_commit=candidate_commit,
+                    artifact_directory=artifact_directory,
+                    label=label,
+                )
+                for label in ("build-1", "build-2")
+            ]
+        first, second = (build.result() for build in builds)
         if first["artifact_identity"] != second["artifact_identity"]:
             raise DeploymentValidationError("Frontend build artifact identity is not reproducible")
+        manifest_path = artifact_directory / "manifest.json"
+        archive_path = artifact_directory / "dist.tar"
+        Path(second["manifest_path"]).replace(manifest_path)
+        blob_store.assemble_archive(
+            json.loads(manifest_path.read_text(encoding="utf-8")),
+            archive_path,
+        )
+        verified = verify_frontend_archive(
+            archive_path=archive_path,
+            manifest_path=manifest_path,
+        )
+        try:
+            garbage = collect_frontend_artifact_garbage(artifact_root)
+        except OSError as exc:
+            garbage = {"status": "failed", "reason": str(exc)}
         return FrontendArtifactEvidence(
             changed=True,
             artifact_directory=str(artifact_directory),
-            archive_path=second["archive_path"],
-            archive_sha256=second["archive_sha256"],
-            manifest_path=second["manifest_path"],
-            manifest_sha256=second["manifest_sha256"],
-            artifact_identity=second["artifact_identity"],
+            archive_path=str(archive_path),
+            archive_sha256=verified["archive_sha256"],
+            manifest_path=str(manifest_path),
+            manifest_sha256=verified["manifest_sha256"],
+            artifact_identity=verified["artifact_identity"],
             lockfile_sha256=lockfile_sha256,
             node_version=node_version,
             npm_version=npm_version,
-            commands=tuple(first["commands"] + second["commands"]),
+            commands=tuple(
+                [cache_verification, dependency_evidence]
+                + first["commands"]
+                + second["commands"]
+                + [{"command": "collect frontend artifact garbage", **garbage}]
+            ),
             reproducibility={
                 "first_identity": first["artifact_identity"],
                 "second_identity": second["artifact_identity"],
                 "matched": True,
                 "archive_identity_source": "normalized manifest and content hashes",
+                "concurrent_builds": True,
             },
         )
 
+    def _prepared_node_modules(
+        self,
+        *,
+        frontend_root: Path,
+        lockfile_sha256: str,
+        store_root: Path,
+    ) -> tuple[Path, dict[str, Any]]:
+        """
+        Return the installed node_modules for lockfile_sha256, installing once.
+
+        The tree is installed with `npm ci --ignore-scripts` from the verified
+        prepared cache, made read-only, and fingerprinted. Later builds with
+        the same lockfile reuse it after rechecking the fingerprint; a tree
+        that no longer matches is discarded and installed again.
+        """
+        store_root.mkdir(mode=0o750, parents=True, exist_ok=True)
+        if store_root.is_symlink():
+            raise DeploymentValidationError("Frontend dependency store is unsafe")
+        entry = store_root / lockfile_sha256
+        installed = entry / "node_modules"
+        record_path = entry / "verification.json"
+        started = time.monotonic()
+        with (store_root / f"{lockfile_sha256}.lock").open("a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if entry.exists() or entry.is_symlink():
+                try:
+                    record = json.loads(record_path.read_text(encoding="utf-8"))
+                    if (
+                        not entry.is_symlink()
+                        and record.get("lockfile_sha256") == lockfile_sha256
+                        and record.get("fingerprint") == _node_modules_fingerprint(installed)
+                    ):
+                        return installed, {
+                            "command": "reuse installed node_modules",
+                            "duration_ms": round((time.monotonic() - started) * 1000),
+                            "return_code": 0,
+                            "lockfile_sha256": lockfile_sha256,
+                            "fingerprint": record["fingerprint"],
+                            "network": "not_required",
+                        }
+                except (OSError, ValueError, AttributeError, DeploymentValidationError):
+                    pass
+                self._discard_store_entry(entry)
+
+            staging = Path(tempfile.mkdtemp(prefix=f"{lockfile_sha256}-", dir=str(store_root)))
+            try:
+                source = staging / "source"
+                (source / "frontend-web").mkdir(parents=True)
+                for name in ("package.json", "package-lock.json"):
+                    shutil.copyfile(frontend_root / name, source / "frontend-web" / name)
+                cache_source = self.cache_root / lockfile_sha256
+                if cache_source.is_symlink() or not cache_source.is_dir():
+                    raise DeploymentValidationError(
+                        "Prepared frontend npm cache is missing or unsafe"
+                    )
+                shutil.copytree(
+                    cache_source,
+                    source / ".npm-cache",
+                    symlinks=True,
+                )
+                self._reject_unsafe_tree(
+                    source / ".npm-cache",
+                    context="Prepared frontend npm cache",
+                )
+                (source / ".npm-home").mkdir(mode=0o700)
+                evidence = self._run_command(
+                    [str(self.npm_binary), "ci", "--ignore-scripts"],
+                    cwd=source / "frontend-web",
+                    network="offline-prepared-cache",
+                )
+                produced = source / "frontend-web" / "node_modules"
+                if produced.is_symlink() or not produced.is_dir():
+                    raise DeploymentValidationError(
+                        "Frontend dependency install did not produce node_modules"
+                    )
+                _freeze_tree(produced)
+                entry.mkdir(mode=0o750)
+                produced.rename(installed)
+                fingerprint = _node_modules_fingerprint(installed)
+                record_path.write_bytes(
+                    _canonical_json_bytes(
+                        {
+                            "lockfile_sha256": lockfile_sha256,
+                            "fingerprint": fingerprint,
+                            "installed_at": _utc_now(),
+                        }
+                    )
+                )
+            except BaseException:
+                self._discard_store_entry(entry)
+                raise
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+        evidence["lockfile_sha256"] = lockfile_sha256
+        evidence["fingerprint"] = fingerprint
+        return installed, evidence
+
+    @staticmethod
+    def _discard_store_entry(entry: Path) -> None:
+        if entry.is_symlink():
+            entry.unlink()
+            return
+        # Frozen files are read-only; their directories stay writable.
+        shutil.rmtree(entry, ignore_errors=True)
+
     def _build_once(
         self,
         *,
-        candidate_worktree: Path,
         frontend_root: Path,
+        node_modules: Path,
+        blob_store: FrontendBlobStore,
         lockfile_sha256: str,
         candidate_commit: str,
         artifact_directory: Path,
@@ -724,29 +1266,19 @@ class LocalFrontendArtifactBuilder:
                 source / "frontend-web",
                 context="Frontend source snapshot",
             )
-            cache_verification = self._verify_prepared_cache(lockfile_sha256)
-            cache_source = self.cache_root / lockfile_sha256
-            if cache_source.is_symlink() or not cache_source.is_dir():
-                raise DeploymentValidationError(
-                    "Prepared frontend npm cache is missing or unsafe"
-                )
-            shutil.copytree(
-                cache_source,
-                source / ".npm-cache",
-                symlinks=True,
-            )
-            self._reject_unsafe_tree(
-                source / ".npm-cache",
-                context="Prepared frontend npm cache",
-            )
+            linked_started = time.monotonic()
+            linked_files = _link_tree(node_modules, source / "frontend-web" / "node_modules")
+            # An empty cache keeps npm offline; lint and build need no packages.
+            (source / ".npm-cache").mkdir(mode=0o700)
             (source / ".npm-home").mkdir(mode=0o700)
             commands = [
-                cache_verification,
-                self._run_command(
-                    [str(self.npm_binary), "ci", "--ignore-scripts"],
-                    cwd=source / "frontend-web",
-                    network="offline-prepared-cache",
-                ),
+                {
+                    "command": "link installed node_modules",
+                    "duration_ms": round((time.monotonic() - linked_started) * 1000),
+                    "return_code": 0,
+                    "linked_files": linked_files,
+                    "network": "not_required",
+                },
                 self._run_command(
                     [str(self.npm_binary), "run", "lint"],
                     cwd=source / "frontend-web",
@@ -759,36 +1291,40 @@ class LocalFrontendArtifactBuilder:
                 ),
             ]
             dist_root = source / "frontend-web" / "dist"
+            if dist_root.is_dir() and not dist_root.is_symlink():
+                # Variants are part of the artifact so the server never compresses.
+                compressed_started = time.monotonic()
+                compressed = precompress_tree(dist_root)
+                commands.append(
+                    {
+                        "command": "precompress frontend assets",
+                        "duration_ms": round((time.monotonic() - compressed_started) * 1000),
+                        "return_code": 0,
+                        **compressed,
+                        "network": "not_required",
+                    }
+                )
             manifest = _frontend_artifact_manifest(
                 dist_root,
                 candidate_commit=candidate_commit,
                 lockfile_sha256=lockfile_sha256,
             )
+            stored_started = time.monotonic()
+            stored = blob_store.store_dist(dist_root, manifest)
+            commands.append(
+                {
+                    "command": "store frontend artifact blobs",
+                    "duration_ms": round((time.monotonic() - stored_started) * 1000),
+                    "return_code": 0,
+                    **stored,
+                    "network": "not_required",
+                }
+            )
             manifest_path = artifact_directory / f"{label}.manifest.json"
             manifest_path.write_bytes(_canonical_json_bytes(manifest))
             os.chmod(manifest_path, 0o640)
-            archive_path = artifact_directory / f"{label}.dist.tar"
-            _write_deterministic_frontend_archive(dist_root, archive_path, manifest)
-            verified = verify_frontend_archive(
-                archive_path=archive_path,
-                manifest_path=manifest_path,
-            )
-            final_manifest = artifact_directory / "manifest.json"
-            final_archive = artifact_directory / "dist.tar"
-            if label == "build-2":
-                manifest_path.replace(final_manifest)
-                archive_path.replace(final_archive)
-                manifest_path = final_manifest
-                archive_path = final_archive
-                verified = verify_frontend_archive(
-                    archive_path=archive_path,
-                    manifest_path=manifest_path,
-                )
             return {
-                "artifact_identity": verified["artifact_identity"],
-                "archive_sha256": verified["archive_sha256"],
-                "manifest_sha256": verified["manifest_sha256"],
-                "archive_path": str(archive_path),
+                "artifact_identity": manifest["artifact_identity"],
                 "manifest_path": str(manifest_path),
                 "commands": commands,
             }
@@ -954,6 +1490,8 @@ class PostgresDeploymentDatabase:
         pg_dump_binary: str = "/usr/bin/pg_dump",
         pg_restore_binary: str = "/usr/bin/pg_restore",
         command_timeout_seconds: int = 900,
+        backup_jobs: int = 1,
+        backup_schema_scope: bool = False,
     ):
         self.config_path = _required_absolute_file(
             config_path,
@@ -979,7 +1517,11 @@ class PostgresDeploymentDatabase:
         )
         if command_timeout_seconds < 1:
             raise ValueError("command_timeout_seconds must be at least 1")
+        if backup_jobs < 1:
+            raise ValueError("backup_jobs must be at least 1")
         self.command_timeout_seconds = command_timeout_seconds
+        self.backup_jobs = backup_jobs
+        self.backup_schema_scope = backup_schema_scope
 
     def migration_history(self) -> tuple[dict[str, str], ...]:
         conn = self._connect()
@@ -1021,15 +1563,34 @@ class PostgresDeploymentDatabase:
             finally:
                 conn.close()
 
-    def backup(self, *, card_id: str, deployment_run_id: str) -> BackupEvidence:
+    def backup(
+        self,
+        *,
+        card_id: str,
+        deployment_run_id: str,
+        schemas: tuple[str, ...] | None = None,
+    ) -> BackupEvidence:
+        """
+        Dump the database before migrations and verify the dump is readable.
+
+        With more than one job the dump uses the directory format so pg_dump
+        can write tables in parallel; its files are then hashed in parallel
+        while pg_restore lists the archive. A single job streams the custom
+        format through the hash as it is written. schemas limits the dump
+        only when schema scoping is enabled; None means the touched schemas
+        are unknown and the whole database is dumped.
+        """
         card_root = self.backup_root / card_id
         card_root.mkdir(mode=0o750, exist_ok=True)
         if card_root.is_symlink():
             raise AgentDeploymentError("Database backup directory must not be a symlink")
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        backup_path = card_root / f"{deployment_run_id}-{timestamp}.dump"
+        directory_format = self.backup_jobs > 1
+        suffix = "dump.d" if directory_format else "dump"
+        backup_path = card_root / f"{deployment_run_id}-{timestamp}.{suffix}"
         if backup_path.exists() or backup_path.is_symlink():
             raise AgentDeploymentError("Database backup path already exists")
+        scoped_schemas = tuple(schemas or ()) if self.backup_schema_scope else ()
 
         database = load_config(self.config_path)["Database"]
         environment = {
@@ -1040,7 +1601,7 @@ class PostgresDeploymentDatabase:
         }
         command = [
             str(self.pg_dump_binary),
-            "--format=custom",
+            "--format=directory" if directory_format else "--format=custom",
             "--no-owner",
             "--no-privileges",
             "--host",
@@ -1051,25 +1612,73 @@ class PostgresDeploymentDatabase:
             database["user"],
             "--role",
             self.owner_role,
-            "--file",
-            str(backup_path),
-            database["database"],
         ]
-        self._run(command, environment=environment, context="PostgreSQL backup failed")
-        os.chmod(backup_path, 0o600)
-        self._run(
-            [str(self.pg_restore_binary), "--list", str(backup_path)],
-            environment={
-                "HOME": "/nonexistent",
-                "LANG": os.environ.get("LANG", "C.UTF-8"),
-                "PATH": "/usr/bin:/bin",
-            },
-            context="PostgreSQL backup verification failed",
-        )
+        for schema in scoped_schemas:
+            command.extend(["--schema", schema])
+        verify_environment = {
+            "HOME": "/nonexistent",
+            "LANG": os.environ.get("LANG", "C.UTF-8"),
+            "PATH": "/usr/bin:/bin",
+        }
+        verify_command = [str(self.pg_restore_binary), "--list", str(backup_path)]
+
+        started = time.monotonic()
+        if directory_format:
+            command.extend(
+                [
+                    "--jobs",
+                    str(self.backup_jobs),
+                    "--file",
+                    str(backup_path),
+                    database["database"],
+                ]
+            )
+            self._run(command, environment=environment, context="PostgreSQL backup failed")
+            dumped = time.monotonic()
+            os.chmod(backup_path, 0o700)
+            files = sorted(path for path in backup_path.rglob("*") if path.is_file())
+            for path in files:
+                os.chmod(path, 0o600)
+            with ThreadPoolExecutor(max_workers=self.backup_jobs + 1) as pool:
+                listing = pool.submit(
+                    self._run,
+                    verify_command,
+                    environment=verify_environment,
+                    context="PostgreSQL backup verification failed",
+                )
+                digests = dict(
+                    zip(
+                        (path.relative_to(backup_path).as_posix() for path in files),
+                        pool.map(_sha256_file, files),
+                    )
+                )
+                listing.result()
+            size_bytes = sum(path.stat().st_size for path in files)
+            sha256 = hashlib.sha256(_canonical_json_bytes(digests)).hexdigest()
+        else:
+            command.append(database["database"])
+            size_bytes, sha256 = self._stream_to_file(
+                command,
+                backup_path,
+                environment=environment,
+                context="PostgreSQL backup failed",
+            )
+            dumped = time.monotonic()
+            self._run(
+                verify_command,
+                environment=verify_environment,
+                context="PostgreSQL backup verification failed",
+            )
+        verified = time.monotonic()
         return BackupEvidence(
             path=str(backup_path),
-            size_bytes=backup_path.stat().st_size,
-            sha256=_sha256_file(backup_path),
+            size_bytes=size_bytes,
+            sha256=sha256,
+            format="directory" if directory_format else "custom",
+            jobs=self.backup_jobs,
+            schemas=scoped_schemas,
+            dump_ms=int((dumped - started) * 1000),
+            verify_ms=int((verified - dumped) * 1000),
         )
 
     def upgrade(
@@ -1179,6 +1788,51 @@ class PostgresDeploymentDatabase:
             suffix = f": {detail}" if detail else ""
             raise AgentDeploymentError(f"{context}{suffix}")
 
+    def _stream_to_file(
+        self,
+        command: list[str],
+        destination: Path,
+        *,
+        environment: dict[str, str],
+        context: str,
+    ) -> tuple[int, str]:
+        """Write command's stdout to destination, hashing it on the way."""
+        digest = hashlib.sha256()
+        size_bytes = 0
+        descriptor = os.open(
+            destination,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW,
+            0o600,
+        )
+        with tempfile.TemporaryFile() as stderr, os.fdopen(descriptor, "wb") as output:
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    env=environment,
+                )
+            except OSError as exc:
+                raise AgentDeploymentError(context) from exc
+            # pg_dump only writes to the pipe, so a watchdog enforces the timeout.
+            watchdog = threading.Timer(self.command_timeout_seconds, process.kill)
+            watchdog.start()
+            try:
+                for chunk in iter(lambda: process.stdout.read(1024 * 1024), b""):
+                    output.write(chunk)
+                    digest.update(chunk)
+                    size_bytes += len(chunk)
+                returncode = process.wait()
+            finally:
+                watchdog.cancel()
+                process.stdout.close()
+            if returncode != 0:
+                stderr.seek(0)
+                detail = _tail(stderr.read().decode("utf-8", errors="replace"), 2000)
+                suffix = f": {detail}" if detail else ""
+                raise AgentDeploymentError(f"{context}{suffix}")
+        return size_bytes, digest.hexdigest()
+
 
 class PostgresMigrationHistoryReader:
     """Read-only schema_migrations access for cross-environment parity checks."""
@@ -1766,24 +2420,28 @@ class GitBackendDeploymentManager:
                 "Deployment requires an approved implementation result"
             )
 
+        timeline = StageTimeline()
         lock_path = self.lock_root / f"{claim.card_id}.lock"
         with lock_path.open("a+", encoding="utf-8") as lock_file:
             os.chmod(lock_path, 0o640)
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            with timeline.span("card_lock"):
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
             try:
-                approved = self._validate_approved_implementation(
-                    claim,
-                    claim.deployment_source,
-                )
-                candidate_branch, candidate_commit, candidate_path = (
-                    self._materialize_candidate(claim, approved)
-                )
-                self._verify_qa_candidate(claim, candidate_commit)
-                migration_plan = self._migration_plan(
-                    approved.base_commit,
-                    candidate_commit,
-                    candidate_path,
-                )
+                with timeline.span("approval_check"):
+                    approved = self._validate_approved_implementation(
+                        claim,
+                        claim.deployment_source,
+                    )
+                with timeline.span("candidate_materialization"):
+                    candidate_branch, candidate_commit, candidate_path = (
+                        self._materialize_candidate(claim, approved)
+                    )
+                    self._verify_qa_candidate(claim, candidate_commit)
+                    migration_plan = self._migration_plan(
+                        approved.base_commit,
+                        candidate_commit,
+                        candidate_path,
+                    )
                 frontend_changed = frontend_web_changed(approved.changed_files)
                 rollback_ref = self._rollback_ref(claim)
                 manifest_path = self._manifest_path(claim)
@@ -1803,13 +2461,15 @@ class GitBackendDeploymentManager:
                     self.target_branch,
                 )
                 if prior_success is not None and current_target == candidate_commit:
-                    health = self.runtime.verify()
+                    with timeline.span("health_verify"):
+                        health = self.runtime.verify()
                     frontend_artifact = _frontend_artifact_from_manifest(manifest)
                     if frontend_artifact is not None:
-                        self.runtime.frontend_verify(
-                            artifact_manifest=frontend_artifact.manifest_path,
-                            artifact_identity=frontend_artifact.artifact_identity,
-                        )
+                        with timeline.span("frontend_verify"):
+                            self.runtime.frontend_verify(
+                                artifact_manifest=frontend_artifact.manifest_path,
+                                artifact_identity=frontend_artifact.artifact_identity,
+                            )
                     return self._candidate_from_success(
                         approved,
                         candidate_branch=candidate_branch,
@@ -1819,6 +2479,7 @@ class GitBackendDeploymentManager:
                         attempt=prior_success,
                         health=health,
                         frontend_artifact=frontend_artifact,
+                        stage_timeline=timeline.as_metadata(),
                     )
 
                 if current_target != approved.base_commit:
@@ -1827,6 +2488,7 @@ class GitBackendDeploymentManager:
                     )
 
                 attempt = self._begin_attempt(manifest, claim)
+                timeline.attach(attempt)
                 self._write_manifest(manifest_path, manifest)
                 return self._execute_candidate(
                     claim,
@@ -1839,6 +2501,7 @@ class GitBackendDeploymentManager:
                     manifest_path=manifest_path,
                     manifest=manifest,
                     attempt=attempt,
+                    timeline=timeline,
                 )
             finally:
                 fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -1951,6 +2614,7 @@ class GitBackendDeploymentManager:
         manifest_path: Path,
         manifest: dict,
         attempt: dict,
+        timeline: StageTimeline,
     ) -> DeploymentCandidate:
         validation: ValidationEvidence | None = None
         frontend_artifact = FrontendArtifactEvidence(
@@ -1970,21 +2634,26 @@ class GitBackendDeploymentManager:
         migrations_dir = candidate_path / "backend" / "database" / "migrations"
 
         try:
-            validation = self.validator.validate(candidate_path)
+            with timeline.span("validation"):
+                validation = self.validator.validate(
+                    candidate_path,
+                    changed_files=approved.changed_files,
+                )
             attempt["validation"] = asdict(validation)
             attempt["stage"] = "validated"
             self._write_manifest(manifest_path, manifest)
-            frontend_artifact = self.frontend_builder.build(
-                candidate_worktree=candidate_path,
-                artifact_root=self.deployment_artifact_root,
-                card_id=claim.card_id,
-                card_revision=claim.card_revision,
-                deployment_run_id=claim.id,
-                approval_id=approved.approval_id,
-                implementation_run_id=approved.implementation_run_id,
-                candidate_commit=candidate_commit,
-                changed_files=approved.changed_files,
-            )
+            with timeline.span("frontend_build"):
+                frontend_artifact = self.frontend_builder.build(
+                    candidate_worktree=candidate_path,
+                    artifact_root=self.deployment_artifact_root,
+                    card_id=claim.card_id,
+                    card_revision=claim.card_revision,
+                    deployment_run_id=claim.id,
+                    approval_id=approved.approval_id,
+                    implementation_run_id=approved.implementation_run_id,
+                    candidate_commit=candidate_commit,
+                    changed_files=approved.changed_files,
+                )
             manifest["frontend_artifact"] = asdict(frontend_artifact)
             attempt["frontend_artifact"] = asdict(frontend_artifact)
             attempt["stage"] = (
@@ -2002,15 +2671,16 @@ class GitBackendDeploymentManager:
 
         if self.environment == "production":
             try:
-                self._record_and_require_migration_history(
-                    attempt,
-                    manifest_path,
-                    manifest,
-                    source="qa",
-                    stage="qa_history_before_production_mutation",
-                    expected_history=migration_plan.expected_history,
-                    reader=self._required_qa_history_reader(),
-                )
+                with timeline.span("migration_parity"):
+                    self._record_and_require_migration_history(
+                        attempt,
+                        manifest_path,
+                        manifest,
+                        source="qa",
+                        stage="qa_history_before_production_mutation",
+                        expected_history=migration_plan.expected_history,
+                        reader=self._required_qa_history_reader(),
+                    )
             except Exception as exc:
                 attempt["status"] = "failed_migration_parity"
                 attempt["error"] = f"{type(exc).__name__}: {exc}"[:10000]
@@ -2019,37 +2689,44 @@ class GitBackendDeploymentManager:
                 raise
 
         try:
-            pending = self.database.pending_versions(migrations_dir)
-            if pending != migration_plan.versions:
-                raise AgentDeploymentError(
-                    "Database pending migrations do not match the approved candidate: "
-                    f"expected {migration_plan.versions!r}, found {pending!r}"
-                )
-
-            self._ensure_rollback_ref(rollback_ref, approved.base_commit)
+            with timeline.span("migration_preflight"):
+                pending = self.database.pending_versions(migrations_dir)
+                if pending != migration_plan.versions:
+                    raise AgentDeploymentError(
+                        "Database pending migrations do not match the approved candidate: "
+                        f"expected {migration_plan.versions!r}, found {pending!r}"
+                    )
+                self._ensure_rollback_ref(rollback_ref, approved.base_commit)
             attempt["stage"] = "rollback_reference_created"
             self._write_manifest(manifest_path, manifest)
 
             if migration_plan.versions:
-                backup = self.database.backup(
-                    card_id=claim.card_id,
-                    deployment_run_id=claim.id,
-                )
+                with timeline.span("database_backup"):
+                    backup = self.database.backup(
+                        card_id=claim.card_id,
+                        deployment_run_id=claim.id,
+                        schemas=_migration_schemas(migrations_dir, migration_plan.versions),
+                    )
                 attempt["database_backup"] = asdict(backup)
                 attempt["stage"] = "database_backed_up"
                 self._write_manifest(manifest_path, manifest)
+            else:
+                # Nothing will change in the database, so there is nothing to restore.
+                attempt["database_backup_skipped"] = "no pending migrations"
 
-            self.runtime.stop()
+            with timeline.span("service_stop"):
+                self.runtime.stop()
             service_stopped = True
             attempt["stage"] = "service_stopped"
             self._write_manifest(manifest_path, manifest)
 
             if migration_plan.versions:
                 try:
-                    migrations_applied = self.database.upgrade(
-                        migrations_dir,
-                        migration_plan.versions,
-                    )
+                    with timeline.span("migrations"):
+                        migrations_applied = self.database.upgrade(
+                            migrations_dir,
+                            migration_plan.versions,
+                        )
                 except Exception:
                     pending_after_failure = self.database.pending_versions(
                         migrations_dir
@@ -2068,12 +2745,13 @@ class GitBackendDeploymentManager:
                 self._write_manifest(manifest_path, manifest)
 
             runtime_promotion_attempted = True
-            self.runtime.promote(
-                candidate_branch=candidate_branch,
-                candidate_commit=candidate_commit,
-                expected_before=approved.base_commit,
-                rollback_ref=rollback_ref,
-            )
+            with timeline.span("runtime_promote"):
+                self.runtime.promote(
+                    candidate_branch=candidate_branch,
+                    candidate_commit=candidate_commit,
+                    expected_before=approved.base_commit,
+                    rollback_ref=rollback_ref,
+                )
             runtime_promoted = True
             attempt["stage"] = "runtime_promoted"
             self._write_manifest(manifest_path, manifest)
@@ -2083,22 +2761,26 @@ class GitBackendDeploymentManager:
                 assert frontend_artifact.manifest_path is not None
                 assert frontend_artifact.archive_path is not None
                 assert frontend_artifact.artifact_identity is not None
-                install_evidence = self.runtime.frontend_install(
-                    artifact_manifest=frontend_artifact.manifest_path,
-                    artifact_archive=frontend_artifact.archive_path,
-                    artifact_identity=frontend_artifact.artifact_identity,
-                    candidate_commit=candidate_commit,
-                    card_id=claim.card_id,
-                    deployment_run_id=claim.id,
-                )
+                with timeline.span("frontend_install"):
+                    ensure_frontend_archive(self.deployment_artifact_root, frontend_artifact)
+                    install_evidence = self.runtime.frontend_install(
+                        artifact_manifest=frontend_artifact.manifest_path,
+                        artifact_archive=frontend_artifact.archive_path,
+                        artifact_identity=frontend_artifact.artifact_identity,
+                        candidate_commit=candidate_commit,
+                        card_id=claim.card_id,
+                        deployment_run_id=claim.id,
+                    )
                 frontend_installed = True
                 attempt["frontend_install"] = install_evidence
                 attempt["stage"] = "frontend_installed"
                 self._write_manifest(manifest_path, manifest)
 
-            self.runtime.start()
+            with timeline.span("service_start"):
+                self.runtime.start()
             service_stopped = False
-            health = self.runtime.verify()
+            with timeline.span("health_verify"):
+                health = self.runtime.verify()
             attempt["health"] = asdict(health)
             attempt["stage"] = "health_verified"
             self._write_manifest(manifest_path, manifest)
@@ -2106,54 +2788,58 @@ class GitBackendDeploymentManager:
             if frontend_artifact.changed:
                 assert frontend_artifact.manifest_path is not None
                 assert frontend_artifact.artifact_identity is not None
-                attempt["frontend_verified"] = self.runtime.frontend_verify(
-                    artifact_manifest=frontend_artifact.manifest_path,
-                    artifact_identity=frontend_artifact.artifact_identity,
-                )
+                with timeline.span("frontend_verify"):
+                    attempt["frontend_verified"] = self.runtime.frontend_verify(
+                        artifact_manifest=frontend_artifact.manifest_path,
+                        artifact_identity=frontend_artifact.artifact_identity,
+                    )
                 attempt["stage"] = "frontend_verified"
                 self._write_manifest(manifest_path, manifest)
 
-            if self.environment == "qa":
-                self._record_and_require_migration_history(
-                    attempt,
-                    manifest_path,
-                    manifest,
-                    source="qa",
-                    stage="qa_history_after_validation",
-                    expected_history=migration_plan.expected_history,
-                    reader=self.database,
-                )
-            else:
-                self._record_and_require_migration_history(
-                    attempt,
-                    manifest_path,
-                    manifest,
-                    source="production",
-                    stage="production_history_after_validation",
-                    expected_history=migration_plan.expected_history,
-                    reader=self.database,
-                )
+            with timeline.span("migration_history"):
+                if self.environment == "qa":
+                    self._record_and_require_migration_history(
+                        attempt,
+                        manifest_path,
+                        manifest,
+                        source="qa",
+                        stage="qa_history_after_validation",
+                        expected_history=migration_plan.expected_history,
+                        reader=self.database,
+                    )
+                else:
+                    self._record_and_require_migration_history(
+                        attempt,
+                        manifest_path,
+                        manifest,
+                        source="production",
+                        stage="production_history_after_validation",
+                        expected_history=migration_plan.expected_history,
+                        reader=self.database,
+                    )
 
             target_update_attempted = True
-            self._run_git(
-                self.target_repository,
-                "update-ref",
-                f"refs/heads/{self.target_branch}",
-                candidate_commit,
-                approved.base_commit,
-                error_context="Unable to advance the deployment target",
-            )
+            with timeline.span("target_advance"):
+                self._run_git(
+                    self.target_repository,
+                    "update-ref",
+                    f"refs/heads/{self.target_branch}",
+                    candidate_commit,
+                    approved.base_commit,
+                    error_context="Unable to advance the deployment target",
+                )
             target_updated = True
             attempt["stage"] = "target_advanced"
             self._write_manifest(manifest_path, manifest)
 
             source_sync_attempted = self.environment == "production"
-            self.runtime.synchronize_sources(
-                candidate_branch=candidate_branch,
-                candidate_commit=candidate_commit,
-                expected_before=approved.base_commit,
-                rollback_ref=rollback_ref,
-            )
+            with timeline.span("source_sync"):
+                self.runtime.synchronize_sources(
+                    candidate_branch=candidate_branch,
+                    candidate_commit=candidate_commit,
+                    expected_before=approved.base_commit,
+                    rollback_ref=rollback_ref,
+                )
             sources_synchronized = self.environment == "production"
             attempt["stage"] = "sources_synchronized"
             attempt["status"] = "succeeded"
@@ -2183,6 +2869,7 @@ class GitBackendDeploymentManager:
                 migrations_applied=migrations_applied,
                 database_backup=asdict(backup) if backup else None,
                 rollback_performed=False,
+                stage_timeline=timeline.as_metadata(),
             )
         except Exception as exc:
             rollback_errors: list[str] = []
@@ -2193,83 +2880,84 @@ class GitBackendDeploymentManager:
             # service down before touching code or database state, then reconcile
             # each durable boundary from its observed state instead of trusting a
             # local boolean that may not have been updated before the failure.
-            try:
-                self.runtime.stop()
-                service_stopped = True
-            except Exception as rollback_exc:
-                rollback_errors.append(f"stop: {rollback_exc}")
-
-            if source_sync_attempted:
+            with timeline.span("rollback"):
                 try:
-                    self.runtime.restore_sources(
-                        expected_current=candidate_commit,
-                        rollback_commit=approved.base_commit,
-                    )
-                    sources_synchronized = False
+                    self.runtime.stop()
+                    service_stopped = True
                 except Exception as rollback_exc:
-                    rollback_errors.append(f"restore_sources: {rollback_exc}")
+                    rollback_errors.append(f"stop: {rollback_exc}")
 
-            if target_update_attempted or target_updated:
-                try:
-                    observed_target = self._resolve_commit(
-                        self.target_repository,
-                        self.target_branch,
-                    )
-                    if observed_target == candidate_commit:
-                        self._run_git(
+                if source_sync_attempted:
+                    try:
+                        self.runtime.restore_sources(
+                            expected_current=candidate_commit,
+                            rollback_commit=approved.base_commit,
+                        )
+                        sources_synchronized = False
+                    except Exception as rollback_exc:
+                        rollback_errors.append(f"restore_sources: {rollback_exc}")
+
+                if target_update_attempted or target_updated:
+                    try:
+                        observed_target = self._resolve_commit(
                             self.target_repository,
-                            "update-ref",
-                            f"refs/heads/{self.target_branch}",
-                            approved.base_commit,
-                            candidate_commit,
-                            error_context="Unable to restore the deployment target",
+                            self.target_branch,
                         )
-                    elif observed_target != approved.base_commit:
-                        raise AgentDeploymentError(
-                            "Deployment target is neither the candidate nor rollback commit"
+                        if observed_target == candidate_commit:
+                            self._run_git(
+                                self.target_repository,
+                                "update-ref",
+                                f"refs/heads/{self.target_branch}",
+                                approved.base_commit,
+                                candidate_commit,
+                                error_context="Unable to restore the deployment target",
+                            )
+                        elif observed_target != approved.base_commit:
+                            raise AgentDeploymentError(
+                                "Deployment target is neither the candidate nor rollback commit"
+                            )
+                        target_updated = False
+                    except Exception as rollback_exc:
+                        rollback_errors.append(f"target: {rollback_exc}")
+
+                if runtime_promotion_attempted or runtime_promoted:
+                    try:
+                        self.runtime.restore(
+                            expected_current=candidate_commit,
+                            rollback_commit=approved.base_commit,
                         )
-                    target_updated = False
-                except Exception as rollback_exc:
-                    rollback_errors.append(f"target: {rollback_exc}")
-
-            if runtime_promotion_attempted or runtime_promoted:
-                try:
-                    self.runtime.restore(
-                        expected_current=candidate_commit,
-                        rollback_commit=approved.base_commit,
-                    )
-                    runtime_promoted = False
-                except Exception as rollback_exc:
-                    rollback_errors.append(f"runtime: {rollback_exc}")
-
-            if frontend_install_attempted or frontend_installed:
-                try:
-                    attempt["frontend_restored"] = self.runtime.frontend_restore()
-                    frontend_installed = False
-                except Exception as rollback_exc:
-                    rollback_errors.append(f"frontend: {rollback_exc}")
+                        runtime_promoted = False
+                    except Exception as rollback_exc:
+                        rollback_errors.append(f"runtime: {rollback_exc}")
+
+                if frontend_install_attempted or frontend_installed:
+                    try:
+                        attempt["frontend_restored"] = self.runtime.frontend_restore()
+                        frontend_installed = False
+                    except Exception as rollback_exc:
+                        rollback_errors.append(f"frontend: {rollback_exc}")
+
+                if migrations_applied:
+                    try:
+                        migrations_dir = (
+                            candidate_path / "backend" / "database" / "migrations"
+                        )
+                        rolled_back = self.database.downgrade(
+                            migrations_dir,
+                            migrations_applied,
+                        )
+                        attempt["migrations_rolled_back"] = list(rolled_back)
+                        migrations_applied = ()
+                    except Exception as rollback_exc:
+                        rollback_errors.append(f"database: {rollback_exc}")
 
-            if migrations_applied:
                 try:
-                    migrations_dir = (
-                        candidate_path / "backend" / "database" / "migrations"
-                    )
-                    rolled_back = self.database.downgrade(
-                        migrations_dir,
-                        migrations_applied,
-                    )
-                    attempt["migrations_rolled_back"] = list(rolled_back)
-                    migrations_applied = ()
+                    self.runtime.start()
+                    service_stopped = False
+                    restored_health = self.runtime.verify()
+                    attempt["restored_health"] = asdict(restored_health)
                 except Exception as rollback_exc:
-                    rollback_errors.append(f"database: {rollback_exc}")
-
-            try:
-                self.runtime.start()
-                service_stopped = False
-                restored_health = self.runtime.verify()
-                attempt["restored_health"] = asdict(restored_health)
-            except Exception as rollback_exc:
-                rollback_errors.append(f"restart: {rollback_exc}")
+                    rollback_errors.append(f"restart: {rollback_exc}")
 
             attempt["rollback_performed"] = True
             attempt["rollback_errors"] = rollback_errors
@@ -2870,6 +3558,15 @@ class GitBackendDeploymentManager:
                 rf"\bCREATE\s+{create_keywords[object_type]}\s+"
                 rf"(?:IF\s+NOT\s+EXISTS\s+)?{object_name}\b"
             )
+            schema_name, _, index_name = match.group(2).rpartition(".")
+            if object_type == "INDEX" and schema_name:
+                # An index lives in its table's schema and cannot be qualified
+                # when it is created, only when it is dropped.
+                create_pattern = (
+                    rf"{create_pattern}|\bCREATE\s+{create_keywords[object_type]}\s+"
+                    rf"(?:IF\s+NOT\s+EXISTS\s+)?{re.escape(index_name)}\s+"
+                    rf"ON\s+(?:ONLY\s+)?{re.escape(schema_name)}\."
+                )
             if not re.search(create_pattern, up_sql, flags=re.IGNORECASE):
                 raise AgentDeploymentError(
                     "Down migration drops an object not created by its up migration: "
@@ -3181,6 +3878,7 @@ class GitBackendDeploymentManager:
         attempt: dict,
         health: RuntimeHealth,
         frontend_artifact: FrontendArtifactEvidence | None,
+        stage_timeline: dict | None = None,
     ) -> DeploymentCandidate:
         validation = attempt.get("validation") or {}
         backup = attempt.get("database_backup")
@@ -3207,6 +3905,7 @@ class GitBackendDeploymentManager:
             migrations_applied=tuple(attempt.get("migrations_applied") or ()),
             database_backup=backup,
             rollback_performed=False,
+            stage_timeline=stage_timeline,
         )
 
     def _required_qa_history_reader(self) -> MigrationHistoryReader:
@@ -3911,6 +4610,62 @@ def verify_distinct_database_identities(
         )
 
 
+_MIGRATION_IDENTIFIER = r"[a-z_][a-z0-9_$]*"
+# Statements whose target object a migration changes. The captured name is
+# schema-qualified when group 2 is present.
+_MIGRATION_TARGET = re.compile(
+    r"\b(?:"
+    r"(?:create|alter|drop)\s+(?:or\s+replace\s+)?(?:unlogged\s+)?(?:materialized\s+)?"
+    r"(?:table|view|sequence|type|function|procedure|domain)"
+    r"(?:\s+if\s+(?:not\s+)?exists)?"
+    r"|insert\s+into|update|delete\s+from|truncate(?:\s+table)?|references"
+    r"|\bon"
+    r")\s+(?:only\s+)?"
+    rf"({_MIGRATION_IDENTIFIER})(\s*\.\s*{_MIGRATION_IDENTIFIER})?",
+)
+_MIGRATION_CREATED_SCHEMA = re.compile(
+    rf"\bcreate\s+schema\s+(?:if\s+not\s+exists\s+)?({_MIGRATION_IDENTIFIER})"
+)
+
+
+def _migration_schemas(
+    migrations_dir: Path,
+    versions: tuple[str, ...],
+) -> tuple[str, ...] | None:
+    """
+    Return the existing schemas the pending up migrations change.
+
+    None means the set cannot be read reliably from the SQL and the whole
+    database must be backed up: unqualified or quoted names, procedural
+    blocks, CASCADE, search_path changes, or no schema at all.
+    """
+    wanted = set(versions)
+    schemas: set[str] = set()
+    created: set[str] = set()
+    for migration in migration_runner.discover_migrations(migrations_dir):
+        if migration.version not in wanted:
+            continue
+        sql = migration.up_path.read_text(encoding="utf-8").lower()
+        sql = re.sub(r"--[^\n]*", " ", sql)
+        sql = re.sub(r"'(?:[^']|'')*'", "''", sql)
+        # Foreign key actions name no object of their own.
+        sql = re.sub(
+            r"\bon\s+(?:delete|update)\s+(?:cascade|restrict|set\s+null|set\s+default|no\s+action)\b",
+            " ",
+            sql,
+        )
+        if re.search(r'"|\$\$|/\*|\bcascade\b|\bsearch_path\b|\bdo\b', sql):
+            return None
+        created.update(_MIGRATION_CREATED_SCHEMA.findall(sql))
+        for name, qualified_name in _MIGRATION_TARGET.findall(sql):
+            if not qualified_name:
+                return None
+            schemas.add(name)
+    # New schemas have nothing to back up; their objects go with a rollback.
+    schemas -= created
+    return tuple(sorted(schemas)) or None
+
+
 def _sha256_file(path: Path) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as handle:
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import resource
+import time
+from typing import Iterator
+
+
+# ru_inblock/ru_oublock count 512-byte blocks on Linux.
+_BLOCK_BYTES = 512
+
+
+@dataclass(frozen=True)
+class _ResourceSample:
+    monotonic: float
+    cpu_seconds: float
+    max_rss_kb: int
+    read_blocks: int
+    write_blocks: int
+
+
+def _sample() -> _ResourceSample:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return _ResourceSample(
+        monotonic=time.monotonic(),
+        cpu_seconds=(
+            own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+        ),
+        max_rss_kb=max(own.ru_maxrss, children.ru_maxrss),
+        read_blocks=own.ru_inblock + children.ru_inblock,
+        write_blocks=own.ru_oublock + children.ru_oublock,
+    )
+
+
+@dataclass(frozen=True)
+class StageSpan:
+    name: str
+    offset_ms: int
+    duration_ms: int
+    # CPU and block I/O of this process and its reaped children, such as
+    # pg_dump, npm, and the validator sandbox.
+    cpu_ms: int
+    read_bytes: int
+    write_bytes: int
+    # Peak RSS of this process or its largest child so far.
+    max_rss_kb: int
+    status: str
+
+
+class StageTimeline:
+    """
+    Record how long each deployment stage takes and what it costs.
+
+    Spans are recorded in the order they finish. A span that raises is kept
+    with status "failed" so a rolled-back deployment still shows where its
+    time went. When attached to a manifest attempt, the timeline is copied
+    into the attempt after every span so the next manifest write persists it.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self._origin = _sample()
+        self._spans: list[StageSpan] = []
+        self._attempt: dict | None = None
+
+    def attach(self, attempt: dict) -> None:
+        self._attempt = attempt
+        attempt["stage_timeline"] = self.as_metadata()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        start = _sample()
+        status = "failed"
+        try:
+            yield
+            status = "succeeded"
+        finally:
+            end = _sample()
+            self._spans.append(
+                StageSpan(
+                    name=name,
+                    offset_ms=int((start.monotonic - self._origin.monotonic) * 1000),
+                    duration_ms=int((end.monotonic - start.monotonic) * 1000),
+                    cpu_ms=int((end.cpu_seconds - start.cpu_seconds) * 1000),
+                    read_bytes=(end.read_blocks - start.read_blocks) * _BLOCK_BYTES,
+                    write_bytes=(end.write_blocks - start.write_blocks) * _BLOCK_BYTES,
+                    max_rss_kb=end.max_rss_kb,
+                    status=status,
+                )
+            )
+            if self._attempt is not None:
+                self._attempt["stage_timeline"] = self.as_metadata()
+
+    def as_metadata(self) -> dict:
+        return {
+            "started_at": self.started_at,
+            "total_ms": int((time.monotonic() - self._origin.monotonic) * 1000),
+            "spans": [asdict(span) for span in self._spans],
+        }
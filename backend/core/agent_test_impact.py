@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path, PurePosixPath
+
+
+# Changes here can affect any test without appearing in its imports.
+FULL_RUN_PATHS = (
+    "backend/config.py",
+    "backend/database/",
+    "backend/main.py",
+    "backend/app.py",
+    "tests/fixtures/",
+    "requirements.txt",
+    "requirements-agent.txt",
+)
+# A module imported by at least this share of test modules counts as core.
+CORE_MODULE_TEST_SHARE = 0.5
+
+
+def _module_name(relative: str) -> str | None:
+    path = PurePosixPath(relative)
+    if path.suffix != ".py":
+        return None
+    parts = list(path.with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts) if parts else None
+
+
+def _python_modules(root: Path, package: str) -> dict[str, Path]:
+    modules = {}
+    base = root / package
+    if not base.is_dir():
+        return modules
+    for path in sorted(base.rglob("*.py")):
+        if "__pycache__" in path.parts:
+            continue
+        name = _module_name(path.relative_to(root).as_posix())
+        if name is not None:
+            modules[name] = path
+    return modules
+
+
+def _imported_modules(path: Path, module: str, known: set[str]) -> set[str]:
+    """Return the known modules a file imports, anywhere in its body."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return set()
+    package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+    imported = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            candidates = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                anchor = package.split(".")
+                anchor = anchor[: len(anchor) - node.level + 1]
+                base = ".".join(part for part in [*anchor, base] if part)
+            candidates = [base] + [f"{base}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for candidate in candidates:
+            # "import backend.services.x" also runs every parent package.
+            while candidate:
+                if candidate in known:
+                    imported.add(candidate)
+                candidate = candidate.rpartition(".")[0]
+    return imported
+
+
+def _dependents(graph: dict[str, set[str]]) -> dict[str, set[str]]:
+    reverse: dict[str, set[str]] = {name: set() for name in graph}
+    for name, imports in graph.items():
+        for imported in imports:
+            reverse.setdefault(imported, set()).add(name)
+    return reverse
+
+
+def select_impacted_tests(worktree: Path, changed_files: tuple[str, ...]) -> tuple[str, ...] | None:
+    """
+    Return the test modules affected by changed_files, or None for a full run.
+
+    A test is affected when it imports a changed backend module directly or
+    through other backend modules. Anything the import graph cannot see
+    forces a full run: non-Python files, package __init__ files, deleted
+    modules, FULL_RUN_PATHS, and core modules imported by most tests. A
+    change no test reaches also runs everything rather than nothing.
+    """
+    if not changed_files:
+        return None
+    backend_modules = _python_modules(worktree, "backend")
+    test_modules = {
+        name: path
+        for name, path in _python_modules(worktree, "tests").items()
+        if name.rpartition(".")[2].startswith("test_")
+    }
+    if not test_modules:
+        return None
+    known = set(backend_modules) | set(test_modules)
+
+    selected: set[str] = set()
+    changed_modules: set[str] = set()
+    for relative in changed_files:
+        for path in FULL_RUN_PATHS:
+            if relative == path or (path.endswith("/") and relative.startswith(path)):
+                return None
+        name = _module_name(relative)
+        if name is None or relative.endswith("__init__.py"):
+            return None
+        if name in test_modules:
+            selected.add(name)
+        elif name in backend_modules:
+            changed_modules.add(name)
+        else:
+            # Deleted, or outside the packages the graph covers.
+            return None
+
+    graph = {
+        name: _imported_modules(path, name, known) - {name}
+        for name, path in {**backend_modules, **test_modules}.items()
+    }
+    dependents = _dependents(graph)
+    for changed in changed_modules:
+        affected: set[str] = set()
+        pending = [changed]
+        while pending:
+            for dependent in dependents.get(pending.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+        tests = affected & set(test_modules)
+        if len(tests) >= CORE_MODULE_TEST_SHARE * len(test_modules):
+            return None
+        selected |= tests
+
+    return tuple(sorted(selected)) if selected else None
@@ -16,6 +16,7 @@ from backend.core.agent_deployment import (
     GitBackendDeploymentManager,
     _required_executable,
 )
+from backend.core.agent_stage_timing import StageTimeline
 from backend.core.agent_state import (
     CardStatus,
     RepositoryScope,
@@ -91,6 +92,7 @@ class AndroidDeploymentCandidate:
     version: dict
     validation: dict
     publication: dict
+    stage_timeline: dict | None = None
 
 
 class CommandAndroidReleaseValidator:
@@ -449,24 +451,29 @@ class GitAndroidDeploymentManager(GitBackendDeploymentManager):
                 "Android deployment requires an approved implementation result"
             )
 
+        timeline = StageTimeline()
         lock_path = self.lock_root / f"{claim.card_id}.lock"
         with lock_path.open("a+", encoding="utf-8") as lock_file:
             os.chmod(lock_path, 0o640)
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            with timeline.span("card_lock"):
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
             try:
-                self._validate_android_review_evidence(claim)
-                approved = self._validate_approved_implementation(
-                    replace(claim, base_branch="master"),
-                    claim.deployment_source,
-                )
-                candidate_branch, candidate_commit, candidate_path = (
-                    self._materialize_candidate(claim, approved)
-                )
-                version = self.release_runtime.reserve(
-                    claim=claim,
-                    approved=approved,
-                    candidate_commit=candidate_commit,
-                )
+                with timeline.span("approval_check"):
+                    self._validate_android_review_evidence(claim)
+                    approved = self._validate_approved_implementation(
+                        replace(claim, base_branch="master"),
+                        claim.deployment_source,
+                    )
+                with timeline.span("candidate_materialization"):
+                    candidate_branch, candidate_commit, candidate_path = (
+                        self._materialize_candidate(claim, approved)
+                    )
+                with timeline.span("version_reservation"):
+                    version = self.release_runtime.reserve(
+                        claim=claim,
+                        approved=approved,
+                        candidate_commit=candidate_commit,
+                    )
                 manifest_path = self._manifest_path(claim)
                 manifest = self._load_or_initialize_android_manifest(
                     manifest_path,
@@ -479,7 +486,8 @@ class GitAndroidDeploymentManager(GitBackendDeploymentManager):
                 successful = self._successful_attempt(manifest)
                 request_path = manifest_path.with_suffix(".release-request.json")
                 if successful is not None:
-                    publication = self.release_runtime.verify(request_path)
+                    with timeline.span("publication_verify"):
+                        publication = self.release_runtime.verify(request_path)
                     return self._candidate(
                         approved,
                         candidate_branch=candidate_branch,
@@ -489,39 +497,44 @@ class GitAndroidDeploymentManager(GitBackendDeploymentManager):
                         version=version,
                         validation=successful["validation"],
                         publication=asdict(publication),
+                        stage_timeline=timeline.as_metadata(),
                     )
 
                 attempt = self._begin_attempt(manifest, claim)
+                timeline.attach(attempt)
                 self._write_manifest(manifest_path, manifest)
                 try:
-                    validation, validation_metadata = self._validation_for_attempt(
-                        manifest=manifest,
-                        current_attempt=attempt,
-                        candidate_worktree=candidate_path,
-                        claim=claim,
-                        version=version,
-                    )
+                    with timeline.span("validation"):
+                        validation, validation_metadata = self._validation_for_attempt(
+                            manifest=manifest,
+                            current_attempt=attempt,
+                            candidate_worktree=candidate_path,
+                            claim=claim,
+                            version=version,
+                        )
                     attempt.update(validation_metadata)
                     attempt["stage"] = "validated"
                     attempt["validation"] = asdict(validation)
                     self._write_manifest(manifest_path, manifest)
 
-                    request = self._release_request(
-                        claim=claim,
-                        approved=approved,
-                        candidate_branch=candidate_branch,
-                        candidate_commit=candidate_commit,
-                        candidate_path=candidate_path,
-                        version=version,
-                        validation=validation,
-                        manifest_path=manifest_path,
-                    )
-                    self._write_json(request_path, request)
+                    with timeline.span("release_request"):
+                        request = self._release_request(
+                            claim=claim,
+                            approved=approved,
+                            candidate_branch=candidate_branch,
+                            candidate_commit=candidate_commit,
+                            candidate_path=candidate_path,
+                            version=version,
+                            validation=validation,
+                            manifest_path=manifest_path,
+                        )
+                        self._write_json(request_path, request)
                     attempt["stage"] = "publication_requested"
                     attempt["request_path"] = str(request_path)
                     self._write_manifest(manifest_path, manifest)
 
-                    publication = self.release_runtime.publish(request_path)
+                    with timeline.span("publication"):
+                        publication = self.release_runtime.publish(request_path)
                     attempt["stage"] = "published"
                     attempt["status"] = "succeeded"
                     attempt["finished_at"] = _utc_now()
@@ -536,6 +549,7 @@ class GitAndroidDeploymentManager(GitBackendDeploymentManager):
                         version=version,
                         validation=asdict(validation),
                         publication=asdict(publication),
+                        stage_timeline=timeline.as_metadata(),
                     )
                 except Exception as exc:
                     attempt["status"] = (
@@ -840,6 +854,7 @@ class GitAndroidDeploymentManager(GitBackendDeploymentManager):
         version: AndroidReleaseVersion,
         validation: dict,
         publication: dict,
+        stage_timeline: dict | None = None,
     ) -> AndroidDeploymentCandidate:
         return AndroidDeploymentCandidate(
             approval_id=approved.approval_id,
@@ -855,6 +870,7 @@ class GitAndroidDeploymentManager(GitBackendDeploymentManager):
             version=asdict(version),
             validation=validation,
             publication=publication,
+            stage_timeline=stage_timeline,
         )
 
 
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class InotifyError(OSError):
+    pass
+
+
+@dataclass(frozen=True)
+class InotifyEvent:
+    path: Path
+    mask: int
+    cookie: int
+
+    @property
+    def is_dir(self) -> bool:
+        return bool(self.mask & IN_ISDIR)
+
+    @property
+    def overflowed(self) -> bool:
+        return bool(self.mask & IN_Q_OVERFLOW)
+
+
+def _load_libc():
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    return libc
+
+
+class InotifyWatcher:
+    """
+    Minimal recursive inotify reader built on libc.
+
+    Only the events the caller asks for are delivered. Directories created
+    or moved into a watched tree are watched automatically so downloads that
+    arrive inside new package folders are still seen.
+    """
+
+    def __init__(self, mask: int):
+        self._libc = _load_libc()
+        self._mask = mask | IN_CREATE | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise InotifyError(error, os.strerror(error))
+        self._paths_by_descriptor: dict[int, Path] = {}
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> "InotifyWatcher":
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def add_watch(self, directory: str | Path) -> None:
+        path = Path(directory)
+        descriptor = self._libc.inotify_add_watch(
+            self._fd,
+            os.fsencode(path),
+            self._mask | IN_ONLYDIR,
+        )
+        if descriptor < 0:
+            error = ctypes.get_errno()
+            if error in {errno.ENOENT, errno.ENOTDIR}:
+                return
+            raise InotifyError(error, f"{os.strerror(error)}: {path}")
+        self._paths_by_descriptor[descriptor] = path
+
+    def add_tree(self, root: str | Path) -> None:
+        self.add_watch(root)
+        for directory, subdirectories, _files in os.walk(root):
+            for subdirectory in subdirectories:
+                self.add_watch(Path(directory) / subdirectory)
+
+    def read_events(self, timeout: float | None) -> list[InotifyEvent]:
+        """Wait up to timeout seconds and return every pending event."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        events: list[InotifyEvent] = []
+        while True:
+            try:
+                buffer = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not buffer:
+                break
+            events.extend(self._parse(buffer))
+
+        return events
+
+    def _parse(self, buffer: bytes) -> list[InotifyEvent]:
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            descriptor, mask, cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buffer[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                events.append(InotifyEvent(path=Path("."), mask=mask, cookie=cookie))
+                continue
+
+            directory = self._paths_by_descriptor.get(descriptor)
+            if directory is None:
+                continue
+
+            if mask & IN_IGNORED:
+                self._paths_by_descriptor.pop(descriptor, None)
+                continue
+
+            path = directory / os.fsdecode(raw_name) if raw_name else directory
+
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # Files may already exist in a directory moved into the tree,
+                # so the caller still receives the directory event.
+                self.add_tree(path)
+
+            events.append(InotifyEvent(path=path, mask=mask, cookie=cookie))
+
+        return events
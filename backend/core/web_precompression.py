@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+
+
+# Suffixes worth compressing; images and fonts are already compressed.
+COMPRESSIBLE_SUFFIXES = frozenset(
+    {".css", ".html", ".js", ".json", ".map", ".mjs", ".svg", ".txt", ".webmanifest", ".xml"}
+)
+# Below this size the saved bytes do not cover the extra header and lookup.
+MIN_COMPRESSIBLE_BYTES = 1024
+# Preferred first when a client accepts several encodings.
+ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _brotli_compress(data: bytes) -> bytes | None:
+    try:
+        import brotli
+    except ImportError:
+        # gzip variants are still written; brotli is served when available.
+        return None
+    return brotli.compress(data, quality=11)
+
+
+def compress_variants(data: bytes) -> dict[str, bytes]:
+    """Return the encodings of data that are smaller than data itself."""
+    variants = {}
+    # mtime=0 keeps the output byte-identical across builds.
+    encoded = {"br": _brotli_compress(data), "gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    for encoding, _suffix in ENCODING_SUFFIXES:
+        if encoded[encoding] is not None and len(encoded[encoding]) < len(data):
+            variants[encoding] = encoded[encoding]
+    return variants
+
+
+def precompress_tree(root: Path) -> dict[str, int]:
+    """
+    Write .br and .gz files next to every compressible file under root.
+
+    Variants are deterministic, so reproducible builds stay identical, and a
+    variant is only written when it is smaller than the original.
+    """
+    counts = {"files": 0, "gzip": 0, "br": 0, "bytes_saved": 0}
+    suffixes = {suffix for _encoding, suffix in ENCODING_SUFFIXES}
+    for path in sorted(root.rglob("*")):
+        if (
+            path.is_symlink()
+            or not path.is_file()
+            or path.suffix in suffixes
+            or path.suffix.lower() not in COMPRESSIBLE_SUFFIXES
+        ):
+            continue
+        data = path.read_bytes()
+        if len(data) < MIN_COMPRESSIBLE_BYTES:
+            continue
+        counts["files"] += 1
+        variants = compress_variants(data)
+        for encoding, suffix in ENCODING_SUFFIXES:
+            variant = variants.get(encoding)
+            if variant is None:
+                continue
+            variant_path = path.with_name(path.name + suffix)
+            variant_path.write_bytes(variant)
+            os.chmod(variant_path, 0o644)
+            counts[encoding] += 1
+            counts["bytes_saved"] += len(data) - len(variant)
+    return counts
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import hashlib
+from mimetypes import guess_type
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from backend.core.web_precompression import (
+    COMPRESSIBLE_SUFFIXES,
+    ENCODING_SUFFIXES,
+    MIN_COMPRESSIBLE_BYTES,
+    compress_variants,
+)
+
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Mutable names are always revalidated; the ETag keeps that to a 304.
+REVALIDATE_CACHE_CONTROL = "no-cache"
+# A new deployment reaches open tabs within this long.
+INDEX_MAX_AGE_SECONDS = 60
+INDEX_CACHE_CONTROL = f"public, max-age={INDEX_MAX_AGE_SECONDS}, must-revalidate"
+
+
+def accepted_encodings(accept_encoding: str | None) -> set[str]:
+    """Return the content codings a client accepts with a non-zero q-value."""
+    accepted = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _separator, parameters = item.strip().partition(";")
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            name, _separator, value = parameter.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _negotiate(accepted: set[str], available) -> str | None:
+    for encoding, _suffix in ENCODING_SUFFIXES:
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves the .br/.gz variants written at build time.
+
+    A variant is used only when the client accepts it and it is at least as
+    new as the original, so a hand-copied file never serves stale bytes.
+    Mounts with immutable=True must only contain fingerprinted names, as
+    Vite's assets directory does; everything else is revalidated each time.
+    """
+
+    def __init__(self, *args, immutable: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+
+    def _variant(self, full_path: str, stat_result: os.stat_result, scope: Scope):
+        accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding"))
+        if not accepted:
+            return None
+        for encoding, suffix in ENCODING_SUFFIXES:
+            if encoding not in accepted and "*" not in accepted:
+                continue
+            try:
+                variant_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            if variant_stat.st_mtime >= stat_result.st_mtime:
+                return encoding, full_path + suffix, variant_stat
+        return None
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = os.fspath(full_path)
+        headers = {"Cache-Control": self.cache_control}
+        variant = self._variant(full_path, stat_result, scope)
+        if variant is None:
+            response = FileResponse(
+                full_path,
+                status_code=status_code,
+                headers=headers,
+                stat_result=stat_result,
+            )
+        else:
+            encoding, variant_path, variant_stat = variant
+            response = FileResponse(
+                variant_path,
+                status_code=status_code,
+                headers={**headers, "Content-Encoding": encoding},
+                # The type comes from the original name, not .br or .gz.
+                media_type=guess_type(full_path)[0] or "text/plain",
+                stat_result=variant_stat,
+            )
+        if Path(full_path).suffix.lower() in COMPRESSIBLE_SUFFIXES:
+            response.headers["Vary"] = "Accept-Encoding"
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+@dataclass(frozen=True)
+class _IndexSnapshot:
+    key: tuple[int, int, int]
+    bodies: dict[str | None, bytes]
+    etag: str
+
+
+class WebIndex:
+    """
+    Serve the SPA index.html from memory.
+
+    The file is re-read only when its mtime, size, or inode changes, which
+    covers deployments that replace it in place or swap the dist directory.
+    Encoded copies are built once per load, and each coding has its own
+    ETag so a conditional request is answered without sending the body.
+    """
+
+    def __init__(self, dist_dir: Path):
+        self.path = Path(dist_dir) / "index.html"
+        self._snapshot: _IndexSnapshot | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> _IndexSnapshot | None:
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            return None
+        key = (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.key == key:
+            return snapshot
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.key == key:
+                return self._snapshot
+            try:
+                data = self.path.read_bytes()
+            except OSError:
+                return None
+            bodies: dict[str | None, bytes] = {None: data}
+            if len(data) >= MIN_COMPRESSIBLE_BYTES:
+                bodies.update(compress_variants(data))
+            snapshot = _IndexSnapshot(
+                key=key,
+                bodies=bodies,
+                etag=hashlib.sha256(data).hexdigest()[:20],
+            )
+            self._snapshot = snapshot
+            return snapshot
+
+    def response(self, request_headers: Headers | dict | None = None) -> Response:
+        snapshot = self._load()
+        if snapshot is None:
+            return Response("Web bundle is not installed", status_code=404, media_type="text/plain")
+        request_headers = Headers(headers=dict(request_headers or {}))
+        encoding = _negotiate(accepted_encodings(request_headers.get("accept-encoding")), snapshot.bodies)
+        etag = f'"{snapshot.etag}-{encoding}"' if encoding else f'"{snapshot.etag}"'
+        headers = {
+            "Cache-Control": INDEX_CACHE_CONTROL,
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if etag in tags or "*" in tags:
+                return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(snapshot.bodies[encoding], media_type="text/html", headers=headers)
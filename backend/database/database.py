@@ -1,5 +1,8 @@
+from functools import lru_cache
 from pathlib import Path
+import threading
 
+import psycopg2
 from psycopg2 import pool
 
 from backend.config import load_config, resolve_database_config_path
@@ -7,25 +10,59 @@ from backend.config import load_config, resolve_database_config_path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_DATABASE_CONFIG = PROJECT_ROOT / "config" / "config.ini"
-database_config_path = resolve_database_config_path(DEFAULT_DATABASE_CONFIG)
-config = load_config(str(database_config_path))["Database"]
 
-db_pool = pool.ThreadedConnectionPool(
-    minconn=1,
-    maxconn=5,
-    user=config["user"],
-    password=config["password"],
-    host=config["host"],
-    port=config["port"],
-    database=config["database"],
-)
+# Created by the API lifespan, or on first use by workers and scripts, so
+# importing a module that talks to the database never opens a connection.
+db_pool = None
+_db_pool_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def database_config() -> dict:
+    return load_config(str(resolve_database_config_path(DEFAULT_DATABASE_CONFIG)))["Database"]
+
+
+def _connection_parameters() -> dict:
+    config = database_config()
+    return {
+        "user": config["user"],
+        "password": config["password"],
+        "host": config["host"],
+        "port": config["port"],
+        "database": config["database"],
+    }
+
+
+def init_db_pool():
+    """Create the shared connection pool if it does not exist yet."""
+    global db_pool
+    with _db_pool_lock:
+        if db_pool is None:
+            db_pool = pool.ThreadedConnectionPool(
+                minconn=1,
+                maxconn=5,
+                **_connection_parameters(),
+            )
+        return db_pool
+
+
+def close_db_pool():
+    global db_pool
+    with _db_pool_lock:
+        if db_pool is not None:
+            db_pool.closeall()
+            db_pool = None
 
 
 def get_db_conn():
-    if db_pool:
-        return db_pool.getconn()
+    return (db_pool or init_db_pool()).getconn()
 
 
 def put_db_conn(conn):
     if db_pool:
         db_pool.putconn(conn)
+
+
+def open_db_conn():
+    """Open a connection outside the pool for long-lived sessions such as LISTEN."""
+    return psycopg2.connect(**_connection_parameters())
@@ -0,0 +1,3 @@
+DROP INDEX finance_valuation_cache_provider_fetched_idx;
+
+DROP TABLE public.finance_valuation_cache;
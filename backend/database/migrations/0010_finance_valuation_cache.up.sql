@@ -0,0 +1,25 @@
+CREATE TABLE public.finance_valuation_cache (
+    valuation_key text PRIMARY KEY,
+    provider text NOT NULL,
+    label text NOT NULL,
+    asset_category text NOT NULL,
+    value numeric(14, 2) NOT NULL,
+    confidence text NOT NULL,
+    raw_payload jsonb NOT NULL DEFAULT '{}'::jsonb,
+    fetched_at timestamp with time zone NOT NULL,
+    last_attempt_at timestamp with time zone NOT NULL,
+    last_error text,
+    created_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT finance_valuation_cache_key_check
+        CHECK (char_length(btrim(valuation_key)) BETWEEN 1 AND 120),
+    CONSTRAINT finance_valuation_cache_provider_check
+        CHECK (provider IN ('zillow', 'kbb')),
+    CONSTRAINT finance_valuation_cache_payload_check
+        CHECK (jsonb_typeof(raw_payload) = 'object'),
+    CONSTRAINT finance_valuation_cache_attempt_check
+        CHECK (last_attempt_at >= fetched_at)
+);
+
+CREATE INDEX finance_valuation_cache_provider_fetched_idx
+    ON public.finance_valuation_cache (provider, fetched_at);
@@ -0,0 +1,7 @@
+DROP INDEX media_conversion_jobs_status_updated_idx;
+
+DROP INDEX media_conversion_jobs_queue_idx;
+
+DROP INDEX media_conversion_jobs_active_source_uidx;
+
+DROP TABLE public.media_conversion_jobs;
@@ -0,0 +1,63 @@
+CREATE TABLE public.media_conversion_jobs (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    source_path text NOT NULL,
+    target_path text NOT NULL,
+    status text NOT NULL DEFAULT 'queued',
+    delete_source boolean NOT NULL DEFAULT false,
+    overwrite boolean NOT NULL DEFAULT false,
+    worker_id text,
+    lease_expires_at timestamp with time zone,
+    attempt_count integer NOT NULL DEFAULT 0,
+    duration_seconds numeric(12, 3),
+    out_time_seconds numeric(12, 3),
+    progress_percent numeric(5, 2),
+    speed numeric(8, 3),
+    eta_seconds integer,
+    elapsed_seconds numeric(12, 2),
+    message text,
+    created_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at timestamp with time zone,
+    finished_at timestamp with time zone,
+    updated_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT media_conversion_jobs_status_check
+        CHECK (
+            status IN (
+                'queued',
+                'running',
+                'converted',
+                'skipped',
+                'skipped_existing',
+                'failed'
+            )
+        ),
+    CONSTRAINT media_conversion_jobs_source_path_check
+        CHECK (char_length(source_path) BETWEEN 1 AND 4096),
+    CONSTRAINT media_conversion_jobs_attempt_count_check
+        CHECK (attempt_count >= 0),
+    CONSTRAINT media_conversion_jobs_progress_check
+        CHECK (progress_percent IS NULL OR progress_percent BETWEEN 0 AND 100),
+    CONSTRAINT media_conversion_jobs_lease_state_check
+        CHECK (
+            (
+                status = 'running'
+                AND worker_id IS NOT NULL
+                AND lease_expires_at IS NOT NULL
+            )
+            OR
+            (
+                status <> 'running'
+                AND lease_expires_at IS NULL
+            )
+        )
+);
+
+CREATE UNIQUE INDEX media_conversion_jobs_active_source_uidx
+    ON public.media_conversion_jobs (source_path)
+    WHERE status IN ('queued', 'running');
+
+CREATE INDEX media_conversion_jobs_queue_idx
+    ON public.media_conversion_jobs (created_at, id)
+    WHERE status = 'queued';
+
+CREATE INDEX media_conversion_jobs_status_updated_idx
+    ON public.media_conversion_jobs (status, updated_at DESC);
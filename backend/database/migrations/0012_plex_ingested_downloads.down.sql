@@ -0,0 +1,5 @@
+DROP INDEX plex_ingested_downloads_processed_idx;
+
+DROP INDEX plex_ingested_downloads_source_uidx;
+
+DROP TABLE public.plex_ingested_downloads;
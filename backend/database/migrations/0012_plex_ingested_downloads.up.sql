@@ -0,0 +1,23 @@
+CREATE TABLE public.plex_ingested_downloads (
+    id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+    library text NOT NULL,
+    source_path text NOT NULL,
+    source_size bigint NOT NULL,
+    source_mtime_ns bigint NOT NULL,
+    destination_path text,
+    status text NOT NULL,
+    message text,
+    processed_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT plex_ingested_downloads_library_check
+        CHECK (library IN ('TV', 'Movies')),
+    CONSTRAINT plex_ingested_downloads_status_check
+        CHECK (status IN ('moved', 'quarantined', 'skipped', 'failed')),
+    CONSTRAINT plex_ingested_downloads_size_check
+        CHECK (source_size >= 0)
+);
+
+CREATE UNIQUE INDEX plex_ingested_downloads_source_uidx
+    ON public.plex_ingested_downloads (source_path, source_size, source_mtime_ns);
+
+CREATE INDEX plex_ingested_downloads_processed_idx
+    ON public.plex_ingested_downloads (processed_at DESC);
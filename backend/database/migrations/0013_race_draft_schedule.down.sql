@@ -0,0 +1,3 @@
+DROP INDEX indy_pool_draft_schedule_participant_idx;
+
+DROP TABLE public.indy_pool_draft_schedule;
@@ -0,0 +1,12 @@
+CREATE TABLE public.indy_pool_draft_schedule (
+    pool_id integer NOT NULL,
+    pick_number integer NOT NULL,
+    participant_name text NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (pool_id, pick_number),
+    CONSTRAINT indy_pool_draft_schedule_pick_number_check
+        CHECK (pick_number >= 1)
+);
+
+CREATE INDEX indy_pool_draft_schedule_participant_idx
+    ON public.indy_pool_draft_schedule (pool_id, participant_name, pick_number);
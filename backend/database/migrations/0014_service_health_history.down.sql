@@ -0,0 +1,7 @@
+DROP TABLE public.service_health_checkpoints;
+
+DROP INDEX service_health_transitions_observed_idx;
+
+DROP INDEX service_health_transitions_component_observed_idx;
+
+DROP TABLE public.service_health_transitions;
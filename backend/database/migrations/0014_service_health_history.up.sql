@@ -0,0 +1,34 @@
+CREATE TABLE public.service_health_transitions (
+    id bigserial PRIMARY KEY,
+    component_id text NOT NULL,
+    observed_at timestamp with time zone NOT NULL,
+    status text NOT NULL,
+    previous_status text,
+    message text NOT NULL,
+    required boolean NOT NULL DEFAULT true,
+    created_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT service_health_transitions_status_check
+        CHECK (status IN ('healthy', 'degraded', 'unhealthy', 'idle', 'unknown')),
+    CONSTRAINT service_health_transitions_previous_status_check
+        CHECK (
+            previous_status IS NULL
+            OR previous_status IN ('healthy', 'degraded', 'unhealthy', 'idle', 'unknown')
+        )
+);
+
+CREATE INDEX service_health_transitions_component_observed_idx
+    ON public.service_health_transitions (component_id, observed_at DESC);
+
+CREATE INDEX service_health_transitions_observed_idx
+    ON public.service_health_transitions (observed_at);
+
+CREATE TABLE public.service_health_checkpoints (
+    checked_at timestamp with time zone PRIMARY KEY,
+    overall text NOT NULL,
+    statuses jsonb NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT service_health_checkpoints_overall_check
+        CHECK (overall IN ('healthy', 'degraded', 'unhealthy', 'idle', 'unknown')),
+    CONSTRAINT service_health_checkpoints_statuses_check
+        CHECK (jsonb_typeof(statuses) = 'object')
+);
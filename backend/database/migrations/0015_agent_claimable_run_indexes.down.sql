@@ -0,0 +1,5 @@
+DROP INDEX agent.agent_events_deployment_binding_idx;
+
+DROP INDEX agent.agent_runs_lease_expiry_idx;
+
+DROP INDEX agent.agent_runs_claimable_phase_idx;
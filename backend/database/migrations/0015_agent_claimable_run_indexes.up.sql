@@ -0,0 +1,11 @@
+CREATE INDEX agent_runs_claimable_phase_idx
+    ON agent.runs (phase, available_at)
+    WHERE status IN ('queued', 'blocked');
+
+CREATE INDEX agent_runs_lease_expiry_idx
+    ON agent.runs (phase, lease_expires_at)
+    WHERE status IN ('claimed', 'running');
+
+CREATE INDEX agent_events_deployment_binding_idx
+    ON agent.events (card_id, created_at DESC, id DESC)
+    WHERE event_type IN ('card.deployment_approved', 'card.deployment_retry_bound');
@@ -0,0 +1 @@
+DROP TABLE agent.card_board;
@@ -0,0 +1,14 @@
+CREATE TABLE agent.card_board (
+    card_id uuid PRIMARY KEY,
+    card jsonb NOT NULL,
+    latest_run jsonb,
+    card_status text NOT NULL,
+    board_updated_at timestamp with time zone NOT NULL,
+    CONSTRAINT agent_card_board_card_id_fkey
+        FOREIGN KEY (card_id)
+        REFERENCES agent.cards(id)
+        ON DELETE CASCADE
+);
+
+CREATE INDEX agent_card_board_updated_idx
+    ON agent.card_board (board_updated_at, card_id);
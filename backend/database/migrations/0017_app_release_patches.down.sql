@@ -0,0 +1,3 @@
+DROP INDEX app_release_patch_pair_uidx;
+
+DROP TABLE public.app_release_patch;
@@ -0,0 +1,34 @@
+CREATE TABLE public.app_release_patch (
+    id serial PRIMARY KEY,
+    release_id integer NOT NULL
+        REFERENCES public.app_release(id) ON DELETE CASCADE,
+    from_release_id integer NOT NULL
+        REFERENCES public.app_release(id) ON DELETE CASCADE,
+    patch_format text NOT NULL,
+    outcome text NOT NULL DEFAULT 'published',
+    patch_filename text,
+    patch_relative_path text,
+    patch_sha256 text,
+    patch_size_bytes bigint NOT NULL,
+    created_at timestamp with time zone NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT app_release_patch_format_check
+        CHECK (patch_format IN ('bsdiff4')),
+    CONSTRAINT app_release_patch_outcome_check
+        CHECK (outcome IN ('published', 'not_worth_it')),
+    CONSTRAINT app_release_patch_published_file_check
+        CHECK (
+            outcome <> 'published'
+            OR (
+                patch_filename IS NOT NULL
+                AND patch_relative_path IS NOT NULL
+                AND patch_sha256 IS NOT NULL
+            )
+        ),
+    CONSTRAINT app_release_patch_size_check
+        CHECK (patch_size_bytes > 0),
+    CONSTRAINT app_release_patch_distinct_check
+        CHECK (release_id <> from_release_id)
+);
+
+CREATE UNIQUE INDEX app_release_patch_pair_uidx
+    ON public.app_release_patch (release_id, from_release_id, patch_format);
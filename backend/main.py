@@ -2,12 +2,13 @@
 import asyncio
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
+import importlib
 import logging
 from pathlib import Path
 import threading
 
 # 3rd Party Imports
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
@@ -17,7 +18,8 @@ from starlette.staticfiles import StaticFiles
 from backend.services.race import race_service
 from backend.config import resolve_environment_file_path
 from backend.core.auth import AuthMode, get_auth_mode, get_current_principal
-from backend.database.database import get_db_conn, put_db_conn
+from backend.core.web_static import PrecompressedStaticFiles, WebIndex
+from backend.database.database import close_db_pool, get_db_conn, init_db_pool, put_db_conn
 from backend.routers import (
         agent,
         app_update,
@@ -40,19 +42,6 @@ from backend.routers import (
         mead,
         spotify,
     )
-from backend.tasks import (
-        swimming_pool_monitor,
-        plex_dl_monitor,
-        notification_worker,
-        fitness_notification_worker,
-        field_status_watcher,
-        # jury_watch,
-        speed_test_worker,
-        weather_monitor,
-        finance_worker,
-        kids_investing_worker,
-        mead_task_worker,
-    )
 
 TEST_MODE = False
 logger = logging.getLogger("remihub.main")
@@ -62,12 +51,36 @@ BASE_DIR = Path(__file__).resolve().parent.parent  # /opt/remihub
 STATIC_DIR = BASE_DIR / 'backend' / 'static'
 WEB_DIST_DIR = BASE_DIR / 'frontend-web' / 'dist'
 WEB_ASSETS_DIR = WEB_DIST_DIR / 'assets'
+WEB_INDEX = WebIndex(WEB_DIST_DIR)
 
 # Load environment variables
 _ENV_PATH = resolve_environment_file_path()
 
 load_dotenv(dotenv_path=_ENV_PATH, override=False)
 
+# Background workers are imported when they start rather than with the app,
+# so tests and tools that import the app skip their dependencies.
+BACKGROUND_WORKERS = (
+    "backend.tasks.notification_worker:run_notification_worker",
+    "backend.tasks.fitness_notification_worker:run_fitness_notification_worker",
+    "backend.tasks.swimming_pool_monitor:run_pool_monitor",
+    "backend.tasks.plex_dl_monitor:main",
+    "backend.tasks.field_status_watcher:run_monitor",
+    # "backend.tasks.jury_watch:run_monitor",
+    "backend.tasks.speed_test_worker:run_monitor",
+    "backend.tasks.weather_monitor:run_weather_monitor",
+    "backend.tasks.finance_worker:run_finance_worker",
+    "backend.tasks.finance_worker:run_finance_valuation_worker",
+    "backend.tasks.kids_investing_worker:run_kids_investing_worker",
+    "backend.tasks.mead_task_worker:run_mead_task_worker",
+    "backend.tasks.media_conversion_worker:run_media_conversion_worker",
+)
+
+
+def load_background_worker(target: str):
+    module_name, _, function_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
 # Define the lifespan of the app
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -78,31 +91,21 @@ async def lifespan(app: FastAPI):
             "API authentication is in transition mode; requests without credentials are still permitted"
         )
 
+    # The pool is opened here rather than on import so importing the app
+    # never needs a database.
+    init_db_pool()
+
     # Start background tasks
     if not TEST_MODE:
         # 1 - Kick off our Race Day family pool monitor
         asyncio.create_task(race_service.update_leaderboard_loop())
 
-        threads = [
-            notification_worker.run_notification_worker,
-            fitness_notification_worker.run_fitness_notification_worker,
-            swimming_pool_monitor.run_pool_monitor,
-            plex_dl_monitor.main,
-            field_status_watcher.run_monitor,
-            # jury_watch.run_monitor,
-            speed_test_worker.run_monitor,
-            weather_monitor.run_weather_monitor,
-            finance_worker.run_finance_worker,
-            kids_investing_worker.run_kids_investing_worker,
-            mead_task_worker.run_mead_task_worker,
-        ]
-
         # 0 - Kick off the Threads
-        for thread in threads:
-            threading.Thread(target=thread, daemon=True).start()
+        for target in BACKGROUND_WORKERS:
+            threading.Thread(target=load_background_worker(target), daemon=True).start()
 
     yield
-    # (Optional) Cleanup tasks go here
+    close_db_pool()
 
 # Create the API and add the routers
 app = FastAPI(lifespan=lifespan)
@@ -169,50 +172,52 @@ app.mount(
     name='static',
 )
 
+# Vite fingerprints every file under assets/, so browsers may keep them
+# forever; the build also ships .br/.gz copies that are served as-is.
 app.mount(
     '/assets',
-    StaticFiles(directory=str(WEB_ASSETS_DIR), check_dir=False),
+    PrecompressedStaticFiles(directory=str(WEB_ASSETS_DIR), check_dir=False, immutable=True),
     name='web-assets',
 )
 
 
-def serve_web_index():
-    return FileResponse(WEB_DIST_DIR / "index.html")
+def serve_web_index(request: Request):
+    return WEB_INDEX.response(request.headers)
 
 
 # Serve React pages for public Race and private portal routes.
 @app.get("/", include_in_schema=False)
-async def serve_portal_root():
-    return serve_web_index()
+async def serve_portal_root(request: Request):
+    return serve_web_index(request)
 
 
 @app.get("/race/draft", include_in_schema=False)
 @app.get("/race/draft/{full_path:path}", include_in_schema=False)
-async def serve_race_draft(full_path: str = ""):
-    return serve_web_index()
+async def serve_race_draft(request: Request, full_path: str = ""):
+    return serve_web_index(request)
 
 @app.get("/storage", include_in_schema=False)
 @app.get("/storage/{full_path:path}", include_in_schema=False)
-async def serve_storage_status(full_path: str = ""):
-    return serve_web_index()
+async def serve_storage_status(request: Request, full_path: str = ""):
+    return serve_web_index(request)
 
 
 @app.get("/agent", include_in_schema=False)
 @app.get("/agent/{full_path:path}", include_in_schema=False)
-async def serve_agent_portal(full_path: str = ""):
-    return serve_web_index()
+async def serve_agent_portal(request: Request, full_path: str = ""):
+    return serve_web_index(request)
 
 
 @app.get("/health", include_in_schema=False)
 @app.get("/health/{full_path:path}", include_in_schema=False)
-async def serve_health_portal(full_path: str = ""):
-    return serve_web_index()
+async def serve_health_portal(request: Request, full_path: str = ""):
+    return serve_web_index(request)
 
 
 @app.get("/portal", include_in_schema=False)
 @app.get("/portal/{full_path:path}", include_in_schema=False)
-async def serve_portal(full_path: str = ""):
-    return serve_web_index()
+async def serve_portal(request: Request, full_path: str = ""):
+    return serve_web_index(request)
 
 
 @app.get("/favicon.png", include_in_schema=False)
@@ -221,7 +226,7 @@ async def web_favicon():
 
 app.mount(
     '/race',
-    StaticFiles(directory=str(WEB_DIST_DIR), html=True, check_dir=False),
+    PrecompressedStaticFiles(directory=str(WEB_DIST_DIR), html=True, check_dir=False),
     name='race',
 )
 
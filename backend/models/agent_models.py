@@ -161,3 +161,14 @@ class AgentCardResponse(BaseModel):
 class AgentCardListResponse(BaseModel):
     success: Literal[True] = True
     data: list[AgentCardSummary]
+
+
+class AgentBoardPage(BaseModel):
+    cards: list[AgentCardSummary]
+    next_cursor: str | None = None
+    next_updated_since: datetime
+
+
+class AgentBoardResponse(BaseModel):
+    success: Literal[True] = True
+    data: AgentBoardPage
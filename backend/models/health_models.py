@@ -74,6 +74,7 @@ class HealthComponent(BaseModel):
     systemd: HealthSystemdMetadata | None = None
     dependencies: list[HealthDependencyCheck] = Field(default_factory=list)
     checked_at: datetime
+    evaluation_ms: float | None = None
 
 
 class ServiceHealthSnapshotResponse(BaseModel):
@@ -81,3 +82,38 @@ class ServiceHealthSnapshotResponse(BaseModel):
     checked_at: datetime
     overall: HealthStatus
     components: list[HealthComponent]
+    collection_ms: float | None = None
+
+
+class HealthTransition(BaseModel):
+    component_id: str
+    observed_at: datetime
+    status: HealthStatus
+    previous_status: HealthStatus | None = None
+    message: str
+    required: bool = True
+
+
+class HealthTransitionTimelineResponse(BaseModel):
+    success: Literal[True] = True
+    component_id: str
+    since: datetime
+    transitions: list[HealthTransition]
+
+
+class HealthUptimeSummary(BaseModel):
+    component_id: str
+    window_start: datetime
+    window_end: datetime
+    observed_seconds: float
+    up_seconds: float
+    uptime_ratio: float | None = None
+    seconds_by_status: dict[HealthStatus, float] = Field(default_factory=dict)
+    transition_count: int = 0
+    recovery_count: int = 0
+    mean_time_to_recovery_seconds: float | None = None
+
+
+class HealthUptimeResponse(BaseModel):
+    success: Literal[True] = True
+    data: HealthUptimeSummary
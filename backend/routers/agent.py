@@ -1,9 +1,13 @@
+import asyncio
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 
 from backend.core.auth import AuthenticatedPrincipal, require_admin_principal
 from backend.models.agent_models import (
+    AgentBoardResponse,
     AgentCardCreate,
     AgentCardListResponse,
     AgentCardResponse,
@@ -12,7 +16,7 @@ from backend.models.agent_models import (
     AgentGitHubSyncRetryRequest,
     AgentMessageCreate,
 )
-from backend.services import agent_service
+from backend.services import agent_event_stream, agent_service
 
 
 AUTH_ERROR_RESPONSES = {
@@ -101,6 +105,34 @@ def list_cards(
     return {"success": True, "data": cards}
 
 
+@router.get(
+    "/board",
+    response_model=AgentBoardResponse,
+    responses={
+        **AUTH_ERROR_RESPONSES,
+        status.HTTP_400_BAD_REQUEST: {"model": AgentErrorResponse},
+    },
+)
+def list_board(
+    limit: int = agent_service.BOARD_PAGE_LIMIT,
+    cursor: str | None = None,
+    updated_since: datetime | None = None,
+    include_closed: bool = False,
+    _principal: AuthenticatedPrincipal = Depends(require_admin_principal),
+):
+    try:
+        board = agent_service.list_board(
+            limit=limit,
+            cursor=cursor,
+            updated_since=updated_since,
+            include_closed=include_closed,
+        )
+    except Exception as exc:
+        _raise_http_error(exc)
+
+    return {"success": True, "data": board}
+
+
 @router.get(
     "/cards/{card_id}",
     response_model=AgentCardResponse,
@@ -121,6 +153,38 @@ def get_card(
     return {"success": True, "data": card}
 
 
+# Server-sent events: card_event (resumable via Last-Event-ID), run_heartbeat, resync
+@router.get(
+    "/cards/{card_id}/events/stream",
+    response_class=StreamingResponse,
+    responses={
+        **AUTH_ERROR_RESPONSES,
+        status.HTTP_404_NOT_FOUND: {"model": AgentErrorResponse},
+    },
+)
+async def stream_card_events(
+    card_id: UUID,
+    http_request: Request,
+    last_event_id: str | None = Header(default=None),
+    _principal: AuthenticatedPrincipal = Depends(require_admin_principal),
+):
+    if not await asyncio.to_thread(agent_service.card_exists, str(card_id)):
+        _raise_http_error(agent_service.AgentCardNotFoundError(f"Agent card not found: {card_id}"))
+
+    return StreamingResponse(
+        agent_event_stream.stream_card_events(
+            str(card_id),
+            last_event_id,
+            http_request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post(
     "/cards/{card_id}/messages",
     response_model=AgentCardResponse,
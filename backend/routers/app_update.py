@@ -1,5 +1,6 @@
 # Python Imports
 import logging
+from pathlib import Path
 
 # 3rd Party Imports
 from fastapi.responses import FileResponse
@@ -9,6 +10,8 @@ from fastapi import APIRouter, HTTPException, Query
 from backend.services.app_update_service import (
     get_app_release_by_id,
     get_latest_app_release,
+    get_release_patch,
+    get_release_patch_by_id,
     resolve_release_file_path,
 )
 
@@ -19,7 +22,10 @@ router = APIRouter(
 )
 
 @router.get("/latest")
-def latest_app_update(platform: str = Query(...)):
+def latest_app_update(
+    platform: str = Query(...),
+    current_version_code: int | None = Query(None, ge=1),
+):
     release = get_latest_app_release(platform=platform)
 
     if not release:
@@ -28,11 +34,19 @@ def latest_app_update(platform: str = Query(...)):
             detail=f"No active app release found for platform={platform}",
         )
 
+    # Older clients omit current_version_code and keep using download_url.
+    patch = None
+    if current_version_code is not None and current_version_code < release["version_code"]:
+        patch = get_release_patch(release["id"], current_version_code)
+        if patch:
+            patch["download_url"] = f"/app-update/patch/{patch['id']}"
+
     package = {
         "success": True,
         "data": {
             **release,
             "download_url": f"/app-update/download/{release['id']}",
+            "patch": patch,
         },
     }
 
@@ -41,6 +55,40 @@ def latest_app_update(platform: str = Query(...)):
     return package
 
 
+def _published_file_response(
+    file_path: Path,
+    *,
+    filename: str,
+    sha256: str,
+    size_bytes: int,
+    media_type: str,
+) -> FileResponse:
+    try:
+        size_on_disk = file_path.stat().st_size
+    except OSError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Release file not found on disk: {filename}",
+        )
+    if size_on_disk != size_bytes:
+        # Never label a file that is mid-copy or replaced with the
+        # published hash.
+        raise HTTPException(
+            status_code=409,
+            detail=f"Release file does not match the published release: {filename}",
+        )
+
+    # FileResponse answers Range and If-Range requests, so interrupted
+    # downloads resume. The content hash as ETag keeps If-Range valid when a
+    # file is copied or restored with a new mtime.
+    return FileResponse(
+        path=str(file_path),
+        filename=filename,
+        media_type=media_type,
+        headers={"ETag": f'"{sha256}"'},
+    )
+
+
 @router.get("/download/{release_id}")
 def download_app_release(release_id: int):
     release = get_app_release_by_id(release_id)
@@ -51,16 +99,29 @@ def download_app_release(release_id: int):
             detail=f"Release id={release_id} not found",
         )
 
-    file_path = resolve_release_file_path(release["apk_relative_path"])
+    return _published_file_response(
+        resolve_release_file_path(release["apk_relative_path"]),
+        filename=release["apk_filename"],
+        sha256=release["apk_sha256"],
+        size_bytes=release["file_size_bytes"],
+        media_type="application/vnd.android.package-archive",
+    )
+
 
-    if not file_path.exists():
+@router.get("/patch/{patch_id}")
+def download_app_release_patch(patch_id: int):
+    patch = get_release_patch_by_id(patch_id)
+
+    if not patch:
         raise HTTPException(
             status_code=404,
-            detail=f"Release file not found on disk: {release['apk_filename']}",
+            detail=f"Release patch id={patch_id} not found",
         )
 
-    return FileResponse(
-        path=str(file_path),
-        filename=release["apk_filename"],
-        media_type="application/vnd.android.package-archive",
+    return _published_file_response(
+        resolve_release_file_path(patch["patch_relative_path"]),
+        filename=patch["patch_filename"],
+        sha256=patch["patch_sha256"],
+        size_bytes=patch["patch_size_bytes"],
+        media_type="application/octet-stream",
     )
@@ -1,7 +1,7 @@
 # Python Imports
 
 # 3rd Party Imports
-from fastapi import APIRouter, File, UploadFile
+from fastapi import APIRouter, File, Header, Query, UploadFile
 
 # Local Imports
 from backend.services import autograph_service
@@ -18,8 +18,16 @@ async def upload_autograph_image(file: UploadFile = File(...)):
 
 
 @router.get("/image/{filename}")
-def get_autograph_image(filename: str):
-    return autograph_service.get_autograph_image(filename)
+def get_autograph_image(
+    filename: str,
+    size: str = Query(default="original", pattern="^(original|medium|thumb)$"),
+    if_none_match: str | None = Header(default=None),
+):
+    return autograph_service.get_autograph_image(
+        filename,
+        size=size,
+        if_none_match=if_none_match,
+    )
 
 @router.post("/add")
 def add_autograph(entry: AutographCreate):
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from backend.core.auth import require_admin_principal
 from backend.models.agent_models import AgentErrorResponse
-from backend.models.health_models import ServiceHealthSnapshotResponse
-from backend.services import service_health_service
+from backend.models.health_models import (
+    HealthTransitionTimelineResponse,
+    HealthUptimeResponse,
+    ServiceHealthSnapshotResponse,
+)
+from backend.services import service_health_history, service_health_service
 
 
 AUTH_ERROR_RESPONSES = {
@@ -27,3 +33,50 @@ router = APIRouter(
 )
 def get_service_health_snapshot():
     return service_health_service.get_service_health_snapshot()
+
+
+@router.get(
+    "/services/{component_id}/transitions",
+    response_model=HealthTransitionTimelineResponse,
+    responses=AUTH_ERROR_RESPONSES,
+)
+def get_component_transitions(
+    component_id: str,
+    since: datetime | None = None,
+    limit: int = Query(200, ge=1, le=service_health_history.MAX_TIMELINE_LIMIT),
+):
+    since = since or datetime.now(timezone.utc) - service_health_history.DEFAULT_TIMELINE_WINDOW
+    transitions = service_health_history.list_component_transitions(
+        component_id,
+        since=since,
+        limit=limit,
+    )
+    return {
+        "success": True,
+        "component_id": component_id,
+        "since": since,
+        "transitions": transitions,
+    }
+
+
+@router.get(
+    "/services/{component_id}/uptime",
+    response_model=HealthUptimeResponse,
+    responses={
+        **AUTH_ERROR_RESPONSES,
+        status.HTTP_404_NOT_FOUND: {"model": AgentErrorResponse},
+    },
+)
+def get_component_uptime(
+    component_id: str,
+    days: int = Query(7, ge=1, le=service_health_history.MAX_UPTIME_WINDOW_DAYS),
+):
+    try:
+        summary = service_health_history.get_component_uptime(component_id, days=days)
+    except service_health_history.HealthComponentHistoryNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(exc),
+        ) from exc
+
+    return {"success": True, "data": summary}
@@ -1,11 +1,12 @@
 # Python Imports
+from uuid import UUID
 
 # 3rd Party Imports
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import JSONResponse
 
 # Local Imports
-from backend.services import plex_service
+from backend.services import media_conversion_service, plex_service
 
 router = APIRouter(prefix="/plex", tags=["Plex"])
 
@@ -37,3 +38,30 @@ def getRecentRequests():
             media_type="application/json"
         )
 
+
+@router.post("/conversions")
+def enqueue_conversions(req: media_conversion_service.MediaConversionEnqueueRequest):
+    try:
+        sources = media_conversion_service.collect_conversion_sources(req)
+    except media_conversion_service.MediaConversionPathError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return media_conversion_service.enqueue_conversion_jobs(
+        sources,
+        delete_source=req.delete_source,
+        overwrite=req.overwrite,
+    )
+
+
+@router.get("/conversions")
+def list_conversions(status: str | None = None, limit: int = 100):
+    return media_conversion_service.list_conversion_jobs(status=status, limit=limit)
+
+
+@router.get("/conversions/{job_id}")
+def get_conversion(job_id: UUID):
+    job = media_conversion_service.get_conversion_job(str(job_id))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Conversion job not found")
+
+    return {"success": True, "data": job}
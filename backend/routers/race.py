@@ -1,7 +1,8 @@
 # Python Imports
 
 # 3rd Party Imports
-from fastapi import APIRouter, Body, Depends, Query
+from fastapi import APIRouter, Body, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
 
 # Local Imports
 from backend.core.auth import AuthenticatedPrincipal, require_admin_principal
@@ -18,7 +19,11 @@ PUBLIC_RACE_API_ROUTES = frozenset(
         ("GET", "/race/getCurrentPick"),
         ("GET", "/race/getRecentPicks"),
         ("GET", "/race/getDraftStatus"),
+        ("GET", "/race/getDraftState"),
+        ("GET", "/race/getPicksUntilTurn"),
+        ("GET", "/race/draftEvents"),
         ("GET", "/race/getLeaderboard"),
+        ("GET", "/race/getLeaderboardRefreshStatus"),
         ("GET", "/race/getStartingGridStatus"),
         ("GET", "/race/getArchives"),
         ("GET", "/race/getArchiveEntries"),
@@ -111,6 +116,31 @@ def get_recent_picks(pool_id: int = Query(...), limit: int = Query(5)):
 @router.get("/getDraftStatus")
 def draft_status(pool_id: int):
     return race_service.get_draft_status(pool_id)
+
+@router.get("/getPicksUntilTurn")
+def picks_until_turn(pool_id: int = Query(...), participant: str = Query(...)):
+    return race_service.get_picks_until_turn(pool_id, participant)
+
+# One snapshot of the whole draft room; pair with /draftEvents for updates
+@router.get("/getDraftState")
+def draft_state(pool_id: int = Query(...), recent_limit: int = Query(5, ge=0, le=50)):
+    return race_service.get_draft_state(pool_id, recent_limit)
+
+# Server-sent events: pick_made, on_the_clock, draft_complete, draft_started
+@router.get("/draftEvents")
+async def draft_events(
+    request: Request,
+    pool_id: int = Query(...),
+    last_event_id: str | None = Header(default=None),
+):
+    return StreamingResponse(
+        race_service.stream_draft_events(pool_id, last_event_id, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
 # --------------------------------
 
 # Pool Leaderboard Endpoints
@@ -119,6 +149,10 @@ def draft_status(pool_id: int):
 def get_leaderboard(pool_id: int = Query(...)):
     return race_service.get_leaderboard(pool_id)
 
+@router.get("/getLeaderboardRefreshStatus")
+def get_leaderboard_refresh_status():
+    return race_service.get_leaderboard_refresh_status()
+
 @router.get("/getStartingGridStatus")
 def get_grid_status(pool_id: int = Query(...)):
     return race_service.get_starting_grid_status(pool_id)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from backend.database.database import get_db_conn, put_db_conn
+from backend.services.race.draft import record_pick
+
+
+def first_available_car(pool_id: int) -> str | None:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT sg.car_number
+                FROM indy_pool_starting_grid sg
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM indy_pool_assignments a
+                    WHERE a.car_number = sg.car_number AND a.pool_id = %s
+                )
+                ORDER BY sg.starting_position ASC
+                LIMIT 1
+            """, (pool_id, ))
+            row = cur.fetchone()
+            return row[0] if row else None
+    finally:
+        put_db_conn(conn)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time the draft pick transaction against the configured database. "
+            "Every pick is rolled back, so the pool is left unchanged."
+        )
+    )
+    parser.add_argument("--pool-id", type=int, required=True)
+    parser.add_argument("--car-number")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    car_number = args.car_number or first_available_car(args.pool_id)
+    if car_number is None:
+        parser.error("no available car in this pool; pass --car-number")
+
+    timings = []
+    conn = get_db_conn()
+    try:
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            with conn.cursor() as cur:
+                pick = record_pick(cur, args.pool_id, car_number)
+            conn.rollback()
+            timings.append(time.perf_counter() - started)
+
+            if pick is None:
+                parser.error(f"car {car_number} cannot be picked in pool {args.pool_id}")
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+    timings.sort()
+    print(
+        json.dumps(
+            {
+                "pool_id": args.pool_id,
+                "car_number": car_number,
+                "rounds": args.rounds,
+                "p50_ms": round(timings[len(timings) // 2] * 1000, 3),
+                "p95_ms": round(timings[int(len(timings) * 0.95) - 1] * 1000, 3),
+                "max_ms": round(timings[-1] * 1000, 3),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
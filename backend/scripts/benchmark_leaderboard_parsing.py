@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from backend.services.race.leaderboard import _extract_rows_with_locators
+from backend.services.race.leaderboard_parser import parse_leaderboard_html
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CAPTURED_PAGES = (
+    PROJECT_ROOT / "leaderboard.html",
+    PROJECT_ROOT / "cleaned_leaderboard.html",
+    PROJECT_ROOT / "cached_leaderboard_test.html",
+)
+
+
+def read_page(path: Path) -> str:
+    # Captures were saved from the browser and are not all valid UTF-8.
+    return path.read_bytes().decode("utf-8", errors="replace")
+
+
+def time_calls(function, iterations: int) -> tuple[float, object]:
+    result = function()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return round((time.perf_counter() - started) * 1000 / iterations, 2), result
+
+
+def measure_browser(pages: dict[str, str], iterations: int) -> dict:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return {"available": False, "reason": "playwright is not installed"}
+
+    results = {}
+    playwright = sync_playwright().start()
+    try:
+        try:
+            browser = playwright.chromium.launch(headless=True, args=["--no-sandbox"])
+        except Exception as exc:
+            return {"available": False, "reason": str(exc).strip().splitlines()[0]}
+        try:
+            page = browser.new_page()
+            for name, html in pages.items():
+                # Scripts would refetch live data over the captured rows.
+                page.route("**/*", lambda route: route.abort())
+                page.set_content(html, wait_until="domcontentloaded")
+                locator_ms, locator_rows = time_calls(lambda: _extract_rows_with_locators(page), iterations)
+                content_ms, content_rows = time_calls(lambda: parse_leaderboard_html(page.content()), iterations)
+                results[name] = {
+                    "locator_ms": locator_ms,
+                    "page_content_and_parse_ms": content_ms,
+                    "speedup": round(locator_ms / content_ms, 1) if content_ms else None,
+                    "same_rows": locator_rows == content_rows,
+                }
+        finally:
+            browser.close()
+    finally:
+        playwright.stop()
+    return {"available": True, "pages": results}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare extracting leaderboard rows through Playwright locators "
+            "with parsing one page.content() snapshot in Python."
+        )
+    )
+    parser.add_argument(
+        "--html",
+        type=Path,
+        nargs="+",
+        default=[path for path in CAPTURED_PAGES if path.is_file()],
+        help="captured leaderboard pages (defaults to the captures in the repo root)",
+    )
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--skip-browser", action="store_true")
+    args = parser.parse_args()
+    if not args.html:
+        parser.error("no captured leaderboard pages found; pass --html")
+
+    pages = {path.name: read_page(path) for path in args.html}
+    parsed = {}
+    for name, html in pages.items():
+        parse_ms, rows = time_calls(lambda: parse_leaderboard_html(html), max(args.iterations, 50))
+        parsed[name] = {"html_bytes": len(html.encode()), "rows": len(rows), "python_parse_ms": parse_ms}
+
+    print(
+        json.dumps(
+            {
+                "iterations": args.iterations,
+                "offline": parsed,
+                "browser": (
+                    {"available": False, "reason": "skipped"}
+                    if args.skip_browser
+                    else measure_browser(pages, args.iterations)
+                ),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
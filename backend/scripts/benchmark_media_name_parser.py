@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from backend.services.media_name_parser import MediaNameError, MediaNameParser
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CORPUS = PROJECT_ROOT / "tests" / "fixtures" / "media_release_names.jsonl"
+
+
+def load_names(corpus: Path) -> list[tuple[str, str]]:
+    with corpus.open(encoding="utf-8") as handle:
+        return [
+            (case["library"], case["name"])
+            for case in (json.loads(line) for line in handle if line.strip())
+        ]
+
+
+def parse_all(parser: MediaNameParser, names: list[tuple[str, str]]) -> int:
+    failures = 0
+    for library, name in names:
+        try:
+            if library == "TV":
+                parser.parse_tv(name)
+            elif parser.parse_movie(name) is None:
+                failures += 1
+        except MediaNameError:
+            failures += 1
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time the Plex release-name parser against the regression corpus."
+    )
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    names = load_names(args.corpus)
+    name_parser = MediaNameParser()
+
+    timings = []
+    failures = 0
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        failures = parse_all(name_parser, names)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    print(
+        json.dumps(
+            {
+                "names": len(names),
+                "rounds": args.rounds,
+                "unparsed": failures,
+                "best_round_ms": round(best * 1000, 3),
+                "mean_round_ms": round(sum(timings) / len(timings) * 1000, 3),
+                "names_per_second": round(len(names) / best),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import FileResponse
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+from starlette.testclient import TestClient
+
+from backend.core.web_precompression import precompress_tree
+from backend.core.web_static import PrecompressedStaticFiles, WebIndex
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_DIST = PROJECT_ROOT / "frontend-web" / "dist"
+BROWSER_HEADERS = {"Accept-Encoding": "gzip, deflate, br"}
+
+
+def plain_app(dist: Path) -> Starlette:
+    async def index(request: Request):
+        return FileResponse(dist / "index.html")
+
+    return Starlette(
+        routes=[
+            Route("/", index),
+            Mount("/assets", StaticFiles(directory=str(dist / "assets"))),
+        ]
+    )
+
+
+def precompressed_app(dist: Path) -> Starlette:
+    web_index = WebIndex(dist)
+
+    async def index(request: Request):
+        return web_index.response(request.headers)
+
+    return Starlette(
+        routes=[
+            Route("/", index),
+            Mount(
+                "/assets",
+                PrecompressedStaticFiles(directory=str(dist / "assets"), immutable=True),
+            ),
+        ]
+    )
+
+
+def fetch_raw(client: TestClient, path: str, headers: dict[str, str]) -> int:
+    # Bodies are counted as sent; decoding them would time the client instead.
+    with client.stream("GET", path, headers=headers) as response:
+        return sum(len(chunk) for chunk in response.iter_raw())
+
+
+def measure(client: TestClient, paths: list[str], rounds: int) -> dict:
+    transferred = sum(fetch_raw(client, path, BROWSER_HEADERS) for path in paths)
+
+    revisit = 0
+    for path in paths:
+        first = client.get(path, headers=BROWSER_HEADERS)
+        cache_control = first.headers.get("cache-control", "")
+        if "immutable" in cache_control:
+            continue
+        validators = {}
+        if "etag" in first.headers:
+            validators["If-None-Match"] = first.headers["etag"]
+        if "last-modified" in first.headers:
+            validators["If-Modified-Since"] = first.headers["last-modified"]
+        revisit += fetch_raw(client, path, {**BROWSER_HEADERS, **validators})
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            fetch_raw(client, path, BROWSER_HEADERS)
+    elapsed = time.perf_counter() - started
+    return {
+        "first_visit_bytes": transferred,
+        "revisit_bytes": revisit,
+        "requests_per_second": round(rounds * len(paths) / elapsed),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the plain static mounts with precompressed, cached serving "
+            "on a copy of the built web bundle."
+        )
+    )
+    parser.add_argument("--dist", type=Path, default=DEFAULT_DIST)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    if not (args.dist / "index.html").is_file():
+        parser.error(f"{args.dist} has no index.html; run npm run build first")
+
+    with tempfile.TemporaryDirectory(prefix="remihub-static-benchmark-") as directory:
+        dist = Path(directory) / "dist"
+        shutil.copytree(args.dist, dist, ignore=shutil.ignore_patterns("*.br", "*.gz"))
+        paths = ["/"] + [
+            f"/assets/{path.name}"
+            for path in sorted((dist / "assets").glob("*"))
+            if path.suffix in {".js", ".css"}
+        ]
+        with TestClient(plain_app(dist)) as client:
+            plain = measure(client, paths, args.rounds)
+        compressed = precompress_tree(dist)
+        with TestClient(precompressed_app(dist)) as client:
+            precompressed = measure(client, paths, args.rounds)
+
+    print(
+        json.dumps(
+            {
+                "paths": len(paths),
+                "rounds": args.rounds,
+                "precompressed_files": compressed,
+                "plain": plain,
+                "precompressed": precompressed,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
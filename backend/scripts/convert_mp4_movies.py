@@ -6,26 +6,16 @@ import sys
 import time
 from pathlib import Path
 
-from backend.tasks.media_conversion import convert_mp4_to_mkv, result_to_dict
+from backend.tasks.media_conversion import (
+    convert_mp4_to_mkv,
+    iter_mp4_files,
+    result_to_dict,
+)
 
 
 DEFAULT_ROOT = Path("/mnt/plex-pool/Movies")
 
 
-def iter_mp4_files(root: Path):
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-
-        if path.suffix.lower() != ".mp4":
-            continue
-
-        # Skip temp/remux artifacts just in case.
-        if ".remuxing." in path.name:
-            continue
-
-        yield path
-
 def format_seconds(seconds: float | int | None) -> str:
     if seconds is None:
         return "unknown"
@@ -106,6 +96,44 @@ def print_progress_report(
     print("", file=sys.stderr)
 
 
+def enqueue_files(root: Path, args: argparse.Namespace) -> int:
+    from backend.services import media_conversion_service
+
+    request = media_conversion_service.MediaConversionEnqueueRequest(
+        root=str(root),
+        delete_source=args.delete_source,
+        overwrite=args.overwrite,
+        limit=args.limit,
+    )
+
+    try:
+        sources = media_conversion_service.collect_conversion_sources(request)
+    except media_conversion_service.MediaConversionPathError as exc:
+        print(json.dumps({"status": "failed", "message": str(exc)}))
+        return 1
+
+    if not args.apply:
+        print(
+            json.dumps(
+                {
+                    "root": str(root),
+                    "dry_run": True,
+                    "would_enqueue": len(sources),
+                },
+                indent=2,
+            )
+        )
+        return 0
+
+    result = media_conversion_service.enqueue_conversion_jobs(
+        sources,
+        delete_source=args.delete_source,
+        overwrite=args.overwrite,
+    )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Remux .mp4 movie files to .mkv containers."
@@ -137,6 +165,14 @@ def main() -> int:
         default=None,
         help="Only process the first N files. Useful for testing.",
     )
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help=(
+            "Queue the files for the backend media conversion workers instead "
+            "of converting them one at a time in this process."
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -153,6 +189,9 @@ def main() -> int:
         )
         return 1
 
+    if args.enqueue:
+        return enqueue_files(root, args)
+
     files = list(iter_mp4_files(root))
 
     if args.limit is not None:
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+
+def recent_stage_timelines(
+    *,
+    limit: int,
+    environment: str | None,
+    executor: str | None,
+) -> list[dict]:
+    # Imported here so the summary can be reused without a database.
+    from backend.database.database import get_db_conn, put_db_conn
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT runs.result_metadata #> '{candidate,stage_timeline}'
+                FROM agent.runs AS runs
+                WHERE runs.phase = 'deployment'
+                  AND runs.result_metadata #> '{candidate,stage_timeline}' IS NOT NULL
+                  AND (%s::text IS NULL OR runs.result_metadata ->> 'environment' = %s)
+                  AND (%s::text IS NULL OR runs.result_metadata ->> 'executor' = %s)
+                ORDER BY runs.finished_at DESC NULLS LAST, runs.created_at DESC
+                LIMIT %s
+                """,
+                (environment, environment, executor, executor, limit),
+            )
+            return [row[0] for row in cur.fetchall()]
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+
+def _percentile(ordered: list[int], share: float) -> int:
+    return ordered[max(0, int(len(ordered) * share + 0.5) - 1)]
+
+
+def summarize_stage_timelines(timelines: list[dict]) -> dict:
+    """Aggregate span durations per stage, largest share of release time first."""
+    stages: dict[str, dict[str, list[int]]] = {}
+    total_ms = 0
+    for timeline in timelines:
+        total_ms += int(timeline.get("total_ms") or 0)
+        for span in timeline.get("spans") or ():
+            stage = stages.setdefault(
+                span["name"],
+                {"duration_ms": [], "cpu_ms": [], "write_bytes": [], "failed": []},
+            )
+            stage["duration_ms"].append(int(span["duration_ms"]))
+            stage["cpu_ms"].append(int(span.get("cpu_ms") or 0))
+            stage["write_bytes"].append(int(span.get("write_bytes") or 0))
+            stage["failed"].append(int(span.get("status") == "failed"))
+
+    rows = []
+    for name, samples in stages.items():
+        durations = sorted(samples["duration_ms"])
+        stage_total = sum(durations)
+        rows.append(
+            {
+                "stage": name,
+                "spans": len(durations),
+                "failed": sum(samples["failed"]),
+                "total_ms": stage_total,
+                "share_pct": round(stage_total * 100 / total_ms, 1) if total_ms else 0.0,
+                "p50_ms": _percentile(durations, 0.5),
+                "p95_ms": _percentile(durations, 0.95),
+                "max_ms": durations[-1],
+                "cpu_ms": sum(samples["cpu_ms"]),
+                "write_mb": round(sum(samples["write_bytes"]) / (1024 * 1024), 1),
+            }
+        )
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return {"deployments": len(timelines), "total_ms": total_ms, "stages": rows}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Show where release time goes by aggregating the stage timelines "
+            "recorded on recent deployment runs."
+        )
+    )
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--environment", choices=("qa", "production"))
+    parser.add_argument(
+        "--executor",
+        choices=("git_backend_deployment", "git_android_deployment"),
+    )
+    args = parser.parse_args()
+    if args.limit < 1:
+        parser.error("--limit must be at least 1")
+
+    timelines = recent_stage_timelines(
+        limit=args.limit,
+        environment=args.environment,
+        executor=args.executor,
+    )
+    print(json.dumps(summarize_stage_timelines(timelines), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,25 @@
+from dotenv import load_dotenv
+
+from backend.config import resolve_environment_file_path
+from backend.tasks.finance_worker import refresh_valuation_cache
+
+
+def main() -> None:
+    """
+    Force a Zillow/KBB refresh of the finance valuation cache.
+
+    Snapshots read the cache, so run this before a forced snapshot when the
+    cached values should reflect today's estimates.
+    """
+    load_dotenv(dotenv_path=resolve_environment_file_path(), override=False)
+
+    for result in refresh_valuation_cache(force=True):
+        print(
+            f"{result['provider']}: "
+            f"refreshed={result['refreshed']} "
+            f"failed={result['failed']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
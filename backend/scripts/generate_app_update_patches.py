@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import argparse
+import json
+
+from backend.services.app_update_patches import PATCH_SOURCE_RELEASES, generate_release_patches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Create binary patches to the active app release from recent "
+            "releases. Run on the host that stores the published APKs."
+        )
+    )
+    parser.add_argument("--platform", default="android")
+    parser.add_argument("--sources", type=int, default=PATCH_SOURCE_RELEASES)
+    args = parser.parse_args()
+    if args.sources < 1:
+        parser.error("--sources must be at least 1")
+
+    print(json.dumps(generate_release_patches(args.platform, sources=args.sources), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+# Libraries that should load on first use inside a service or task, never
+# while the API imports.
+LAZY_PACKAGES = (
+    "bs4",
+    "firebase_admin",
+    "google.oauth2",
+    "pandas",
+    "plaid",
+    "playwright",
+    "plexapi",
+    "selenium",
+    "spotipy",
+    "yfinance",
+)
+
+_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+# __import__ rather than importlib so -X importtime reports the module itself.
+__import__(sys.argv[1])
+module = sys.modules[sys.argv[1]]
+if sys.argv[2] == "1":
+    for target in module.BACKGROUND_WORKERS:
+        module.load_background_worker(target)
+print(json.dumps({
+    "import_ms": round((time.perf_counter() - started) * 1000, 1),
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+@dataclass
+class ImportRecord:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    parent: ImportRecord | None = None
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """
+    Rebuild the import tree from -X importtime output.
+
+    The interpreter reports a module after everything it imported, indented
+    one level deeper than its importer, so children precede their parent.
+    """
+    records: list[ImportRecord] = []
+    pending: list[ImportRecord] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        columns = line.split(":", 1)[1].split("|")
+        if len(columns) != 3 or not columns[0].strip().isdigit():
+            continue
+        name = columns[2][1:]
+        record = ImportRecord(
+            name=name.strip(),
+            self_us=int(columns[0]),
+            cumulative_us=int(columns[1]),
+            depth=(len(name) - len(name.lstrip(" "))) // 2,
+        )
+        while pending and pending[-1].depth > record.depth:
+            pending.pop().parent = record
+        pending.append(record)
+        records.append(record)
+    return records
+
+
+def _package(name: str) -> str:
+    return name.split(".", 1)[0]
+
+
+def summarize_imports(records: list[ImportRecord], *, top: int) -> dict:
+    """
+    Attribute import time to the package that paid for it.
+
+    A package is charged the cumulative time of each point where it is first
+    entered from another package, along with the backend module that pulled
+    it in, which is where a lazy import would go.
+    """
+    packages: dict[str, dict] = {}
+    backend_modules = []
+    for record in records:
+        if _package(record.name) == "backend":
+            backend_modules.append(
+                {"module": record.name, "self_ms": round(record.self_us / 1000, 1)}
+            )
+        if record.parent is not None and _package(record.parent.name) == _package(record.name):
+            continue
+        importer = record.parent
+        while importer is not None and _package(importer.name) != "backend":
+            importer = importer.parent
+        package = packages.setdefault(
+            _package(record.name),
+            {"package": _package(record.name), "cumulative_ms": 0.0, "imported_by": set()},
+        )
+        package["cumulative_ms"] += record.cumulative_us / 1000
+        if importer is not None:
+            package["imported_by"].add(importer.name)
+
+    ranked = sorted(
+        (package for name, package in packages.items() if name != "backend"),
+        key=lambda package: package["cumulative_ms"],
+        reverse=True,
+    )
+    backend_modules.sort(key=lambda module: module["self_ms"], reverse=True)
+    return {
+        "packages": [
+            {
+                "package": package["package"],
+                "cumulative_ms": round(package["cumulative_ms"], 1),
+                "imported_by": sorted(package["imported_by"]),
+            }
+            for package in ranked[:top]
+        ],
+        "backend_modules": backend_modules[:top],
+    }
+
+
+def profile_imports(module: str, *, with_workers: bool) -> tuple[dict, list[ImportRecord]]:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        part for part in (str(PROJECT_ROOT), environment.get("PYTHONPATH")) if part
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, module, "1" if with_workers else "0"],
+        cwd=PROJECT_ROOT,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    return json.loads(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Profile what importing the API costs: wall time, peak RSS, the "
+            "third-party packages that dominate, and heavy libraries that were "
+            "loaded eagerly."
+        )
+    )
+    parser.add_argument("--module", default="backend.main")
+    parser.add_argument(
+        "--with-workers",
+        action="store_true",
+        help="also import every background worker, as API startup does",
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    probe, records = profile_imports(args.module, with_workers=args.with_workers)
+    loaded = set(probe["modules"])
+    print(
+        json.dumps(
+            {
+                "module": args.module,
+                "with_workers": args.with_workers,
+                "import_ms": probe["import_ms"],
+                "max_rss_mb": round(probe["max_rss_kb"] / 1024, 1),
+                "modules_loaded": len(loaded),
+                "eager_heavy_packages": [name for name in LAZY_PACKAGES if name in loaded],
+                **summarize_imports(records, top=args.top),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
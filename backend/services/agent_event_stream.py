@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import json
+import logging
+import select
+import threading
+
+import psycopg2
+
+from backend.services import agent_service
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between SSE comments that keep proxies from closing idle streams
+KEEPALIVE_SECONDS = 15
+# Events buffered per subscriber before it is told to resync
+SUBSCRIBER_QUEUE_SIZE = 100
+# Persisted events replayed to a reconnecting stream before it must resync
+CATCH_UP_LIMIT = 200
+# Seconds the listener blocks in select() before checking for shutdown
+LISTEN_CHECK_SECONDS = 5.0
+# Seconds between attempts to reopen a broken LISTEN connection
+LISTEN_RECONNECT_SECONDS = 5.0
+
+
+def open_db_conn():
+    # The LISTEN session lives for the whole process, so it stays outside the
+    # request pool.
+    from backend.database.database import open_db_conn as open_connection
+
+    return open_connection()
+
+
+@dataclass(frozen=True)
+class AgentStreamEvent:
+    card_id: str
+    type: str
+    data: dict
+    # Only persisted card events carry an id a client can resume from.
+    id: str | None = None
+
+    def to_sse(self) -> str:
+        payload = json.dumps(self.data, default=str, separators=(",", ":"))
+        event_id = f"id: {self.id}\n" if self.id else ""
+        return f"{event_id}event: {self.type}\ndata: {payload}\n\n"
+
+
+def resync_event(card_id: str) -> AgentStreamEvent:
+    return AgentStreamEvent(card_id=card_id, type="resync", data={})
+
+
+@dataclass(eq=False)
+class AgentEventSubscription:
+    card_id: str
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    )
+
+    def offer(self, event: AgentStreamEvent) -> None:
+        # Runs on the subscriber's event loop.
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A stalled client gets one resync instead of an unbounded backlog.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(resync_event(self.card_id))
+
+
+class AgentEventBroker:
+    """
+    Fan agent card events out to every stream watching a card.
+
+    Events arrive on the listener thread, so publishing is thread-safe and
+    hands each event to the subscriber's own event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[AgentEventSubscription]] = {}
+
+    def has_subscribers(self, card_id: str) -> bool:
+        with self._lock:
+            return card_id in self._subscribers
+
+    def publish(self, event: AgentStreamEvent) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(event.card_id, ()))
+        self._deliver(subscribers, lambda _subscription: event)
+
+    def publish_resync(self) -> None:
+        """Tell every stream it may have missed events and must reload."""
+        with self._lock:
+            subscribers = [
+                subscription
+                for card_subscribers in self._subscribers.values()
+                for subscription in card_subscribers
+            ]
+        self._deliver(subscribers, lambda subscription: resync_event(subscription.card_id))
+
+    def subscribe(self, card_id: str) -> AgentEventSubscription:
+        """Register a stream; must be called from the stream's event loop."""
+        subscription = AgentEventSubscription(card_id=card_id, loop=asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(card_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AgentEventSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.card_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.card_id]
+
+    def _deliver(self, subscribers, event_for) -> None:
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event_for(subscription))
+            except RuntimeError:
+                # The subscriber's loop has shut down.
+                self.unsubscribe(subscription)
+
+
+def stream_event_from_notification(payload: str) -> AgentStreamEvent | None:
+    """Translate an agent_card_events NOTIFY payload into a stream event."""
+    try:
+        notification = json.loads(payload)
+        card_id = notification["card_id"]
+    except (ValueError, TypeError, KeyError):
+        logger.warning("Ignoring malformed agent card notification: %r", payload)
+        return None
+
+    if notification.get("type") == "run.heartbeat":
+        data = {key: value for key, value in notification.items() if key != "type"}
+        return AgentStreamEvent(card_id=card_id, type="run_heartbeat", data=data)
+
+    event = {key: value for key, value in notification.items() if key != "type"}
+    if event.pop("truncated", False):
+        # Oversized payloads are not carried by NOTIFY; read the stored row.
+        stored = agent_service.get_event(event["id"])
+        if stored is None:
+            return resync_event(card_id)
+        event = stored
+    return AgentStreamEvent(card_id=card_id, type="card_event", data=event, id=event["id"])
+
+
+class AgentEventListener:
+    """
+    Relay agent card notifications from PostgreSQL to the broker.
+
+    One daemon thread holds a single LISTEN connection for the whole API
+    process, however many streams are open. It starts with the first stream.
+    After a reconnect every stream is told to resync, because notifications
+    sent while the connection was down are gone.
+    """
+
+    def __init__(
+        self,
+        event_broker: AgentEventBroker,
+        *,
+        connect=open_db_conn,
+        check_seconds: float = LISTEN_CHECK_SECONDS,
+        reconnect_seconds: float = LISTEN_RECONNECT_SECONDS,
+    ):
+        self._broker = event_broker
+        self._connect = connect
+        self._check_seconds = check_seconds
+        self._reconnect_seconds = reconnect_seconds
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="agent-card-event-listener",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        subscribed_before = False
+        while not self._stop.is_set():
+            try:
+                conn = self._subscribe()
+            except (OSError, psycopg2.Error):
+                logger.warning("Agent card event listener could not subscribe", exc_info=True)
+                self._stop.wait(self._reconnect_seconds)
+                continue
+
+            if subscribed_before:
+                self._broker.publish_resync()
+            subscribed_before = True
+            try:
+                self._listen(conn)
+            except (OSError, psycopg2.Error):
+                logger.warning("Agent card event listener connection lost", exc_info=True)
+            finally:
+                try:
+                    conn.close()
+                except psycopg2.Error:
+                    pass
+
+    def _subscribe(self):
+        conn = self._connect()
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {agent_service.AGENT_CARD_EVENTS_CHANNEL};")
+        return conn
+
+    def _listen(self, conn) -> None:
+        while not self._stop.is_set():
+            readable, _, _ = select.select([conn], [], [], self._check_seconds)
+            if not readable:
+                continue
+            conn.poll()
+            notifies = list(conn.notifies)
+            conn.notifies.clear()
+            for notify in notifies:
+                self.dispatch(notify.payload)
+
+    def dispatch(self, payload: str) -> None:
+        try:
+            card_id = json.loads(payload).get("card_id")
+        except (ValueError, AttributeError):
+            card_id = None
+        # Skip the work, including oversized payload reads, for unwatched cards.
+        if card_id is not None and not self._broker.has_subscribers(card_id):
+            return
+        try:
+            event = stream_event_from_notification(payload)
+        except Exception:
+            logger.exception("Agent card notification could not be relayed")
+            return
+        if event is not None:
+            self._broker.publish(event)
+
+
+broker = AgentEventBroker()
+listener = AgentEventListener(broker)
+
+
+async def _catch_up(subscription: AgentEventSubscription, last_event_id: str) -> list[AgentStreamEvent]:
+    events = await asyncio.to_thread(
+        agent_service.list_card_events_after,
+        subscription.card_id,
+        last_event_id,
+        limit=CATCH_UP_LIMIT + 1,
+    )
+    if events is None or len(events) > CATCH_UP_LIMIT:
+        # The client's position is unknown or too far behind to replay.
+        return [resync_event(subscription.card_id)]
+    return [
+        AgentStreamEvent(
+            card_id=subscription.card_id,
+            type="card_event",
+            data=event,
+            id=event["id"],
+        )
+        for event in events
+    ]
+
+
+async def stream_card_events(card_id: str, last_event_id: str | None, is_disconnected):
+    """Yield SSE frames for card_id until the client disconnects."""
+    listener.ensure_started()
+    # Subscribe before reading missed events so nothing falls between the two.
+    subscription = broker.subscribe(card_id)
+    try:
+        yield f"retry: 3000\n: connected to card {card_id}\n\n"
+        replayed: set[str] = set()
+        if last_event_id:
+            for event in await _catch_up(subscription, last_event_id):
+                if event.id is not None:
+                    replayed.add(event.id)
+                yield event.to_sse()
+
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(),
+                    timeout=KEEPALIVE_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event.id is not None and event.id in replayed:
+                continue
+            yield event.to_sse()
+    finally:
+        broker.unsubscribe(subscription)
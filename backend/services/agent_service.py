@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import base64
+import binascii
+from datetime import datetime, timedelta
 import json
 import logging
 from pathlib import Path
+import threading
 from uuid import UUID, uuid4
 
 from psycopg2 import errors
@@ -43,6 +47,10 @@ ANDROID_DEPLOYMENT_READINESS_PATH = Path(
 )
 EXPECTED_ANDROID_PACKAGE_NAME = "com.alex.remihub"
 logger = logging.getLogger("remihub.agent_service")
+AGENT_RUNS_CHANNEL = "agent_runs_claimable"
+AGENT_CARD_EVENTS_CHANNEL = "agent_card_events"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_PAYLOAD_BYTES = 6000
 
 
 EXPECTED_ANDROID_CERTIFICATE_SHA256 = (
@@ -69,6 +77,29 @@ CARD_COLUMNS = """
     created_at,
     updated_at
 """
+CARD_COLUMN_NAMES = tuple(
+    column.strip() for column in CARD_COLUMNS.split(",") if column.strip()
+)
+LATEST_RUN_COLUMNS = """
+    id,
+    card_id,
+    phase,
+    status,
+    card_revision,
+    attempt_count,
+    blocked_reason,
+    error_message,
+    result_metadata,
+    created_at,
+    updated_at
+"""
+BOARD_PAGE_LIMIT = 100
+MAX_BOARD_PAGE_LIMIT = 500
+# Board rows are stamped when their transaction writes them, not when it
+# commits, so incremental reads re-scan a short window behind the last read.
+BOARD_SYNC_OVERLAP = timedelta(seconds=30)
+_board_backfilled = False
+_board_backfill_lock = threading.Lock()
 
 
 class AgentServiceError(RuntimeError):
@@ -480,6 +511,15 @@ def _insert_message(
     return message_id
 
 
+def _notify_runs_claimable(cur, *, phase: RunPhase) -> None:
+    # NOTIFY is transactional, so idle workers hear it only once the run
+    # that became claimable has been committed.
+    cur.execute(
+        "SELECT pg_notify(%s, %s)",
+        (AGENT_RUNS_CHANNEL, phase.value),
+    )
+
+
 def _insert_run(
     cur,
     *,
@@ -513,6 +553,7 @@ def _insert_run(
             requested_by,
         ),
     )
+    _notify_runs_claimable(cur, phase=phase)
     return run_id
 
 
@@ -748,17 +789,40 @@ def _insert_event(
     payload: dict | None = None,
 ) -> str:
     event_id = str(uuid4())
+    payload_json = json.dumps(payload or {}, sort_keys=True)
+    notification = {
+        "type": "event",
+        "id": event_id,
+        "card_id": card_id,
+        "event_type": event_type,
+        "actor_type": actor_type,
+        "actor_user_id": actor_user_id,
+    }
+    if len(payload_json.encode("utf-8")) <= MAX_NOTIFY_PAYLOAD_BYTES:
+        notification["payload"] = payload or {}
+    else:
+        # Listeners read oversized payloads back from agent.events.
+        notification["truncated"] = True
+    # Stream listeners hear about the event only once this transaction commits.
     cur.execute(
-        """
-        INSERT INTO agent.events (
-            id,
-            card_id,
-            event_type,
-            actor_type,
-            actor_user_id,
-            payload
+        f"""
+        WITH inserted AS (
+            INSERT INTO agent.events (
+                id,
+                card_id,
+                event_type,
+                actor_type,
+                actor_user_id,
+                payload
+            )
+            VALUES (%s, %s, %s, %s, %s, %s::jsonb)
+            RETURNING created_at
+        )
+        SELECT pg_notify(
+            '{AGENT_CARD_EVENTS_CHANNEL}',
+            (%s::jsonb || jsonb_build_object('created_at', inserted.created_at))::text
         )
-        VALUES (%s, %s, %s, %s, %s, %s::jsonb)
+        FROM inserted
         """,
         (
             event_id,
@@ -766,7 +830,8 @@ def _insert_event(
             event_type,
             actor_type,
             actor_user_id,
-            json.dumps(payload or {}, sort_keys=True),
+            payload_json,
+            json.dumps(notification, sort_keys=True),
         ),
     )
     return event_id
@@ -976,6 +1041,7 @@ def create_card(
                     "status": CardStatus.PLANNING_QUEUED.value,
                 },
             )
+            _refresh_board_card(cur, card_id)
 
         card = _card_detail(conn, card_id)
         conn.commit()
@@ -1009,19 +1075,9 @@ def list_cards(*, include_closed: bool = False) -> list[dict]:
 
             card_ids = [card["id"] for card in cards]
             cur.execute(
-                """
+                f"""
                 SELECT DISTINCT ON (card_id)
-                       id,
-                       card_id,
-                       phase,
-                       status,
-                       card_revision,
-                       attempt_count,
-                       blocked_reason,
-                       error_message,
-                       result_metadata,
-                       created_at,
-                       updated_at
+                       {LATEST_RUN_COLUMNS}
                 FROM agent.runs
                 WHERE card_id = ANY(%s::uuid[])
                 ORDER BY card_id, created_at DESC, id DESC
@@ -1041,6 +1097,270 @@ def list_cards(*, include_closed: bool = False) -> list[dict]:
         put_db_conn(conn)
 
 
+def _upsert_board_cards(cur, *, card_filter: str, parameters: tuple, on_conflict: str) -> None:
+    cur.execute(
+        f"""
+        INSERT INTO agent.card_board (
+            card_id,
+            card,
+            latest_run,
+            card_status,
+            board_updated_at
+        )
+        SELECT cards.id,
+               to_jsonb(cards),
+               to_jsonb(latest_run),
+               cards.status,
+               clock_timestamp()
+        FROM (
+            SELECT {CARD_COLUMNS}
+            FROM agent.cards
+            WHERE {card_filter}
+        ) AS cards
+        LEFT JOIN LATERAL (
+            SELECT {LATEST_RUN_COLUMNS}
+            FROM agent.runs AS runs
+            WHERE runs.card_id = cards.id
+            ORDER BY runs.created_at DESC, runs.id DESC
+            LIMIT 1
+        ) AS latest_run ON TRUE
+        ON CONFLICT (card_id) {on_conflict}
+        """,
+        parameters,
+    )
+
+
+def _refresh_board_card(cur, card_id: str) -> None:
+    """
+    Rewrite a card's board row; call in the transaction that changed it.
+
+    The board is a read model, so a missing table or grant must not block the
+    state change itself. The savepoint keeps that transaction usable.
+    """
+    cur.execute("SAVEPOINT agent_card_board_refresh")
+    try:
+        _upsert_board_cards(
+            cur,
+            card_filter="id = %s",
+            parameters=(card_id,),
+            on_conflict="""
+            DO UPDATE SET card = EXCLUDED.card,
+                          latest_run = EXCLUDED.latest_run,
+                          card_status = EXCLUDED.card_status,
+                          board_updated_at = EXCLUDED.board_updated_at
+            """,
+        )
+    except (errors.InsufficientPrivilege, errors.UndefinedTable):
+        cur.execute("ROLLBACK TO SAVEPOINT agent_card_board_refresh")
+        logger.warning("Agent card board row was not refreshed: card=%s", card_id, exc_info=True)
+    cur.execute("RELEASE SAVEPOINT agent_card_board_refresh")
+
+
+def _ensure_board_backfilled(conn) -> None:
+    # Cards created before the board existed get their row once per process.
+    # DO NOTHING keeps the fresher row of a concurrent state change.
+    global _board_backfilled
+    if _board_backfilled:
+        return
+    with _board_backfill_lock:
+        if _board_backfilled:
+            return
+        with conn.cursor() as cur:
+            _upsert_board_cards(
+                cur,
+                card_filter="""
+                NOT EXISTS (
+                    SELECT 1
+                    FROM agent.card_board AS board
+                    WHERE board.card_id = agent.cards.id
+                )
+                """,
+                parameters=(),
+                on_conflict="DO NOTHING",
+            )
+        conn.commit()
+        _board_backfilled = True
+
+
+def _encode_board_cursor(updated_at: datetime, card_id: str) -> str:
+    raw = f"{updated_at.isoformat()}|{card_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_board_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        updated_at, card_id = raw.split("|", 1)
+        position = datetime.fromisoformat(updated_at)
+        UUID(card_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("cursor is invalid") from exc
+    if position.tzinfo is None:
+        raise ValueError("cursor is invalid")
+    return position, card_id
+
+
+def list_board(
+    *,
+    limit: int = BOARD_PAGE_LIMIT,
+    cursor: str | None = None,
+    updated_since: datetime | None = None,
+    include_closed: bool = False,
+) -> dict:
+    """
+    Page through the denormalized card board.
+
+    Rows are ordered by when their card or latest run last changed, and
+    next_cursor continues after the last returned row. With updated_since,
+    only rows changed after that time are returned, closed cards included so
+    clients can drop them. next_updated_since is the value to send on the
+    next incremental read; it trails this read by BOARD_SYNC_OVERLAP, so a
+    card can be returned twice.
+    """
+    if limit < 1 or limit > MAX_BOARD_PAGE_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_BOARD_PAGE_LIMIT}")
+    if updated_since is not None and updated_since.tzinfo is None:
+        raise ValueError("updated_since must include a timezone")
+    position = _decode_board_cursor(cursor) if cursor else None
+
+    predicates = []
+    parameters: list[object] = []
+    if updated_since is not None:
+        predicates.append("board_updated_at > %s")
+        parameters.append(updated_since)
+    elif not include_closed:
+        predicates.append("card_status <> 'closed'")
+    if position is not None:
+        predicates.append("(board_updated_at, card_id) > (%s, %s::uuid)")
+        parameters.extend(position)
+    where_clause = f"WHERE {' AND '.join(predicates)}" if predicates else ""
+    parameters.append(limit + 1)
+
+    conn = get_db_conn()
+    try:
+        _ensure_board_backfilled(conn)
+        with conn.cursor() as cur:
+            cur.execute("SELECT CURRENT_TIMESTAMP")
+            read_at = cur.fetchone()[0]
+            cur.execute(
+                f"""
+                SELECT card_id, card, latest_run, board_updated_at
+                FROM agent.card_board
+                {where_clause}
+                ORDER BY board_updated_at, card_id
+                LIMIT %s
+                """,
+                tuple(parameters),
+            )
+            rows = cur.fetchall()
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+    page = rows[:limit]
+    cards = [
+        _decorate_card(
+            {column: card[column] for column in CARD_COLUMN_NAMES},
+            latest_run=latest_run,
+        )
+        for _, card, latest_run, _ in page
+    ]
+    next_cursor = None
+    if len(rows) > limit:
+        last_card_id, _, _, last_updated_at = page[-1]
+        next_cursor = _encode_board_cursor(last_updated_at, str(last_card_id))
+    return {
+        "cards": cards,
+        "next_cursor": next_cursor,
+        "next_updated_since": read_at - BOARD_SYNC_OVERLAP,
+    }
+
+
+def card_exists(card_id: str) -> bool:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1 FROM agent.cards WHERE id = %s", (card_id,))
+            return cur.fetchone() is not None
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+
+def list_card_events_after(
+    card_id: str,
+    last_event_id: str,
+    *,
+    limit: int = 200,
+) -> list[dict] | None:
+    """
+    Return a card's events recorded after last_event_id, oldest first.
+
+    None means last_event_id is not one of the card's events, so the caller
+    cannot resume from it and must reload the card instead.
+    """
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT created_at, id
+                FROM agent.events
+                WHERE card_id = %s
+                  AND id = %s
+                """,
+                (card_id, last_event_id),
+            )
+            position = cur.fetchone()
+            if position is None:
+                return None
+            cur.execute(
+                """
+                SELECT id,
+                       card_id,
+                       event_type,
+                       actor_type,
+                       actor_user_id,
+                       payload,
+                       created_at
+                FROM agent.events
+                WHERE card_id = %s
+                  AND (created_at, id) > (%s, %s)
+                ORDER BY created_at, id
+                LIMIT %s
+                """,
+                (card_id, position[0], position[1], limit),
+            )
+            return _rows_to_dicts(cur, cur.fetchall())
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+
+def get_event(event_id: str) -> dict | None:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id,
+                       card_id,
+                       event_type,
+                       actor_type,
+                       actor_user_id,
+                       payload,
+                       created_at
+                FROM agent.events
+                WHERE id = %s
+                """,
+                (event_id,),
+            )
+            return _row_to_dict(cur, cur.fetchone())
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+
 def get_card(card_id: str) -> dict:
     conn = get_db_conn()
     try:
@@ -1106,6 +1426,7 @@ def add_follow_up(
                     "to_status": target_status.value,
                 },
             )
+            _refresh_board_card(cur, card_id)
 
         result = _card_detail(conn, card_id)
         conn.commit()
@@ -1174,6 +1495,7 @@ def approve_implementation(
                     "to_status": target_status.value,
                 },
             )
+            _refresh_board_card(cur, card_id)
 
         result = _card_detail(conn, card_id)
         conn.commit()
@@ -1251,6 +1573,7 @@ def approve_deployment(
                     "to_status": target_status.value,
                 },
             )
+            _refresh_board_card(cur, card_id)
 
         result = _card_detail(conn, card_id)
         conn.commit()
@@ -1422,6 +1745,7 @@ def retry_card(
                     "to_status": target_status.value,
                 },
             )
+            _refresh_board_card(cur, card_id)
 
         result = _card_detail(conn, card_id)
         conn.commit()
@@ -1561,6 +1885,7 @@ def retry_deployment_github_sync(
                 raise AgentStateConflictError(
                     "GitHub synchronization retry lost the blocked deployment run"
                 )
+            _notify_runs_claimable(cur, phase=RunPhase.DEPLOYMENT)
             cur.execute(
                 """
                 UPDATE agent.cards
@@ -1589,6 +1914,7 @@ def retry_deployment_github_sync(
                     "notes": notes,
                 },
             )
+            _refresh_board_card(cur, card_id)
             result = _card_detail(conn, card_id)
             deployment_trigger_scope = RepositoryScope.BACKEND
         conn.commit()
@@ -1654,6 +1980,7 @@ def cancel_card(
                     "notes": notes,
                 },
             )
+            _refresh_board_card(cur, card_id)
 
         result = _card_detail(conn, card_id)
         conn.commit()
@@ -1696,6 +2023,7 @@ def close_card(
                     "notes": notes,
                 },
             )
+            _refresh_board_card(cur, card_id)
 
         result = _card_detail(conn, card_id)
         conn.commit()
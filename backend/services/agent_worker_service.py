@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
+import select
+import time
+from typing import Callable
 from uuid import uuid4
 
 import psycopg2
@@ -31,8 +34,12 @@ from backend.notifications.notifications import (
     insert_notification,
 )
 from backend.services.agent_service import (
+    AGENT_CARD_EVENTS_CHANNEL,
+    AGENT_RUNS_CHANNEL,
     _insert_event,
     _insert_message,
+    _notify_runs_claimable,
+    _refresh_board_card,
     _row_to_dict,
     _rows_to_dicts,
 )
@@ -41,6 +48,8 @@ from backend.services.agent_service import (
 logger = logging.getLogger("remihub.agent_worker_service")
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_DATABASE_CONFIG = PROJECT_ROOT / "config" / "config.ini"
+LISTEN_CHECK_SECONDS = 1.0
+LISTEN_RECONNECT_SECONDS = 30.0
 
 
 class AgentQueueStateError(RuntimeError):
@@ -106,6 +115,36 @@ def _lease_interval_sql() -> str:
     return "(%s * INTERVAL '1 second')"
 
 
+HEARTBEAT_RETURNING_COLUMNS = """
+    runs.id,
+    runs.card_id,
+    runs.phase,
+    runs.status,
+    runs.attempt_count,
+    runs.last_heartbeat_at,
+    runs.lease_expires_at
+"""
+
+
+def _heartbeat_notify_sql() -> str:
+    # Heartbeats write no audit event, so portal streams hear them directly.
+    return f"""
+    pg_notify(
+        '{AGENT_CARD_EVENTS_CHANNEL}',
+        jsonb_build_object(
+            'type', 'run.heartbeat',
+            'card_id', renewed.card_id,
+            'run_id', renewed.id,
+            'phase', renewed.phase,
+            'status', renewed.status,
+            'attempt_count', renewed.attempt_count,
+            'last_heartbeat_at', renewed.last_heartbeat_at,
+            'lease_expires_at', renewed.lease_expires_at
+        )::text
+    )
+    """
+
+
 def _validate_positive_seconds(value: int, *, field: str) -> int:
     if value < 1:
         raise ValueError(f"{field} must be at least 1")
@@ -481,6 +520,7 @@ def claim_next_run(
                 "lease_token": lease_token,
                 "worker_id": normalized_worker_id,
             }
+            _refresh_board_card(cur, row["card_id"])
 
         conn.commit()
         return _claimed_run_from_row(claimed_row, messages)
@@ -564,6 +604,7 @@ def start_run(claim: ClaimedRun, *, lease_seconds: int) -> None:
                     "worker_id": claim.worker_id,
                 },
             )
+            _refresh_board_card(cur, claim.card_id)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -582,15 +623,20 @@ def heartbeat_run(claim: ClaimedRun, *, lease_seconds: int) -> None:
         with conn.cursor() as cur:
             cur.execute(
                 f"""
-                UPDATE agent.runs
-                SET last_heartbeat_at = CURRENT_TIMESTAMP,
-                    lease_expires_at = CURRENT_TIMESTAMP + {_lease_interval_sql()}
-                WHERE id = %s
-                  AND card_id = %s
-                  AND worker_id = %s
-                  AND lease_token = %s
-                  AND status IN ('claimed', 'running')
-                  AND lease_expires_at > CURRENT_TIMESTAMP
+                WITH renewed AS (
+                    UPDATE agent.runs AS runs
+                    SET last_heartbeat_at = CURRENT_TIMESTAMP,
+                        lease_expires_at = CURRENT_TIMESTAMP + {_lease_interval_sql()}
+                    WHERE id = %s
+                      AND card_id = %s
+                      AND worker_id = %s
+                      AND lease_token = %s
+                      AND status IN ('claimed', 'running')
+                      AND lease_expires_at > CURRENT_TIMESTAMP
+                    RETURNING {HEARTBEAT_RETURNING_COLUMNS}
+                )
+                SELECT renewed.id::text, {_heartbeat_notify_sql()}
+                FROM renewed
                 """,
                 (
                     lease_seconds,
@@ -661,6 +707,7 @@ def persist_codex_thread_id(claim: ClaimedRun, *, thread_id: str) -> None:
                     "worker_id": claim.worker_id,
                 },
             )
+            _refresh_board_card(cur, claim.card_id)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -735,6 +782,7 @@ def persist_implementation_workspace(
                     "worktree_path": normalized_path,
                 },
             )
+            _refresh_board_card(cur, claim.card_id)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -877,6 +925,9 @@ def complete_run(claim: ClaimedRun, result: ExecutionResult) -> None:
                 actor_user_id=None,
                 payload=event_payload,
             )
+            if qa_handoff:
+                _notify_runs_claimable(cur, phase=RunPhase.DEPLOYMENT)
+            _refresh_board_card(cur, claim.card_id)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -986,6 +1037,7 @@ def block_run(
                     "metadata": _merge_metadata(claim.result_metadata, metadata),
                 },
             )
+            _refresh_board_card(cur, claim.card_id)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -1062,6 +1114,7 @@ def fail_run(claim: ClaimedRun, *, error_message: str) -> None:
                     "worker_id": claim.worker_id,
                 },
             )
+            _refresh_board_card(cur, claim.card_id)
         conn.commit()
     except Exception:
         conn.rollback()
@@ -1070,6 +1123,149 @@ def fail_run(claim: ClaimedRun, *, error_message: str) -> None:
         put_db_conn(conn)
 
 
+def seconds_until_claimable(allowed_phases: frozenset[RunPhase]) -> float | None:
+    """
+    Return how long until the next run in allowed_phases becomes claimable.
+
+    Zero means a run is already due, and None means nothing is pending. Only
+    the partial queue and lease indexes are read, so idle workers can ask
+    this instead of repeating the full claim query.
+    """
+    phases = sorted(RunPhase(phase).value for phase in allowed_phases)
+    if not phases:
+        raise ValueError("allowed_phases must not be empty")
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT GREATEST(
+                    0,
+                    EXTRACT(
+                        EPOCH FROM LEAST(
+                            (
+                                SELECT min(available_at)
+                                FROM agent.runs
+                                WHERE status IN ('queued', 'blocked')
+                                  AND phase = ANY(%s)
+                            ),
+                            (
+                                SELECT min(lease_expires_at)
+                                FROM agent.runs
+                                WHERE status IN ('claimed', 'running')
+                                  AND phase = ANY(%s)
+                            )
+                        ) - CURRENT_TIMESTAMP
+                    )
+                )
+                """,
+                (phases, phases),
+            )
+            row = cur.fetchone()
+        return None if row is None or row[0] is None else float(row[0])
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+
+class ClaimableRunListener:
+    """
+    Wait for the NOTIFY sent when an agent run becomes claimable.
+
+    The listener holds one autocommit connection subscribed to
+    AGENT_RUNS_CHANNEL. If that connection cannot be opened or breaks, waits
+    degrade to plain sleeps and a reconnect is attempted later, so workers
+    keep making progress at their polling cadence.
+    """
+
+    def __init__(
+        self,
+        *,
+        connect: Callable[[], object] = get_db_conn,
+        check_seconds: float = LISTEN_CHECK_SECONDS,
+        reconnect_seconds: float = LISTEN_RECONNECT_SECONDS,
+    ):
+        self._connect = connect
+        self._check_seconds = check_seconds
+        self._reconnect_seconds = reconnect_seconds
+        self._conn = None
+        self._next_connect_at = 0.0
+
+    def wait(
+        self,
+        timeout: float,
+        *,
+        phases: frozenset[RunPhase] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> bool:
+        """
+        Block until a matching notification, timeout, or should_stop().
+
+        Returns True when the caller should try to claim again: a run in one
+        of phases was announced, or the subscription was just (re)opened and
+        announcements may have been missed.
+        """
+        accepted = None if phases is None else {RunPhase(phase).value for phase in phases}
+        deadline = time.monotonic() + timeout
+        while True:
+            conn, reconnected = self._connection()
+            if reconnected:
+                return True
+            if conn is not None and self._drain(conn, accepted):
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or (should_stop is not None and should_stop()):
+                return False
+            interval = min(remaining, self._check_seconds)
+            if conn is None:
+                time.sleep(interval)
+                continue
+            try:
+                readable, _, _ = select.select([conn], [], [], interval)
+                if readable:
+                    conn.poll()
+            except (OSError, psycopg2.Error):
+                logger.warning("Agent run listener connection lost", exc_info=True)
+                self.close()
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except psycopg2.Error:
+                pass
+
+    def _connection(self) -> tuple[object | None, bool]:
+        if self._conn is not None:
+            return self._conn, False
+        now = time.monotonic()
+        if now < self._next_connect_at:
+            return None, False
+        self._next_connect_at = now + self._reconnect_seconds
+        try:
+            conn = self._connect()
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {AGENT_RUNS_CHANNEL};")
+        except (OSError, psycopg2.Error):
+            logger.warning("Agent run listener could not subscribe", exc_info=True)
+            return None, False
+        self._conn = conn
+        return conn, True
+
+    @staticmethod
+    def _drain(conn, accepted: set[str] | None) -> bool:
+        notifies = list(conn.notifies)
+        conn.notifies.clear()
+        return any(
+            accepted is None or notify.payload in accepted
+            for notify in notifies
+        )
+
+
 class DatabaseAgentQueue:
     def __init__(
         self,
@@ -1081,6 +1277,7 @@ class DatabaseAgentQueue:
         self.deployment_environment = _normalize_deployment_environment(
             deployment_environment
         )
+        self._listener = ClaimableRunListener()
 
     def verify_identity(self) -> tuple[str, str, str]:
         return verify_worker_identity(self.environment)
@@ -1106,6 +1303,42 @@ class DatabaseAgentQueue:
             ),
         )
 
+    def wait_for_claimable_run(
+        self,
+        *,
+        allowed_phases: frozenset[RunPhase],
+        idle_seconds: int,
+        retry_seconds: int,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> bool:
+        """
+        Wait after an empty claim until a run may be claimable again.
+
+        Nothing pending waits up to idle_seconds for a notification, and a
+        run that becomes due sooner (a blocked retry or an expiring lease)
+        shortens the wait to its due time. A run that is already due but was
+        not claimable by this worker is retried after retry_seconds.
+        """
+        try:
+            delay = seconds_until_claimable(allowed_phases)
+        except psycopg2.Error:
+            logger.warning("Could not read agent queue due time", exc_info=True)
+            delay = 0.0
+        if delay is None:
+            timeout = float(idle_seconds)
+        elif delay > 0:
+            timeout = min(delay, float(idle_seconds))
+        else:
+            timeout = float(retry_seconds)
+        return self._listener.wait(
+            timeout,
+            phases=allowed_phases,
+            should_stop=should_stop,
+        )
+
+    def close(self) -> None:
+        self._listener.close()
+
     def start_run(self, claim: ClaimedRun, *, lease_seconds: int) -> None:
         start_run(claim, lease_seconds=lease_seconds)
 
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path, PurePosixPath
+
+from backend.database.database import get_db_conn, put_db_conn
+from backend.services.app_update_service import resolve_release_file_path
+
+
+PATCH_FORMAT = "bsdiff4"
+PATCH_PUBLISHED = "published"
+PATCH_NOT_WORTH_IT = "not_worth_it"
+# Phones usually update from one of the last few releases.
+PATCH_SOURCE_RELEASES = 3
+# Applying a patch costs the phone CPU and a second copy of the APK, so a
+# patch that saves less than this share of the download is not kept.
+MAX_PATCH_SHARE = 0.8
+
+
+class AppUpdatePatchError(RuntimeError):
+    pass
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _bsdiff4():
+    try:
+        import bsdiff4
+    except ImportError as exc:
+        raise AppUpdatePatchError("bsdiff4 is not installed") from exc
+    return bsdiff4
+
+
+def build_release_patch(source: Path, target: Path, destination: Path) -> dict:
+    """
+    Write a bsdiff4 patch that turns source into target.
+
+    The patch is applied back to source before it is kept, so a published
+    patch is known to rebuild the exact target bytes.
+    """
+    bsdiff4 = _bsdiff4()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".patch-", dir=str(destination.parent)) as directory:
+        patch_path = Path(directory) / destination.name
+        rebuilt_path = Path(directory) / "rebuilt.apk"
+        bsdiff4.file_diff(str(source), str(target), str(patch_path))
+        bsdiff4.file_patch(str(source), str(rebuilt_path), str(patch_path))
+        if _sha256_file(rebuilt_path) != _sha256_file(target):
+            raise AppUpdatePatchError(f"Patch {destination.name} does not rebuild its target")
+        os.chmod(patch_path, 0o644)
+        patch_path.replace(destination)
+    return {
+        "patch_sha256": _sha256_file(destination),
+        "patch_size_bytes": destination.stat().st_size,
+    }
+
+
+def _patch_candidates(platform: str, sources: int) -> tuple[dict | None, list[dict]]:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id, version_code, apk_filename, apk_relative_path, apk_sha256, file_size_bytes
+                FROM app_release
+                WHERE platform = %s
+                  AND is_active = TRUE
+                ORDER BY version_code DESC, created_at DESC
+                LIMIT 1;
+                """,
+                (platform,),
+            )
+            row = cur.fetchone()
+            if not row:
+                return None, []
+            columns = (
+                "id",
+                "version_code",
+                "apk_filename",
+                "apk_relative_path",
+                "apk_sha256",
+                "file_size_bytes",
+            )
+            target = dict(zip(columns, row))
+            # The window is the `sources` most recent earlier versions. Pairs
+            # already published or judged not worth it are skipped inside
+            # it, so re-runs never reach further back in history.
+            cur.execute(
+                """
+                WITH ranked AS (
+                    SELECT
+                        id,
+                        version_code,
+                        apk_filename,
+                        apk_relative_path,
+                        apk_sha256,
+                        file_size_bytes,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY version_code
+                            ORDER BY created_at DESC, id DESC
+                        ) AS version_rank
+                    FROM app_release
+                    WHERE platform = %s
+                      AND version_code < %s
+                ),
+                recent AS (
+                    SELECT id, version_code, apk_filename, apk_relative_path, apk_sha256, file_size_bytes
+                    FROM ranked
+                    WHERE version_rank = 1
+                    ORDER BY version_code DESC
+                    LIMIT %s
+                )
+                SELECT
+                    source.id,
+                    source.version_code,
+                    source.apk_filename,
+                    source.apk_relative_path,
+                    source.apk_sha256,
+                    source.file_size_bytes
+                FROM recent AS source
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM app_release_patch AS patch
+                    WHERE patch.release_id = %s
+                      AND patch.from_release_id = source.id
+                      AND patch.patch_format = %s
+                )
+                ORDER BY source.version_code DESC;
+                """,
+                (platform, target["version_code"], sources, target["id"], PATCH_FORMAT),
+            )
+            return target, [dict(zip(columns, row)) for row in cur.fetchall()]
+    finally:
+        conn.rollback()
+        put_db_conn(conn)
+
+
+def _record_patch(
+    target: dict,
+    source: dict,
+    built: dict,
+    *,
+    outcome: str = PATCH_PUBLISHED,
+    filename: str | None = None,
+    relative_path: str | None = None,
+) -> None:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO app_release_patch (
+                    release_id,
+                    from_release_id,
+                    patch_format,
+                    outcome,
+                    patch_filename,
+                    patch_relative_path,
+                    patch_sha256,
+                    patch_size_bytes
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (release_id, from_release_id, patch_format) DO NOTHING;
+                """,
+                (
+                    target["id"],
+                    source["id"],
+                    PATCH_FORMAT,
+                    outcome,
+                    filename,
+                    relative_path,
+                    built["patch_sha256"] if outcome == PATCH_PUBLISHED else None,
+                    built["patch_size_bytes"],
+                ),
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        put_db_conn(conn)
+
+
+def generate_release_patches(platform: str, *, sources: int = PATCH_SOURCE_RELEASES) -> list[dict]:
+    """
+    Create patches to the active release from the previous `sources` releases.
+
+    Each pair is diffed once: published patches and patches that saved too
+    little are both recorded and skipped on later runs.
+
+    A source whose file no longer matches its published hash is skipped,
+    because phones running it would fail to apply the patch.
+    """
+    target, candidates = _patch_candidates(platform, sources)
+    if target is None:
+        return []
+    target_path = resolve_release_file_path(target["apk_relative_path"])
+    if _sha256_file(target_path) != target["apk_sha256"]:
+        raise AppUpdatePatchError(f"Active release file does not match its hash: {target['apk_filename']}")
+
+    results = []
+    for source in candidates:
+        result = {"from_version_code": source["version_code"], "to_version_code": target["version_code"]}
+        source_path = resolve_release_file_path(source["apk_relative_path"])
+        if not source_path.is_file() or _sha256_file(source_path) != source["apk_sha256"]:
+            results.append({**result, "status": "skipped", "reason": "source file missing or changed"})
+            continue
+
+        filename = f"{Path(target['apk_filename']).stem}.from-v{source['version_code']}.{PATCH_FORMAT}"
+        relative_path = str(PurePosixPath(target["apk_relative_path"]).parent / "patches" / filename)
+        destination = resolve_release_file_path(relative_path)
+        built = build_release_patch(source_path, target_path, destination)
+        if built["patch_size_bytes"] >= target["file_size_bytes"] * MAX_PATCH_SHARE:
+            destination.unlink()
+            # Recorded so later runs do not diff this pair again.
+            _record_patch(target, source, built, outcome=PATCH_NOT_WORTH_IT)
+            results.append({**result, "status": "skipped", "reason": "patch saves too little", **built})
+            continue
+
+        _record_patch(target, source, built, filename=filename, relative_path=relative_path)
+        results.append({**result, "status": "created", "patch_relative_path": relative_path, **built})
+    return results
@@ -98,3 +98,88 @@ def get_app_release_by_id(release_id: int) -> dict | None:
 
 def resolve_release_file_path(apk_relative_path: str) -> Path:
     return RELEASES_BASE_DIR / apk_relative_path
+
+
+def get_release_patch(release_id: int, from_version_code: int) -> dict | None:
+    """Return the smallest patch from from_version_code that beats the full APK."""
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT
+                    patch.id,
+                    patch.patch_format,
+                    patch.patch_sha256,
+                    patch.patch_size_bytes,
+                    source.version_code,
+                    source.apk_sha256
+                FROM app_release_patch AS patch
+                JOIN app_release AS source ON source.id = patch.from_release_id
+                JOIN app_release AS target ON target.id = patch.release_id
+                WHERE patch.release_id = %s
+                  AND patch.outcome = 'published'
+                  AND source.platform = target.platform
+                  AND source.version_code = %s
+                  AND patch.patch_size_bytes < target.file_size_bytes
+                ORDER BY patch.patch_size_bytes ASC, patch.id DESC
+                LIMIT 1;
+                """,
+                (release_id, from_version_code),
+            )
+            row = cur.fetchone()
+
+        if not row:
+            return None
+
+        return {
+            "id": row[0],
+            "format": row[1],
+            "patch_sha256": row[2],
+            "patch_size_bytes": row[3],
+            "from_version_code": row[4],
+            "from_apk_sha256": row[5],
+        }
+    finally:
+        put_db_conn(conn)
+
+
+def get_release_patch_by_id(patch_id: int) -> dict | None:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT
+                    id,
+                    release_id,
+                    from_release_id,
+                    patch_format,
+                    patch_filename,
+                    patch_relative_path,
+                    patch_sha256,
+                    patch_size_bytes
+                FROM app_release_patch
+                WHERE id = %s
+                  AND outcome = 'published'
+                LIMIT 1;
+                """,
+                (patch_id,),
+            )
+            row = cur.fetchone()
+
+        if not row:
+            return None
+
+        return {
+            "id": row[0],
+            "release_id": row[1],
+            "from_release_id": row[2],
+            "patch_format": row[3],
+            "patch_filename": row[4],
+            "patch_relative_path": row[5],
+            "patch_sha256": row[6],
+            "patch_size_bytes": row[7],
+        }
+    finally:
+        put_db_conn(conn)
@@ -2,17 +2,14 @@
 from __future__ import annotations
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, List
-
-from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
+from typing import TYPE_CHECKING, Callable, Dict, List
 
 from backend.config import load_application_config
 
+# Selenium is imported when a login runs so the API does not load it at startup.
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 @dataclass
 class AutoLoginResult:
     success: bool
@@ -50,6 +47,9 @@ class AutoLoginService:
     # ---------- helpers ----------
 
     def _new_driver(self) -> webdriver.Chrome:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         opts = Options()
         opts.add_argument('--headless=new')
         opts.add_argument('--no-sandbox')
@@ -62,6 +62,10 @@ class AutoLoginService:
     # ---------- providers ----------
 
     def _login_fanduel(self, code: str, logs: List[str]) -> None:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         cfg = load_application_config()
         fd = cfg.get('Auto Login.fanduel', {})
 
@@ -143,6 +147,9 @@ def _select_tv_provider(d, wait, provider_name: str, logs: list[str]) -> None:
       2) Otherwise, open the 'Search for more providers' dialog,
          type a query (e.g., 'alta'), and click the matching item.
     """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+
     pname = provider_name.strip().lower()
 
     def _contains_case_insensitive(text: str) -> str:
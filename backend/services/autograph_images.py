@@ -0,0 +1,266 @@
+# Python Imports
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import logging
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from uuid import uuid4
+
+# 3rd Party Imports
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import FileResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+# Local Imports
+
+
+logger = logging.getLogger("autograph_images")
+
+AUTOGRAPH_IMAGE_DIR = Path("/opt/remihub/data/autographs")
+AUTOGRAPH_IMAGE_DIR.mkdir(parents=True, exist_ok=True)
+MAX_IMAGE_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB
+UPLOAD_CHUNK_BYTES = 256 * 1024
+
+ALLOWED_IMAGE_TYPES = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+}
+
+# Longest edge in pixels for each served derivative.
+IMAGE_DERIVATIVE_SIZES = {
+    "thumb": 320,
+    "medium": 1280,
+}
+IMAGE_SIZES = ("original", *IMAGE_DERIVATIVE_SIZES)
+DERIVATIVE_WEBP_QUALITY = 80
+# A failed derivative is not rescheduled by requests until this has passed.
+DERIVATIVE_RETRY_SECONDS = 15 * 60
+
+# Content-hash names never change meaning, so browsers may cache them
+# forever. Legacy uuid names are revalidated daily.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+LEGACY_CACHE_CONTROL = "public, max-age=86400"
+
+CONTENT_HASH_FILENAME = re.compile(r"^[0-9a-f]{64}\.(?:jpg|png|webp)$")
+SAFE_FILENAME = re.compile(r"^[0-9A-Za-z][0-9A-Za-z._-]{0,127}$")
+
+_derivative_executor = ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="autograph-derivatives",
+)
+_derivative_lock = threading.Lock()
+# Originals queued or being processed, and monotonic retry-after times for
+# originals whose derivatives failed.
+_derivatives_pending: set[str] = set()
+_derivative_retry_after: dict[str, float] = {}
+
+
+def derivative_dir() -> Path:
+    return AUTOGRAPH_IMAGE_DIR / "derivatives"
+
+
+def derivative_path(filename: str, size: str) -> Path:
+    return derivative_dir() / f"{Path(filename).stem}.{size}.webp"
+
+
+def generate_image_derivatives(filename: str) -> list[Path]:
+    """Write the thumbnail and medium WebP variants for one original."""
+    from PIL import Image, ImageOps
+
+    source = AUTOGRAPH_IMAGE_DIR / filename
+    derivative_dir().mkdir(parents=True, exist_ok=True)
+    written = []
+
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        for size, longest_edge in IMAGE_DERIVATIVE_SIZES.items():
+            target = derivative_path(filename, size)
+            if target.exists():
+                continue
+
+            resized = image.copy()
+            resized.thumbnail((longest_edge, longest_edge))
+
+            temp_target = target.with_name(f".{target.name}.{uuid4().hex}.tmp")
+            try:
+                resized.save(temp_target, "WEBP", quality=DERIVATIVE_WEBP_QUALITY)
+                os.replace(temp_target, target)
+            finally:
+                temp_target.unlink(missing_ok=True)
+            written.append(target)
+
+    return written
+
+
+def _generate_derivatives_logged(filename: str) -> None:
+    try:
+        generate_image_derivatives(filename)
+    except Exception:
+        logger.exception("Failed to generate derivatives for %s", filename)
+        with _derivative_lock:
+            _derivative_retry_after[filename] = time.monotonic() + DERIVATIVE_RETRY_SECONDS
+    else:
+        with _derivative_lock:
+            _derivative_retry_after.pop(filename, None)
+    finally:
+        with _derivative_lock:
+            _derivatives_pending.discard(filename)
+
+
+def schedule_image_derivatives(filename: str):
+    """
+    Queue derivative generation unless it is already queued or recently failed.
+
+    Returns the future, or None when nothing was scheduled.
+    """
+    with _derivative_lock:
+        if filename in _derivatives_pending:
+            return None
+        if _derivative_retry_after.get(filename, 0.0) > time.monotonic():
+            return None
+        _derivatives_pending.add(filename)
+
+    return _derivative_executor.submit(_generate_derivatives_logged, filename)
+
+
+def _finalize_upload(temp_path: Path, file_path: Path) -> None:
+    if file_path.exists():
+        # Same content already stored under its hash.
+        temp_path.unlink(missing_ok=True)
+        return
+    os.replace(temp_path, file_path)
+
+
+async def upload_autograph_image(file: UploadFile):
+    """
+    Stream an upload to disk in chunks, named by its sha256.
+
+    Disk writes run in the threadpool so a slow NAS never blocks the event
+    loop, and identical uploads share one stored file.
+    """
+    if file.content_type not in ALLOWED_IMAGE_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail="Only JPEG, PNG, and WEBP images are allowed.",
+        )
+
+    extension = ALLOWED_IMAGE_TYPES[file.content_type]
+    temp_path = AUTOGRAPH_IMAGE_DIR / f".upload-{uuid4().hex}{extension}.tmp"
+    digest = hashlib.sha256()
+    total_bytes = 0
+
+    try:
+        output_file = await run_in_threadpool(open, temp_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+                total_bytes += len(chunk)
+                if total_bytes > MAX_IMAGE_SIZE_BYTES:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Image is too large. Maximum size is 5 MB.",
+                    )
+                digest.update(chunk)
+                await run_in_threadpool(output_file.write, chunk)
+        finally:
+            await run_in_threadpool(output_file.close)
+
+        if total_bytes == 0:
+            raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+
+        filename = f"{digest.hexdigest()}{extension}"
+        await run_in_threadpool(
+            _finalize_upload,
+            temp_path,
+            AUTOGRAPH_IMAGE_DIR / filename,
+        )
+        schedule_image_derivatives(filename)
+
+        return {
+            "success": True,
+            "image_path": f"/autographs/image/{filename}",
+            "filename": filename,
+        }
+
+    except HTTPException:
+        raise
+
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip() for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def get_autograph_image(
+    filename: str,
+    size: str = "original",
+    if_none_match: str | None = None,
+):
+    if not SAFE_FILENAME.fullmatch(filename):
+        raise HTTPException(status_code=404, detail="Image not found.")
+
+    if size not in IMAGE_SIZES:
+        raise HTTPException(status_code=400, detail="Unknown image size.")
+
+    file_path = AUTOGRAPH_IMAGE_DIR / filename
+
+    if not file_path.exists() or not file_path.is_file():
+        raise HTTPException(status_code=404, detail="Image not found.")
+
+    served_path = file_path
+    served_size = "original"
+
+    if size != "original":
+        variant = derivative_path(filename, size)
+        if variant.is_file():
+            served_path = variant
+            served_size = size
+        else:
+            # Fall back to the original until the worker catches up.
+            schedule_image_derivatives(filename)
+
+    if CONTENT_HASH_FILENAME.fullmatch(filename):
+        etag = f'"{Path(filename).stem}-{served_size}"'
+        cache_control = IMMUTABLE_CACHE_CONTROL
+        if served_size != size:
+            # Do not pin the fallback original under the derivative URL.
+            cache_control = "no-cache"
+    else:
+        stat_result = served_path.stat()
+        etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}-{served_size}"'
+        cache_control = LEGACY_CACHE_CONTROL
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(served_path, headers=headers)
+
+
+def delete_autograph_image(filename: str) -> None:
+    """Remove an original and its derivatives once nothing references it."""
+    file_path = AUTOGRAPH_IMAGE_DIR / filename
+
+    if file_path.exists() and file_path.is_file():
+        file_path.unlink()
+
+    for size in IMAGE_DERIVATIVE_SIZES:
+        derivative_path(filename, size).unlink(missing_ok=True)
+
+    with _derivative_lock:
+        _derivative_retry_after.pop(filename, None)
@@ -1,72 +1,29 @@
 # Python Imports
 from pathlib import Path
-from uuid import uuid4
 
 # 3rd Party Imports
 from fastapi import HTTPException, UploadFile
-from fastapi.responses import FileResponse
 
 # Local Imports
 from backend.database.database import get_db_conn, put_db_conn
 from backend.models.autographs import AutographCreate, AutographEntry
-
-
-AUTOGRAPH_IMAGE_DIR = Path("/opt/remihub/data/autographs")
-AUTOGRAPH_IMAGE_DIR.mkdir(parents=True, exist_ok=True)
-MAX_IMAGE_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB
-
-ALLOWED_IMAGE_TYPES = {
-    "image/jpeg": ".jpg",
-    "image/png": ".png",
-    "image/webp": ".webp",
-}
+from backend.services import autograph_images
 
 
 async def upload_autograph_image(file: UploadFile):
-    if file.content_type not in ALLOWED_IMAGE_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail="Only JPEG, PNG, and WEBP images are allowed.",
-        )
+    return await autograph_images.upload_autograph_image(file)
 
-    extension = ALLOWED_IMAGE_TYPES[file.content_type]
-    filename = f"{uuid4()}{extension}"
-    file_path = AUTOGRAPH_IMAGE_DIR / filename
 
-    try:
-        contents = await file.read()
-
-        if not contents:
-            raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-
-        if len(contents) > MAX_IMAGE_SIZE_BYTES:
-            raise HTTPException(
-                status_code=400,
-                detail="Image is too large. Maximum size is 5 MB.",
-            )
-        with open(file_path, "wb") as output_file:
-            output_file.write(contents)
-
-        return {
-            "success": True,
-            "image_path": f"/autographs/image/{filename}",
-            "filename": filename,
-        }
-
-    except HTTPException:
-        raise
-
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
-
-
-def get_autograph_image(filename: str):
-    file_path = AUTOGRAPH_IMAGE_DIR / filename
-
-    if not file_path.exists() or not file_path.is_file():
-        raise HTTPException(status_code=404, detail="Image not found.")
-
-    return FileResponse(file_path)
+def get_autograph_image(
+    filename: str,
+    size: str = "original",
+    if_none_match: str | None = None,
+):
+    return autograph_images.get_autograph_image(
+        filename,
+        size=size,
+        if_none_match=if_none_match,
+    )
 
 
 def add_autograph(entry: AutographCreate):
@@ -188,15 +145,26 @@ def delete_autograph(autograph_id: int):
             (autograph_id,),
         )
 
+        remove_image = False
         if image_path:
-            filename = Path(image_path).name
-            file_path = AUTOGRAPH_IMAGE_DIR / filename
-
-            if file_path.exists() and file_path.is_file():
-                file_path.unlink()
+            # Content-hash uploads are shared by identical images.
+            cur.execute(
+                """
+                SELECT EXISTS (
+                    SELECT 1
+                    FROM autograph_entries
+                    WHERE image_path = %s
+                )
+                """,
+                (image_path,),
+            )
+            remove_image = not cur.fetchone()[0]
 
         conn.commit()
 
+        if remove_image:
+            autograph_images.delete_autograph_image(Path(image_path).name)
+
         return {
             "success": True,
             "deleted_id": autograph_id,
@@ -0,0 +1,384 @@
+import os
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+# 3rd Party Imports
+from pydantic import BaseModel
+
+# Local Imports
+from backend.tasks.media_conversion import (
+    ConversionProgress,
+    ConversionResult,
+    iter_mp4_files,
+)
+
+MEDIA_CONVERSION_ROOTS = tuple(
+    Path(root).expanduser()
+    for root in os.getenv(
+        "REMIHUB_MEDIA_CONVERSION_ROOTS",
+        "/mnt/plex-pool/Movies",
+    ).split(os.pathsep)
+    if root.strip()
+)
+JOB_LEASE_DURATION = timedelta(minutes=10)
+MAX_JOB_ATTEMPTS = 3
+MAX_ENQUEUE_FILES = 50_000
+JOB_COLUMNS = """
+    id,
+    source_path,
+    target_path,
+    status,
+    delete_source,
+    overwrite,
+    worker_id,
+    attempt_count,
+    duration_seconds,
+    out_time_seconds,
+    progress_percent,
+    speed,
+    eta_seconds,
+    elapsed_seconds,
+    message,
+    created_at,
+    started_at,
+    finished_at,
+    updated_at
+"""
+TERMINAL_STATUSES = {"converted", "skipped", "skipped_existing", "failed"}
+
+
+class MediaConversionPathError(ValueError):
+    pass
+
+
+class MediaConversionEnqueueRequest(BaseModel):
+    paths: list[str] = []
+    root: str | None = None
+    delete_source: bool = False
+    overwrite: bool = False
+    limit: int | None = None
+
+
+def _serialize_value(value):
+    if isinstance(value, UUID):
+        return str(value)
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+
+    return value
+
+
+def _job_from_row(columns, row) -> dict:
+    return {
+        column: _serialize_value(value)
+        for column, value in zip(columns, row)
+    }
+
+
+def resolve_conversion_path(raw_path: str | Path) -> Path:
+    """
+    Resolve a requested path and require it to live under an allowed root.
+
+    The queue runs ffmpeg and may delete sources, so API callers are limited
+    to the configured media libraries.
+    """
+    path = Path(raw_path).expanduser().resolve()
+
+    for root in MEDIA_CONVERSION_ROOTS:
+        resolved_root = root.resolve()
+        if path == resolved_root or resolved_root in path.parents:
+            return path
+
+    raise MediaConversionPathError(
+        f"Path is outside the configured media conversion roots: {raw_path}"
+    )
+
+
+def collect_conversion_sources(req: MediaConversionEnqueueRequest) -> list[Path]:
+    limit = min(req.limit or MAX_ENQUEUE_FILES, MAX_ENQUEUE_FILES)
+    sources: list[Path] = []
+
+    for raw_path in req.paths:
+        path = resolve_conversion_path(raw_path)
+        if path.suffix.lower() != ".mp4":
+            raise MediaConversionPathError(f"Source is not an .mp4 file: {raw_path}")
+        sources.append(path)
+
+    if req.root:
+        root = resolve_conversion_path(req.root)
+        if not root.is_dir():
+            raise MediaConversionPathError(f"Root path is not a directory: {req.root}")
+
+        for path in iter_mp4_files(root):
+            if len(sources) >= limit:
+                break
+            sources.append(path)
+
+    if not sources:
+        raise MediaConversionPathError("At least one path or root is required")
+
+    return sources[:limit]
+
+
+def enqueue_conversion_jobs(
+    sources: list[Path],
+    *,
+    delete_source: bool = False,
+    overwrite: bool = False,
+) -> dict:
+    """
+    Queue remux jobs for each source.
+
+    Sources that already have a queued or running job are left alone, so a
+    library scan can be re-enqueued safely.
+    """
+    from backend.database.database import get_db_conn, put_db_conn
+
+    queued = 0
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            for source in sources:
+                cur.execute(
+                    """
+                    INSERT INTO media_conversion_jobs (
+                        source_path,
+                        target_path,
+                        delete_source,
+                        overwrite
+                    )
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (source_path)
+                        WHERE status IN ('queued', 'running')
+                        DO NOTHING
+                    """,
+                    (
+                        str(source),
+                        str(source.with_suffix(".mkv")),
+                        delete_source,
+                        overwrite,
+                    ),
+                )
+                queued += cur.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        put_db_conn(conn)
+
+    return {
+        "success": True,
+        "requested": len(sources),
+        "queued": queued,
+        "already_queued": len(sources) - queued,
+    }
+
+
+def list_conversion_jobs(*, status: str | None = None, limit: int = 100) -> dict:
+    from backend.database.database import get_db_conn, put_db_conn
+
+    limit = max(1, min(limit, 500))
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT status, count(*)
+                FROM media_conversion_jobs
+                GROUP BY status
+                """
+            )
+            counts = {row[0]: row[1] for row in cur.fetchall()}
+
+            cur.execute(
+                f"""
+                SELECT {JOB_COLUMNS}
+                FROM media_conversion_jobs
+                WHERE (%s::text IS NULL OR status = %s)
+                ORDER BY updated_at DESC, id
+                LIMIT %s
+                """,
+                (status, status, limit),
+            )
+            columns = [desc[0] for desc in cur.description]
+            jobs = [_job_from_row(columns, row) for row in cur.fetchall()]
+
+        return {"success": True, "counts": counts, "data": jobs}
+    finally:
+        put_db_conn(conn)
+
+
+def get_conversion_job(job_id: str) -> dict | None:
+    from backend.database.database import get_db_conn, put_db_conn
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT {JOB_COLUMNS}
+                FROM media_conversion_jobs
+                WHERE id = %s
+                """,
+                (job_id,),
+            )
+            row = cur.fetchone()
+            if not row:
+                return None
+
+            columns = [desc[0] for desc in cur.description]
+            return _job_from_row(columns, row)
+    finally:
+        put_db_conn(conn)
+
+
+def requeue_abandoned_conversion_jobs(conn) -> int:
+    """
+    Return jobs whose worker stopped heartbeating to the queue.
+
+    ffmpeg always writes to a temp file first, so an interrupted job restarts
+    that file from scratch. Jobs that keep getting interrupted are failed.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE media_conversion_jobs
+            SET status = CASE
+                    WHEN attempt_count >= %s THEN 'failed'
+                    ELSE 'queued'
+                END,
+                message = CASE
+                    WHEN attempt_count >= %s
+                        THEN 'Conversion interrupted too many times'
+                    ELSE 'Requeued after interrupted conversion'
+                END,
+                finished_at = CASE
+                    WHEN attempt_count >= %s THEN now()
+                    ELSE NULL
+                END,
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                updated_at = now()
+            WHERE status = 'running'
+              AND lease_expires_at < now()
+            """,
+            (MAX_JOB_ATTEMPTS, MAX_JOB_ATTEMPTS, MAX_JOB_ATTEMPTS),
+        )
+        return cur.rowcount
+
+
+def claim_next_conversion_job(conn, *, worker_id: str) -> dict | None:
+    with conn.cursor() as cur:
+        cur.execute(
+            f"""
+            UPDATE media_conversion_jobs
+            SET status = 'running',
+                worker_id = %s,
+                lease_expires_at = %s,
+                attempt_count = attempt_count + 1,
+                started_at = now(),
+                finished_at = NULL,
+                progress_percent = NULL,
+                eta_seconds = NULL,
+                message = NULL,
+                updated_at = now()
+            WHERE id = (
+                SELECT id
+                FROM media_conversion_jobs
+                WHERE status = 'queued'
+                ORDER BY created_at, id
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING {JOB_COLUMNS}
+            """,
+            (worker_id, datetime.now(timezone.utc) + JOB_LEASE_DURATION),
+        )
+        row = cur.fetchone()
+        if not row:
+            return None
+
+        columns = [desc[0] for desc in cur.description]
+        return _job_from_row(columns, row)
+
+
+def record_conversion_progress(
+    conn,
+    *,
+    job_id: str,
+    worker_id: str,
+    progress: ConversionProgress,
+) -> None:
+    """Store the latest progress and extend the job lease."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE media_conversion_jobs
+            SET duration_seconds = %s,
+                out_time_seconds = %s,
+                progress_percent = %s,
+                speed = %s,
+                eta_seconds = %s,
+                lease_expires_at = %s,
+                updated_at = now()
+            WHERE id = %s
+              AND worker_id = %s
+              AND status = 'running'
+            """,
+            (
+                progress.duration_seconds,
+                progress.out_time_seconds,
+                progress.percent,
+                progress.speed,
+                round(progress.eta_seconds) if progress.eta_seconds is not None else None,
+                datetime.now(timezone.utc) + JOB_LEASE_DURATION,
+                job_id,
+                worker_id,
+            ),
+        )
+
+
+def finish_conversion_job(
+    conn,
+    *,
+    job_id: str,
+    worker_id: str,
+    result: ConversionResult,
+) -> None:
+    status = result.status if result.status in TERMINAL_STATUSES else "skipped"
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE media_conversion_jobs
+            SET status = %s,
+                message = %s,
+                elapsed_seconds = %s,
+                progress_percent = CASE
+                    WHEN %s = 'converted' THEN 100
+                    ELSE progress_percent
+                END,
+                eta_seconds = NULL,
+                lease_expires_at = NULL,
+                finished_at = now(),
+                updated_at = now()
+            WHERE id = %s
+              AND worker_id = %s
+              AND status = 'running'
+            """,
+            (
+                status,
+                result.message[:4000],
+                result.elapsed_seconds,
+                status,
+                job_id,
+                worker_id,
+            ),
+        )
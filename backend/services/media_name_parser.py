@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+
+SEASON_EPISODE_PATTERN = re.compile(r"S\d{1,2}([-+]?E\d{1,2})+")
+EPISODE_ONLY_PATTERN = re.compile(r"EP\d{1,2}")
+SEASON_X_EPISODE_PATTERN = re.compile(r"\d{1}X\d{1,2}")
+RESOLUTION_PATTERN = re.compile(r"\d{3,4}P")
+# Four digits, unless they are a resolution such as 2160p.
+YEAR_PATTERN = re.compile(r"\d{4}(?!P)")
+
+# Whole-series replacements, keyed by the upper-cased parsed series name.
+DEFAULT_SERIES_ALIASES = {
+    "MXC": "MXC Most Extreme Elimination Challenge",
+}
+
+# Token fixes for words that str.title() mangles.
+DEFAULT_SERIES_TOKEN_FIXES = (
+    (" Ii ", " II "),
+    ("Bbc", "BBC"),
+)
+
+
+class MediaNameError(ValueError):
+    pass
+
+
+def _extension(file_name: str) -> str:
+    return os.path.splitext(file_name)[1].lstrip(".").lower()
+
+
+def _year_match(name: str) -> re.Match | None:
+    # A leading number is the title itself (1923, 2001 A Space Odyssey), not
+    # its year, so only a year with title text before it counts.
+    for match in YEAR_PATTERN.finditer(name):
+        if name[: match.start()].strip(" .-("):
+            return match
+    return None
+
+
+@dataclass(frozen=True)
+class ParsedEpisode:
+    series: str
+    year: str | None
+    season: int
+    episode: int
+    episode_title: str | None
+    extension: str
+
+    @property
+    def file_name(self) -> str:
+        episode_title = f" - {self.episode_title}" if self.episode_title else ""
+        if self.year:
+            return (
+                f"{self.series} ({self.year}) - "
+                f"S{self.season:02d}E{self.episode:02d}{episode_title}.{self.extension}"
+            )
+        return f"{self.series} - S{self.season:02d}E{self.episode:02d}{episode_title}.{self.extension}"
+
+    @property
+    def series_dir(self) -> str:
+        return self.file_name.split("-")[0].strip()
+
+    @property
+    def season_dir(self) -> str:
+        return f"Season {self.season:02d}"
+
+
+@dataclass(frozen=True)
+class ParsedMovie:
+    title: str
+    year: str
+    extension: str
+
+    @property
+    def file_name(self) -> str:
+        return f"{self.title} ({self.year}).{self.extension}"
+
+
+class MediaNameParser:
+    """
+    Turn download release names into Plex library names.
+
+    Patterns are compiled once at import and the series alias table is
+    configurable, so new naming fixes do not need code changes.
+    """
+
+    def __init__(
+        self,
+        *,
+        series_aliases: dict[str, str] | None = None,
+        token_fixes: tuple[tuple[str, str], ...] = DEFAULT_SERIES_TOKEN_FIXES,
+    ):
+        aliases = dict(DEFAULT_SERIES_ALIASES)
+        aliases.update(series_aliases or {})
+        self.series_aliases = {key.upper(): value for key, value in aliases.items()}
+        self.token_fixes = token_fixes
+
+    def parse_tv(self, file_name: str) -> ParsedEpisode:
+        release = file_name.upper().replace(".", " ")
+
+        match = SEASON_EPISODE_PATTERN.search(release)
+        if match:
+            info = match.group()
+            try:
+                season = int(info.split("E")[0].split("S")[1])
+                episode = int(info.split("E")[1])
+            except ValueError as exc:
+                raise MediaNameError(f"Unsupported episode marker {info!r}") from exc
+        elif match := EPISODE_ONLY_PATTERN.search(release):
+            info = match.group()
+            season = 1
+            episode = int(info.strip("EP"))
+        elif match := SEASON_X_EPISODE_PATTERN.search(release):
+            info = match.group()
+            season, episode = (int(part) for part in info.split("X"))
+        else:
+            raise MediaNameError(f"No season/episode marker found in {file_name!r}")
+
+        before, extra = release.split(info)[:2]
+        series = self._apply_series_fixes(before.replace("-", "").strip().title())
+        extra = extra.replace("-", "").replace("(", "").replace(")", "")
+
+        resolution = RESOLUTION_PATTERN.search(extra)
+        episode_title = (
+            extra.split(resolution.group())[0].strip().title()
+            if resolution
+            else None
+        )
+
+        year = None
+        if year_match := _year_match(series):
+            year = year_match.group()
+            series = series[: year_match.start()].replace("(", "").replace(")", "").strip()
+
+        return ParsedEpisode(
+            series=series,
+            year=year,
+            season=season,
+            episode=episode,
+            episode_title=episode_title,
+            extension=_extension(file_name),
+        )
+
+    def parse_movie(self, file_name: str) -> ParsedMovie | None:
+        release = file_name.upper()
+
+        year_match = _year_match(release)
+        if not year_match:
+            return None
+
+        year = year_match.group()
+        title = (
+            release[: year_match.start()]
+            .replace(".", " ")
+            .replace("(", "")
+            .replace(")", "")
+            .strip()
+        )
+        return ParsedMovie(
+            title=title.title(),
+            year=year,
+            extension=_extension(file_name),
+        )
+
+    def _apply_series_fixes(self, series: str) -> str:
+        alias = self.series_aliases.get(series.upper())
+        if alias:
+            return alias
+
+        for old, new in self.token_fixes:
+            series = series.replace(old, new)
+        return series
+
+
+class SeriesDirectoryCache:
+    """
+    Remember library directories that are known to exist.
+
+    Most downloads land in an existing Season folder, so the filesystem is
+    only touched the first time a directory is seen by this process.
+    """
+
+    def __init__(self):
+        self._known: set[Path] = set()
+        self._lock = threading.Lock()
+
+    def ensure(self, directory: str | Path) -> bool:
+        """Create directory if needed; return True when it had to be created."""
+        path = Path(directory)
+        with self._lock:
+            if path in self._known:
+                return False
+
+        created = False
+        try:
+            os.makedirs(path)
+            created = True
+        except FileExistsError:
+            pass
+
+        with self._lock:
+            self._known.add(path)
+        return created
+
+    def invalidate(self, directory: str | Path) -> None:
+        with self._lock:
+            self._known.discard(Path(directory))
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+
+
+PROC_ROOT = Path("/proc")
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+CACHE_FILENAME = "process-presence.json"
+
+
+@dataclass(frozen=True)
+class ProcessIdentity:
+    pid: int
+    # Clock ticks after boot; a recycled PID gets a different value.
+    start_time: int
+
+
+@dataclass(frozen=True)
+class ProcessLookup:
+    identity: ProcessIdentity | None
+    source: str | None = None
+
+    @property
+    def present(self) -> bool:
+        return self.identity is not None
+
+
+def default_cache_path() -> Path | None:
+    runtime_dir = os.environ.get("RUNTIME_DIRECTORY") or os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        return None
+    # RUNTIME_DIRECTORY may list several directories separated by colons.
+    return Path(runtime_dir.split(":", 1)[0]) / "remihub-health" / CACHE_FILENAME
+
+
+class ProcessPresenceIndex:
+    """
+    Locate long-running processes without scanning /proc on every check.
+
+    A process is found, in order, through the MainPID most recently reported
+    by its systemd unit (and that unit's cgroup), through the PID cached from
+    an earlier lookup, and only then through a full /proc scan. Cached PIDs
+    are re-validated against their command line and start time, so a
+    recycled PID is never mistaken for the original process. When a cache
+    path is available, cached PIDs survive across collector runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        proc_root: Path = PROC_ROOT,
+        cgroup_root: Path = CGROUP_ROOT,
+        cache_path: Path | None = None,
+    ):
+        self._proc_root = proc_root
+        self._cgroup_root = cgroup_root
+        self._cache_path = cache_path
+        self._lock = threading.Lock()
+        self._cache: dict[str, ProcessIdentity] | None = None
+        self._main_pid_hints: dict[str, int] = {}
+
+    def note_main_pid(self, key: str, pid: int | None) -> None:
+        """Record the MainPID a systemd query reported for the process."""
+        with self._lock:
+            if pid:
+                self._main_pid_hints[key] = pid
+            else:
+                self._main_pid_hints.pop(key, None)
+
+    def locate(self, key: str, marker: str) -> ProcessLookup:
+        with self._lock:
+            main_pid = self._main_pid_hints.pop(key, None)
+            cached = self._load_cache().get(key)
+
+        if main_pid is not None:
+            identity = self._match(main_pid, marker)
+            if identity is None:
+                identity = self._match_in_cgroup(main_pid, marker)
+            if identity is not None:
+                self._remember(key, identity)
+                return ProcessLookup(identity, "systemd_main_pid")
+
+        if cached is not None:
+            identity = self._match(cached.pid, marker)
+            if identity == cached:
+                return ProcessLookup(identity, "cached_pid")
+
+        identity = self._scan(marker)
+        self._remember(key, identity)
+        return ProcessLookup(identity, "proc_scan" if identity else None)
+
+    def _start_time(self, pid: int) -> int | None:
+        try:
+            stat = (self._proc_root / str(pid) / "stat").read_text(encoding="utf-8")
+        except (FileNotFoundError, PermissionError, ProcessLookupError):
+            return None
+        # comm may contain spaces or parentheses, so parse after the last ")".
+        fields = stat.rsplit(")", 1)[-1].split()
+        try:
+            return int(fields[19])
+        except (IndexError, ValueError):
+            return None
+
+    def _match(self, pid: int, marker: str) -> ProcessIdentity | None:
+        try:
+            cmdline = (self._proc_root / str(pid) / "cmdline").read_text(
+                encoding="utf-8",
+                errors="replace",
+            )
+        except (FileNotFoundError, PermissionError, ProcessLookupError):
+            return None
+        if marker not in cmdline:
+            return None
+        start_time = self._start_time(pid)
+        if start_time is None:
+            return None
+        return ProcessIdentity(pid=pid, start_time=start_time)
+
+    def _match_in_cgroup(self, main_pid: int, marker: str) -> ProcessIdentity | None:
+        # MainPID may be a launcher; the service's cgroup holds the real process.
+        try:
+            cgroup = (self._proc_root / str(main_pid) / "cgroup").read_text(encoding="utf-8")
+        except (FileNotFoundError, PermissionError, ProcessLookupError):
+            return None
+        for line in cgroup.splitlines():
+            hierarchy, _, path = line.partition("::")
+            if hierarchy != "0" or not path.startswith("/"):
+                continue
+            try:
+                procs = (self._cgroup_root / path.lstrip("/") / "cgroup.procs").read_text(
+                    encoding="utf-8"
+                )
+            except OSError:
+                return None
+            for pid in procs.split():
+                if pid.isdigit() and int(pid) != main_pid:
+                    identity = self._match(int(pid), marker)
+                    if identity is not None:
+                        return identity
+        return None
+
+    def _scan(self, marker: str) -> ProcessIdentity | None:
+        for pid in os.listdir(self._proc_root):
+            if not pid.isdigit():
+                continue
+            identity = self._match(int(pid), marker)
+            if identity is not None:
+                return identity
+        return None
+
+    def _load_cache(self) -> dict[str, ProcessIdentity]:
+        if self._cache is not None:
+            return self._cache
+        self._cache = {}
+        if self._cache_path is None:
+            return self._cache
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            for key, value in payload.items():
+                self._cache[key] = ProcessIdentity(
+                    pid=int(value["pid"]),
+                    start_time=int(value["start_time"]),
+                )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._cache = {}
+        return self._cache
+
+    def _remember(self, key: str, identity: ProcessIdentity | None) -> None:
+        with self._lock:
+            cache = self._load_cache()
+            if cache.get(key) == identity:
+                return
+            if identity is None:
+                cache.pop(key, None)
+            else:
+                cache[key] = identity
+            payload = {
+                cached_key: {"pid": value.pid, "start_time": value.start_time}
+                for cached_key, value in cache.items()
+            }
+
+        if self._cache_path is None:
+            return
+        try:
+            self._cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temporary_path = self._cache_path.with_suffix(".tmp")
+            temporary_path.write_text(json.dumps(payload), encoding="utf-8")
+            temporary_path.replace(self._cache_path)
+        except OSError:
+            # The in-memory cache still serves this process.
+            pass
+
+
+process_presence = ProcessPresenceIndex(cache_path=default_cache_path())
@@ -2,7 +2,13 @@
 
 # Local Imports
 from backend.database.database import get_db_conn, put_db_conn
-from backend.services.race.leaderboard import save_pool_standings_to_db
+from backend.services.race import draft_events
+from backend.services.race.leaderboard import invalidate_race_status, save_pool_standings_to_db
+
+
+# Statuses in which nobody is on the clock
+IDLE_DRAFT_STATUSES = ('NOT_INITIALIZED', 'DRAFT_READY', 'PRE_RACE', 'RACE_ACTIVE', 'RACE_COMPLETED', )
+ON_DECK_COUNT = 7
 
 
 def set_race_draft_status(status: str, pool_id: int = 0, ):
@@ -17,6 +23,7 @@ def set_race_draft_status(status: str, pool_id: int = 0, ):
         conn.commit()
     finally:
         put_db_conn(conn)
+    invalidate_race_status()
 
 def get_starting_grid_status(pool_id: int) -> list[dict]:
     conn = get_db_conn()
@@ -35,139 +42,92 @@ def get_starting_grid_status(pool_id: int) -> list[dict]:
             """, (pool_id,))
 
             rows = cur.fetchall()
-            return [
-                {
-                    'number': row[0],
-                    'name': row[1],
-                    'starting_position': row[2],
-                    'takenBy': row[3],  # May be None if unassigned
-                    'car_image_url': f'static/images/{row[0]}.png',
-                }
-                for row in rows
-            ]
+            return [_starting_grid_entry(row) for row in rows]
     finally:
         put_db_conn(conn)
 
-def assign_driver_to_participant(pool_id: int, participant_name: str, car_number: str, pick_number: int) -> bool:
-    conn = get_db_conn()
-    try:
-        with conn.cursor() as cur:
-            # Verify driver is available
-            cur.execute("""
-                SELECT sg.driver_name
-                FROM indy_pool_starting_grid sg
-                WHERE sg.car_number = %s
-                AND NOT EXISTS (
-                    SELECT 1 FROM indy_pool_assignments a
-                    WHERE a.car_number = sg.car_number AND a.pool_id = %s
-                )
-            """, (car_number, pool_id))
-            result = cur.fetchone()
-
-            if not result:
-                return False  # Already taken or invalid
-
-            driver_name = result[0]
-
-            # Insert into pool-specific assignments
-            cur.execute("""
-                INSERT INTO indy_pool_assignments (participant_name, car_number, driver_name, pool_id, pick_number)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (participant_name, car_number, driver_name, pool_id, pick_number))
-
-        conn.commit()
-        return True
-    finally:
-        put_db_conn(conn)
+def _starting_grid_entry(row) -> dict:
+    return {
+        'number': row[0],
+        'name': row[1],
+        'starting_position': row[2],
+        'takenBy': row[3],  # May be None if unassigned
+        'car_image_url': f'static/images/{row[0]}.png',
+    }
 
 def get_current_draft_pick(pool_id: int, ) -> dict:
     conn = get_db_conn()
     try:
         with conn.cursor() as cur:
-            # Get current pick number
-            cur.execute("SELECT current_pick FROM indy_pool_draft_status WHERE pool_id=%s LIMIT 1", (pool_id, ))
-            current_pick = cur.fetchone()[0]
-
-            # Step 2: Get the full draft order
-            cur.execute("SELECT participant_name FROM indy_pool_draft_order WHERE pool_id=%s ORDER BY pick_position ASC", (pool_id, ))
-            full_order = [row[0] for row in cur.fetchall()]
-            participant = full_order[current_pick - 1]
+            _, current_pick, _, full_order, upcoming = _fetch_draft_status(cur, pool_id)
 
             return {
                 'current_pick': current_pick,
-                'participant': participant
+                'participant': upcoming[0] if upcoming else full_order[current_pick - 1],
             }
     finally:
         put_db_conn(conn)
 
-def get_current_draft_status(pool_id: int, ):
-    try:
-        conn = get_db_conn()
-        with conn.cursor() as cur:
-            # Get current draft status
-            cur.execute("SELECT current_pick, total_picks FROM indy_pool_draft_status WHERE pool_id=%s LIMIT 1", (pool_id, ))
-            current_pick, total_picks = cur.fetchone()
-            return current_pick, total_picks
-    finally:
-        put_db_conn(conn)
-
-def advance_draft(pool_id: int, ):
-    conn = get_db_conn()
-    try:
-        with conn.cursor() as cur:
-            # Get current draft status
-            current_pick, total_picks = get_current_draft_status(pool_id)
-
-            # Get full draft order
-            cur.execute("SELECT participant_name FROM indy_pool_draft_order WHERE pool_id=%s ORDER BY pick_position ASC", (pool_id, ))
-            full_order = [row[0] for row in cur.fetchall()]
-            num_participants = len(full_order)
-
-            if num_participants == 0:
-                return  # No participants, nothing to do
+def advance_snake_pick(current_pick: int, total_picks: int, num_participants: int) -> tuple[int, int]:
+    """
+    Return (current_pick, total_picks) after one pick.
 
-            # Step 1: Increment total_picks
-            total_picks += 1
+    current_pick is the 1-based draft position on the clock. The last
+    position in a round picks twice in a row as the order turns around.
+    """
+    total_picks += 1
+    round_number = (total_picks - 1) // num_participants
 
-            # Step 2: Determine round number
-            round_number = (total_picks - 1) // num_participants
+    if round_number % 2 == 0:
+        # Even round → move right (increment)
+        current_pick = min(current_pick + 1, num_participants)
+    else:
+        # Odd round → move left (decrement)
+        current_pick = max(current_pick - 1, 1)
 
-            # Step 3: Advance current_pick based on round
-            if round_number % 2 == 0:
-                # Even round → move right (increment)
-                current_pick += 1
-                if current_pick > num_participants:
-                    current_pick = num_participants
-            else:
-                # Odd round → move left (decrement)
-                current_pick -= 1
-                if current_pick < 1:
-                    current_pick = 1
+    return current_pick, total_picks
 
-            # Get max number of picks
-            cur.execute("""
-                SELECT COUNT(*) FROM indy_pool_starting_grid;
-            """)
-            max_picks = cur.fetchone()[0]
-            if total_picks >= max_picks:
-                # The draft is over, all cars have been chosen
-                set_race_draft_status('PRE_RACE', pool_id)
-                # Initialize the starting grid
-                seed_leaderboard()
+def snake_schedule(full_order: list[str], max_picks: int) -> list[str]:
+    """Participant for every pick of a snake draft, in pick order."""
+    num_participants = len(full_order)
+    if num_participants == 0:
+        return []
 
-                # Generate the initial standings
-                save_pool_standings_to_db(pool_id)
+    schedule = []
+    for pick_index in range(max_picks):
+        round_number, index_in_round = divmod(pick_index, num_participants)
+        if round_number % 2 == 1:
+            index_in_round = num_participants - 1 - index_in_round
+        schedule.append(full_order[index_in_round])
+    return schedule
 
-            # Step 4: Update draft status
-            cur.execute("""
-                UPDATE indy_pool_draft_status
-                SET current_pick = %s, total_picks = %s
-                WHERE pool_id = %s;
-            """, (current_pick, total_picks, pool_id, ))
+def materialize_draft_schedule(cur, pool_id: int) -> list[str]:
+    """
+    Store pick number → participant for the whole draft.
 
-        conn.commit()
-    finally:
-        put_db_conn(conn)
+    Runs on the caller's cursor without committing, so it lands in the same
+    transaction as the draft order it was built from.
+    """
+    cur.execute("""
+        SELECT
+            ARRAY(
+                SELECT participant_name
+                FROM indy_pool_draft_order
+                WHERE pool_id = %s
+                ORDER BY pick_position ASC
+            ),
+            (SELECT COUNT(*) FROM indy_pool_starting_grid)
+    """, (pool_id, ))
+    full_order, max_picks = cur.fetchone()
+    schedule = snake_schedule(full_order, max_picks)
+
+    cur.execute("DELETE FROM indy_pool_draft_schedule WHERE pool_id = %s", (pool_id,))
+    cur.execute("""
+        INSERT INTO indy_pool_draft_schedule (pool_id, pick_number, participant_name)
+        SELECT %s, s.pick_number, s.participant_name
+        FROM unnest(%s::text[]) WITH ORDINALITY AS s(participant_name, pick_number)
+    """, (pool_id, schedule))
+    return schedule
 
 def seed_leaderboard():
     conn = get_db_conn()
@@ -217,23 +177,128 @@ def reset_draft(pool_id: int, pick_order: list[dict]):
                     (1, 0, 'DRAFT_READY', %s)
                 """, (pool_id, ))
 
+            # Precompute who picks when
+            materialize_draft_schedule(cur, pool_id)
+
         conn.commit()
     finally:
         put_db_conn(conn)
 
-def make_pick(pool_id: int, car_number: str) -> bool:
-    state = get_current_draft_pick(pool_id)
-    participant = state['participant']
+def record_pick(cur, pool_id: int, car_number: str) -> dict | None:
+    """
+    Assign car_number to whoever is on the clock and advance the draft.
 
-    # Get the pick number
-    _, total_picks = get_current_draft_status(pool_id)
+    Runs on the caller's cursor without committing. The draft status row is
+    locked first, so concurrent picks for the same pool are serialized and
+    the second one sees the advanced state.
+    """
+    cur.execute("""
+        SELECT
+            ds.current_pick,
+            ds.total_picks,
+            ARRAY(
+                SELECT s.participant_name
+                FROM indy_pool_draft_schedule s
+                WHERE s.pool_id = ds.pool_id
+                AND s.pick_number IN (ds.total_picks + 1, ds.total_picks + 2)
+                ORDER BY s.pick_number ASC
+            ),
+            (SELECT COUNT(*) FROM indy_pool_draft_order o WHERE o.pool_id = ds.pool_id),
+            (SELECT COUNT(*) FROM indy_pool_starting_grid)
+        FROM indy_pool_draft_status ds
+        WHERE ds.pool_id = %s
+        LIMIT 1
+        FOR UPDATE OF ds
+    """, (pool_id, ))
+    row = cur.fetchone()
+    if not row:
+        return None
+
+    current_pick, total_picks, upcoming, num_participants, max_picks = row
+    if not upcoming and num_participants and total_picks < max_picks:
+        # Drafts reset before the schedule existed get one on first use
+        upcoming = materialize_draft_schedule(cur, pool_id)[total_picks:total_picks + 2]
+    if not upcoming:
+        return None
+
+    participant = upcoming[0]
     pick_number = total_picks + 1
 
-    success = assign_driver_to_participant(pool_id, participant, car_number, pick_number)
-    if success:
-        # This is where we can hook in and check if the draft is completed
-        advance_draft(pool_id)
-    return success
+    # Insert only if the driver exists and is still available in this pool
+    cur.execute("""
+        INSERT INTO indy_pool_assignments (participant_name, car_number, driver_name, pool_id, pick_number)
+        SELECT %s, sg.car_number, sg.driver_name, %s, %s
+        FROM indy_pool_starting_grid sg
+        WHERE sg.car_number = %s
+        AND NOT EXISTS (
+            SELECT 1 FROM indy_pool_assignments a
+            WHERE a.car_number = sg.car_number AND a.pool_id = %s
+        )
+        RETURNING driver_name
+    """, (participant, pool_id, pick_number, car_number, pool_id))
+    inserted = cur.fetchone()
+    if not inserted:
+        return None  # Already taken or invalid
+
+    next_pick, total_picks = advance_snake_pick(current_pick, total_picks, num_participants)
+    draft_complete = total_picks >= max_picks
+
+    cur.execute("""
+        UPDATE indy_pool_draft_status
+        SET current_pick = %s,
+            total_picks = %s,
+            event_status = CASE WHEN %s THEN 'PRE_RACE' ELSE event_status END
+        WHERE pool_id = %s;
+    """, (next_pick, total_picks, draft_complete, pool_id, ))
+
+    return {
+        "pool_id": pool_id,
+        "pick_number": pick_number,
+        "participant": participant,
+        "car_number": car_number,
+        "driver_name": inserted[0],
+        "current_pick": next_pick,
+        "total_picks": total_picks,
+        "next_participant": None if draft_complete or len(upcoming) < 2 else upcoming[1],
+        "draft_complete": draft_complete,
+    }
+
+def make_pick(pool_id: int, car_number: str) -> bool:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            pick = record_pick(cur, pool_id, car_number)
+
+        if pick is None:
+            conn.rollback()
+            return False
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        put_db_conn(conn)
+
+    if pick["draft_complete"]:
+        # The draft is over, all cars have been chosen
+        # Initialize the starting grid
+        seed_leaderboard()
+
+        # Generate the initial standings
+        save_pool_standings_to_db(pool_id)
+
+    if pick["draft_complete"]:
+        turn_event = ('draft_complete', {"total_picks": pick["total_picks"]})
+    else:
+        # overall_pick counts picks across rounds; state.current_pick.pick_number
+        # is the snake position within the round.
+        turn_event = ('on_the_clock', {
+            "participant": pick["next_participant"],
+            "overall_pick": pick["total_picks"] + 1,
+        })
+    publish_draft_events(pool_id, [('pick_made', {"pick": pick}), turn_event])
+    return True
 
 def get_draft_order(pool_id: int, ) -> list[dict]:
     conn = get_db_conn()
@@ -283,6 +348,9 @@ def reset_draft_to_square_one():
             cur.execute("""
                 TRUNCATE indy_pool_draft_order;
             """)
+            cur.execute("""
+                TRUNCATE indy_pool_draft_schedule;
+            """)
 
             print('Clearing leaderboard')
             # Step 4: Clear out driver leaderboard
@@ -338,110 +406,207 @@ def start_draft(pool_id: int, ):
         return {"success": False, "message": "Draft not yet ready to be started."}
 
     set_race_draft_status("DRAFT_ACTIVE", pool_id)
+    publish_draft_event(pool_id, 'draft_started')
     return {"success": True, "message": "Draft has started!"}
 
-def get_on_deck_picks(full_order: list[str], pool_id: int, num_on_deck: int = 7, max_picks: int = 33) -> list[str]:
-    """
-    Given the full draft order and current_pick (already adjusted for snake logic),
-    return the next `num_on_deck` participants.
-    """
-    if not full_order:
-        return []
-
-    num_participants = len(full_order)
-    picks = []
-
-    # total_picks_so_far means how many picks have already happened
-    current_pick, total_picks_so_far = get_current_draft_status(pool_id)
-
-    # Skip the current picker
-    total_picks_so_far += 1
-
-    round_number = (total_picks_so_far) // num_participants
-    index_in_round = (total_picks_so_far) % num_participants
-
-    for _ in range(num_on_deck):
-        if total_picks_so_far >= max_picks:
-            break
-
-        if round_number % 2 == 0:
-            idx = index_in_round
-        else:
-            idx = num_participants - 1 - index_in_round
-
-        if idx < 0 or idx >= len(full_order):
-            break
+def get_picks_until_turn(pool_id: int, participant: str) -> dict:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT ds.total_picks, MIN(s.pick_number)
+                FROM indy_pool_draft_status ds
+                LEFT JOIN indy_pool_draft_schedule s
+                    ON s.pool_id = ds.pool_id
+                    AND s.participant_name = %s
+                    AND s.pick_number > ds.total_picks
+                WHERE ds.pool_id = %s
+                GROUP BY ds.total_picks
+            """, (participant, pool_id))
+            row = cur.fetchone()
+    finally:
+        put_db_conn(conn)
 
-        picks.append(full_order[idx])
+    total_picks, next_pick_number = row if row else (0, None)
+    return {
+        "participant": participant,
+        "next_pick_number": next_pick_number,
+        # 0 means the participant is on the clock
+        "picks_until_turn": None if next_pick_number is None else next_pick_number - total_picks - 1,
+    }
+
+# Draft status, order and the scheduled pickers from the one on the clock on
+_DRAFT_STATUS_SQL = """
+    SELECT
+        ds.event_status,
+        ds.current_pick,
+        ds.total_picks,
+        ARRAY(
+            SELECT o.participant_name
+            FROM indy_pool_draft_order o
+            WHERE o.pool_id = ds.pool_id
+            ORDER BY o.pick_position ASC
+        ),
+        ARRAY(
+            SELECT s.participant_name
+            FROM indy_pool_draft_schedule s
+            WHERE s.pool_id = ds.pool_id
+            AND s.pick_number > ds.total_picks
+            ORDER BY s.pick_number ASC
+            LIMIT %s
+        ),
+        (SELECT COUNT(*) FROM indy_pool_starting_grid)
+    FROM indy_pool_draft_status ds
+    WHERE ds.pool_id = %s
+    LIMIT 1
+"""
+
+def _fetch_draft_status(cur, pool_id: int):
+    """Return (status, current_pick, total_picks, full_order, upcoming) or None."""
+    cur.execute(_DRAFT_STATUS_SQL, (ON_DECK_COUNT + 1, pool_id))
+    row = cur.fetchone()
+    if row is None:
+        return None
+
+    status, current_pick, total_picks, full_order, upcoming, max_picks = row
+    if not upcoming and full_order:
+        # Reset before the schedule existed; it is stored on the next pick.
+        upcoming = snake_schedule(full_order, max_picks)[total_picks:total_picks + ON_DECK_COUNT + 1]
+    return status, current_pick, total_picks, full_order, upcoming
 
-        # Advance
-        index_in_round += 1
-        if index_in_round == num_participants:
-            index_in_round = 0
-            round_number += 1
+def get_draft_status(pool_id: int, ):
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            draft_status = _fetch_draft_status(cur, pool_id)
+    finally:
+        put_db_conn(conn)
 
-        total_picks_so_far += 1
+    if draft_status is None:
+        return _idle_draft_status('NOT_INITIALIZED')
+
+    status, _, total_picks, full_order, upcoming = draft_status
+    if status in IDLE_DRAFT_STATUSES:
+        return _idle_draft_status(status)
+
+    # Draft in Progress Case: show current picker and on-deck list
+    return _active_draft_status(status, total_picks, full_order, upcoming)
+
+def _idle_draft_status(status: str) -> dict:
+    return {
+        "status": status,
+        "current_picker": "",
+        "on_deck": [],
+        "total_picks": 0,
+    }
+
+def _active_draft_status(status: str, total_picks: int, full_order: list[str], upcoming: list[str]) -> dict:
+    return {
+        "status": status,
+        "current_picker": upcoming[0] if upcoming else "",
+        "on_deck": upcoming[1:ON_DECK_COUNT + 1],
+        "total_picks": total_picks,
+        "participants": full_order,
+    }
+
+def get_draft_state(pool_id: int, recent_limit: int = 5) -> dict:
+    """
+    Everything the draft room shows, read on one connection.
 
-    return picks
+    Replaces polling getDraftStatus, getCurrentPick, getStartingGridStatus,
+    getPoolAssignments and getRecentPicks. event_id is the last draft event
+    already reflected here, for resuming the event stream.
+    """
+    event_id = draft_events.broker.last_event_id(pool_id)
 
-def get_draft_status(pool_id: int, ):
     conn = get_db_conn()
     try:
         with conn.cursor() as cur:
-            # Get our Event Status
-            cur.execute("""
-                SELECT event_status FROM indy_pool_draft_status WHERE pool_id=%s; 
-            """, (pool_id, ))
-            status = cur.fetchone()[0]
-            if status in ['NOT_INITIALIZED', 'DRAFT_READY', 'PRE_RACE', 'RACE_ACTIVE', 'RACE_COMPLETED', ]:
-                return {
-                    "status": status,
-                    "current_picker": "",
-                    "on_deck": [],
-                    "total_picks": 0,
-                }
+            status_row = _fetch_draft_status(cur, pool_id)
 
-            # Get current pick number
-            cur.execute("SELECT current_pick, total_picks FROM indy_pool_draft_status WHERE pool_id=%s;", (pool_id, ))
-            result = cur.fetchone()
-            if not result:
-                return {
-                    "status": status,
-                    "current_picker": "",
-                    "on_deck": [],
-                    "total_picks": 0,
-                }
-            current_pick, total_picks = result
-
-            # Get full draft order
             cur.execute("""
-                SELECT participant_name
-                FROM indy_pool_draft_order
-                WHERE pool_id=%s
-                ORDER BY pick_position ASC
+                SELECT
+                    sg.car_number,
+                    sg.driver_name,
+                    sg.starting_position,
+                    a.participant_name,
+                    a.pick_number
+                FROM indy_pool_starting_grid sg
+                LEFT JOIN indy_pool_assignments a
+                    ON sg.car_number = a.car_number AND a.pool_id = %s
+                ORDER BY sg.starting_position ASC
             """, (pool_id, ))
-            full_order = [row[0] for row in cur.fetchall()]
-
-            # Get max number of picks
-            cur.execute("""
-                SELECT COUNT(*) FROM indy_pool_starting_grid;
-            """)
-            max_picks = cur.fetchone()[0]
-
-            # Draft in Progress Case: show current picker and on-deck list
-            current_picker = full_order[current_pick - 1]
-            on_deck = get_on_deck_picks(full_order, pool_id, num_on_deck=7, max_picks=max_picks)
-
-            return {
-                "status": status,
-                "current_picker": current_picker,
-                "on_deck": on_deck,
-                "total_picks": total_picks,
-                "participants": full_order,
-            }
+            grid_rows = cur.fetchall()
     finally:
         put_db_conn(conn)
 
+    grid = [_starting_grid_entry(row) for row in grid_rows]
+
+    assignments = {}
+    for car_number, driver_name, _, participant_name, _ in grid_rows:
+        if participant_name is not None:
+            assignments.setdefault(participant_name, []).append({
+                'number': car_number,
+                'name': driver_name,
+            })
+    for participant_drivers in assignments.values():
+        participant_drivers.sort(key=lambda d: int(d['number']))
+
+    picked = sorted(
+        (row for row in grid_rows if row[4] is not None),
+        key=lambda row: row[4],
+        reverse=True,
+    )
+    recent_picks = [
+        {
+            "participant": row[3],
+            "driver_name": row[1],
+            "car_number": row[0],
+            "pick_number": row[4],
+        }
+        for row in picked[:recent_limit]
+    ]
+
+    current_pick = None
+    if status_row is None:
+        draft_status = _idle_draft_status('NOT_INITIALIZED')
+    else:
+        status, current_pick_position, total_picks, full_order, upcoming = status_row
+        if status in IDLE_DRAFT_STATUSES or not full_order:
+            draft_status = _idle_draft_status(status)
+        else:
+            draft_status = _active_draft_status(status, total_picks, full_order, upcoming)
+        if full_order:
+            current_pick = {
+                "pick_number": current_pick_position,
+                "participant": upcoming[0] if upcoming else full_order[current_pick_position - 1],
+            }
+
+    return {
+        "pool_id": pool_id,
+        "event_id": event_id,
+        "draft_status": draft_status,
+        "current_pick": current_pick,
+        "grid": grid,
+        "assignments": assignments,
+        "recent_picks": recent_picks,
+    }
+
+def publish_draft_event(pool_id: int, event_type: str, **data) -> None:
+    """Broadcast a draft event with the fresh draft state attached."""
+    publish_draft_events(pool_id, [(event_type, data)])
+
+def publish_draft_events(pool_id: int, events: list[tuple[str, dict]]) -> None:
+    """Broadcast events from one change, sharing a single draft state read."""
+    try:
+        state = get_draft_state(pool_id)
+    except Exception as e:
+        # Viewers fall back to fetching getDraftState themselves.
+        print(f'Error building draft state for pool {pool_id}: {e}')
+        state = None
+    for event_type, data in events:
+        draft_events.broker.publish(pool_id, event_type, {**data, "state": state})
+
 def get_recent_picks(pool_id: int, limit: int = 5) -> list[dict]:
     conn = get_db_conn()
     try:
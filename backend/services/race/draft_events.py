@@ -0,0 +1,154 @@
+# Python Imports
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import json
+import threading
+
+# Local Imports
+
+
+# Seconds between SSE comments that keep proxies from closing idle streams
+KEEPALIVE_SECONDS = 15
+# Events kept per pool so a reconnecting client can catch up
+HISTORY_SIZE = 50
+# Events buffered per subscriber before it is told to resync
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class DraftEvent:
+    id: int
+    pool_id: int
+    type: str
+    data: dict
+
+    def to_sse(self) -> str:
+        payload = json.dumps(self.data, default=str, separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+@dataclass(eq=False)
+class DraftSubscription:
+    pool_id: int
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    )
+
+    def offer(self, event: DraftEvent) -> None:
+        # Runs on the subscriber's event loop.
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A stalled client gets one resync instead of an unbounded backlog.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(
+                DraftEvent(id=event.id, pool_id=self.pool_id, type="resync", data={})
+            )
+
+
+class DraftEventBroker:
+    """
+    Fan draft events out to every stream watching a pool.
+
+    Picks commit on threadpool workers, so publishing is thread-safe and
+    hands each event to the subscriber's own event loop.
+    """
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self._lock = threading.Lock()
+        self._last_ids: dict[int, int] = {}
+        self._history_size = history_size
+        self._history: dict[int, deque[DraftEvent]] = {}
+        self._subscribers: dict[int, set[DraftSubscription]] = {}
+
+    def last_event_id(self, pool_id: int) -> int:
+        with self._lock:
+            return self._last_ids.get(pool_id, 0)
+
+    def publish(self, pool_id: int, event_type: str, data: dict) -> DraftEvent:
+        with self._lock:
+            event_id = self._last_ids.get(pool_id, 0) + 1
+            self._last_ids[pool_id] = event_id
+            event = DraftEvent(
+                id=event_id,
+                pool_id=pool_id,
+                type=event_type,
+                data=data,
+            )
+            history = self._history.setdefault(pool_id, deque(maxlen=self._history_size))
+            history.append(event)
+            subscribers = list(self._subscribers.get(pool_id, ()))
+
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The subscriber's loop has shut down.
+                self.unsubscribe(subscription)
+
+        return event
+
+    def subscribe(self, pool_id: int, last_event_id: int | None = None) -> DraftSubscription:
+        """Register a stream; must be called from the stream's event loop."""
+        subscription = DraftSubscription(pool_id=pool_id, loop=asyncio.get_running_loop())
+
+        with self._lock:
+            self._subscribers.setdefault(pool_id, set()).add(subscription)
+            history = list(self._history.get(pool_id, ()))
+            current_id = self._last_ids.get(pool_id, 0)
+
+        if last_event_id is None or last_event_id == current_id:
+            return subscription
+
+        oldest_id = history[0].id if history else current_id + 1
+        if last_event_id > current_id or last_event_id < oldest_id - 1:
+            # Missed events fell out of history, or the server restarted.
+            subscription.offer(
+                DraftEvent(id=current_id, pool_id=pool_id, type="resync", data={})
+            )
+        else:
+            for event in history:
+                if event.id > last_event_id:
+                    subscription.offer(event)
+
+        return subscription
+
+    def unsubscribe(self, subscription: DraftSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.pool_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.pool_id]
+
+
+broker = DraftEventBroker()
+
+
+def parse_last_event_id(value: str | None) -> int | None:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+async def stream_draft_events(pool_id: int, last_event_id: int | None, is_disconnected):
+    """Yield SSE frames for pool_id until the client disconnects."""
+    subscription = broker.subscribe(pool_id, last_event_id)
+    try:
+        yield f"retry: 3000\n: connected to pool {pool_id}\n\n"
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(),
+                    timeout=KEEPALIVE_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield event.to_sse()
+    finally:
+        broker.unsubscribe(subscription)
@@ -4,14 +4,27 @@ from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
-import re
-from playwright.sync_api import sync_playwright
+import threading
+import time
 
 # Local imports
 from backend.database.database import get_db_conn, put_db_conn
+from backend.services.race.leaderboard_parser import (
+    CAR_COLUMN,
+    LAPS_COLUMN,
+    POSITION_COLUMN,
+    SPEED_COLUMN,
+    STATUS_COLUMN,
+    leaderboard_entry,
+    parse_leaderboard_html,
+    parse_track_flag,
+)
 from backend.services.race.pool import load_pool_from_db
 
 OFFLINE = False
+# Read rows from a single page.content() snapshot instead of querying each
+# cell through the browser; set False to fall back to the locator path.
+PARSE_PAGE_HTML = True
 _executor = ThreadPoolExecutor(max_workers=1)
 
 # Browser caching
@@ -21,19 +34,53 @@ _page = None
 _browser_created_at = None
 _BROWSER_MAX_AGE_SECONDS = 600  # 10 minutes
 
+# Race status caching. Status changes made through set_race_draft_status
+# invalidate it at once; the age limit covers edits made outside the API.
+_RACE_STATUS_MAX_AGE_SECONDS = 300
+_race_status_lock = threading.Lock()
+_race_active = None
+_race_active_checked_at = 0.0
+_race_status_generation = 0
 
-def should_fetch_leaderboard():
+
+def _load_race_active():
     conn = get_db_conn()
     try:
         with conn.cursor() as cur:
             cur.execute("SELECT event_status FROM indy_pool_draft_status LIMIT 1")
             status = cur.fetchone()[0]
             return status == 'RACE_ACTIVE'
-    except:
-        return False
     finally:
         put_db_conn(conn)
 
+def should_fetch_leaderboard():
+    global _race_active, _race_active_checked_at
+
+    now = time.monotonic()
+    with _race_status_lock:
+        if _race_active is not None and now - _race_active_checked_at < _RACE_STATUS_MAX_AGE_SECONDS:
+            return _race_active
+        generation = _race_status_generation
+
+    try:
+        active = _load_race_active()
+    except:
+        return False
+
+    with _race_status_lock:
+        # A status change while the query ran makes its answer stale.
+        if generation == _race_status_generation:
+            _race_active = active
+            _race_active_checked_at = now
+    return active
+
+def invalidate_race_status():
+    global _race_active, _race_status_generation
+
+    with _race_status_lock:
+        _race_active = None
+        _race_status_generation += 1
+
 def _get_or_create_page():
     global _playwright, _browser, _page, _browser_created_at
 
@@ -52,6 +99,9 @@ def _get_or_create_page():
 
     print("Launching new Playwright browser")
 
+    # Playwright is only needed while a race is live.
+    from playwright.sync_api import sync_playwright
+
     _playwright = sync_playwright().start()
 
     _browser = _playwright.chromium.launch(
@@ -105,11 +155,11 @@ def _get_leaderboard_data_blocking_with_recovery():
     except Exception as e:
         print(f"Exception getting leaderboard data: {e}")
         _reset_browser()
-        return []
+        # Raise so a failed scrape never replaces the stored leaderboard.
+        raise
 
 def _get_leaderboard_data_blocking():
     url = "https://proud-island-0d704c910.4.azurestaticapps.net/"
-    leaderboard = []
 
     page = _get_or_create_page()
 
@@ -120,6 +170,13 @@ def _get_leaderboard_data_blocking():
     )
 
     page.wait_for_selector("table tbody tr img", state="attached", timeout=30000)
+    if PARSE_PAGE_HTML:
+        html = page.content()
+        return parse_leaderboard_html(html), parse_track_flag(html)
+    return _extract_rows_with_locators(page), None
+
+def _extract_rows_with_locators(page):
+    leaderboard = []
     rows = page.locator("table tbody tr")
 
     for i in range(rows.count()):
@@ -128,28 +185,15 @@ def _get_leaderboard_data_blocking():
             continue
 
         try:
-            img_src = row.locator("td:nth-child(2) img").get_attribute("src") or ""
-            match = re.search(r"/(\d+)-[^/]*\.png", img_src)
-            number = match.group(1) if match else "UNKNOWN"
-
-            position_cell = row.locator("td:nth-child(1)").inner_text().strip()
-            lap_text = row.locator("td:nth-child(15)").inner_text().strip()
-            speed_text = row.locator("td:nth-child(6)").inner_text().strip()
-            status = row.locator("td:nth-child(3)").inner_text().strip()
-
-            position_match = re.search(r"\d+", position_cell)
-            if not position_match:
-                continue
-
-            position_text = position_match.group(0)
-
-            leaderboard.append({
-                "position": int(position_text),
-                "laps": int(lap_text) if lap_text.isdigit() else 0,
-                "speed": float(speed_text) if speed_text.replace(".", "", 1).isdigit() else 0.0,
-                "number": number,
-                "status": status,
-            })
+            entry = leaderboard_entry(
+                row.locator(f"td:nth-child({POSITION_COLUMN})").inner_text().strip(),
+                row.locator(f"td:nth-child({CAR_COLUMN}) img").get_attribute("src") or "",
+                row.locator(f"td:nth-child({STATUS_COLUMN})").inner_text().strip(),
+                row.locator(f"td:nth-child({SPEED_COLUMN})").inner_text().strip(),
+                row.locator(f"td:nth-child({LAPS_COLUMN})").inner_text().strip(),
+            )
+            if entry is not None:
+                leaderboard.append(entry)
 
         except Exception as e:
             print(f"Error in table loop: {e}")
@@ -158,7 +202,7 @@ def _get_leaderboard_data_blocking():
 
 async def save_leaderboard_to_db():
     # Step 1 - get the latest leaderboard data from web scrape
-    leaderboard_data = await _get_leaderboard_data()
+    leaderboard_data, track_flag = await _get_leaderboard_data()
 
     # Step 2 - Put the data into the db
     conn = get_db_conn()
@@ -190,6 +234,8 @@ async def save_leaderboard_to_db():
     finally:
         put_db_conn(conn)
 
+    return leaderboard_data, track_flag
+
 def load_leaderboard_from_db() -> list[dict]:
     conn = get_db_conn()
     table_name = 'indy_pool_leaderboard'
@@ -307,16 +353,16 @@ def load_pool_standings_from_db(pool_id: int):
         put_db_conn(conn)
 
 async def get_leaderboard():
-    return await _get_leaderboard_data()
+    leaderboard_data, _track_flag = await _get_leaderboard_data()
+    return leaderboard_data
 
 if __name__ == "__main__":
-    import time
     num = 0
     while num < 5:
         num += 1
         print(f"starting loop {num}")
         start = time.time()
-        data = asyncio.run(_get_leaderboard_data())
+        data = asyncio.run(get_leaderboard())
         end = time.time()
         delta = end - start
 
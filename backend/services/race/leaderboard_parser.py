@@ -0,0 +1,190 @@
+# Python Imports
+from html.parser import HTMLParser
+import re
+
+# Local Imports
+
+
+# 1-based columns of the timing table, matching the td:nth-child selectors
+POSITION_COLUMN = 1
+CAR_COLUMN = 2
+STATUS_COLUMN = 3
+SPEED_COLUMN = 6
+LAPS_COLUMN = 15
+
+# The timing page renders a mobile and a desktop copy of the table and hides
+# one with Tailwind display classes. Playwright's default 1280px viewport
+# activates these breakpoints, in cascade order.
+VIEWPORT_BREAKPOINTS = ("sm", "md", "lg", "xl")
+_SHOWN_CLASSES = {
+    "block",
+    "contents",
+    "flex",
+    "grid",
+    "inline",
+    "inline-block",
+    "inline-flex",
+    "inline-grid",
+    "table",
+    "table-cell",
+    "table-row",
+    "table-row-group",
+}
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# Flags shown in the page header beside the time remaining
+TRACK_FLAGS = ("GREEN", "YELLOW", "RED", "WHITE", "CHECKERED")
+
+_CAR_NUMBER = re.compile(r"/(\d+)-[^/]*\.png")
+_TRACK_FLAG = re.compile(r'class="section-header[^"]*">\s*([A-Za-z]+)\s*<')
+_POSITION = re.compile(r"\d+")
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+
+
+def leaderboard_entry(position_cell: str, img_src: str, status: str, speed_text: str, lap_text: str) -> dict | None:
+    """Turn the raw cell values of one timing row into a leaderboard entry."""
+    position_match = _POSITION.search(position_cell)
+    if not position_match:
+        return None
+
+    match = _CAR_NUMBER.search(img_src)
+    return {
+        "position": int(position_match.group(0)),
+        "laps": int(lap_text) if lap_text.isdigit() else 0,
+        "speed": float(speed_text) if speed_text.replace(".", "", 1).isdigit() else 0.0,
+        "number": match.group(1) if match else "UNKNOWN",
+        "status": status,
+    }
+
+
+def _is_hidden(attrs: list[tuple[str, str | None]]) -> bool:
+    hidden = False
+    for name, value in attrs:
+        if name == "hidden":
+            return True
+        if name == "style" and value and _HIDDEN_STYLE.search(value.lower()):
+            return True
+        if name == "class" and value:
+            classes = value.split()
+            if "invisible" in classes:
+                return True
+            for prefix in ("", *(f"{breakpoint}:" for breakpoint in VIEWPORT_BREAKPOINTS)):
+                for css_class in classes:
+                    if not css_class.startswith(prefix) or ":" in css_class[len(prefix):]:
+                        continue
+                    utility = css_class[len(prefix):]
+                    if utility == "hidden":
+                        hidden = True
+                    elif utility in _SHOWN_CLASSES:
+                        hidden = False
+    return hidden
+
+
+class _TimingTableParser(HTMLParser):
+    """
+    Collect the text and car image of every visible `table tbody tr` row.
+
+    A single pass over page.content() replaces the browser round trips the
+    locator path makes for every cell.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: list[tuple[list[str], str]] = []
+        # (tag, hidden) for each open element
+        self._open: list[tuple[str, bool]] = []
+        self._row: list[list[str]] | None = None
+        self._row_depth = 0
+        self._img_src: str | None = None
+        self._cell: list[str] | None = None
+
+    def _hidden(self) -> bool:
+        return bool(self._open) and self._open[-1][1]
+
+    def _inside(self, tag: str) -> bool:
+        return any(open_tag == tag for open_tag, _hidden in self._open)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _VOID_TAGS:
+            if tag == "img" and self._cell is not None and len(self._row) == CAR_COLUMN and self._img_src is None:
+                self._img_src = dict(attrs).get("src") or ""
+            elif tag == "br" and self._cell is not None:
+                self._cell.append("\n")
+            return
+
+        if tag == "tr" and self._row is None and self._inside("tbody") and self._inside("table"):
+            self._row = []
+            self._row_depth = len(self._open) + 1
+            self._img_src = None
+        elif tag in ("td", "th") and self._row is not None and len(self._open) == self._row_depth:
+            self._cell = []
+            self._row.append(self._cell)
+        self._open.append((tag, self._hidden() or _is_hidden(attrs)))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if not self._inside(tag):
+            return
+        while self._open:
+            open_tag, hidden = self._open.pop()
+            depth = len(self._open)
+            if self._row is not None and depth == self._row_depth:
+                self._cell = None
+            elif self._row is not None and depth == self._row_depth - 1:
+                if not hidden:
+                    cells = [" ".join("".join(cell).split()) for cell in self._row]
+                    self.rows.append((cells, self._img_src or ""))
+                self._row = None
+                self._cell = None
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._cell is not None and not self._hidden():
+            self._cell.append(data)
+
+
+def parse_leaderboard_html(html: str) -> list[dict]:
+    """
+    Extract leaderboard entries from the timing page's HTML.
+
+    Accepts the rendered page from Playwright's page.content() or a saved
+    copy of it. Rows hidden by attribute, inline style or Tailwind display
+    class at the browser's viewport are skipped, as is_visible() skips them
+    on the locator path.
+    """
+    parser = _TimingTableParser()
+    parser.feed(html)
+    parser.close()
+
+    leaderboard = []
+    for cells, img_src in parser.rows:
+
+        def cell(column: int) -> str:
+            return cells[column - 1] if len(cells) >= column else ""
+
+        entry = leaderboard_entry(
+            cell(POSITION_COLUMN),
+            img_src,
+            cell(STATUS_COLUMN),
+            cell(SPEED_COLUMN),
+            cell(LAPS_COLUMN),
+        )
+        if entry is not None:
+            leaderboard.append(entry)
+    return leaderboard
+
+
+def parse_track_flag(html: str) -> str | None:
+    """Return the flag from the timing page header, or None if it is not shown."""
+    match = _TRACK_FLAG.search(html)
+    if not match or match.group(1).upper() not in TRACK_FLAGS:
+        return None
+    return match.group(1).upper()
@@ -0,0 +1,114 @@
+# Python Imports
+from dataclasses import dataclass, field
+from datetime import datetime
+import threading
+
+# Local Imports
+
+
+# Seconds between scrapes while positions change at an ordinary rate
+BASE_INTERVAL_SECONDS = 15
+# Bounds on the effective interval
+MIN_INTERVAL_SECONDS = 5
+MAX_INTERVAL_SECONDS = 60
+# Positions are frozen behind the pace car, so caution periods poll slowly
+CAUTION_INTERVAL_SECONDS = 30
+CAUTION_FLAGS = ("YELLOW", "RED")
+# Share of the field changing position per scrape, smoothed across scrapes
+FAST_CHANGE_RATE = 0.15
+SLOW_CHANGE_RATE = 0.02
+CHANGE_RATE_SMOOTHING = 0.5
+# Growth of the interval per scrape while nothing moves
+QUIET_BACKOFF = 1.5
+
+
+def position_change_share(previous: dict[str, int], current: dict[str, int]) -> float:
+    """Share of cars whose position changed, counting cars that appeared or dropped out."""
+    cars = previous.keys() | current.keys()
+    if not cars:
+        return 0.0
+    changed = sum(1 for car in cars if previous.get(car) != current.get(car))
+    return changed / len(cars)
+
+
+@dataclass
+class LeaderboardRefreshSchedule:
+    """
+    Pick the delay before the next leaderboard scrape from what the last ones saw.
+
+    Restarts, the white flag and busy pit cycles tighten the interval toward
+    MIN_INTERVAL_SECONDS; cautions, a settled field, the checkered flag and
+    failing scrapes back it off toward MAX_INTERVAL_SECONDS.
+    """
+
+    interval_seconds: float = BASE_INTERVAL_SECONDS
+    change_rate: float | None = None
+    track_flag: str | None = None
+    last_scrape_ms: float | None = None
+    consecutive_failures: int = 0
+    scrapes: int = 0
+    failures: int = 0
+    last_scrape_at: datetime | None = None
+    _positions: dict[str, int] = field(default_factory=dict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_scrape(self, rows: list[dict], track_flag: str | None, elapsed_seconds: float) -> float:
+        positions = {row["number"]: row["position"] for row in rows}
+        with self._lock:
+            restart = self.track_flag in CAUTION_FLAGS and track_flag == "GREEN"
+            if self.scrapes:
+                share = position_change_share(self._positions, positions)
+                self.change_rate = (
+                    share
+                    if self.change_rate is None
+                    else CHANGE_RATE_SMOOTHING * share + (1 - CHANGE_RATE_SMOOTHING) * self.change_rate
+                )
+
+            if track_flag == "CHECKERED":
+                interval = MAX_INTERVAL_SECONDS
+            elif track_flag in CAUTION_FLAGS:
+                interval = CAUTION_INTERVAL_SECONDS
+            elif restart or track_flag == "WHITE":
+                interval = MIN_INTERVAL_SECONDS
+            elif self.change_rate is None:
+                interval = BASE_INTERVAL_SECONDS
+            elif self.change_rate >= FAST_CHANGE_RATE:
+                interval = MIN_INTERVAL_SECONDS
+            elif self.change_rate <= SLOW_CHANGE_RATE:
+                interval = max(self.interval_seconds, BASE_INTERVAL_SECONDS) * QUIET_BACKOFF
+            else:
+                share_of_range = (self.change_rate - SLOW_CHANGE_RATE) / (FAST_CHANGE_RATE - SLOW_CHANGE_RATE)
+                interval = BASE_INTERVAL_SECONDS - (BASE_INTERVAL_SECONDS - MIN_INTERVAL_SECONDS) * share_of_range
+
+            self._positions = positions
+            self.track_flag = track_flag
+            self.consecutive_failures = 0
+            self.scrapes += 1
+            return self._finish(interval, elapsed_seconds)
+
+    def record_failure(self, elapsed_seconds: float) -> float:
+        with self._lock:
+            self.consecutive_failures += 1
+            self.failures += 1
+            return self._finish(BASE_INTERVAL_SECONDS * 2 ** self.consecutive_failures, elapsed_seconds)
+
+    def _finish(self, interval: float, elapsed_seconds: float) -> float:
+        self.interval_seconds = round(min(max(interval, MIN_INTERVAL_SECONDS), MAX_INTERVAL_SECONDS), 1)
+        self.last_scrape_ms = round(elapsed_seconds * 1000, 1)
+        self.last_scrape_at = datetime.now()
+        return self.interval_seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "intervalSeconds": self.interval_seconds,
+                # The loop scrapes, then sleeps, so scrape time adds to the cadence.
+                "effectiveIntervalSeconds": round(self.interval_seconds + (self.last_scrape_ms or 0) / 1000, 1),
+                "changeRate": None if self.change_rate is None else round(self.change_rate, 3),
+                "trackFlag": self.track_flag,
+                "lastScrapeMs": self.last_scrape_ms,
+                "lastScrapeAt": self.last_scrape_at.isoformat() if self.last_scrape_at else None,
+                "consecutiveFailures": self.consecutive_failures,
+                "scrapes": self.scrapes,
+                "failures": self.failures,
+            }
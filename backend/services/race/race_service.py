@@ -1,28 +1,49 @@
 # Python Imports
 import asyncio
 from datetime import datetime
+import time
 
 # Local Imports
 from backend.services.race import draft
+from backend.services.race import draft_events
 from backend.services.race import leaderboard
 from backend.services.race import pool
+from backend.services.race.leaderboard_schedule import LeaderboardRefreshSchedule
 from backend.services.race import archive
 
 
+# Seconds between race status checks while no race is active. The status is
+# cached in memory, so these checks rarely reach the database.
 LEADERBOARD_UPDATE_DELAY = 15
 
+_leaderboard_schedule = LeaderboardRefreshSchedule()
+
 # Begin to update the leaderboard on a regular basis
 async def update_leaderboard_loop():
+    global _leaderboard_schedule
+
+    race_active = False
     while True:
+        delay = LEADERBOARD_UPDATE_DELAY
         if should_fetch_leaderboard():
+            if not race_active:
+                # Each race starts from the base cadence
+                _leaderboard_schedule = LeaderboardRefreshSchedule()
+            race_active = True
+
             # It's time to update our leaderboard
+            started = time.monotonic()
             try:
-                await update_leaderboard_and_standings()
+                rows, track_flag = await update_leaderboard_and_standings()
+                delay = _leaderboard_schedule.record_scrape(rows, track_flag, time.monotonic() - started)
             except Exception as e:
                 print("Error updating leaderboard:", e)
+                delay = _leaderboard_schedule.record_failure(time.monotonic() - started)
+        else:
+            race_active = False
 
         # Sleep
-        await asyncio.sleep(LEADERBOARD_UPDATE_DELAY)
+        await asyncio.sleep(delay)
 
 
 # Expose Pool Functionalities
@@ -83,6 +104,19 @@ def reset_draft(pool_id: int, order: list[dict]) -> None:
 def get_recent_picks(pool_id: int, limit: int = 5):
     return draft.get_recent_picks(pool_id, limit)
 
+def get_picks_until_turn(pool_id: int, participant: str) -> dict:
+    return draft.get_picks_until_turn(pool_id, participant)
+
+def get_draft_state(pool_id: int, recent_limit: int = 5) -> dict:
+    return draft.get_draft_state(pool_id, recent_limit)
+
+def stream_draft_events(pool_id: int, last_event_id: str | None, is_disconnected):
+    return draft_events.stream_draft_events(
+        pool_id,
+        draft_events.parse_last_event_id(last_event_id),
+        is_disconnected,
+    )
+
 # Expose Race Leaderboard Functionalities
 def get_leaderboard(pool_id: int):
     try:
@@ -105,16 +139,24 @@ def get_leaderboard(pool_id: int):
             "updatedAt": datetime.now().isoformat(),
         }
 
+def get_leaderboard_refresh_status() -> dict:
+    return {
+        "success": True,
+        "raceActive": should_fetch_leaderboard(),
+        **_leaderboard_schedule.snapshot(),
+    }
+
 def should_fetch_leaderboard() -> bool:
     return leaderboard.should_fetch_leaderboard()
 
 async def update_leaderboard_and_standings():
-    await leaderboard.save_leaderboard_to_db()
+    scrape = await leaderboard.save_leaderboard_to_db()
 
     # Update standings for all pools
     pools = pool.get_all_pools()
     for _pool in pools:
         leaderboard.save_pool_standings_to_db(_pool['id'])
+    return scrape
 
 # Expose Archive Functionalities
 def archive_pool(
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+import json
+
+from backend.models.health_models import (
+    HealthStatus,
+    HealthTransition,
+    HealthUptimeSummary,
+    ServiceHealthSnapshotResponse,
+)
+
+
+CHECKPOINT_INTERVAL = timedelta(hours=1)
+HOURLY_CHECKPOINT_RETENTION = timedelta(days=7)
+CHECKPOINT_RETENTION = timedelta(days=365)
+TRANSITION_RETENTION = timedelta(days=90)
+DEFAULT_TIMELINE_WINDOW = timedelta(days=7)
+MAX_TIMELINE_LIMIT = 1000
+MAX_UPTIME_WINDOW_DAYS = 90
+UP_STATUSES = frozenset({HealthStatus.HEALTHY, HealthStatus.IDLE})
+DOWN_STATUSES = frozenset({HealthStatus.DEGRADED, HealthStatus.UNHEALTHY})
+
+
+class HealthComponentHistoryNotFoundError(LookupError):
+    pass
+
+
+def get_db_conn():
+    from backend.database.database import get_db_conn as acquire_connection
+
+    return acquire_connection()
+
+
+def put_db_conn(conn) -> None:
+    from backend.database.database import put_db_conn as release_connection
+
+    release_connection(conn)
+
+
+def detect_transitions(
+    snapshot: ServiceHealthSnapshotResponse,
+    last_statuses: dict[str, HealthStatus],
+) -> list[HealthTransition]:
+    transitions = []
+    for component in snapshot.components:
+        previous = last_statuses.get(component.id)
+        if previous == component.status:
+            continue
+        transitions.append(
+            HealthTransition(
+                component_id=component.id,
+                observed_at=snapshot.checked_at,
+                status=component.status,
+                previous_status=previous,
+                message=component.message,
+                required=component.required,
+            )
+        )
+    return transitions
+
+
+def _last_statuses(cur) -> dict[str, HealthStatus]:
+    cur.execute(
+        """
+        SELECT DISTINCT ON (component_id) component_id, status
+        FROM public.service_health_transitions
+        ORDER BY component_id, observed_at DESC, id DESC;
+        """
+    )
+    return {component_id: HealthStatus(status) for component_id, status in cur.fetchall()}
+
+
+def _checkpoint_due(cur, checked_at: datetime) -> bool:
+    cur.execute("SELECT max(checked_at) FROM public.service_health_checkpoints;")
+    row = cur.fetchone()
+    last_checkpoint = row[0] if row else None
+    return last_checkpoint is None or checked_at - last_checkpoint >= CHECKPOINT_INTERVAL
+
+
+def _prune_history(cur, now: datetime) -> None:
+    # Keep each component's newest expired transition: it is the baseline
+    # status at the start of every window that reaches past the cutoff.
+    cur.execute(
+        """
+        DELETE FROM public.service_health_transitions expired
+        WHERE expired.observed_at < %s
+          AND EXISTS (
+              SELECT 1
+              FROM public.service_health_transitions newer
+              WHERE newer.component_id = expired.component_id
+                AND newer.observed_at > expired.observed_at
+                AND newer.observed_at < %s
+          );
+        """,
+        (now - TRANSITION_RETENTION, now - TRANSITION_RETENTION),
+    )
+    # Older checkpoints are downsampled to the first one of each UTC day.
+    cur.execute(
+        """
+        DELETE FROM public.service_health_checkpoints later
+        WHERE later.checked_at < %s
+          AND EXISTS (
+              SELECT 1
+              FROM public.service_health_checkpoints earlier
+              WHERE earlier.checked_at < later.checked_at
+                AND date_trunc('day', earlier.checked_at AT TIME ZONE 'UTC')
+                    = date_trunc('day', later.checked_at AT TIME ZONE 'UTC')
+          );
+        """,
+        (now - HOURLY_CHECKPOINT_RETENTION,),
+    )
+    cur.execute(
+        "DELETE FROM public.service_health_checkpoints WHERE checked_at < %s;",
+        (now - CHECKPOINT_RETENTION,),
+    )
+
+
+def record_service_health_history(snapshot: ServiceHealthSnapshotResponse) -> list[HealthTransition]:
+    """
+    Append status changes from a collected snapshot to the history.
+
+    Only components whose status differs from their last recorded transition
+    are written. A compact checkpoint of every component status is stored at
+    most once per CHECKPOINT_INTERVAL, and retention runs alongside it.
+    """
+    validated = ServiceHealthSnapshotResponse.model_validate(snapshot)
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            transitions = detect_transitions(validated, _last_statuses(cur))
+            for transition in transitions:
+                cur.execute(
+                    """
+                    INSERT INTO public.service_health_transitions (
+                        component_id,
+                        observed_at,
+                        status,
+                        previous_status,
+                        message,
+                        required
+                    )
+                    VALUES (%s, %s, %s, %s, %s, %s);
+                    """,
+                    (
+                        transition.component_id,
+                        transition.observed_at,
+                        transition.status.value,
+                        transition.previous_status.value if transition.previous_status else None,
+                        transition.message,
+                        transition.required,
+                    ),
+                )
+
+            if _checkpoint_due(cur, validated.checked_at):
+                statuses = {
+                    component.id: component.status.value
+                    for component in validated.components
+                }
+                cur.execute(
+                    """
+                    INSERT INTO public.service_health_checkpoints (checked_at, overall, statuses)
+                    VALUES (%s, %s, %s::jsonb)
+                    ON CONFLICT (checked_at) DO NOTHING;
+                    """,
+                    (
+                        validated.checked_at,
+                        validated.overall.value,
+                        json.dumps(statuses, separators=(",", ":")),
+                    ),
+                )
+                _prune_history(cur, validated.checked_at)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        put_db_conn(conn)
+
+    return transitions
+
+
+def _transition_from_row(row) -> HealthTransition:
+    component_id, observed_at, status, previous_status, message, required = row
+    return HealthTransition(
+        component_id=component_id,
+        observed_at=observed_at,
+        status=HealthStatus(status),
+        previous_status=HealthStatus(previous_status) if previous_status else None,
+        message=message,
+        required=required,
+    )
+
+
+def list_component_transitions(
+    component_id: str,
+    *,
+    since: datetime | None = None,
+    limit: int = 200,
+) -> list[HealthTransition]:
+    if limit < 1 or limit > MAX_TIMELINE_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_TIMELINE_LIMIT}")
+    since = since or datetime.now(timezone.utc) - DEFAULT_TIMELINE_WINDOW
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT component_id, observed_at, status, previous_status, message, required
+                FROM public.service_health_transitions
+                WHERE component_id = %s
+                  AND observed_at >= %s
+                ORDER BY observed_at DESC, id DESC
+                LIMIT %s;
+                """,
+                (component_id, since, limit),
+            )
+            rows = cur.fetchall()
+    finally:
+        put_db_conn(conn)
+
+    return [_transition_from_row(row) for row in rows]
+
+
+def summarize_uptime(
+    component_id: str,
+    transitions: list[HealthTransition],
+    window_start: datetime,
+    window_end: datetime,
+) -> HealthUptimeSummary:
+    """
+    Summarize time spent in each status between window_start and window_end.
+
+    transitions must be ordered oldest first and may begin with the last
+    transition before the window, which sets the status the window opens in.
+    Unknown time is excluded from the uptime ratio because the component's
+    real state was not observed. A recovery is a return to an up status after
+    a degraded or unhealthy spell; its duration counts from the first down
+    transition, even when that happened before the window.
+    """
+    seconds_by_status: dict[HealthStatus, float] = {}
+    down_since: datetime | None = None
+    recoveries: list[float] = []
+    transition_count = 0
+
+    for index, transition in enumerate(transitions):
+        next_at = (
+            transitions[index + 1].observed_at
+            if index + 1 < len(transitions)
+            else window_end
+        )
+        start = max(transition.observed_at, window_start)
+        end = min(next_at, window_end)
+        if end > start:
+            seconds_by_status[transition.status] = (
+                seconds_by_status.get(transition.status, 0.0)
+                + (end - start).total_seconds()
+            )
+
+        in_window = window_start <= transition.observed_at <= window_end
+        if in_window and transition.previous_status is not None:
+            transition_count += 1
+
+        if transition.status in DOWN_STATUSES:
+            if down_since is None:
+                down_since = transition.observed_at
+        elif transition.status in UP_STATUSES and down_since is not None:
+            if in_window:
+                recoveries.append((transition.observed_at - down_since).total_seconds())
+            down_since = None
+
+    observed_seconds = sum(seconds_by_status.values())
+    up_seconds = sum(
+        seconds for status, seconds in seconds_by_status.items() if status in UP_STATUSES
+    )
+    known_seconds = observed_seconds - seconds_by_status.get(HealthStatus.UNKNOWN, 0.0)
+    return HealthUptimeSummary(
+        component_id=component_id,
+        window_start=window_start,
+        window_end=window_end,
+        observed_seconds=round(observed_seconds, 3),
+        up_seconds=round(up_seconds, 3),
+        uptime_ratio=round(up_seconds / known_seconds, 6) if known_seconds > 0 else None,
+        seconds_by_status={
+            status: round(seconds, 3) for status, seconds in seconds_by_status.items()
+        },
+        transition_count=transition_count,
+        recovery_count=len(recoveries),
+        mean_time_to_recovery_seconds=(
+            round(sum(recoveries) / len(recoveries), 3) if recoveries else None
+        ),
+    )
+
+
+def get_component_uptime(
+    component_id: str,
+    *,
+    days: int = 7,
+    now: datetime | None = None,
+) -> HealthUptimeSummary:
+    if days < 1 or days > MAX_UPTIME_WINDOW_DAYS:
+        raise ValueError(f"days must be between 1 and {MAX_UPTIME_WINDOW_DAYS}")
+    window_end = now or datetime.now(timezone.utc)
+    window_start = window_end - timedelta(days=days)
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                (
+                    SELECT id, component_id, observed_at, status, previous_status, message, required
+                    FROM public.service_health_transitions
+                    WHERE component_id = %s
+                      AND observed_at < %s
+                    ORDER BY observed_at DESC, id DESC
+                    LIMIT 1
+                )
+                UNION ALL
+                (
+                    SELECT id, component_id, observed_at, status, previous_status, message, required
+                    FROM public.service_health_transitions
+                    WHERE component_id = %s
+                      AND observed_at >= %s
+                      AND observed_at <= %s
+                )
+                ORDER BY observed_at ASC, id ASC;
+                """,
+                (component_id, window_start, component_id, window_start, window_end),
+            )
+            rows = cur.fetchall()
+    finally:
+        put_db_conn(conn)
+
+    if not rows:
+        raise HealthComponentHistoryNotFoundError(
+            f"No health history recorded for component: {component_id}"
+        )
+
+    transitions = [_transition_from_row(row[1:]) for row in rows]
+    return summarize_uptime(component_id, transitions, window_start, window_end)
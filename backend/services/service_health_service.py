@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
@@ -7,6 +8,7 @@ from pathlib import Path
 import os
 import pwd
 import subprocess
+import time
 
 from backend.models.health_models import (
     HealthComponent,
@@ -17,10 +19,12 @@ from backend.models.health_models import (
     HealthSystemdMetadata,
     ServiceHealthSnapshotResponse,
 )
+from backend.services.process_presence import process_presence
 
 
 SYSTEMCTL = "/usr/bin/systemctl"
 SYSTEMD_TIMEOUT_SECONDS = 3
+HEALTH_EVALUATION_WORKERS = 8
 SNAPSHOT_SINGLETON_ID = "current"
 SNAPSHOT_FRESHNESS_COMPONENT_ID = "health-collector-snapshot-freshness"
 SNAPSHOT_STALE_AFTER_SECONDS = 90
@@ -379,6 +383,8 @@ JDOWNLOADER_PATHS = (
 
 JDOWNLOADER_USER = "alex"
 JDOWNLOADER_SYSTEMD_UNIT_NAME = "jdownloader.service"
+JDOWNLOADER_PROCESS_KEY = "jdownloader"
+JDOWNLOADER_PROCESS_MARKER = "JDownloader.jar"
 
 DEPLOYMENT_BASELINE_OBSERVATION_ROWS = (
     ("canonical", "Canonical / Production Runtime", "HEAD", "main"),
@@ -496,15 +502,26 @@ def inspect_systemd_unit(unit: str, *, timeout: float = SYSTEMD_TIMEOUT_SECONDS)
             error=f"systemd status unavailable: {type(exc).__name__}",
         )
 
+    return _systemd_unit_status(
+        unit,
+        _parse_systemd_properties(result.stdout.splitlines()),
+        result.returncode,
+    )
+
+
+def _parse_systemd_properties(lines: list[str]) -> dict[str, str]:
     properties: dict[str, str] = {}
-    for line in result.stdout.splitlines():
+    for line in lines:
         if "=" not in line:
             continue
         key, value = line.split("=", 1)
         properties[key] = value
+    return properties
+
 
+def _systemd_unit_status(unit: str, properties: dict[str, str], returncode: int) -> SystemdUnitStatus:
     load_state = properties.get("LoadState")
-    available = result.returncode == 0 and load_state not in {"", "not-found", "error"}
+    available = returncode == 0 and load_state not in {"", "not-found", "error"}
     return SystemdUnitStatus(
         unit=unit,
         available=available,
@@ -513,6 +530,79 @@ def inspect_systemd_unit(unit: str, *, timeout: float = SYSTEMD_TIMEOUT_SECONDS)
     )
 
 
+def _split_systemd_show_blocks(stdout: str) -> list[list[str]]:
+    blocks: list[list[str]] = []
+    current: list[str] = []
+    for line in stdout.splitlines():
+        if line.strip():
+            current.append(line)
+        elif current:
+            blocks.append(current)
+            current = []
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def inspect_systemd_units(
+    units: list[str] | tuple[str, ...],
+    *,
+    timeout: float = SYSTEMD_TIMEOUT_SECONDS,
+) -> dict[str, SystemdUnitStatus]:
+    """
+    Inspect several units with a single ``systemctl show`` call.
+
+    systemctl prints one property block per unit, separated by blank lines and
+    in argument order. If the batch fails or its output cannot be matched back
+    to the requested units, each unit is inspected on its own instead.
+    """
+    units = list(dict.fromkeys(units))
+    for unit in units:
+        if unit not in ALLOWED_SYSTEMD_UNITS:
+            raise ValueError(f"Systemd unit is not allowlisted: {unit}")
+    if not units:
+        return {}
+
+    command = [
+        SYSTEMCTL,
+        "show",
+        *units,
+        *(f"--property={prop}" for prop in SYSTEMD_PROPERTIES),
+        "--no-pager",
+    ]
+    try:
+        result = subprocess.run(
+            command,
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except Exception as exc:
+        return {
+            unit: SystemdUnitStatus(
+                unit=unit,
+                available=False,
+                properties={},
+                error=f"systemd status unavailable: {type(exc).__name__}",
+            )
+            for unit in units
+        }
+
+    blocks = _split_systemd_show_blocks(result.stdout)
+    if result.returncode != 0 or len(blocks) != len(units):
+        return {unit: inspect_systemd_unit(unit, timeout=timeout) for unit in units}
+
+    statuses: dict[str, SystemdUnitStatus] = {}
+    for unit, block in zip(units, blocks):
+        statuses[unit] = _systemd_unit_status(
+            unit,
+            _parse_systemd_properties(block),
+            result.returncode,
+        )
+    return statuses
+
+
 def systemd_status_for_rh_storage_compat(service_name: str) -> dict[str, object]:
     status = inspect_systemd_unit(service_name)
     pid = _positive_int(status.get("ExecMainPID")) or _positive_int(status.get("MainPID"))
@@ -734,8 +824,13 @@ def _component(
     )
 
 
-def evaluate_unit_component(definition: UnitDefinition, checked_at: datetime) -> HealthComponent:
-    status = inspect_systemd_unit(definition.unit)
+def evaluate_unit_component(
+    definition: UnitDefinition,
+    checked_at: datetime,
+    status: SystemdUnitStatus | None = None,
+) -> HealthComponent:
+    if status is None:
+        status = inspect_systemd_unit(definition.unit)
     normalized, message = evaluate_systemd_status(status, definition.expected_mode)
     dependencies: list[HealthDependencyCheck] = []
 
@@ -1299,6 +1394,11 @@ def inspect_jdownloader_user_service() -> HealthDependencyCheck:
         properties=values,
     )
     observed = _jdownloader_observed_state(values)
+    if result.returncode == 0:
+        process_presence.note_main_pid(
+            JDOWNLOADER_PROCESS_KEY,
+            _positive_int(values.get("MainPID")),
+        )
 
     if result.returncode != 0:
         if _user_manager_unavailable_error(result.stderr):
@@ -1360,24 +1460,7 @@ def inspect_jdownloader_user_service() -> HealthDependencyCheck:
 
 def inspect_jdownloader_process() -> HealthDependencyCheck:
     try:
-        for pid in os.listdir("/proc"):
-            if not pid.isdigit():
-                continue
-            cmdline_path = Path("/proc") / pid / "cmdline"
-            try:
-                cmdline = cmdline_path.read_text(encoding="utf-8", errors="replace")
-            except (FileNotFoundError, PermissionError, ProcessLookupError):
-                continue
-            if "JDownloader.jar" in cmdline:
-                return HealthDependencyCheck(
-                    id="jdownloader-process",
-                    name="JDownloader Process",
-                    kind=HealthComponentKind.PROCESS,
-                    status=HealthStatus.HEALTHY,
-                    message="Expected JDownloader process is present",
-                    expected="process_present",
-                    observed="process_present",
-                )
+        lookup = process_presence.locate(JDOWNLOADER_PROCESS_KEY, JDOWNLOADER_PROCESS_MARKER)
     except Exception as exc:
         return HealthDependencyCheck(
             id="jdownloader-process",
@@ -1389,6 +1472,22 @@ def inspect_jdownloader_process() -> HealthDependencyCheck:
             observed="unknown",
         )
 
+    if lookup.present:
+        return HealthDependencyCheck(
+            id="jdownloader-process",
+            name="JDownloader Process",
+            kind=HealthComponentKind.PROCESS,
+            status=HealthStatus.HEALTHY,
+            # The pid changes across restarts, so it stays out of observed,
+            # which baselines compare against expected.
+            message=(
+                f"Expected JDownloader process is present "
+                f"(pid {lookup.identity.pid}, found by {lookup.source})"
+            ),
+            expected="process_present",
+            observed="process_present",
+        )
+
     return HealthDependencyCheck(
         id="jdownloader-process",
         name="JDownloader Process",
@@ -1438,81 +1537,155 @@ def aggregate_overall(components: list[HealthComponent]) -> HealthStatus:
     return HealthStatus.HEALTHY
 
 
-def collect_service_health_snapshot() -> ServiceHealthSnapshotResponse:
-    checked_at = datetime.now(timezone.utc)
-    components: list[HealthComponent] = []
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
 
-    for definition in UNIT_DEFINITIONS:
-        try:
-            components.append(evaluate_unit_component(definition, checked_at))
-        except Exception as exc:
-            components.append(
-                _component(
-                    id=definition.id,
-                    name=definition.name,
-                    group=definition.group,
-                    kind=HealthComponentKind.SYSTEMD_UNIT,
-                    status=HealthStatus.UNKNOWN,
-                    message=f"Health evaluation unavailable: {type(exc).__name__}",
-                    checked_at=checked_at,
-                    required=definition.required,
-                    unit=definition.unit,
-                    expected_mode=definition.expected_mode,
-                )
-            )
-
-    for definition in PATH_DEFINITIONS:
-        try:
-            components.append(evaluate_path_component(definition, checked_at))
-        except Exception as exc:
-            components.append(
-                _component(
-                    id=definition.id,
-                    name=definition.name,
-                    group=definition.group,
-                    kind=definition.kind,
-                    status=HealthStatus.UNKNOWN,
-                    message=f"Path health evaluation unavailable: {type(exc).__name__}",
-                    checked_at=checked_at,
-                    required=definition.required,
-                )
-            )
 
+def _timed_component(evaluate, unavailable) -> HealthComponent:
+    started = time.perf_counter()
     try:
-        components.append(evaluate_deployment_baseline_parity_component(checked_at))
+        component = evaluate()
     except Exception as exc:
+        component = unavailable(exc)
+    return component.model_copy(update={"evaluation_ms": _elapsed_ms(started)})
+
+
+def _unit_component_unavailable(
+    definition: UnitDefinition,
+    checked_at: datetime,
+    exc: Exception,
+) -> HealthComponent:
+    return _component(
+        id=definition.id,
+        name=definition.name,
+        group=definition.group,
+        kind=HealthComponentKind.SYSTEMD_UNIT,
+        status=HealthStatus.UNKNOWN,
+        message=f"Health evaluation unavailable: {type(exc).__name__}",
+        checked_at=checked_at,
+        required=definition.required,
+        unit=definition.unit,
+        expected_mode=definition.expected_mode,
+    )
+
+
+def _path_component_unavailable(
+    definition: PathDefinition,
+    checked_at: datetime,
+    exc: Exception,
+) -> HealthComponent:
+    return _component(
+        id=definition.id,
+        name=definition.name,
+        group=definition.group,
+        kind=definition.kind,
+        status=HealthStatus.UNKNOWN,
+        message=f"Path health evaluation unavailable: {type(exc).__name__}",
+        checked_at=checked_at,
+        required=definition.required,
+    )
+
+
+def _deployment_baseline_parity_unavailable(checked_at: datetime, exc: Exception) -> HealthComponent:
+    return _component(
+        id=DEPLOYMENT_BASELINE_PARITY_COMPONENT_ID,
+        name="Deployment Baseline Parity",
+        group=HealthComponentGroup.CORE,
+        kind=HealthComponentKind.COMPOSITE,
+        status=HealthStatus.UNKNOWN,
+        message=f"Deployment baseline parity evaluation unavailable: {type(exc).__name__}",
+        checked_at=checked_at,
+    )
+
+
+def _jdownloader_unavailable(checked_at: datetime, exc: Exception) -> HealthComponent:
+    return _component(
+        id="jdownloader",
+        name="JDownloader",
+        group=HealthComponentGroup.MEDIA,
+        kind=HealthComponentKind.COMPOSITE,
+        status=HealthStatus.UNKNOWN,
+        message=f"JDownloader health evaluation unavailable: {type(exc).__name__}",
+        checked_at=checked_at,
+    )
+
+
+def _evaluate_unit_components(checked_at: datetime) -> list[HealthComponent]:
+    started = time.perf_counter()
+    try:
+        statuses = inspect_systemd_units([definition.unit for definition in UNIT_DEFINITIONS])
+    except Exception:
+        # Units without a batched status are inspected individually.
+        statuses = {}
+    # Every unit waited on the same systemctl call, so each carries its cost.
+    query_ms = _elapsed_ms(started)
+
+    components = []
+    for definition in UNIT_DEFINITIONS:
+        component = _timed_component(
+            lambda: evaluate_unit_component(definition, checked_at, statuses.get(definition.unit)),
+            lambda exc: _unit_component_unavailable(definition, checked_at, exc),
+        )
         components.append(
-            _component(
-                id=DEPLOYMENT_BASELINE_PARITY_COMPONENT_ID,
-                name="Deployment Baseline Parity",
-                group=HealthComponentGroup.CORE,
-                kind=HealthComponentKind.COMPOSITE,
-                status=HealthStatus.UNKNOWN,
-                message=f"Deployment baseline parity evaluation unavailable: {type(exc).__name__}",
-                checked_at=checked_at,
+            component.model_copy(
+                update={"evaluation_ms": round(component.evaluation_ms + query_ms, 3)}
             )
         )
+    return components
 
-    try:
-        components.append(evaluate_jdownloader_component(checked_at))
-    except Exception as exc:
-        components.append(
-            _component(
-                id="jdownloader",
-                name="JDownloader",
-                group=HealthComponentGroup.MEDIA,
-                kind=HealthComponentKind.COMPOSITE,
-                status=HealthStatus.UNKNOWN,
-                message=f"JDownloader health evaluation unavailable: {type(exc).__name__}",
-                checked_at=checked_at,
+
+def collect_service_health_snapshot() -> ServiceHealthSnapshotResponse:
+    """
+    Evaluate every component once and return the snapshot.
+
+    Units are inspected with one batched systemctl call while path, baseline
+    and JDownloader checks run alongside it, since none of them share state.
+    Components keep their definition order regardless of completion order.
+    """
+    started = time.perf_counter()
+    checked_at = datetime.now(timezone.utc)
+
+    with ThreadPoolExecutor(
+        max_workers=HEALTH_EVALUATION_WORKERS,
+        thread_name_prefix="service-health",
+    ) as executor:
+        units = executor.submit(_evaluate_unit_components, checked_at)
+        paths = [
+            executor.submit(
+                _timed_component,
+                lambda definition=definition: evaluate_path_component(definition, checked_at),
+                lambda exc, definition=definition: _path_component_unavailable(
+                    definition,
+                    checked_at,
+                    exc,
+                ),
             )
+            for definition in PATH_DEFINITIONS
+        ]
+        parity = executor.submit(
+            _timed_component,
+            lambda: evaluate_deployment_baseline_parity_component(checked_at),
+            lambda exc: _deployment_baseline_parity_unavailable(checked_at, exc),
         )
+        jdownloader = executor.submit(
+            _timed_component,
+            lambda: evaluate_jdownloader_component(checked_at),
+            lambda exc: _jdownloader_unavailable(checked_at, exc),
+        )
+
+        components: list[HealthComponent] = [
+            *units.result(),
+            *(future.result() for future in paths),
+            parity.result(),
+            jdownloader.result(),
+        ]
 
     return ServiceHealthSnapshotResponse(
         success=True,
         checked_at=checked_at,
         overall=aggregate_overall(components),
         components=components,
+        collection_ms=_elapsed_ms(started),
     )
 
 
@@ -1644,6 +1817,7 @@ def _with_freshness_component(
         checked_at=snapshot.checked_at,
         overall=aggregate_overall(components),
         components=components,
+        collection_ms=snapshot.collection_ms,
     )
 
 
@@ -5,13 +5,15 @@ import re
 import time
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-import spotipy
 from psycopg2.extensions import connection as PgConnection
 from psycopg2.extras import RealDictCursor
-from spotipy.oauth2 import SpotifyOAuth
+
+# spotipy loads on the first Spotify request rather than at API startup.
+if TYPE_CHECKING:
+    import spotipy
 
 
 SPOTIFY_SCOPE = (
@@ -54,6 +56,9 @@ def get_good_songs_playlist_id() -> str:
 
 
 def make_spotify_client(open_browser: bool = False) -> spotipy.Spotify:
+    import spotipy
+    from spotipy.oauth2 import SpotifyOAuth
+
     client_id = require_env_var("SPOTIFY_CLIENT_ID")
     client_secret = require_env_var("SPOTIFY_CLIENT_SECRET")
     redirect_uri = require_env_var("SPOTIFY_REDIRECT_URI")
@@ -72,6 +77,8 @@ def make_spotify_client(open_browser: bool = False) -> spotipy.Spotify:
 
 
 def spotify_call(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    import spotipy
+
     try:
         return fn(*args, **kwargs)
     except spotipy.SpotifyException as exc:
@@ -6,9 +6,12 @@ import time
 from logging.handlers import RotatingFileHandler
 
 # 3rd Party Imports
-from bs4 import BeautifulSoup
 import requests
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# BeautifulSoup is imported by the first scrape, not when the API starts.
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 # Local Imports
 from backend.database.database import get_db_conn, put_db_conn
@@ -31,7 +34,7 @@ log_handler.setFormatter(formatter)
 logger.addHandler(log_handler)
 
 
-def extract_updated_timestamp(soup: BeautifulSoup) -> Tuple[Optional[datetime], Optional[date]]:
+def extract_updated_timestamp(soup: "BeautifulSoup") -> Tuple[Optional[datetime], Optional[date]]:
     heading = soup.find('h5', class_='heading-component-title')
     if not heading:
         return None, None
@@ -50,6 +53,8 @@ def extract_updated_timestamp(soup: BeautifulSoup) -> Tuple[Optional[datetime],
         return None, None
 
 def scrape_field_statuses():
+    from bs4 import BeautifulSoup
+
     response = requests.get(FIELD_STATUS_URL)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, "html.parser")
@@ -1,36 +1,37 @@
 # Python Imports
-from bs4 import BeautifulSoup
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from dotenv import load_dotenv
+from functools import lru_cache
 import json
 import logging
 from logging.handlers import RotatingFileHandler
 import os
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 import re
 import requests
+import threading
 import time
+from typing import TYPE_CHECKING
 import uuid
 from uuid import uuid4
 
 # 3rd Party Imports
-from plaid.api import plaid_api
-from plaid.api_client import ApiClient
-from plaid.configuration import Configuration
-from plaid.model.accounts_balance_get_request import AccountsBalanceGetRequest
-
+# Plaid, Playwright and BeautifulSoup are imported by the functions that use
+# them so loading this module for the API or a script stays cheap.
 from cryptography.fernet import Fernet
 
+if TYPE_CHECKING:
+    from plaid.api import plaid_api
+
 # Local Imports
 from backend.database.database import get_db_conn, put_db_conn
 from backend.notifications.notifications import insert_notification, Notification
 from backend.config import load_application_config, resolve_environment_file_path
 from backend.core.runtime_paths import ensure_log_directory
 
-# Initialize config
-cfg = load_application_config()
-finance_config = cfg.get('Finance', {})
+@lru_cache(maxsize=1)
+def _finance_config() -> dict:
+    return load_application_config().get('Finance', {})
 
 
 # Create loggers
@@ -213,7 +214,11 @@ def mark_plaid_item_error(plaid_item_id: str, error: str) -> None:
     finally:
         put_db_conn(conn)
 
-def get_plaid_client(environment: str = "production") -> plaid_api.PlaidApi:
+def get_plaid_client(environment: str = "production") -> "plaid_api.PlaidApi":
+    from plaid.api import plaid_api
+    from plaid.api_client import ApiClient
+    from plaid.configuration import Configuration
+
     client_id = os.getenv("PLAID_CLIENT_ID")
     secret = os.getenv("PLAID_SECRET")
 
@@ -235,6 +240,11 @@ def get_plaid_client(environment: str = "production") -> plaid_api.PlaidApi:
 
     return plaid_api.PlaidApi(ApiClient(configuration))
 
+def _accounts_balance_request(access_token: str):
+    from plaid.model.accounts_balance_get_request import AccountsBalanceGetRequest
+
+    return AccountsBalanceGetRequest(access_token=access_token)
+
 def _safe_str(value) -> str | None:
     if value is None:
         return None
@@ -413,7 +423,7 @@ def discover_plaid_accounts() -> list[dict]:
             access_token = decrypt_access_token(item["access_token_encrypted"])
 
             response = client.accounts_balance_get(
-                AccountsBalanceGetRequest(access_token=access_token)
+                _accounts_balance_request(access_token)
             )
             response_dict = response.to_dict()
 
@@ -600,6 +610,8 @@ def _scrape_zillow_price_text(zillow_url: str) -> str | None:
     If Zillow blocks the request, shows a captcha, or the expected selector
     does not appear, return None so the manual Home value remains the fallback.
     """
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+
     browser = None
 
     try:
@@ -664,7 +676,7 @@ def get_zillow_home_values() -> list[dict]:
     If Zillow cannot be reached or parsed, return [] so the manual Home asset
     remains the fallback value for valuation_key=home_primary.
     """
-    zillow_url = finance_config.get("zillow_url")
+    zillow_url = _finance_config().get("zillow_url")
 
     if not zillow_url:
         logger.info("No Zillow URL configured. Using manual home value fallback.")
@@ -708,6 +720,8 @@ def _extract_kbb_private_party_value_from_widget(html: str) -> tuple[Decimal | N
     - Private Party Value
     - $9,320
     """
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "html.parser")
 
     text_values = [
@@ -765,30 +779,31 @@ def _fetch_kbb_widget_html(*, vehicle_label: str, kbb_widget_url: str,) -> str |
         )
         return None
 
-def get_kbb_vehicle_values() -> list[dict]:
-    """
-    Pull current KBB private party vehicle values from the configured
-    KBB price advisor widget URLs.
-
-    If a vehicle cannot be fetched or parsed, no valuation item is returned
-    for that vehicle, so its manual asset remains the fallback.
-    """
-    vehicle_configs = [
+def _kbb_vehicle_configs() -> list[dict]:
+    return [
         {
             "valuation_key": "vehicle_telluride",
             "label": "2025 Kia Telluride",
-            "url": finance_config.get("vehicle_kia_url"),
+            "url": _finance_config().get("vehicle_kia_url"),
         },
         {
             "valuation_key": "vehicle_camry",
             "label": "2014 Toyota Camry",
-            "url": finance_config.get("vehicle_camry_url"),
+            "url": _finance_config().get("vehicle_camry_url"),
         },
     ]
 
+def get_kbb_vehicle_values() -> list[dict]:
+    """
+    Pull current KBB private party vehicle values from the configured
+    KBB price advisor widget URLs.
+
+    If a vehicle cannot be fetched or parsed, no valuation item is returned
+    for that vehicle, so its manual asset remains the fallback.
+    """
     valuation_items = []
 
-    for vehicle in vehicle_configs:
+    for vehicle in _kbb_vehicle_configs():
         valuation_key = vehicle["valuation_key"]
         label = vehicle["label"]
         kbb_widget_url = vehicle.get("url")
@@ -926,7 +941,7 @@ def collect_plaid_snapshot_items() -> tuple[list[dict], list[str]]:
             access_token = decrypt_access_token(item["access_token_encrypted"])
 
             response = client.accounts_balance_get(
-                AccountsBalanceGetRequest(access_token=access_token)
+                _accounts_balance_request(access_token)
             )
             response_dict = response.to_dict()
 
@@ -1026,52 +1041,382 @@ def collect_manual_snapshot_items(
     return items
 
 
-def collect_stubbed_valuation_items() -> list[dict]:
+def _config_ttl_hours(key: str, default_hours: float) -> timedelta:
+    raw_value = _finance_config().get(key)
+
+    if raw_value in (None, ""):
+        return timedelta(hours=default_hours)
+
+    try:
+        hours = float(raw_value)
+    except (TypeError, ValueError):
+        logger.warning(
+            "Invalid finance config %s=%r. Using %s hours.",
+            key,
+            raw_value,
+            default_hours,
+        )
+        return timedelta(hours=default_hours)
+
+    return timedelta(hours=max(hours, 0))
+
+
+# How long a successful scrape is trusted before the background refresher
+# fetches it again. Expired values are still served as the last-good value.
+# Read on first use so importing the worker never needs the config file.
+@lru_cache(maxsize=1)
+def _valuation_provider_ttls() -> dict[str, timedelta]:
+    return {
+        "zillow": _config_ttl_hours("zillow_cache_ttl_hours", 24 * 7),
+        "kbb": _config_ttl_hours("kbb_cache_ttl_hours", 24 * 7),
+    }
+
+
+# Minimum wait after a failed or blocked provider attempt before retrying.
+@lru_cache(maxsize=1)
+def _valuation_retry_interval() -> timedelta:
+    return _config_ttl_hours("valuation_retry_hours", 6)
+
+
+VALUATION_REFRESH_INTERVAL_SECONDS = 60 * 30
+
+_valuation_attempts_lock = threading.Lock()
+_valuation_provider_attempts: dict[str, datetime] = {}
+
+
+def _zillow_valuation_keys() -> list[str]:
+    return ["home_primary"] if _finance_config().get("zillow_url") else []
+
+
+def _kbb_valuation_keys() -> list[str]:
+    return [
+        vehicle["valuation_key"]
+        for vehicle in _kbb_vehicle_configs()
+        if vehicle.get("url")
+    ]
+
+
+VALUATION_PROVIDERS = {
+    "zillow": {
+        "fetch": get_zillow_home_values,
+        "configured_keys": _zillow_valuation_keys,
+        "asset_category": "home",
+    },
+    "kbb": {
+        "fetch": get_kbb_vehicle_values,
+        "configured_keys": _kbb_valuation_keys,
+        "asset_category": "vehicle",
+    },
+}
+
+
+def get_cached_valuations() -> list[dict]:
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT valuation_key,
+                       provider,
+                       label,
+                       asset_category,
+                       value,
+                       confidence,
+                       raw_payload,
+                       fetched_at,
+                       last_attempt_at,
+                       last_error
+                FROM finance_valuation_cache
+                ORDER BY provider, valuation_key
+                """
+            )
+            rows = cur.fetchall()
+            columns = [desc[0] for desc in cur.description]
+
+        return [dict(zip(columns, row)) for row in rows]
+    finally:
+        put_db_conn(conn)
+
+
+def _is_valuation_expired(cached: dict, now: datetime) -> bool:
+    ttl = _valuation_provider_ttls().get(cached["provider"], timedelta(0))
+    return cached["fetched_at"] + ttl <= now
+
+
+def store_valuation_items(
+    *,
+    provider: str,
+    items: list[dict],
+    attempted_at: datetime,
+) -> None:
+    """Upsert freshly scraped valuation items as the new last-good values."""
+    if not items:
+        return
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            for item in items:
+                cur.execute(
+                    """
+                    INSERT INTO finance_valuation_cache (
+                        valuation_key,
+                        provider,
+                        label,
+                        asset_category,
+                        value,
+                        confidence,
+                        raw_payload,
+                        fetched_at,
+                        last_attempt_at,
+                        last_error,
+                        created_at,
+                        updated_at
+                    )
+                    VALUES (%s, %s, %s, %s, %s, %s, %s::jsonb, %s, %s, NULL, now(), now())
+                    ON CONFLICT (valuation_key) DO UPDATE
+                    SET provider = EXCLUDED.provider,
+                        label = EXCLUDED.label,
+                        asset_category = EXCLUDED.asset_category,
+                        value = EXCLUDED.value,
+                        confidence = EXCLUDED.confidence,
+                        raw_payload = EXCLUDED.raw_payload,
+                        fetched_at = EXCLUDED.fetched_at,
+                        last_attempt_at = EXCLUDED.last_attempt_at,
+                        last_error = NULL,
+                        updated_at = now()
+                    """,
+                    (
+                        item["valuation_key"],
+                        provider,
+                        item["label"],
+                        item.get("asset_category")
+                        or VALUATION_PROVIDERS[provider]["asset_category"],
+                        _money(_to_decimal(item["value"])),
+                        item.get("confidence", "estimate"),
+                        json.dumps(item.get("raw_payload", {}), default=str),
+                        attempted_at,
+                        attempted_at,
+                    ),
+                )
+
+        conn.commit()
+    finally:
+        put_db_conn(conn)
+
+
+def record_valuation_failure(
+    *,
+    valuation_keys: list[str],
+    error: str,
+    attempted_at: datetime,
+) -> None:
+    """Record a failed attempt without disturbing the last-good values."""
+    if not valuation_keys:
+        return
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE finance_valuation_cache
+                SET last_attempt_at = %s,
+                    last_error = %s,
+                    updated_at = now()
+                WHERE valuation_key = ANY(%s)
+                """,
+                (attempted_at, error[:2000], valuation_keys),
+            )
+        conn.commit()
+    finally:
+        put_db_conn(conn)
+
+
+def _last_valuation_attempt(
+    provider: str,
+    cached_by_key: dict[str, dict],
+) -> datetime | None:
     """
-    Zillow/KBB are currently stubs. If/when they return values, this will include them.
-    Manual home/vehicle assets are used as fallback when no live valuation exists.
+    Latest attempt for a provider, seeded from the persisted cache so a
+    restarted worker does not retry a provider that just failed.
     """
-    items = []
+    attempts = [
+        cached["last_attempt_at"]
+        for cached in cached_by_key.values()
+        if cached["provider"] == provider and cached.get("last_attempt_at")
+    ]
 
-    for value in get_zillow_home_values():
-        valuation_key = value.get("valuation_key")
+    with _valuation_attempts_lock:
+        if provider in _valuation_provider_attempts:
+            attempts.append(_valuation_provider_attempts[provider])
+        if not attempts:
+            return None
+        _valuation_provider_attempts[provider] = max(attempts)
+        return _valuation_provider_attempts[provider]
 
-        items.append(
-            {
-                "source": "zillow",
-                "source_account_id": value.get("source_account_id") or valuation_key,
-                "valuation_key": valuation_key,
-                "label": value["label"],
-                "institution_label": None,
-                "asset_category": value.get("asset_category", "home"),
-                "value": _money(_to_decimal(value["value"])),
-                "include_in_net_worth": True,
-                "confidence": value.get("confidence", "estimate"),
-                "raw_payload": value.get("raw_payload", {}),
-            }
+
+def _valuation_refresh_due(
+    provider: str,
+    cached_by_key: dict[str, dict],
+    now: datetime,
+) -> bool:
+    configured_keys = VALUATION_PROVIDERS[provider]["configured_keys"]()
+
+    if not configured_keys:
+        return False
+
+    last_attempt = _last_valuation_attempt(provider, cached_by_key)
+
+    if last_attempt and now - last_attempt < _valuation_retry_interval():
+        return False
+
+    for valuation_key in configured_keys:
+        cached = cached_by_key.get(valuation_key)
+
+        if cached is None or _is_valuation_expired(cached, now):
+            return True
+
+    return False
+
+
+def refresh_valuation_provider(provider: str) -> dict:
+    """
+    Run one provider scrape and store whatever it returned.
+
+    Keys the provider was expected to return but did not keep their
+    last-good cached value and only record the failed attempt.
+    """
+    attempted_at = datetime.now(timezone.utc)
+
+    with _valuation_attempts_lock:
+        _valuation_provider_attempts[provider] = attempted_at
+
+    configured_keys = VALUATION_PROVIDERS[provider]["configured_keys"]()
+
+    try:
+        items = VALUATION_PROVIDERS[provider]["fetch"]()
+    except Exception as exc:
+        logger.exception("Valuation provider %s failed: %s", provider, exc)
+        record_valuation_failure(
+            valuation_keys=configured_keys,
+            error=str(exc),
+            attempted_at=attempted_at,
         )
+        return {
+            "provider": provider,
+            "refreshed": [],
+            "failed": configured_keys,
+        }
 
-    for value in get_kbb_vehicle_values():
-        valuation_key = value.get("valuation_key")
+    items = [item for item in items if item.get("valuation_key")]
+    store_valuation_items(
+        provider=provider,
+        items=items,
+        attempted_at=attempted_at,
+    )
+
+    refreshed_keys = [item["valuation_key"] for item in items]
+    failed_keys = [
+        valuation_key
+        for valuation_key in configured_keys
+        if valuation_key not in refreshed_keys
+    ]
+    record_valuation_failure(
+        valuation_keys=failed_keys,
+        error=f"{provider} returned no value",
+        attempted_at=attempted_at,
+    )
+
+    return {
+        "provider": provider,
+        "refreshed": refreshed_keys,
+        "failed": failed_keys,
+    }
+
+
+def refresh_valuation_cache(*, force: bool = False) -> list[dict]:
+    """
+    Refresh every valuation provider whose cached values are missing or
+    older than the provider TTL.
+
+    Providers run one at a time because Zillow launches a full browser.
+    """
+    now = datetime.now(timezone.utc)
+    cached_by_key = {
+        cached["valuation_key"]: cached
+        for cached in get_cached_valuations()
+    }
+
+    results = []
+
+    for provider in VALUATION_PROVIDERS:
+        if not force and not _valuation_refresh_due(provider, cached_by_key, now):
+            continue
+
+        results.append(refresh_valuation_provider(provider))
+
+    return results
+
+
+def collect_cached_valuation_items(
+    *,
+    now: datetime | None = None,
+) -> list[dict]:
+    """
+    Build snapshot items from the valuation cache without scraping.
+
+    Expired values are still used as the last-good value and flagged as stale
+    in the raw payload. Rows whose key is no longer configured (a sold home or
+    vehicle) are left out. Manual home/vehicle assets remain the fallback when
+    a valuation has never been fetched.
+    """
+    now = now or datetime.now(timezone.utc)
+    configured_keys = {
+        provider: set(spec["configured_keys"]())
+        for provider, spec in VALUATION_PROVIDERS.items()
+    }
+    items = []
+
+    for cached in get_cached_valuations():
+        valuation_key = cached["valuation_key"]
+        if valuation_key not in configured_keys.get(cached["provider"], ()):
+            continue
+
+        raw_payload = dict(cached.get("raw_payload") or {})
+        raw_payload["cache"] = {
+            "fetched_at": cached["fetched_at"].isoformat(),
+            "last_attempt_at": cached["last_attempt_at"].isoformat(),
+            "last_error": cached.get("last_error"),
+            "stale": _is_valuation_expired(cached, now),
+        }
 
         items.append(
             {
-                "source": "kbb",
-                "source_account_id": value.get("source_account_id") or valuation_key,
+                "source": cached["provider"],
+                "source_account_id": valuation_key,
                 "valuation_key": valuation_key,
-                "label": value["label"],
+                "label": cached["label"],
                 "institution_label": None,
-                "asset_category": value.get("asset_category", "vehicle"),
-                "value": _money(_to_decimal(value["value"])),
+                "asset_category": cached["asset_category"],
+                "value": _money(_to_decimal(cached["value"])),
                 "include_in_net_worth": True,
-                "confidence": value.get("confidence", "estimate"),
-                "raw_payload": value.get("raw_payload", {}),
+                "confidence": cached["confidence"],
+                "raw_payload": raw_payload,
             }
         )
 
     return items
 
 
+def _stale_valuation_keys(valuation_items: list[dict]) -> list[str]:
+    return [
+        item["valuation_key"]
+        for item in valuation_items
+        if item["raw_payload"].get("cache", {}).get("stale")
+    ]
+
+
 def create_monthly_finance_snapshot(
     *,
     target_date: date | None = None,
@@ -1097,7 +1442,7 @@ def create_monthly_finance_snapshot(
 
     # Gather the items from various sources
     plaid_items, plaid_errors = collect_plaid_snapshot_items()
-    valuation_items = collect_stubbed_valuation_items()
+    valuation_items = collect_cached_valuation_items()
 
     # Gather the keys for the manual items
     overridden_valuation_keys = {
@@ -1211,6 +1556,7 @@ def create_monthly_finance_snapshot(
         "total_liabilities": float(total_liabilities),
         "net_worth": float(net_worth),
         "errors": plaid_errors,
+        "stale_valuation_keys": _stale_valuation_keys(valuation_items),
     }
 
 def send_finance_snapshot_notification(result: dict) -> None:
@@ -1249,7 +1595,7 @@ def send_finance_snapshot_notification(result: dict) -> None:
 
 def preview_monthly_finance_snapshot_items() -> str:
     plaid_items, plaid_errors = collect_plaid_snapshot_items()
-    valuation_items = collect_stubbed_valuation_items()
+    valuation_items = collect_cached_valuation_items()
 
     overridden_valuation_keys = {
         item["valuation_key"]
@@ -1272,6 +1618,7 @@ def preview_monthly_finance_snapshot_items() -> str:
         "total_liabilities": float(total_liabilities),
         "net_worth": float(net_worth),
         "errors": plaid_errors,
+        "stale_valuation_keys": _stale_valuation_keys(valuation_items),
         "items": snapshot_items,
     }
     return json.dumps(result, indent=2, default=str)
@@ -1326,6 +1673,30 @@ def run_finance_worker():
         time.sleep(60 * 60 * 6)
 
 
+def run_finance_valuation_worker():
+    """
+    Long-running valuation cache refresher.
+
+    Runs on its own schedule so Zillow/KBB scrapes never block a snapshot.
+    Snapshots and previews only read the cached values.
+    """
+    logger.info("Starting Finance Valuation Worker")
+
+    while True:
+        try:
+            for result in refresh_valuation_cache():
+                logger.info(
+                    "Valuation refresh: provider=%s refreshed=%s failed=%s",
+                    result["provider"],
+                    result["refreshed"],
+                    result["failed"],
+                )
+        except Exception as exc:
+            logger.exception("Error refreshing finance valuations: %s", exc)
+
+        time.sleep(VALUATION_REFRESH_INTERVAL_SECONDS)
+
+
 if __name__ == "__main__":
     load_dotenv(dotenv_path=resolve_environment_file_path(), override=False)
     print(preview_monthly_finance_snapshot_items())
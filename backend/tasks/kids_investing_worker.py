@@ -5,12 +5,9 @@ import csv
 import logging
 from logging.handlers import RotatingFileHandler
 import time
-import pandas as pd
 from datetime import date
 from decimal import Decimal
 
-import yfinance as yf
-
 import requests
 
 from backend.services import kids_investing_service
@@ -29,6 +26,10 @@ if not logger.handlers:
 
 
 def fetch_yfinance_latest_price(ticker: str) -> dict:
+    # yfinance pulls in pandas and numpy; only load them for a price lookup.
+    import pandas as pd
+    import yfinance as yf
+
     symbol = ticker.strip().upper()
 
     df = yf.download(
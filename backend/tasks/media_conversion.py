@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import os
 import subprocess
+import tempfile
 import time
+from collections.abc import Callable, Iterator
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 
+STDERR_TAIL_BYTES = 4000
+
+
 @dataclass
 class ConversionResult:
     source: str
@@ -15,11 +21,166 @@ class ConversionResult:
     elapsed_seconds: float = 0.0
 
 
+@dataclass
+class ConversionProgress:
+    out_time_seconds: float
+    duration_seconds: float | None
+    speed: float | None
+    percent: float | None
+    eta_seconds: float | None
+    done: bool = False
+
+
+class FfmpegProgressParser:
+    """
+    Turn ffmpeg ``-progress`` key=value lines into progress snapshots.
+
+    ffmpeg writes one block of keys per update and terminates each block with
+    ``progress=continue`` or ``progress=end``.
+    """
+
+    def __init__(self, duration_seconds: float | None):
+        self.duration_seconds = duration_seconds
+        self._out_time_seconds = 0.0
+        self._speed: float | None = None
+
+    def feed(self, line: str) -> ConversionProgress | None:
+        key, separator, value = line.strip().partition("=")
+        if not separator:
+            return None
+
+        value = value.strip()
+
+        if key in {"out_time_us", "out_time_ms"}:
+            # ffmpeg reports both keys in microseconds.
+            try:
+                self._out_time_seconds = max(int(value), 0) / 1_000_000
+            except ValueError:
+                pass
+        elif key == "speed":
+            try:
+                self._speed = float(value.rstrip("x"))
+            except ValueError:
+                self._speed = None
+        elif key == "progress":
+            return self._snapshot(done=value == "end")
+
+        return None
+
+    def _snapshot(self, *, done: bool) -> ConversionProgress:
+        percent = None
+        eta_seconds = None
+
+        if self.duration_seconds:
+            if done:
+                percent = 100.0
+                eta_seconds = 0.0
+            else:
+                percent = min(
+                    self._out_time_seconds / self.duration_seconds * 100,
+                    100.0,
+                )
+                if self._speed:
+                    remaining = max(self.duration_seconds - self._out_time_seconds, 0)
+                    eta_seconds = remaining / self._speed
+
+        return ConversionProgress(
+            out_time_seconds=self._out_time_seconds,
+            duration_seconds=self.duration_seconds,
+            speed=self._speed,
+            percent=round(percent, 2) if percent is not None else None,
+            eta_seconds=round(eta_seconds, 1) if eta_seconds is not None else None,
+            done=done,
+        )
+
+
+def _sorted_entries(directory: str | Path) -> list[os.DirEntry]:
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(entries, key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def iter_mp4_files(root: str | Path) -> Iterator[Path]:
+    """
+    Yield .mp4 files below root as the tree is walked.
+
+    Uses scandir so only directory entries are touched, and yields lazily so
+    callers can start queueing work before the whole library is listed. Each
+    directory is listed in name order and descended into in place, so files
+    come out in path order and a --limit always picks the same files.
+    """
+    pending = [iter(_sorted_entries(root))]
+
+    while pending:
+        entry = next(pending[-1], None)
+
+        if entry is None:
+            pending.pop()
+            continue
+
+        if entry.is_dir(follow_symlinks=False):
+            pending.append(iter(_sorted_entries(entry.path)))
+            continue
+
+        if not entry.name.lower().endswith(".mp4"):
+            continue
+
+        # Skip temp/remux artifacts just in case.
+        if ".remuxing." in entry.name:
+            continue
+
+        if entry.is_file():
+            yield Path(entry.path)
+
+
+def probe_duration_seconds(source: str | Path) -> float | None:
+    """Return the container duration reported by ffprobe, if available."""
+    try:
+        proc = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(source),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    if proc.returncode != 0:
+        return None
+
+    try:
+        duration = float(proc.stdout.strip())
+    except ValueError:
+        return None
+
+    return duration if duration > 0 else None
+
+
+def _read_tail(handle, limit: int = STDERR_TAIL_BYTES) -> str:
+    handle.seek(0, os.SEEK_END)
+    size = handle.tell()
+    handle.seek(max(size - limit, 0))
+    return handle.read().decode("utf-8", errors="replace")
+
+
 def convert_mp4_to_mkv(
     source_path: str | Path,
     *,
     delete_source: bool = False,
     overwrite: bool = False,
+    on_progress: Callable[[ConversionProgress], None] | None = None,
 ) -> ConversionResult:
     """
     Remux an .mp4 file into an .mkv container without transcoding video/audio.
@@ -32,6 +193,7 @@ def convert_mp4_to_mkv(
         source_path: Path to the .mp4 file.
         delete_source: Delete the original .mp4 after successful conversion.
         overwrite: Replace an existing .mkv if one already exists.
+        on_progress: Called with each ffmpeg progress update.
 
     Returns:
         ConversionResult describing what happened.
@@ -99,19 +261,36 @@ def convert_mp4_to_mkv(
         "srt",
         "-max_muxing_queue_size",
         "4096",
+        "-progress",
+        "pipe:1",
+        "-nostats",
         str(temp_target),
     ]
 
-    proc = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+    parser = FfmpegProgressParser(
+        probe_duration_seconds(source) if on_progress else None
     )
 
+    # Stream progress from stdout and spool stderr to disk so a long remux
+    # never holds ffmpeg's full log in memory.
+    with tempfile.TemporaryFile() as stderr_file:
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+        ) as proc:
+            for line in proc.stdout:
+                progress = parser.feed(line)
+                if progress is not None and on_progress is not None:
+                    on_progress(progress)
+
+        returncode = proc.wait()
+        stderr_tail = _read_tail(stderr_file) if returncode != 0 else ""
+
     elapsed = round(time.monotonic() - started, 2)
 
-    if proc.returncode != 0:
+    if returncode != 0:
         if temp_target.exists():
             temp_target.unlink()
 
@@ -119,7 +298,7 @@ def convert_mp4_to_mkv(
             source=str(source),
             target=str(target),
             status="failed",
-            message=proc.stderr.strip()[-4000:],
+            message=stderr_tail.strip(),
             elapsed_seconds=elapsed,
         )
 
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+from backend.database.database import get_db_conn, put_db_conn
+from backend.services import media_conversion_service
+from backend.tasks.media_conversion import ConversionProgress, convert_mp4_to_mkv
+
+
+logger = logging.getLogger("media_conversion_worker")
+
+# Remuxing is stream copy, so throughput is bound by NAS disk I/O rather than
+# CPU. Size the pool to what the array can sustain, not to the core count.
+DEFAULT_WORKER_COUNT = 2
+IDLE_POLL_SECONDS = 15
+PROGRESS_WRITE_INTERVAL_SECONDS = 5
+
+
+def configured_worker_count() -> int:
+    raw_value = os.getenv("REMIHUB_MEDIA_CONVERSION_WORKERS", "").strip()
+    if not raw_value:
+        return DEFAULT_WORKER_COUNT
+
+    try:
+        return max(int(raw_value), 0)
+    except ValueError:
+        logger.warning(
+            "Invalid REMIHUB_MEDIA_CONVERSION_WORKERS=%r; using %s",
+            raw_value,
+            DEFAULT_WORKER_COUNT,
+        )
+        return DEFAULT_WORKER_COUNT
+
+
+def _run_in_transaction(operation, **kwargs):
+    conn = get_db_conn()
+    try:
+        result = operation(conn, **kwargs)
+        conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        put_db_conn(conn)
+
+
+class ProgressReporter:
+    """Throttle ffmpeg progress updates into periodic job heartbeats."""
+
+    def __init__(self, *, job_id: str, worker_id: str):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self._last_write = 0.0
+
+    def __call__(self, progress: ConversionProgress) -> None:
+        now = time.monotonic()
+        if not progress.done and now - self._last_write < PROGRESS_WRITE_INTERVAL_SECONDS:
+            return
+
+        self._last_write = now
+        try:
+            _run_in_transaction(
+                media_conversion_service.record_conversion_progress,
+                job_id=self.job_id,
+                worker_id=self.worker_id,
+                progress=progress,
+            )
+        except Exception:
+            logger.exception("Failed to record progress for conversion %s", self.job_id)
+
+
+def process_next_conversion_job(worker_id: str) -> bool:
+    job = _run_in_transaction(
+        media_conversion_service.claim_next_conversion_job,
+        worker_id=worker_id,
+    )
+    if job is None:
+        return False
+
+    logger.info("Worker %s converting %s", worker_id, job["source_path"])
+    result = convert_mp4_to_mkv(
+        job["source_path"],
+        delete_source=job["delete_source"],
+        overwrite=job["overwrite"],
+        on_progress=ProgressReporter(job_id=job["id"], worker_id=worker_id),
+    )
+    _run_in_transaction(
+        media_conversion_service.finish_conversion_job,
+        job_id=job["id"],
+        worker_id=worker_id,
+        result=result,
+    )
+    logger.info(
+        "Worker %s finished %s: %s in %ss",
+        worker_id,
+        job["source_path"],
+        result.status,
+        result.elapsed_seconds,
+    )
+    return True
+
+
+def _run_conversion_slot(worker_id: str) -> None:
+    while True:
+        try:
+            if process_next_conversion_job(worker_id):
+                continue
+        except Exception:
+            logger.exception("Media conversion worker %s failed", worker_id)
+        time.sleep(IDLE_POLL_SECONDS)
+
+
+def run_media_conversion_worker():
+    worker_count = configured_worker_count()
+    logger.info("Media conversion worker starting with %s slot(s)", worker_count)
+    if worker_count == 0:
+        return
+
+    try:
+        requeued = _run_in_transaction(
+            media_conversion_service.requeue_abandoned_conversion_jobs,
+        )
+        if requeued:
+            logger.info("Requeued %s interrupted media conversion job(s)", requeued)
+    except Exception:
+        logger.exception("Failed to requeue interrupted media conversion jobs")
+
+    worker_prefix = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    slots = [
+        threading.Thread(
+            target=_run_conversion_slot,
+            args=(f"{worker_prefix}:{index}",),
+            daemon=True,
+        )
+        for index in range(worker_count)
+    ]
+    for slot in slots:
+        slot.start()
+
+    # Interrupted jobs from a crashed process become claimable once their
+    # lease expires, so keep sweeping while the slots run.
+    while True:
+        time.sleep(media_conversion_service.JOB_LEASE_DURATION.total_seconds())
+        try:
+            _run_in_transaction(
+                media_conversion_service.requeue_abandoned_conversion_jobs,
+            )
+        except Exception:
+            logger.exception("Failed to requeue interrupted media conversion jobs")
+
+
+if __name__ == "__main__":
+    run_media_conversion_worker()
@@ -4,8 +4,6 @@ import logging
 
 # 3rd Party Imports
 import httpx
-from google.auth.transport.requests import Request
-from google.oauth2 import service_account
 
 # Local Imports
 from backend.core.firebase_auth import get_service_account_path
@@ -25,6 +23,8 @@ FCM_SCOPE = "https://www.googleapis.com/auth/firebase.messaging"
 FCM_URL_TEMPLATE = "https://fcm.googleapis.com/v1/projects/{project_id}/messages:send"
 
 def load_credentials():
+    from google.oauth2 import service_account
+
     credentials = service_account.Credentials.from_service_account_file(
         str(get_service_account_path()),
         scopes=[FCM_SCOPE]
@@ -33,6 +33,8 @@ def load_credentials():
 
 
 def get_access_token(credentials):
+    from google.auth.transport.requests import Request
+
     credentials.refresh(Request())
     return credentials.token
 
@@ -1,22 +1,27 @@
 # Python Imports
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import json
 import logging
 from logging.handlers import RotatingFileHandler
 import os
 from pathlib import Path
 from random import randint
-import re
 import shutil
 import sys
 import time
 
-# 3rd Party Imports
-from plexapi.server import PlexServer
-
 # Local Imports
 sys.path.append('M:/Q_Drive/Projects/RemiHub/')
 from backend.config import load_application_config
+from backend.core.inotify import (
+    IN_CLOSE_WRITE,
+    IN_DELETE,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    InotifyWatcher,
+)
 from backend.core.runtime_paths import ensure_log_directory
+from backend.services.media_name_parser import MediaNameParser, SeriesDirectoryCache
 
 # ----------------------
 # Configure Logging
@@ -33,164 +38,299 @@ logger.addHandler(log_handler)
 # Configure paths
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # /opt/remihub
 
+IGNORED_SUFFIXES = ('part', 'encrypted', 'rar', 'zip')
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+
+# Quiet period before a batch of events is ingested
+SETTLE_SECONDS = 5
+# Fallback scan that catches anything inotify missed
+RECONCILE_INTERVAL_SECONDS = 10 * 60
+# Scan cadence when inotify is unavailable
+POLL_INTERVAL_SECONDS = 30
+# Moved and quarantined sources have left the download tree, so their
+# records only guard against replays and can be dropped after this long
+INGESTED_RETENTION = timedelta(days=30)
+PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+
+name_parser = MediaNameParser()
+series_directories = SeriesDirectoryCache()
+
+
+def is_ignored_download(name: str) -> bool:
+    return any(name.endswith(suffix) for suffix in IGNORED_SUFFIXES)
 
-def get_new_downloads(src, dest, library):
-    # Check for a "maintenance" flag
-    if os.path.exists(BASE_DIR / 'maintenance.flg'):
+
+def is_download_ready(path: Path) -> bool:
+    if is_ignored_download(path.name):
         return False
 
-    # Build paths
-    # download_dir = f"{src}/{library}/"
-    download_dir = src
+    # The file is still being decrypted
+    if os.path.exists(f'{path}.encrypted'):
+        return False
 
-    # Get our files
-    files = os.listdir(download_dir)
-    ignores = ['part', 'encrypted', 'rar', 'zip']
+    return path.is_file()
 
-    # Keep track of new files
-    new_files = False
 
-    for file in files:
-        enc_file = f'{download_dir}/{file}.encrypted'
-        if any(file.endswith(s) for s in ignores):
-            continue
-        elif os.path.exists(enc_file):
-            # The file is still being decrypted
-            continue
-        elif os.path.isdir(os.path.join(download_dir, file)):
-            # We are in a folder, process that folder first
-            sub_dir = f'{download_dir}/{file}/'
-            new_files = get_new_downloads(src=sub_dir, dest=dest, library=library)
-            # Next, check if it's empty and delete it
-            lingerers = os.listdir(sub_dir)
-            if len(lingerers) == 0:
-                logger.info(f'Subdir {sub_dir} is empty, removing tree')
-                try:
-                    shutil.rmtree(sub_dir)
-                except Exception as e:
-                    logger.error(f'Error: {e}')
-
-            # This was a directory, move on to the next
-            continue
+def scan_download_tree(root) -> list[Path]:
+    """
+    Reconcile scan used at startup, after an inotify overflow, and as a
+    periodic fallback for events missed while the watcher was down.
+    """
+    found = []
+    pending = [Path(root)]
 
-        # We have a new download that needs processed
-        logger.info(f"Migrating {library}: {file}")
-        src_path = os.path.join(f'{download_dir}/{file}')
+    while pending:
+        directory = pending.pop()
         try:
-            if library == 'TV':
-                process_tv(item_path=src_path, dest=dest)
-                new_files = True
-            elif library == 'Movies':
-                process_movie(item_path=src_path, dest=dest)
-                new_files = True
-            else:
-                logger.error(f'Illegal library: {library}')
-        except Exception as e:
-            logger.error(f'Error Processing Item: {e}')
-            quarantine_item(src_path)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif not is_ignored_download(entry.name):
+                        found.append(Path(entry.path))
+        except OSError as e:
+            logger.error(f'Error scanning {directory}: {e}')
 
-    # Return whether or not we had files to move
-    return new_files
+    return [path for path in found if is_download_ready(path)]
+
+
+def _download_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+
+    return str(path), stat_result.st_size, stat_result.st_mtime_ns
 
-def process_movie(item_path, dest):
-    new_item = item_path.split('/')[-1].upper()
+
+def get_processed_download_keys(keys: list[tuple[str, int, int]]) -> set[tuple[str, int, int]]:
+    """
+    Keys that were already handled. Failed moves are left out so a
+    transient error (unmounted library, full disk) is retried next scan.
+    """
+    from backend.database.database import get_db_conn, put_db_conn
+
+    if not keys:
+        return set()
+
+    conn = get_db_conn()
     try:
-        year = re.search('\\d{4}', new_item).group()
-    except:
-        logger.info(f'No year found for {new_item}')
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT source_path, source_size, source_mtime_ns
+                FROM plex_ingested_downloads
+                WHERE source_path = ANY(%s)
+                  AND status <> 'failed'
+                """,
+                ([key[0] for key in keys],),
+            )
+            return {tuple(row) for row in cur.fetchall()}
+    finally:
+        put_db_conn(conn)
+
+
+def record_processed_downloads(records: list[dict]) -> None:
+    from backend.database.database import get_db_conn, put_db_conn
+
+    if not records:
         return
 
-    # Get the file extension and save it for later
-    # extension = new_item[-3:].lower()
-    extension = os.path.splitext(item_path)[1].lstrip('.').lower()
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            for record in records:
+                cur.execute(
+                    """
+                    INSERT INTO plex_ingested_downloads (
+                        library,
+                        source_path,
+                        source_size,
+                        source_mtime_ns,
+                        destination_path,
+                        status,
+                        message
+                    )
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (source_path, source_size, source_mtime_ns) DO UPDATE
+                    SET library = EXCLUDED.library,
+                        destination_path = EXCLUDED.destination_path,
+                        status = EXCLUDED.status,
+                        message = EXCLUDED.message,
+                        processed_at = now()
+                    """,
+                    (
+                        record['library'],
+                        record['source_path'],
+                        record['source_size'],
+                        record['source_mtime_ns'],
+                        record.get('destination_path'),
+                        record['status'],
+                        (record.get('message') or '')[:2000] or None,
+                    ),
+                )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        put_db_conn(conn)
+
+
+def prune_processed_downloads(now: datetime | None = None) -> int:
+    """
+    Delete old records for downloads that left the download tree.
+
+    Skipped items are still sitting in the tree, so their records are kept
+    to stop every reconcile scan from retrying them. Failed records are
+    replaced by the retry that follows them.
+    """
+    from backend.database.database import get_db_conn, put_db_conn
+
+    now = now or datetime.now(timezone.utc)
+
+    conn = get_db_conn()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                DELETE FROM plex_ingested_downloads
+                WHERE processed_at < %s
+                  AND status IN ('moved', 'quarantined')
+                """,
+                (now - INGESTED_RETENTION,),
+            )
+            deleted = cur.rowcount
+        conn.commit()
+        return deleted
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        put_db_conn(conn)
+
+
+def plan_download(item_path, dest, library) -> Path | None:
+    file_name = os.path.basename(item_path)
+
+    if library == 'TV':
+        parsed = name_parser.parse_tv(file_name)
+        return Path(dest) / library / parsed.series_dir / parsed.season_dir / parsed.file_name
+    elif library == 'Movies':
+        parsed = name_parser.parse_movie(file_name)
+        if parsed is None:
+            logger.info(f'No year found for {file_name}')
+            return None
+        return Path(dest) / 'Movies' / parsed.file_name
+
+    raise ValueError(f'Illegal library: {library}')
+
+
+def move_download(source: Path, target: Path) -> None:
+    """
+    Rename in place when the download and library share a filesystem and
+    only fall back to shutil.move's copy+delete across mounts.
+    """
+    try:
+        same_filesystem = source.stat().st_dev == target.parent.stat().st_dev
+    except OSError:
+        same_filesystem = False
+
+    if same_filesystem:
+        os.rename(source, target)
+    else:
+        shutil.move(source, target)
 
-    name = new_item.split(year)[0].replace('.', ' ').strip()
-    new_name = f'{name.title()} ({year}).{extension}'
-    move_file(source=item_path, dest=dest, new_name=new_name, library='Movies')
 
-def process_tv(item_path, dest):
-    # We need to get the series name
-    # We will split on the season/episode number, hopefully it's in a standard format
-    new_item = item_path.split('/')[-1].upper()
-    new_item = new_item.replace('.', ' ')
-    info = re.search('S\\d{1,2}([-+]?E\\d{1,2})+', new_item)
+def _remove_empty_parents(path: Path, stop_at: Path) -> None:
+    parent = path.parent
+    while parent != stop_at and stop_at in parent.parents:
+        try:
+            parent.rmdir()
+        except OSError:
+            return
+        logger.info(f'Subdir {parent} is empty, removed it')
+        parent = parent.parent
+
+
+def ingest_downloads(paths, src, dest, library) -> bool:
+    """
+    Move a batch of completed downloads into the library.
+
+    Items are grouped by destination directory so each Season/Movies folder
+    is created once per batch. Every outcome is recorded so a restart or
+    reconcile scan does not retry items that were already handled.
+    """
+    src_root = Path(src)
+    keys = {}
+    for path in sorted(set(paths)):
+        if not is_download_ready(path):
+            continue
+        key = _download_key(path)
+        if key is not None:
+            keys[path] = key
+
+    already_processed = get_processed_download_keys(list(keys.values()))
+
+    grouped: dict[Path, list[tuple[Path, Path]]] = {}
+    records = []
+
+    def record(path, status, destination=None, message=None):
+        source_path, source_size, source_mtime_ns = keys[path]
+        records.append({
+            'library': library,
+            'source_path': source_path,
+            'source_size': source_size,
+            'source_mtime_ns': source_mtime_ns,
+            'destination_path': str(destination) if destination else None,
+            'status': status,
+            'message': message,
+        })
+
+    for path, key in keys.items():
+        if key in already_processed:
+            continue
 
-    if not info:
         try:
-            info = re.search('EP\\d{1,2}', new_item)
+            target = plan_download(item_path=str(path), dest=dest, library=library)
+        except Exception as e:
+            logger.error(f'Error Processing Item: {e}')
+            quarantine_item(str(path))
+            record(path, 'quarantined', message=str(e))
+            continue
+
+        if target is None:
+            record(path, 'skipped', message='Unable to parse release name')
+            continue
 
-            info = info.group()
-            season = 1
-            episode = int(info.strip('EP'))
-        except:
-            info = None
+        grouped.setdefault(target.parent, []).append((path, target))
 
-        if not info:
+    new_files = False
+
+    for destination_dir, moves in grouped.items():
+        if series_directories.ensure(destination_dir):
+            logger.info(f'Created Destination Dir {destination_dir}')
+
+        for source, target in moves:
+            logger.info(f'Moving {source} ==> {target}')
             try:
-                info = re.search('\\d{1}X\\d{1,2}', new_item)
-                info = info.group()
-                season = int(info.split('X')[0])
-                episode = int(info.split('X')[1])
-            except:
-                info = None
-    else:
-        info = info.group()
-        season = int(info.split('E')[0].split('S')[1])
-        episode = int(info.split('E')[1])
-    series = new_item.split(info)[0].replace('-', '').strip().title()
-    extra = new_item.split(info)[1].replace('-', '').replace('(', '').replace(')', '')
-
-    # Special cases on Names
-    if series.upper() == 'MXC':
-        series = 'MXC Most Extreme Elimination Challenge'
-
-    # Special Cases:
-    if ' Ii ' in series:
-        series = series.replace(' Ii ', ' II ')
-    elif ' Iii ' in series:
-        series = series.replace(' Iii ', ' Iii ')
-    if 'Bbc' in series:
-        series = series.replace('Bbc', 'BBC')
-
-    # Get the file extension and save it for late
-    extension = new_item[-3:].lower()
-
-    # Find the resolution if there is one
-    try:
-        res = re.search('\\d{3,4}P', extra).group()
-    except Exception as e:
-        logger.info(f"Error getting year for Show: {item_path}\n{e}")
-        res = None
+                move_download(source, target)
+            except Exception as e:
+                logger.error(f"Error moving {target.name}:\n{e}")
+                # The directory may have been removed behind our back
+                series_directories.invalidate(destination_dir)
+                record(source, 'failed', destination=target, message=str(e))
+                continue
 
-    # Grab everything before the resolution
-    if res:
-        ep_name = extra.split(res)[0].strip().title()
-        ep_name = f' - {ep_name}'
-    else:
-        ep_name = ''
+            record(source, 'moved', destination=target)
+            _remove_empty_parents(source, src_root)
+            new_files = True
 
-    # Now that we have our bits, start processing
-    try:
-        #year = re.search('\\d{2,4}', series).group()
-        year = re.search('\\d{4}', series).group()
-    except:
-        year = None
+    record_processed_downloads(records)
 
-    if year:
-        series = series.split(year)[0].replace('(', '').replace(')', '').strip()
+    # Return whether or not we had files to move
+    return new_files
 
-        new_name = f'{series} ({year}) - S{season:02d}E{episode:02d}{ep_name}.{extension}'
-    else:
-        new_name = f'{series} - S{season:02d}E{episode:02d}{ep_name}.{extension}'
-
-    move_file(
-        source=item_path,
-        dest=dest,
-        new_name=new_name,
-        library='TV',
-        series=series,
-        season=season
-    )
 
 def quarantine_item(item_path):
     '''
@@ -209,29 +349,78 @@ def quarantine_item(item_path):
     except Exception as e:
         logger.error(f'Error on Quarantine Item: {e}')
 
-def move_file(source, dest, new_name, library, series=None, season=None):
-    # If we are running a TV show, we need to check if the show/season dirs exist
-    if library == "TV":
-        # No pre-existing destination exists, we need to create one
-        dest = f'{dest}/{library}/{new_name.split('-')[0].strip()}'
-        dest = os.path.join(dest, f'Season {season:02d}')
-        if os.path.exists(dest):
-            pass
-        else:
-            logger.info(f'No Season Dir Found for {dest}')
-            os.makedirs(dest)
+def maintenance_active() -> bool:
+    return os.path.exists(BASE_DIR / 'maintenance.flg')
 
-    # Process Movies:
-    elif library == 'Movies':
-        dest = f'{dest}/Movies/'
 
-    # Append our pre-calculated new name to the destination directory
-    dest = f'{dest}/{new_name}'
-    logger.info(f'Moving {source} ==> {dest}')
+def drain_pending(pending: dict[str, set[Path]], ingest) -> bool:
+    """
+    Hand every queued path to ingest(library, paths).
+
+    While the maintenance flag is set nothing is drained and paths keep
+    accumulating, so downloads that finish during maintenance are ingested
+    once the flag is cleared. Returns False when held for maintenance.
+    """
+    if maintenance_active():
+        return False
+
+    for library in pending:
+        if pending[library]:
+            paths, pending[library] = pending[library], set()
+            ingest(library, paths)
+    return True
+
+
+def _library_for_path(path: Path, sources: dict[str, Path]) -> str | None:
+    for library, src_dir in sources.items():
+        if path == src_dir or src_dir in path.parents:
+            return library
+    return None
+
+
+def _open_download_watcher(sources: dict[str, Path]):
     try:
-        shutil.move(source, dest)
-    except Exception as e:
-        logger.error(f"Error moving {new_name}:\n{e}")
+        watcher = InotifyWatcher(WATCH_MASK)
+    except OSError as e:
+        logger.error(f'inotify unavailable, falling back to polling: {e}')
+        return None
+
+    for src_dir in sources.values():
+        os.makedirs(src_dir, exist_ok=True)
+        watcher.add_tree(src_dir)
+
+    return watcher
+
+
+def collect_event_paths(events, sources, pending) -> bool:
+    """
+    Queue paths from inotify events by library.
+
+    Returns True when the kernel queue overflowed and a reconcile scan is
+    needed to catch the dropped events.
+    """
+    overflowed = False
+
+    for event in events:
+        if event.overflowed:
+            overflowed = True
+            continue
+
+        library = _library_for_path(event.path, sources)
+        if library is None:
+            continue
+
+        if event.is_dir:
+            if event.mask & IN_MOVED_TO:
+                # A finished package folder was moved in whole
+                pending[library].update(scan_download_tree(event.path))
+        elif event.mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+            pending[library].add(event.path)
+        elif event.mask & (IN_DELETE | IN_MOVED_FROM) and event.path.name.endswith('.encrypted'):
+            # Decryption finished, the plain file next to it is now complete
+            pending[library].add(event.path.with_suffix(''))
+
+    return overflowed
 
 
 def main():
@@ -242,6 +431,12 @@ def main():
 
     download_dir = config['download_dir']
     media_root = config['media_dir']
+
+    # Optional JSON object mapping parsed series names to library names
+    global name_parser
+    name_parser = MediaNameParser(
+        series_aliases=json.loads(config.get('series_aliases') or '{}'),
+    )
     libraries = ['TV', 'Movies', ]
     logger.info(f"Monitoring Downlaod Directory: {download_dir}")
 
@@ -249,25 +444,76 @@ def main():
     baseurl = config['baseurl']
     PlexToken = config['plextoken']
     logger.info("Starting Plex Server Client")
+    from plexapi.server import PlexServer
+
     plex = PlexServer(baseurl, PlexToken)
 
     # Get an object of each library
     tv = plex.library.section('TV Shows')
     movies = plex.library.section('Movies')
 
+    sources = {library: Path(download_dir) / library for library in libraries}
+    sections = {'TV': tv, 'Movies': movies}
+    pending = {library: set() for library in libraries}
+
+    def ingest(library, paths):
+        new_files = ingest_downloads(
+            paths,
+            src=sources[library],
+            dest=media_root,
+            library=library,
+        )
+
+        # If we had new files, we need to scan the library
+        if new_files:
+            sections[library].update()
+
+    watcher = _open_download_watcher(sources)
+    reconcile_interval = RECONCILE_INTERVAL_SECONDS if watcher else POLL_INTERVAL_SECONDS
+    next_reconcile = 0.0
+    next_prune = 0.0
+    last_event_at = 0.0
+    holding_for_maintenance = False
+
     while True:
-        for library in libraries:
-            src_dir = f"{download_dir}/{library}"
-            new_files = get_new_downloads(src=src_dir, dest=media_root, library=library)
-
-            # If we had new files, we need to scan the library
-            if new_files:
-                if library == 'TV':
-                    tv.update()
-                elif library == 'Movies':
-                    movies.update()
-
-        time.sleep(30)
+        try:
+            if watcher:
+                events = watcher.read_events(timeout=SETTLE_SECONDS)
+                if events:
+                    last_event_at = time.monotonic()
+                if collect_event_paths(events, sources, pending):
+                    logger.warning('inotify queue overflowed, scheduling reconcile scan')
+                    next_reconcile = 0.0
+            else:
+                time.sleep(SETTLE_SECONDS)
+
+            now = time.monotonic()
+
+            if now >= next_reconcile:
+                for library in libraries:
+                    pending[library].update(scan_download_tree(sources[library]))
+                next_reconcile = now + reconcile_interval
+                last_event_at = 0.0
+
+            # Wait for a quiet period so a burst of files moves as one batch
+            if now - last_event_at >= SETTLE_SECONDS:
+                drained = drain_pending(pending, ingest)
+                if drained == holding_for_maintenance:
+                    holding_for_maintenance = not drained
+                    logger.info(
+                        'Maintenance flag set, holding downloads'
+                        if holding_for_maintenance
+                        else 'Maintenance flag cleared, ingesting held downloads'
+                    )
+
+            if now >= next_prune:
+                next_prune = now + PRUNE_INTERVAL_SECONDS
+                pruned = prune_processed_downloads()
+                if pruned:
+                    logger.info(f'Pruned {pruned} ingested download records')
+        except Exception as e:
+            logger.error(f'Error ingesting downloads: {e}')
+            time.sleep(SETTLE_SECONDS)
 
 
 if __name__ == '__main__':
@@ -4,7 +4,7 @@ import logging
 import sys
 
 from backend.models.health_models import ServiceHealthSnapshotResponse
-from backend.services import service_health_service
+from backend.services import service_health_history, service_health_service
 
 
 logger = logging.getLogger("remihub.service_health_collector")
@@ -19,9 +19,25 @@ def persist_snapshot(snapshot: ServiceHealthSnapshotResponse) -> None:
     service_health_service.persist_service_health_snapshot(snapshot)
 
 
+def record_history(snapshot: ServiceHealthSnapshotResponse) -> None:
+    transitions = service_health_history.record_service_health_history(snapshot)
+    for transition in transitions:
+        logger.info(
+            "Component %s changed %s -> %s",
+            transition.component_id,
+            transition.previous_status.value if transition.previous_status else "none",
+            transition.status.value,
+        )
+
+
 def run_collection_once() -> ServiceHealthSnapshotResponse:
     snapshot = collect_snapshot()
     persist_snapshot(snapshot)
+    try:
+        record_history(snapshot)
+    except Exception:
+        # The current snapshot is already stored; history catches up next run.
+        logger.exception("Service health history update failed")
     return snapshot
 
 
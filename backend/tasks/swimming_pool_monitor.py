@@ -4,9 +4,6 @@ import logging
 from logging.handlers import RotatingFileHandler
 import time
 
-# 3rd Party Imports
-from playwright.sync_api import sync_playwright
-
 # Local Imports
 from backend.database.database import get_db_conn, put_db_conn
 from backend.scripts import pool_watch_meta
@@ -59,6 +56,8 @@ def fetch_raymote_temperatures(_config):
     email = _config['email']
     password = _config['password']
 
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as p:
         browser = p.chromium.launch() #headless=True)
         context = browser.new_context(viewport={'width': 1920, 'height': 1080})
@@ -1,5 +1,6 @@
 # Python Imports
 from datetime import datetime, timezone
+from functools import lru_cache
 import logging
 from psycopg2.extras import Json
 import requests
@@ -18,16 +19,18 @@ AMBIENT_DEVICES_URL = "https://api.ambientweather.net/v1/devices"
 class AmbientWeatherError(Exception):
     pass
 
-cfg = load_application_config()
-weather_cfg = cfg.get('Weather', {})
+@lru_cache(maxsize=1)
+def _ambient_keys() -> tuple[str, str]:
+    # Read on first poll so importing the API does not require Weather config.
+    weather_cfg = load_application_config().get('Weather', {})
+    api_key = weather_cfg.get('api_key')
+    application_key = weather_cfg.get('api_app_key')
 
-api_key = weather_cfg.get('api_key')
-application_key = weather_cfg.get('api_app_key')
-
-if not api_key or not application_key:
-    raise AmbientWeatherError(
-        "Missing AMBIENT_API_KEY or AMBIENT_APPLICATION_KEY environment variable"
-    )
+    if not api_key or not application_key:
+        raise AmbientWeatherError(
+            "Missing AMBIENT_API_KEY or AMBIENT_APPLICATION_KEY environment variable"
+        )
+    return api_key, application_key
 
 logger = logging.getLogger(__name__)
 
@@ -142,6 +145,7 @@ def save_weather_reading(data: dict[str, Any]) -> bool:
 def get_latest_weather_reading() -> dict[str, Any]:
     #api_key = os.getenv("AMBIENT_API_KEY")
     #application_key = os.getenv("AMBIENT_APPLICATION_KEY")
+    api_key, application_key = _ambient_keys()
 
     response = requests.get(
         AMBIENT_DEVICES_URL,
@@ -0,0 +1,51 @@
+DO $agent_card_board_grants_rollback$
+DECLARE
+    app_role_name text;
+    worker_role_name text;
+BEGIN
+    IF session_user ~ '_migrator$' THEN
+        app_role_name := regexp_replace(session_user, '_migrator$', '_app');
+        worker_role_name := regexp_replace(
+            session_user,
+            '_migrator$',
+            '_agent_worker'
+        );
+    ELSIF current_database() = 'remihub' THEN
+        app_role_name := 'remihub_app';
+        worker_role_name := 'remihub_agent_worker';
+    ELSIF current_database() = 'remihub_qa' THEN
+        app_role_name := 'remihub_qa_app';
+        worker_role_name := 'remihub_qa_agent_worker';
+    ELSE
+        RAISE EXCEPTION
+            'Unsupported database for Agent card board grant rollback: %',
+            current_database();
+    END IF;
+
+    IF to_regclass('agent.card_board') IS NULL THEN
+        RETURN;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1
+        FROM pg_roles
+        WHERE rolname = app_role_name
+    ) THEN
+        EXECUTE format(
+            'REVOKE SELECT, INSERT, UPDATE ON agent.card_board FROM %I',
+            app_role_name
+        );
+    END IF;
+
+    IF EXISTS (
+        SELECT 1
+        FROM pg_roles
+        WHERE rolname = worker_role_name
+    ) THEN
+        EXECUTE format(
+            'REVOKE SELECT, INSERT, UPDATE ON agent.card_board FROM %I',
+            worker_role_name
+        );
+    END IF;
+END;
+$agent_card_board_grants_rollback$;
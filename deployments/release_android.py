@@ -28,6 +28,8 @@ PLATFORM = "android"
 
 REMOTE_SERVER = "alex@remillard-serv"
 REMOTE_RELEASE_DIR = "/opt/remihub/releases/android"
+REMOTE_PROJECT_DIR = "/opt/remihub"
+REMOTE_PYTHON = "/opt/remihub/.venv/bin/python"
 APK_PUBLIC_RELATIVE_DIR = "releases/android"
 
 
@@ -178,6 +180,29 @@ def upsert_release_row(
         put_db_conn(conn)
 
 
+def generate_remote_patches(platform: str):
+    """
+    Build delta patches to the new release on the server that stores the
+    previous APKs. A failure only costs phones the full download.
+    """
+    result = subprocess.run(
+        [
+            "ssh",
+            REMOTE_SERVER,
+            f"cd {REMOTE_PROJECT_DIR} && {REMOTE_PYTHON} -m backend.scripts.generate_app_update_patches --platform {platform}",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        logger.warning("Patch generation failed; clients will download the full APK: %s", result.stderr.strip())
+        return
+
+    logger.info("Patch generation: %s", result.stdout.strip())
+
+
 def save_version_info(
     version_file: Path,
     version_code: int,
@@ -255,6 +280,8 @@ def main():
         file_size_bytes=file_size_bytes,
     )
 
+    generate_remote_patches(PLATFORM)
+
     save_version_info(
         VERSION_FILE,
         version_code=version_code,
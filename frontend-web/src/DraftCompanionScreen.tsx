@@ -31,8 +31,26 @@ type RecentPick = {
   pick_number: number;
 };
 
+type DraftState = {
+  event_id: number;
+  draft_status: DraftStatus;
+  grid: Driver[];
+  assignments: PoolAssignments;
+  recent_picks: RecentPick[];
+};
+
 type Tab = "draft" | "field" | "available" | "saved" | "teams";
 
+const DRAFT_EVENT_TYPES = [
+  "pick_made",
+  "on_the_clock",
+  "draft_complete",
+  "draft_started",
+];
+
+// Safety net in case the event stream is blocked by a proxy.
+const DRAFT_FALLBACK_REFRESH_MS = 30000;
+
 const getSavedDriversStorageKey = (poolId: number) =>
   `remihub-draft-saved-drivers-${poolId}`;
 
@@ -58,25 +76,18 @@ const DraftCompanionScreen: React.FC = () => {
     }
   };
 
+  const applyDraftState = (state: DraftState) => {
+    setDraftStatus(state.draft_status);
+    setDrivers(Array.isArray(state.grid) ? state.grid : []);
+    setAssignments(state.assignments ?? {});
+    setRecentPicks(Array.isArray(state.recent_picks) ? state.recent_picks : []);
+    setLastUpdated(new Date().toLocaleTimeString());
+  };
+
   const loadDraftData = async (poolId: number) => {
     try {
-      const [statusRes, gridRes, assignmentsRes, picksRes] = await Promise.all([
-        fetch(`/race/getDraftStatus?pool_id=${poolId}`),
-        fetch(`/race/getStartingGridStatus?pool_id=${poolId}`),
-        fetch(`/race/getPoolAssignments?pool_id=${poolId}`),
-        fetch(`/race/getRecentPicks?pool_id=${poolId}&limit=5`),
-      ]);
-
-      const statusData = await statusRes.json();
-      const gridData = await gridRes.json();
-      const assignmentsData = await assignmentsRes.json();
-      const picksData = await picksRes.json();
-
-      setDraftStatus(statusData);
-      setDrivers(Array.isArray(gridData) ? gridData : []);
-      setAssignments(assignmentsData ?? {});
-      setRecentPicks(Array.isArray(picksData) ? picksData : []);
-      setLastUpdated(new Date().toLocaleTimeString());
+      const res = await fetch(`/race/getDraftState?pool_id=${poolId}&recent_limit=5`);
+      applyDraftState(await res.json());
     } catch (error) {
       console.error("Failed to load draft companion data", error);
     }
@@ -117,11 +128,30 @@ const DraftCompanionScreen: React.FC = () => {
 
     loadDraftData(selectedPoolId);
 
+    // Picks are pushed as they commit; each event carries the new state.
+    const events = new EventSource(`/race/draftEvents?pool_id=${selectedPoolId}`);
+    const handleDraftEvent = (event: MessageEvent) => {
+      const payload = JSON.parse(event.data);
+      if (payload?.state) {
+        applyDraftState(payload.state);
+      } else {
+        loadDraftData(selectedPoolId);
+      }
+    };
+
+    DRAFT_EVENT_TYPES.forEach((type) =>
+      events.addEventListener(type, handleDraftEvent)
+    );
+    events.addEventListener("resync", () => loadDraftData(selectedPoolId));
+
     const interval = setInterval(() => {
       loadDraftData(selectedPoolId);
-    }, 1000);
+    }, DRAFT_FALLBACK_REFRESH_MS);
 
-    return () => clearInterval(interval);
+    return () => {
+      events.close();
+      clearInterval(interval);
+    };
   }, [selectedPoolId]);
 
   const availableDrivers = useMemo(
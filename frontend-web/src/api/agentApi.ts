@@ -123,6 +123,17 @@ type AgentCardListResponse = {
   data: AgentCardSummary[];
 };
 
+export type AgentBoardPage = {
+  cards: AgentCardSummary[];
+  next_cursor: string | null;
+  next_updated_since: string;
+};
+
+type AgentBoardResponse = {
+  success: true;
+  data: AgentBoardPage;
+};
+
 type AgentCardResponse = {
   success: true;
   data: AgentCardDetail;
@@ -150,6 +161,30 @@ export async function listAgentCards(
   return response.data;
 }
 
+export async function listAgentBoard(options: {
+  limit?: number;
+  cursor?: string | null;
+  updatedSince?: string | null;
+  includeClosed?: boolean;
+} = {}): Promise<AgentBoardPage> {
+  const params = new URLSearchParams({
+    include_closed: options.includeClosed ? "true" : "false",
+  });
+  if (options.limit !== undefined) {
+    params.set("limit", String(options.limit));
+  }
+  if (options.cursor) {
+    params.set("cursor", options.cursor);
+  }
+  if (options.updatedSince) {
+    params.set("updated_since", options.updatedSince);
+  }
+  const response = await apiRequest<AgentBoardResponse>(
+    `/agent/board?${params.toString()}`,
+  );
+  return response.data;
+}
+
 export async function getAgentCard(cardId: string): Promise<AgentCardDetail> {
   const response = await apiRequest<AgentCardResponse>(`/agent/cards/${cardId}`);
   return response.data;
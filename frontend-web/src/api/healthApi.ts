@@ -64,6 +64,7 @@ export type HealthComponent = {
   systemd: HealthSystemdMetadata | null;
   dependencies: HealthDependencyCheck[];
   checked_at: string;
+  evaluation_ms?: number | null;
 };
 
 export type ServiceHealthSnapshotResponse = {
@@ -71,8 +72,69 @@ export type ServiceHealthSnapshotResponse = {
   checked_at: string;
   overall: HealthStatus;
   components: HealthComponent[];
+  collection_ms?: number | null;
 };
 
 export async function getServiceHealthSnapshot(): Promise<ServiceHealthSnapshotResponse> {
   return apiRequest<ServiceHealthSnapshotResponse>("/health/services");
 }
+
+export type HealthTransition = {
+  component_id: string;
+  observed_at: string;
+  status: HealthStatus;
+  previous_status: HealthStatus | null;
+  message: string;
+  required: boolean;
+};
+
+export type HealthTransitionTimelineResponse = {
+  success: true;
+  component_id: string;
+  since: string;
+  transitions: HealthTransition[];
+};
+
+export type HealthUptimeSummary = {
+  component_id: string;
+  window_start: string;
+  window_end: string;
+  observed_seconds: number;
+  up_seconds: number;
+  uptime_ratio: number | null;
+  seconds_by_status: Partial<Record<HealthStatus, number>>;
+  transition_count: number;
+  recovery_count: number;
+  mean_time_to_recovery_seconds: number | null;
+};
+
+export type HealthUptimeResponse = {
+  success: true;
+  data: HealthUptimeSummary;
+};
+
+export async function getComponentTransitions(
+  componentId: string,
+  options: { since?: string; limit?: number } = {},
+): Promise<HealthTransitionTimelineResponse> {
+  const params = new URLSearchParams();
+  if (options.since) {
+    params.set("since", options.since);
+  }
+  if (options.limit !== undefined) {
+    params.set("limit", String(options.limit));
+  }
+  const query = params.toString();
+  return apiRequest<HealthTransitionTimelineResponse>(
+    `/health/services/${encodeURIComponent(componentId)}/transitions${query ? `?${query}` : ""}`,
+  );
+}
+
+export async function getComponentUptime(
+  componentId: string,
+  days = 7,
+): Promise<HealthUptimeResponse> {
+  return apiRequest<HealthUptimeResponse>(
+    `/health/services/${encodeURIComponent(componentId)}/uptime?days=${days}`,
+  );
+}
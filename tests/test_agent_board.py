@@ -0,0 +1,183 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from psycopg2 import errors
+
+from backend.services import agent_service
+
+
+CARD_ID = "3d8549c4-a965-4d2e-aacf-9df7e6ccdbb4"
+SECOND_CARD_ID = "5b0b7f1e-7a9b-4ad5-9a52-5d3f3ad0c8a1"
+RUN_ID = "9f4e4c1e-7c2b-4a55-9a60-3b0c4d3e2f10"
+USER_ID = "c346f3f4-3867-4ddb-83ea-7d24db8817bc"
+NOW = datetime(2026, 7, 29, 15, 0, tzinfo=timezone.utc)
+
+
+def board_card(card_id: str = CARD_ID, *, status: str = "failed") -> dict:
+    return {
+        "id": card_id,
+        "title": "Medication tracking",
+        "description": "Plan a medication tracking module.",
+        "status": status,
+        "repository_scope": "backend",
+        "revision": 1,
+        "base_branch": "main",
+        "feature_branch": None,
+        "worktree_path": None,
+        "codex_thread_id": None,
+        "resume_status": None,
+        "blocked_reason": None,
+        "blocked_until": None,
+        "created_by": USER_ID,
+        "closed_at": None,
+        "created_at": NOW.isoformat(),
+        "updated_at": NOW.isoformat(),
+        "extra_column": "ignored",
+    }
+
+
+def latest_run() -> dict:
+    return {
+        "id": RUN_ID,
+        "card_id": CARD_ID,
+        "phase": "planning",
+        "status": "failed",
+        "card_revision": 1,
+        "attempt_count": 3,
+        "blocked_reason": None,
+        "error_message": "Codex failed",
+        "result_metadata": {},
+        "created_at": NOW.isoformat(),
+        "updated_at": NOW.isoformat(),
+    }
+
+
+class BoardRefreshTests(unittest.TestCase):
+    def test_refresh_upserts_card_and_latest_run_in_one_statement(self):
+        cursor = MagicMock()
+
+        agent_service._refresh_board_card(cursor, CARD_ID)
+
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        self.assertEqual(statements[0], "SAVEPOINT agent_card_board_refresh")
+        self.assertIn("INSERT INTO agent.card_board", statements[1])
+        self.assertIn("LEFT JOIN LATERAL", statements[1])
+        self.assertIn("DO UPDATE SET", statements[1])
+        self.assertEqual(cursor.execute.call_args_list[1].args[1], (CARD_ID,))
+        self.assertEqual(statements[2], "RELEASE SAVEPOINT agent_card_board_refresh")
+
+    def test_missing_board_grant_does_not_fail_the_state_change(self):
+        cursor = MagicMock()
+        cursor.execute.side_effect = [
+            None,
+            errors.InsufficientPrivilege("permission denied"),
+            None,
+            None,
+        ]
+
+        with self.assertLogs("remihub.agent_service", level="WARNING"):
+            agent_service._refresh_board_card(cursor, CARD_ID)
+
+        self.assertEqual(
+            cursor.execute.call_args_list[2].args[0],
+            "ROLLBACK TO SAVEPOINT agent_card_board_refresh",
+        )
+
+
+class BoardListingTests(unittest.TestCase):
+    def setUp(self):
+        backfilled = patch.object(agent_service, "_board_backfilled", True)
+        backfilled.start()
+        self.addCleanup(backfilled.stop)
+
+    def list_board(self, rows, **kwargs):
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (NOW,)
+        cursor.fetchall.return_value = rows
+        with patch.object(agent_service, "get_db_conn", return_value=connection), patch.object(
+            agent_service,
+            "put_db_conn",
+        ) as put_db_conn:
+            board = agent_service.list_board(**kwargs)
+        put_db_conn.assert_called_once_with(connection)
+        connection.rollback.assert_called_once_with()
+        return board, cursor
+
+    def test_rows_are_decorated_without_extra_queries(self):
+        board, cursor = self.list_board([(CARD_ID, board_card(), latest_run(), NOW)])
+
+        self.assertEqual(cursor.execute.call_count, 2)
+        card = board["cards"][0]
+        self.assertNotIn("extra_column", card)
+        self.assertEqual(card["latest_run"]["error_message"], "Codex failed")
+        self.assertIn("retry", card["allowed_actions"])
+        self.assertIsNone(board["next_cursor"])
+        self.assertEqual(
+            board["next_updated_since"],
+            NOW - agent_service.BOARD_SYNC_OVERLAP,
+        )
+        sql, parameters = cursor.execute.call_args.args
+        self.assertIn("card_status <> 'closed'", sql)
+        self.assertEqual(parameters, (101,))
+
+    def test_cursor_continues_after_the_last_row(self):
+        later = NOW + timedelta(seconds=1)
+        board, _ = self.list_board(
+            [
+                (CARD_ID, board_card(), None, NOW),
+                (SECOND_CARD_ID, board_card(SECOND_CARD_ID), None, later),
+            ],
+            limit=1,
+        )
+
+        self.assertEqual(len(board["cards"]), 1)
+        _, cursor = self.list_board([], cursor=board["next_cursor"])
+        sql, parameters = cursor.execute.call_args.args
+        self.assertIn("(board_updated_at, card_id) > (%s, %s::uuid)", sql)
+        self.assertEqual(parameters, (NOW, CARD_ID, 101))
+
+    def test_updated_since_includes_closed_cards(self):
+        since = NOW - timedelta(minutes=5)
+
+        board, cursor = self.list_board(
+            [(CARD_ID, board_card(status="closed"), None, NOW)],
+            updated_since=since,
+        )
+
+        self.assertEqual(board["cards"][0]["status"], "closed")
+        sql, parameters = cursor.execute.call_args.args
+        self.assertNotIn("card_status <> 'closed'", sql)
+        self.assertEqual(parameters, (since, 101))
+
+    def test_invalid_arguments_are_rejected(self):
+        for kwargs in (
+            {"limit": 0},
+            {"limit": agent_service.MAX_BOARD_PAGE_LIMIT + 1},
+            {"cursor": "not-a-cursor"},
+            {"updated_since": datetime(2026, 7, 29, 15, 0)},
+        ):
+            with self.subTest(kwargs=kwargs):
+                with self.assertRaises(ValueError):
+                    agent_service.list_board(**kwargs)
+
+
+class BoardBackfillTests(unittest.TestCase):
+    def test_backfill_runs_once_and_keeps_existing_rows(self):
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+
+        with patch.object(agent_service, "_board_backfilled", False):
+            agent_service._ensure_board_backfilled(connection)
+            agent_service._ensure_board_backfilled(connection)
+
+        cursor.execute.assert_called_once()
+        sql = cursor.execute.call_args.args[0]
+        self.assertIn("NOT EXISTS", sql)
+        self.assertIn("DO NOTHING", sql)
+        connection.commit.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
+import gzip
+import hashlib
 import importlib.machinery
 import importlib.util
 import json
 import os
 import re
+import shutil
 import sys
 import subprocess
 import tarfile
@@ -21,14 +24,20 @@ from backend.core.agent_deployment import (
     DeploymentRolledBackError,
     DeploymentValidationError,
     FrontendArtifactEvidence,
+    FrontendBlobStore,
     GitBackendDeploymentExecutor,
     GitBackendDeploymentManager,
     PostgresMigrationHistoryReader,
     PostgresDeploymentDatabase,
     RuntimeHealth,
+    SandboxBackendValidator,
+    _canonical_json_bytes,
+    _migration_schemas,
     ValidationEvidence,
     _frontend_artifact_manifest,
     _write_deterministic_frontend_archive,
+    collect_frontend_artifact_garbage,
+    ensure_frontend_archive,
     verify_frontend_archive,
     verify_distinct_database_identities,
 )
@@ -40,6 +49,7 @@ from backend.core.agent_worker import (
     DeploymentSource,
 )
 from backend.core.agent_workspace import GitImplementationWorkspaceManager
+from backend.core.web_precompression import precompress_tree
 
 
 def claimed_run(
@@ -153,9 +163,16 @@ class FakeValidator:
     def __init__(self, *, fail: bool = False):
         self.fail = fail
         self.calls = []
+        self.changed_files = []
 
-    def validate(self, candidate_worktree: Path) -> ValidationEvidence:
+    def validate(
+        self,
+        candidate_worktree: Path,
+        *,
+        changed_files: tuple[str, ...] = (),
+    ) -> ValidationEvidence:
         self.calls.append(candidate_worktree)
+        self.changed_files.append(tuple(changed_files))
         if self.fail:
             raise DeploymentValidationError("full backend tests failed")
         return ValidationEvidence(
@@ -190,6 +207,7 @@ class FakeDatabase:
         self.apply_before_failure = apply_before_failure
         self.fail_downgrade = fail_downgrade
         self.events = []
+        self.backup_schemas = []
 
     def migration_history(self):
         self.events.append("history")
@@ -210,8 +228,9 @@ class FakeDatabase:
             if version not in self.applied
         )
 
-    def backup(self, *, card_id: str, deployment_run_id: str):
+    def backup(self, *, card_id: str, deployment_run_id: str, schemas=None):
         self.events.append(("backup", card_id, deployment_run_id))
+        self.backup_schemas.append(schemas)
         return BackupEvidence(
             path=f"/backups/{card_id}/{deployment_run_id}.dump",
             size_bytes=1234,
@@ -524,6 +543,29 @@ class FrontendArtifactDeterminismTests(unittest.TestCase):
         self.assertTrue(all(member.uid == 0 and member.gid == 0 for member in members))
         self.assertTrue(all(member.uname == "root" and member.gname == "root" for member in members))
 
+    def test_precompressed_variants_are_reproducible_artifact_files(self):
+        (self.dist / "assets" / "app.js").write_text("console.log('ok');\n" * 200, encoding="utf-8")
+        copy = self.root / "copy"
+        shutil.copytree(self.dist, copy)
+
+        counts = precompress_tree(self.dist)
+        precompress_tree(copy)
+        manifests = [
+            _frontend_artifact_manifest(root, candidate_commit="a" * 40, lockfile_sha256="b" * 64)
+            for root in (self.dist, copy)
+        ]
+
+        self.assertEqual(counts["files"], 1)
+        self.assertEqual(manifests[0]["artifact_identity"], manifests[1]["artifact_identity"])
+        paths = [entry["path"] for entry in manifests[0]["entries"]]
+        self.assertIn("assets/app.js.gz", paths)
+        # Too small to be worth an extra file.
+        self.assertNotIn("index.html.gz", paths)
+        self.assertEqual(
+            gzip.decompress((self.dist / "assets" / "app.js.gz").read_bytes()),
+            (self.dist / "assets" / "app.js").read_bytes(),
+        )
+
     def test_archive_metadata_must_be_normalized_even_when_content_matches(self):
         manifest = _frontend_artifact_manifest(
             self.dist,
@@ -559,6 +601,320 @@ class FrontendArtifactDeterminismTests(unittest.TestCase):
             )
 
 
+class FrontendBlobStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.root = Path(self.temporary_directory.name)
+        self.artifact_root = self.root / "artifacts"
+        self.store = FrontendBlobStore(self.artifact_root / ".blobs")
+
+    def build(self, run_id: str, app_js: str) -> tuple[Path, dict]:
+        dist = self.root / run_id / "dist"
+        (dist / "assets").mkdir(parents=True)
+        (dist / "index.html").write_text("<script src=/assets/app.js></script>\n", encoding="utf-8")
+        (dist / "assets" / "app.js").write_text(app_js, encoding="utf-8")
+        manifest = _frontend_artifact_manifest(
+            dist,
+            candidate_commit="a" * 40,
+            lockfile_sha256="b" * 64,
+        )
+        directory = self.artifact_root / "card" / run_id / "frontend-web" / ("a" * 40)
+        directory.mkdir(parents=True)
+        (directory / "manifest.json").write_text(
+            json.dumps(manifest, sort_keys=True, separators=(",", ":")) + "\n",
+            encoding="utf-8",
+        )
+        return dist, manifest
+
+    def test_unchanged_files_are_stored_once_across_deployments(self):
+        first_dist, first = self.build("run-1", "console.log(1)\n")
+        second_dist, second = self.build("run-2", "console.log(2)\n")
+
+        self.assertEqual(self.store.store_dist(first_dist, first)["stored_files"], 2)
+        evidence = self.store.store_dist(second_dist, second)
+
+        self.assertEqual((evidence["stored_files"], evidence["reused_files"]), (1, 1))
+        self.assertEqual(len(list(self.store.root.glob("sha256/*/*"))), 3)
+
+    def test_assembled_archive_matches_archive_written_from_dist(self):
+        dist, manifest = self.build("run-1", "console.log(1)\n")
+        self.store.store_dist(dist, manifest)
+        from_dist = self.root / "from-dist.tar"
+        from_blobs = self.root / "from-blobs.tar"
+
+        _write_deterministic_frontend_archive(dist, from_dist, manifest)
+        self.store.assemble_archive(manifest, from_blobs)
+
+        self.assertEqual(from_dist.read_bytes(), from_blobs.read_bytes())
+
+    def test_garbage_collection_keeps_referenced_and_recent_blobs(self):
+        dist, manifest = self.build("run-1", "console.log(1)\n")
+        self.store.store_dist(dist, manifest)
+        orphan = self.store.path("c" * 64)
+        orphan.parent.mkdir(parents=True)
+        orphan.write_bytes(b"orphan")
+        recent = self.store.path("d" * 64)
+        recent.parent.mkdir(parents=True)
+        recent.write_bytes(b"recent")
+        old = orphan.stat().st_mtime - 2 * 24 * 60 * 60
+        os.utime(orphan, (old, old))
+        for entry in manifest["entries"]:
+            if entry["type"] == "file":
+                os.utime(self.store.path(entry["sha256"]), (old, old))
+
+        result = collect_frontend_artifact_garbage(self.artifact_root)
+
+        self.assertEqual(result["removed_blobs"], 1)
+        self.assertFalse(orphan.exists())
+        self.assertTrue(recent.exists())
+        self.assertEqual(self.store.missing(manifest), [])
+
+    def test_collected_archive_is_reassembled_before_install(self):
+        dist, manifest = self.build("run-1", "console.log(1)\n")
+        self.store.store_dist(dist, manifest)
+        directory = self.artifact_root / "card" / "run-1" / "frontend-web" / ("a" * 40)
+        archive_path = directory / "dist.tar"
+        self.store.assemble_archive(manifest, archive_path)
+        archive_sha256 = _sha256(archive_path)
+        os.utime(archive_path, (0, 0))
+
+        result = collect_frontend_artifact_garbage(self.artifact_root)
+        self.assertEqual(result["removed_archives"], 1)
+        self.assertFalse(archive_path.exists())
+
+        ensure_frontend_archive(
+            self.artifact_root,
+            FrontendArtifactEvidence(
+                changed=True,
+                archive_path=str(archive_path),
+                manifest_path=str(directory / "manifest.json"),
+            ),
+        )
+
+        self.assertEqual(_sha256(archive_path), archive_sha256)
+
+    def test_archive_without_stored_blobs_is_kept(self):
+        _dist, _manifest = self.build("run-1", "console.log(1)\n")
+        archive_path = self.artifact_root / "card" / "run-1" / "frontend-web" / ("a" * 40) / "dist.tar"
+        archive_path.write_bytes(b"tar")
+        os.utime(archive_path, (0, 0))
+
+        result = collect_frontend_artifact_garbage(self.artifact_root)
+
+        self.assertEqual(result["removed_archives"], 0)
+        self.assertTrue(archive_path.exists())
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class FrontendInstallTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.root = Path(self.temporary_directory.name)
+        helper_path = (
+            Path(__file__).resolve().parents[1]
+            / "deployments"
+            / "agent_backend"
+            / "libexec"
+            / "remihub-backend-deployment-control"
+        )
+        loader = importlib.machinery.SourceFileLoader(
+            "remihub_backend_deployment_control_frontend_install_test",
+            str(helper_path),
+        )
+        spec = importlib.util.spec_from_loader(loader.name, loader)
+        self.module = importlib.util.module_from_spec(spec)
+        sys.modules[loader.name] = self.module
+        try:
+            loader.exec_module(self.module)
+        finally:
+            sys.modules.pop(loader.name, None)
+        self.environment = replace(
+            self.module.ENVIRONMENTS["qa"],
+            runtime=self.root / "runtime",
+        )
+        (self.root / "runtime" / "frontend-web").mkdir(parents=True)
+
+    def archive(self, app_js: str) -> Path:
+        dist = self.root / f"build-{len(app_js)}" / "dist"
+        (dist / "assets").mkdir(parents=True)
+        (dist / "index.html").write_text("<main></main>\n", encoding="utf-8")
+        (dist / "assets" / "app.js").write_text(app_js, encoding="utf-8")
+        manifest = _frontend_artifact_manifest(
+            dist,
+            candidate_commit="a" * 40,
+            lockfile_sha256="b" * 64,
+        )
+        archive_path = dist.parent / "dist.tar"
+        _write_deterministic_frontend_archive(dist, archive_path, manifest)
+        return archive_path
+
+    def test_only_changed_files_are_written(self):
+        first = self.module._install_archive_to_dist(self.environment, self.archive("one\n"))
+        installed = self.root / "runtime" / "frontend-web" / "dist"
+        index_inode = (installed / "index.html").stat().st_ino
+
+        second = self.module._install_archive_to_dist(self.environment, self.archive("two!\n"))
+
+        self.assertEqual(first, {"files_written": 2, "files_unchanged": 0})
+        self.assertEqual(second, {"files_written": 1, "files_unchanged": 1})
+        self.assertEqual((installed / "index.html").stat().st_ino, index_inode)
+        self.assertEqual((installed / "assets" / "app.js").read_text(encoding="utf-8"), "two!\n")
+        self.assertEqual((installed / "index.html").stat().st_mode & 0o777, 0o644)
+
+
+class SandboxBackendValidatorTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.root = Path(self.temporary_directory.name)
+        self.log = self.root / "validator.log"
+        self.command = self.root / "validator"
+        self.command.write_text(
+            f'#!/bin/sh\necho "$@" >> {self.log}\necho "tests passed"\n',
+            encoding="utf-8",
+        )
+        self.command.chmod(0o755)
+        self.worktree = self.root / "candidate"
+        subprocess.run(
+            ["git", "init", "-b", "main", str(self.worktree)],
+            check=True,
+            capture_output=True,
+        )
+        _git(self.worktree, "config", "user.name", "RemiHub Test")
+        _git(self.worktree, "config", "user.email", "remihub@example.invalid")
+        files = {
+            "backend/__init__.py": "",
+            "backend/core/__init__.py": "",
+            "backend/core/cards.py": "VALUE = 1\n",
+            "tests/__init__.py": "",
+            "tests/test_cards.py": "from backend.core import cards\n",
+            "tests/test_health.py": "import unittest\n",
+            "tests/test_misc.py": "import unittest\n",
+        }
+        for relative, content in files.items():
+            path = self.worktree / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        _git(self.worktree, "add", ".")
+        _git(self.worktree, "commit", "-m", "Initial")
+        self.validator = SandboxBackendValidator(
+            validation_command=self.command,
+            cache_root=self.root / "cache",
+        )
+
+    def runs(self) -> list[str]:
+        if not self.log.exists():
+            return []
+        return self.log.read_text(encoding="utf-8").splitlines()
+
+    def test_impacted_tests_are_passed_to_the_validator(self):
+        evidence = self.validator.validate(
+            self.worktree,
+            changed_files=("backend/core/cards.py",),
+        )
+
+        self.assertEqual(self.runs(), [f"{self.worktree} tests.test_cards"])
+        self.assertEqual(evidence.selected_tests, ("tests.test_cards",))
+        self.assertEqual(evidence.tree_sha, _git(self.worktree, "rev-parse", "HEAD^{tree}"))
+        self.assertFalse(evidence.cached)
+
+    def test_identical_tree_is_not_validated_twice(self):
+        first = self.validator.validate(self.worktree, changed_files=("docs/notes.md",))
+        again = SandboxBackendValidator(
+            validation_command=self.command,
+            cache_root=self.root / "cache",
+        ).validate(self.worktree, changed_files=("backend/core/cards.py",))
+
+        # The full run also covers the narrower selection.
+        self.assertEqual(self.runs(), [str(self.worktree)])
+        self.assertIsNone(first.selected_tests)
+        self.assertTrue(again.cached)
+        self.assertEqual(again.stdout_sha256, first.stdout_sha256)
+
+    def test_subset_result_does_not_satisfy_full_run(self):
+        self.validator.validate(self.worktree, changed_files=("backend/core/cards.py",))
+        self.validator.validate(self.worktree, changed_files=("docs/notes.md",))
+
+        self.assertEqual(
+            self.runs(),
+            [f"{self.worktree} tests.test_cards", str(self.worktree)],
+        )
+
+    def test_changed_validator_or_dirty_tree_is_not_cached(self):
+        self.validator.validate(self.worktree)
+        self.command.write_text(
+            self.command.read_text(encoding="utf-8") + "# revised\n",
+            encoding="utf-8",
+        )
+        self.validator.validate(self.worktree)
+        (self.worktree / "tests" / "test_misc.py").write_text("import os\n", encoding="utf-8")
+        self.validator.validate(self.worktree)
+        self.validator.validate(self.worktree)
+
+        self.assertEqual(len(self.runs()), 4)
+
+    def test_failed_validation_is_not_cached(self):
+        self.command.write_text("#!/bin/sh\necho failed >&2\nexit 1\n", encoding="utf-8")
+
+        for _attempt in range(2):
+            with self.assertRaises(DeploymentValidationError):
+                self.validator.validate(self.worktree)
+
+        self.assertFalse((self.root / "cache").exists())
+
+
+class MigrationSchemaTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.migrations = Path(self.temporary_directory.name)
+
+    def schemas(self, up_sql: str):
+        (self.migrations / "0001_example.up.sql").write_text(up_sql, encoding="utf-8")
+        return _migration_schemas(self.migrations, ("0001",))
+
+    def test_qualified_targets_name_their_schemas(self):
+        self.assertEqual(
+            self.schemas(
+                "-- public.ignored is only a comment\n"
+                "ALTER TABLE agent.cards ADD COLUMN note text DEFAULT 'x.y';\n"
+                "CREATE INDEX cards_note_idx ON agent.cards (note);\n"
+                "CREATE TABLE public.widgets (\n"
+                "    card_id uuid REFERENCES agent.cards (id) ON DELETE CASCADE\n"
+                ");\n"
+                "INSERT INTO public.widgets SELECT id FROM agent.cards;\n"
+            ),
+            ("agent", "public"),
+        )
+
+    def test_new_schemas_are_not_backed_up(self):
+        self.assertEqual(
+            self.schemas(
+                "CREATE SCHEMA ledger;\n"
+                "CREATE TABLE ledger.entries (id integer);\n"
+                "ALTER TABLE public.users ADD COLUMN ledger_id integer;\n"
+            ),
+            ("public",),
+        )
+
+    def test_unreadable_migrations_back_up_everything(self):
+        for up_sql in (
+            "CREATE TABLE widgets (id integer);\n",
+            'ALTER TABLE "Agent".cards ADD COLUMN note text;\n',
+            "DROP TABLE public.widgets CASCADE;\n",
+            "DO $$ BEGIN PERFORM 1; END $$;\n",
+            "SET search_path TO agent;\nALTER TABLE agent.cards ADD COLUMN note text;\n",
+            "CREATE SCHEMA ledger;\nCREATE TABLE ledger.entries (id integer);\n",
+        ):
+            with self.subTest(up_sql=up_sql):
+                self.assertIsNone(self.schemas(up_sql))
+
+
 class PostgresDeploymentDatabaseTests(unittest.TestCase):
     def setUp(self):
         self.temporary_directory = tempfile.TemporaryDirectory()
@@ -573,19 +929,55 @@ class PostgresDeploymentDatabaseTests(unittest.TestCase):
         self.backups.mkdir()
         self.pg_dump = self.root / "pg_dump"
         self.pg_restore = self.root / "pg_restore"
+        self.pg_dump.write_text(
+            "#!/bin/sh\n"
+            f'echo "$@" >> {self.root}/pg_dump.log\n'
+            'while [ "$#" -gt 0 ]; do\n'
+            '  if [ "$1" = "--file" ]; then\n'
+            '    mkdir "$2" && printf toc > "$2/toc.dat" && printf rows > "$2/3001.dat.gz"\n'
+            "    exit 0\n"
+            "  fi\n"
+            "  shift\n"
+            "done\n"
+            "printf 'verified test dump'\n",
+            encoding="utf-8",
+        )
+        self.pg_restore.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
         for executable in (self.pg_dump, self.pg_restore):
-            executable.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
             executable.chmod(0o755)
+        self.database_config = {
+            "Database": {
+                "user": "remihub_qa_migrator",
+                "password": "secret",
+                "host": "127.0.0.1",
+                "port": "5432",
+                "database": "remihub_qa",
+            }
+        }
 
-    def _database(self):
+    def _database(self, **options):
         return PostgresDeploymentDatabase(
             config_path=self.config,
             backup_root=self.backups,
             owner_role="remihub_qa_owner",
             pg_dump_binary=str(self.pg_dump),
             pg_restore_binary=str(self.pg_restore),
+            **options,
         )
 
+    def _backup(self, database, *, deployment_run_id="run-id", **options):
+        with patch(
+            "backend.core.agent_deployment.load_config",
+            return_value=self.database_config,
+        ):
+            evidence = database.backup(
+                card_id="card-id",
+                deployment_run_id=deployment_run_id,
+                **options,
+            )
+        log = (self.root / "pg_dump.log").read_text(encoding="utf-8")
+        return evidence, log.splitlines()[-1].split()
+
     def test_connection_explicitly_assumes_fixed_owner_role(self):
         connection = MagicMock()
         cursor = connection.cursor.return_value.__enter__.return_value
@@ -599,41 +991,82 @@ class PostgresDeploymentDatabaseTests(unittest.TestCase):
         cursor.execute.assert_called_once_with("SET ROLE remihub_qa_owner")
 
     def test_backup_uses_same_fixed_owner_role(self):
-        database = self._database()
-        commands = []
-
-        def fake_run(command, *, environment, context):
-            commands.append((command, environment, context))
-            if "--file" in command:
-                output = Path(command[command.index("--file") + 1])
-                output.write_bytes(b"verified test dump")
+        evidence, dump_arguments = self._backup(self._database())
 
-        database._run = fake_run
-        with patch(
-            "backend.core.agent_deployment.load_config",
-            return_value={
-                "Database": {
-                    "user": "remihub_qa_migrator",
-                    "password": "secret",
-                    "host": "127.0.0.1",
-                    "port": "5432",
-                    "database": "remihub_qa",
-                }
-            },
-        ):
-            evidence = database.backup(
-                card_id="card-id",
-                deployment_run_id="run-id",
-            )
-
-        dump_command = commands[0][0]
         self.assertEqual(
-            dump_command[dump_command.index("--role") + 1],
+            dump_arguments[dump_arguments.index("--role") + 1],
             "remihub_qa_owner",
         )
         self.assertGreater(evidence.size_bytes, 0)
         self.assertEqual(len(evidence.sha256), 64)
 
+    def test_single_job_backup_is_hashed_while_streaming(self):
+        evidence, dump_arguments = self._backup(self._database())
+
+        self.assertIn("--format=custom", dump_arguments)
+        self.assertNotIn("--file", dump_arguments)
+        backup_path = Path(evidence.path)
+        self.assertEqual(backup_path.read_bytes(), b"verified test dump")
+        self.assertEqual(backup_path.stat().st_mode & 0o777, 0o600)
+        self.assertEqual(
+            evidence.sha256,
+            hashlib.sha256(b"verified test dump").hexdigest(),
+        )
+        self.assertEqual((evidence.format, evidence.jobs), ("custom", 1))
+
+    def test_parallel_backup_uses_directory_format(self):
+        evidence, dump_arguments = self._backup(
+            self._database(backup_jobs=3),
+            schemas=("agent",),
+        )
+
+        self.assertIn("--format=directory", dump_arguments)
+        self.assertEqual(dump_arguments[dump_arguments.index("--jobs") + 1], "3")
+        # Schema scoping is opt-in.
+        self.assertNotIn("--schema", dump_arguments)
+        backup_path = Path(evidence.path)
+        self.assertTrue(backup_path.is_dir())
+        self.assertEqual(backup_path.stat().st_mode & 0o777, 0o700)
+        self.assertEqual(evidence.size_bytes, len("toc") + len("rows"))
+        self.assertEqual(
+            evidence.sha256,
+            hashlib.sha256(
+                _canonical_json_bytes(
+                    {
+                        "3001.dat.gz": hashlib.sha256(b"rows").hexdigest(),
+                        "toc.dat": hashlib.sha256(b"toc").hexdigest(),
+                    }
+                )
+            ).hexdigest(),
+        )
+        self.assertEqual((evidence.format, evidence.jobs, evidence.schemas), ("directory", 3, ()))
+
+    def test_scoped_backup_dumps_only_touched_schemas(self):
+        evidence, dump_arguments = self._backup(
+            self._database(backup_schema_scope=True),
+            schemas=("agent", "public"),
+        )
+
+        self.assertEqual(evidence.schemas, ("agent", "public"))
+        self.assertEqual(
+            [dump_arguments[index + 1] for index, value in enumerate(dump_arguments) if value == "--schema"],
+            ["agent", "public"],
+        )
+
+        unknown, dump_arguments = self._backup(
+            self._database(backup_schema_scope=True),
+            deployment_run_id="next-run-id",
+            schemas=None,
+        )
+        self.assertEqual(unknown.schemas, ())
+        self.assertNotIn("--schema", dump_arguments)
+
+    def test_failed_streamed_backup_reports_stderr(self):
+        self.pg_dump.write_text("#!/bin/sh\necho 'role denied' >&2\nexit 1\n", encoding="utf-8")
+
+        with self.assertRaisesRegex(AgentDeploymentError, "PostgreSQL backup failed: role denied"):
+            self._backup(self._database())
+
     def test_invalid_owner_role_is_rejected(self):
         with self.assertRaisesRegex(
             AgentWorkerConfigurationError,
@@ -1000,6 +1433,11 @@ class GitBackendDeploymentManagerTests(unittest.TestCase):
             manifest["attempts"][-1]["validation"]["stdout_tail"],
             "140 tests passed",
         )
+        self.assertEqual(
+            manifest["attempts"][-1]["database_backup_skipped"],
+            "no pending migrations",
+        )
+        self.assertNotIn("backup", [event[0] for event in self.database.events])
 
     def test_new_paired_reversible_migration_is_backed_up_and_applied(self):
         claim = self._prepare_deployment(
@@ -1025,12 +1463,34 @@ class GitBackendDeploymentManagerTests(unittest.TestCase):
 
         self.assertEqual(candidate.migrations_applied, ("0002",))
         self.assertIsNotNone(candidate.database_backup)
+        # An unqualified table name leaves the touched schemas unknown.
+        self.assertEqual(database.backup_schemas, [None])
         self.assertIn(("upgrade", ("0002",)), database.events)
         backup_index = next(
             index for index, event in enumerate(database.events) if event[0] == "backup"
         )
         upgrade_index = database.events.index(("upgrade", ("0002",)))
         self.assertLess(backup_index, upgrade_index)
+        self.assertEqual(
+            [span["name"] for span in candidate.stage_timeline["spans"]],
+            [
+                "card_lock",
+                "approval_check",
+                "candidate_materialization",
+                "validation",
+                "frontend_build",
+                "migration_preflight",
+                "database_backup",
+                "service_stop",
+                "migrations",
+                "runtime_promote",
+                "service_start",
+                "health_verify",
+                "migration_history",
+                "target_advance",
+                "source_sync",
+            ],
+        )
 
     def test_production_refuses_when_qa_missing_candidate_migration_before_mutation(self):
         changes = {}
@@ -1411,6 +1871,7 @@ class GitBackendDeploymentManagerTests(unittest.TestCase):
         candidate = self._manager().deploy(claim)
 
         self.assertEqual(len(self.validator.calls), 1)
+        self.assertEqual(self.validator.changed_files, [("backend/example.py",)])
         self.assertEqual(
             _git(self.target, "rev-parse", "qa-main"),
             candidate.candidate_commit,
@@ -1465,6 +1926,11 @@ class GitBackendDeploymentManagerTests(unittest.TestCase):
         self.assertEqual(
             manifest["attempts"][-1]["migrations_rolled_back"], ["0002"]
         )
+        spans = manifest["attempts"][-1]["stage_timeline"]["spans"]
+        self.assertEqual(
+            [(span["name"], span["status"]) for span in spans[-2:]],
+            [("health_verify", "failed"), ("rollback", "succeeded")],
+        )
 
     def test_partial_migration_failure_is_detected_and_downgraded(self):
         claim = self._prepare_deployment(
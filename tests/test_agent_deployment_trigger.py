@@ -323,6 +323,19 @@ class DeploymentTriggerAssetTests(unittest.TestCase):
         self.assertNotIn("TRIGGER", grant)
         self.assertNotIn("REVOKE INSERT", rollback)
 
+    def test_card_board_grants_cover_only_the_board_table(self):
+        sql = self.ROOT / "deployments/agent_common/sql"
+        grant = (sql / "agent-card-board-grants.sql").read_text()
+        rollback = (sql / "agent-card-board-grants.rollback.sql").read_text()
+
+        self.assertIn("GRANT SELECT, INSERT, UPDATE ON agent.card_board TO %I", grant)
+        self.assertIn("REVOKE SELECT, INSERT, UPDATE ON agent.card_board FROM %I", rollback)
+        self.assertNotIn("GRANT ALL", grant)
+        self.assertNotIn("agent.cards", grant)
+        self.assertNotIn("agent.runs", grant)
+        self.assertNotIn("DELETE", grant)
+        self.assertNotIn("TRUNCATE", grant)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,253 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+
+from backend.services import agent_event_stream, agent_service
+from backend.services.agent_event_stream import (
+    AgentEventBroker,
+    AgentEventListener,
+    AgentStreamEvent,
+)
+
+
+CARD_ID = "3d8549c4-a965-4d2e-aacf-9df7e6ccdbb4"
+OTHER_CARD_ID = "9f4e4c1e-7c2b-4a55-9a60-3b0c4d3e2f10"
+EVENT_ID = "5b6f2d52-0e8a-4b55-9a45-2f1d0e6c7a11"
+
+
+def event_notification(**overrides) -> str:
+    notification = {
+        "type": "event",
+        "id": EVENT_ID,
+        "card_id": CARD_ID,
+        "event_type": "run.completed",
+        "actor_type": "worker",
+        "actor_user_id": None,
+        "payload": {"phase": "planning"},
+        "created_at": "2026-07-29T15:00:00+00:00",
+    }
+    notification.update(overrides)
+    return json.dumps(notification)
+
+
+class EventNotificationSqlTests(unittest.TestCase):
+    def test_event_insert_notifies_in_the_same_statement(self):
+        cur = MagicMock()
+
+        event_id = agent_service._insert_event(
+            cur,
+            card_id=CARD_ID,
+            event_type="card.created",
+            actor_type="user",
+            actor_user_id=None,
+            payload={"title": "Medication tracking"},
+        )
+
+        cur.execute.assert_called_once()
+        sql, parameters = cur.execute.call_args.args
+        self.assertIn("INSERT INTO agent.events", sql)
+        self.assertIn("pg_notify(\n            'agent_card_events'", sql)
+        notification = json.loads(parameters[-1])
+        self.assertEqual(notification["id"], event_id)
+        self.assertEqual(notification["payload"], {"title": "Medication tracking"})
+        self.assertNotIn("truncated", notification)
+
+    def test_oversized_payload_is_left_for_listeners_to_read(self):
+        cur = MagicMock()
+
+        agent_service._insert_event(
+            cur,
+            card_id=CARD_ID,
+            event_type="run.completed",
+            actor_type="worker",
+            actor_user_id=None,
+            payload={"output": "x" * agent_service.MAX_NOTIFY_PAYLOAD_BYTES},
+        )
+
+        notification = json.loads(cur.execute.call_args.args[1][-1])
+        self.assertTrue(notification["truncated"])
+        self.assertNotIn("payload", notification)
+
+
+class NotificationTranslationTests(unittest.TestCase):
+    def test_card_event_is_resumable_by_id(self):
+        event = agent_event_stream.stream_event_from_notification(event_notification())
+
+        self.assertEqual((event.type, event.id, event.card_id), ("card_event", EVENT_ID, CARD_ID))
+        self.assertEqual(event.data["event_type"], "run.completed")
+        self.assertNotIn("type", event.data)
+
+    def test_heartbeat_has_no_resumable_id(self):
+        event = agent_event_stream.stream_event_from_notification(
+            json.dumps(
+                {
+                    "type": "run.heartbeat",
+                    "card_id": CARD_ID,
+                    "run_id": EVENT_ID,
+                    "lease_expires_at": "2026-07-29T15:02:00+00:00",
+                }
+            )
+        )
+
+        self.assertEqual(event.type, "run_heartbeat")
+        self.assertIsNone(event.id)
+        self.assertEqual(
+            event.to_sse(),
+            "event: run_heartbeat\ndata: "
+            f'{{"card_id":"{CARD_ID}","run_id":"{EVENT_ID}",'
+            '"lease_expires_at":"2026-07-29T15:02:00+00:00"}\n\n',
+        )
+
+    @patch("backend.services.agent_event_stream.agent_service.get_event")
+    def test_truncated_event_is_read_back(self, get_event):
+        get_event.return_value = {"id": EVENT_ID, "card_id": CARD_ID, "payload": {"big": True}}
+
+        event = agent_event_stream.stream_event_from_notification(
+            event_notification(payload=None, truncated=True)
+        )
+
+        get_event.assert_called_once_with(EVENT_ID)
+        self.assertEqual(event.data["payload"], {"big": True})
+
+    def test_malformed_notification_is_ignored(self):
+        with self.assertLogs("backend.services.agent_event_stream", level="WARNING"):
+            self.assertIsNone(agent_event_stream.stream_event_from_notification("not json"))
+
+
+class AgentEventBrokerTests(unittest.TestCase):
+    def test_events_reach_subscribers_of_that_card_only(self):
+        broker = AgentEventBroker()
+
+        async def scenario():
+            watching = broker.subscribe(CARD_ID)
+            other_card = broker.subscribe(OTHER_CARD_ID)
+            # Notifications arrive on the listener thread.
+            await asyncio.to_thread(
+                broker.publish,
+                AgentStreamEvent(card_id=CARD_ID, type="card_event", data={}, id=EVENT_ID),
+            )
+            event = await asyncio.wait_for(watching.queue.get(), timeout=1)
+            return event, other_card.queue.qsize()
+
+        event, other_card_pending = asyncio.run(scenario())
+
+        self.assertEqual(event.id, EVENT_ID)
+        self.assertEqual(other_card_pending, 0)
+
+    def test_resync_reaches_every_stream(self):
+        broker = AgentEventBroker()
+
+        async def scenario():
+            subscriptions = [broker.subscribe(CARD_ID), broker.subscribe(OTHER_CARD_ID)]
+            await asyncio.to_thread(broker.publish_resync)
+            return [
+                await asyncio.wait_for(subscription.queue.get(), timeout=1)
+                for subscription in subscriptions
+            ]
+
+        events = asyncio.run(scenario())
+
+        self.assertEqual(
+            [(event.card_id, event.type) for event in events],
+            [(CARD_ID, "resync"), (OTHER_CARD_ID, "resync")],
+        )
+
+
+class AgentEventListenerTests(unittest.TestCase):
+    @patch("backend.services.agent_event_stream.agent_service.get_event")
+    def test_unwatched_cards_are_skipped(self, get_event):
+        broker = AgentEventBroker()
+        listener = AgentEventListener(broker, connect=MagicMock())
+
+        with patch.object(broker, "publish") as publish:
+            listener.dispatch(event_notification(payload=None, truncated=True))
+
+        publish.assert_not_called()
+        get_event.assert_not_called()
+
+    def test_reconnect_tells_streams_to_resync(self):
+        broker = AgentEventBroker()
+        connections = [MagicMock(), MagicMock()]
+        listener = AgentEventListener(broker, reconnect_seconds=0)
+
+        def connect():
+            conn = connections.pop(0)
+            if not connections:
+                listener._stop.set()
+            return conn
+
+        listener._connect = connect
+        with (
+            patch.object(agent_event_stream.select, "select", side_effect=psycopg2.OperationalError),
+            patch.object(broker, "publish_resync") as publish_resync,
+            self.assertLogs("backend.services.agent_event_stream", level="WARNING"),
+        ):
+            listener._run()
+
+        publish_resync.assert_called_once_with()
+
+
+class StreamCardEventsTests(unittest.TestCase):
+    def run_stream(self, last_event_id, missed_events, live_event=None):
+        async def scenario():
+            broker = AgentEventBroker()
+            with (
+                patch.object(agent_event_stream, "broker", broker),
+                patch.object(agent_event_stream.listener, "ensure_started"),
+                patch.object(
+                    agent_event_stream.agent_service,
+                    "list_card_events_after",
+                    return_value=missed_events,
+                ),
+            ):
+                disconnected = asyncio.Event()
+
+                async def is_disconnected():
+                    return disconnected.is_set()
+
+                stream = agent_event_stream.stream_card_events(
+                    CARD_ID,
+                    last_event_id,
+                    is_disconnected,
+                )
+                frames = [await anext(stream)]
+                if live_event is not None:
+                    broker.publish(live_event)
+                    broker.publish(
+                        AgentStreamEvent(card_id=CARD_ID, type="run_heartbeat", data={})
+                    )
+                while True:
+                    frame = await anext(stream)
+                    frames.append(frame)
+                    if "run_heartbeat" in frame or "resync" in frame:
+                        break
+                disconnected.set()
+                await stream.aclose()
+                return frames, broker._subscribers
+
+        return asyncio.run(scenario())
+
+    def test_reconnect_replays_missed_events_without_duplicates(self):
+        missed = {"id": EVENT_ID, "card_id": CARD_ID, "event_type": "run.completed"}
+        frames, subscribers = self.run_stream(
+            "previous-event",
+            [missed],
+            live_event=AgentStreamEvent(card_id=CARD_ID, type="card_event", data=missed, id=EVENT_ID),
+        )
+
+        self.assertTrue(frames[0].startswith("retry: 3000"))
+        self.assertEqual(sum(f"id: {EVENT_ID}" in frame for frame in frames), 1)
+        self.assertIn("event: run_heartbeat", frames[-1])
+        self.assertEqual(subscribers, {})
+
+    def test_unknown_last_event_id_requests_resync(self):
+        frames, _subscribers = self.run_stream("unknown-event", None)
+
+        self.assertIn("event: resync", frames[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
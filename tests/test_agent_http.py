@@ -118,6 +118,39 @@ class AgentHttpBoundaryTests(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         list_cards.assert_called_once_with(include_closed=True)
 
+    @patch("backend.routers.agent.agent_service.list_board")
+    def test_board_pages_are_incremental(self, list_board):
+        summary = card_detail()
+        for key in ("messages", "runs", "approvals", "events"):
+            summary.pop(key)
+        list_board.return_value = {
+            "cards": [summary],
+            "next_cursor": "next-page",
+            "next_updated_since": NOW,
+        }
+
+        response = admin_client.get(
+            "/agent/board",
+            params={"limit": 50, "cursor": "page", "updated_since": NOW},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["next_cursor"], "next-page")
+        self.assertEqual(response.json()["data"]["cards"][0]["id"], CARD_ID)
+        kwargs = list_board.call_args.kwargs
+        self.assertEqual(kwargs["limit"], 50)
+        self.assertEqual(kwargs["cursor"], "page")
+        self.assertEqual(kwargs["updated_since"].isoformat(), NOW)
+        self.assertFalse(kwargs["include_closed"])
+
+    @patch("backend.routers.agent.agent_service.list_board")
+    def test_invalid_board_cursor_is_bad_request(self, list_board):
+        list_board.side_effect = ValueError("cursor is invalid")
+
+        response = admin_client.get("/agent/board?cursor=bogus")
+
+        self.assertEqual(response.status_code, 400)
+
     @patch("backend.routers.agent.agent_service.get_card")
     def test_missing_card_is_not_found(self, get_card):
         get_card.side_effect = AgentCardNotFoundError(
@@ -128,6 +161,37 @@ class AgentHttpBoundaryTests(unittest.TestCase):
 
         self.assertEqual(response.status_code, 404)
 
+    @patch("backend.routers.agent.agent_event_stream.stream_card_events")
+    @patch("backend.routers.agent.agent_service.card_exists")
+    def test_card_event_stream_resumes_from_last_event_id(self, card_exists, stream_card_events):
+        card_exists.return_value = True
+
+        async def frames(*_args):
+            yield "id: e1\nevent: card_event\ndata: {}\n\n"
+
+        stream_card_events.side_effect = frames
+
+        response = admin_client.get(
+            f"/agent/cards/{CARD_ID}/events/stream",
+            headers={"Last-Event-ID": "e0"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        self.assertEqual(response.headers["x-accel-buffering"], "no")
+        self.assertIn("event: card_event", response.text)
+        self.assertEqual(stream_card_events.call_args.args[:2], (CARD_ID, "e0"))
+
+    @patch("backend.routers.agent.agent_event_stream.stream_card_events")
+    @patch("backend.routers.agent.agent_service.card_exists")
+    def test_missing_card_event_stream_is_not_found(self, card_exists, stream_card_events):
+        card_exists.return_value = False
+
+        response = admin_client.get(f"/agent/cards/{CARD_ID}/events/stream")
+
+        self.assertEqual(response.status_code, 404)
+        stream_card_events.assert_not_called()
+
     @patch("backend.routers.agent.agent_service.add_follow_up")
     def test_follow_up_is_attributed_to_administrator(self, add_follow_up):
         add_follow_up.return_value = card_detail(
@@ -198,7 +262,7 @@ class AgentHttpBoundaryTests(unittest.TestCase):
         schema = admin_app.openapi()
         paths = schema["paths"]
 
-        self.assertEqual(len([path for path in paths if path.startswith("/agent/")]), 9)
+        self.assertEqual(len([path for path in paths if path.startswith("/agent/")]), 11)
         self.assertEqual(
             paths["/agent/cards"]["get"]["responses"]["200"]["content"]
             ["application/json"]["schema"]["$ref"],
@@ -0,0 +1,44 @@
+import unittest
+
+from backend.core.agent_stage_timing import StageTimeline
+
+
+class StageTimelineTests(unittest.TestCase):
+    def test_spans_record_order_status_and_resources(self):
+        timeline = StageTimeline()
+
+        with timeline.span("validation"):
+            sum(range(10000))
+        with self.assertRaises(RuntimeError):
+            with timeline.span("migrations"):
+                raise RuntimeError("migration failed")
+
+        metadata = timeline.as_metadata()
+        self.assertEqual(
+            [(span["name"], span["status"]) for span in metadata["spans"]],
+            [("validation", "succeeded"), ("migrations", "failed")],
+        )
+        first, second = metadata["spans"]
+        self.assertLessEqual(first["offset_ms"], second["offset_ms"])
+        self.assertGreaterEqual(metadata["total_ms"], first["duration_ms"])
+        for key in ("cpu_ms", "read_bytes", "write_bytes", "max_rss_kb"):
+            self.assertGreaterEqual(first[key], 0)
+        self.assertGreater(first["max_rss_kb"], 0)
+
+    def test_attached_attempt_receives_each_finished_span(self):
+        timeline = StageTimeline()
+        attempt = {}
+
+        timeline.attach(attempt)
+        self.assertEqual(attempt["stage_timeline"]["spans"], [])
+        with timeline.span("service_stop"):
+            self.assertEqual(attempt["stage_timeline"]["spans"], [])
+
+        self.assertEqual(
+            [span["name"] for span in attempt["stage_timeline"]["spans"]],
+            ["service_stop"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from backend.core.agent_test_impact import select_impacted_tests
+
+
+class SelectImpactedTestsTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.root = Path(self.temporary_directory.name)
+        self.write("backend/__init__.py", "")
+        self.write("backend/core/__init__.py", "")
+        self.write("backend/core/shared.py", "VALUE = 1\n")
+        self.write("backend/core/leaf.py", "from .shared import VALUE\n")
+        self.write("backend/routers/__init__.py", "")
+        self.write("backend/routers/cards.py", "from backend.core import leaf\n")
+        self.write("backend/routers/health.py", "from backend.core.shared import VALUE\n")
+        self.write("tests/__init__.py", "")
+        self.write("tests/test_cards.py", "from backend.routers import cards\n")
+        self.write("tests/test_health.py", "import backend.routers.health\n")
+        self.write("tests/test_other.py", "import unittest\n")
+        self.write("tests/test_misc.py", "def test():\n    import json\n")
+
+    def write(self, relative: str, content: str) -> None:
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+    def select(self, *changed_files: str):
+        return select_impacted_tests(self.root, changed_files)
+
+    def test_direct_and_transitive_importers_are_selected(self):
+        self.assertEqual(self.select("backend/routers/cards.py"), ("tests.test_cards",))
+        # leaf.py reaches test_cards through a relative import and routers.cards.
+        self.assertEqual(self.select("backend/core/leaf.py"), ("tests.test_cards",))
+
+    def test_changed_test_module_selects_itself(self):
+        self.assertEqual(
+            self.select("tests/test_other.py", "backend/routers/health.py"),
+            ("tests.test_health", "tests.test_other"),
+        )
+
+    def test_core_module_runs_everything(self):
+        # shared.py reaches two of the four test modules.
+        self.assertIsNone(self.select("backend/core/shared.py"))
+
+    def test_unmapped_changes_run_everything(self):
+        for changed in (
+            "docs/agent-workflow-foundation.md",
+            "backend/core/__init__.py",
+            "backend/config.py",
+            "backend/core/removed.py",
+            "tests/fixtures/card.json",
+        ):
+            with self.subTest(changed=changed):
+                self.assertIsNone(self.select("backend/routers/cards.py", changed))
+
+    def test_change_reaching_no_test_runs_everything(self):
+        self.write("backend/core/unused.py", "VALUE = 2\n")
+
+        self.assertIsNone(self.select("backend/core/unused.py"))
+        self.assertIsNone(self.select())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,14 @@
 import os
 import threading
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from backend.agent_worker import AgentWorkerSettings, build_executor
+from backend.agent_worker import (
+    AgentWorkerSettings,
+    _wait_for_claimable_run,
+    build_executor,
+)
 from backend.core.agent_state import CardStatus, RepositoryScope, RunPhase
 from backend.core.agent_worker import (
     AgentLeaseLostError,
@@ -312,6 +317,49 @@ class AgentWorkerSettingsTests(unittest.TestCase):
         with self.assertRaises(AgentWorkerConfigurationError):
             build_executor(settings)
 
+    def test_idle_worker_waits_on_queue_notifications(self):
+        with patch.dict(
+            os.environ,
+            {
+                "REMIHUB_AGENT_POLL_SECONDS": "7",
+                "REMIHUB_AGENT_IDLE_WAIT_SECONDS": "90",
+            },
+            clear=True,
+        ):
+            settings = AgentWorkerSettings.from_environment()
+        queue = MagicMock()
+        stop_event = threading.Event()
+
+        _wait_for_claimable_run(
+            queue,
+            settings,
+            allowed_phases=frozenset({RunPhase.PLANNING}),
+            stop_event=stop_event,
+        )
+
+        kwargs = queue.wait_for_claimable_run.call_args.kwargs
+        self.assertEqual(kwargs["allowed_phases"], frozenset({RunPhase.PLANNING}))
+        self.assertEqual(kwargs["idle_seconds"], 90)
+        self.assertEqual(kwargs["retry_seconds"], 7)
+        self.assertFalse(kwargs["should_stop"]())
+        stop_event.set()
+        self.assertTrue(kwargs["should_stop"]())
+
+    def test_queue_without_notifications_falls_back_to_polling(self):
+        with patch.dict(os.environ, {}, clear=True):
+            settings = AgentWorkerSettings.from_environment()
+        stop_event = MagicMock()
+
+        _wait_for_claimable_run(
+            object(),
+            settings,
+            allowed_phases=frozenset({RunPhase.PLANNING}),
+            stop_event=stop_event,
+        )
+
+        self.assertEqual(settings.idle_wait_seconds, 60)
+        stop_event.wait.assert_called_once_with(settings.poll_seconds)
+
     def test_fake_executor_requires_qa_and_explicit_gate(self):
         with patch.dict(
             os.environ,
@@ -626,6 +674,7 @@ class BackendDeploymentWorkerSettingsTests(unittest.TestCase):
         sandbox_validator.assert_called_once_with(
             validation_command="/srv/agent/bin/validate",
             timeout_seconds=600,
+            cache_root=Path("/srv/agent/deployment-artifacts/.validation-cache"),
         )
         deployment_database.assert_called_once_with(
             config_path="/srv/agent/config/qa-migrator.ini",
@@ -634,6 +683,8 @@ class BackendDeploymentWorkerSettingsTests(unittest.TestCase):
             pg_dump_binary="/usr/lib/postgresql/16/bin/pg_dump",
             pg_restore_binary="/usr/lib/postgresql/16/bin/pg_restore",
             command_timeout_seconds=600,
+            backup_jobs=4,
+            backup_schema_scope=False,
         )
         deployment_runtime.assert_called_once_with(
             environment="qa",
@@ -3,11 +3,15 @@ import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
+import psycopg2
+
 from backend.core.agent_state import CardStatus, RepositoryScope, RunPhase
 from backend.core.agent_worker import AgentLeaseLostError, ExecutionResult
 import backend.services.agent_worker_service as agent_worker_service_module
+from backend.services.agent_service import AGENT_RUNS_CHANNEL, _insert_run
 from backend.services.agent_worker_service import (
     AgentQueueStateError,
+    ClaimableRunListener,
     DatabaseAgentQueue,
     _claimed_run_from_row,
     _validate_candidate,
@@ -18,6 +22,7 @@ from backend.services.agent_worker_service import (
     heartbeat_run,
     persist_codex_thread_id,
     persist_implementation_workspace,
+    seconds_until_claimable,
     verify_worker_identity,
 )
 from tests.test_agent_worker import claimed_run
@@ -450,6 +455,9 @@ class AgentHeartbeatTests(unittest.TestCase):
                 claim.lease_token,
             ),
         )
+        sql = cursor.execute.call_args.args[0]
+        self.assertIn("pg_notify(\n        'agent_card_events'", sql)
+        self.assertIn("'type', 'run.heartbeat'", sql)
 
     @patch("backend.services.agent_worker_service.put_db_conn")
     @patch("backend.services.agent_worker_service.get_db_conn")
@@ -467,7 +475,131 @@ class AgentHeartbeatTests(unittest.TestCase):
         put_db_conn.assert_called_once_with(connection)
 
 
+
+class ClaimableRunWaitTests(unittest.TestCase):
+    def test_inserted_run_is_announced_with_its_phase(self):
+        cursor = MagicMock()
+
+        _insert_run(
+            cursor,
+            card_id="card-id",
+            phase=RunPhase.IMPLEMENTATION,
+            card_revision=1,
+            requested_by="user-id",
+        )
+
+        self.assertEqual(
+            cursor.execute.call_args.args,
+            ("SELECT pg_notify(%s, %s)", (AGENT_RUNS_CHANNEL, "implementation")),
+        )
+
+    @patch("backend.services.agent_worker_service.put_db_conn")
+    @patch("backend.services.agent_worker_service.get_db_conn")
+    def test_due_time_reads_queue_and_lease_expiry(self, get_db_conn, put_db_conn):
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (12.5,)
+        get_db_conn.return_value = connection
+
+        delay = seconds_until_claimable(frozenset({RunPhase.PLANNING}))
+
+        self.assertEqual(delay, 12.5)
+        sql, parameters = cursor.execute.call_args.args
+        self.assertIn("min(available_at)", sql)
+        self.assertIn("min(lease_expires_at)", sql)
+        self.assertEqual(parameters, (["planning"], ["planning"]))
+        put_db_conn.assert_called_once_with(connection)
+
+    def wait_timeout(self, delay):
+        queue = DatabaseAgentQueue(environment="qa")
+        queue._listener = MagicMock()
+        with patch(
+            "backend.services.agent_worker_service.seconds_until_claimable",
+            return_value=delay,
+        ):
+            queue.wait_for_claimable_run(
+                allowed_phases=frozenset({RunPhase.PLANNING}),
+                idle_seconds=60,
+                retry_seconds=5,
+            )
+        return queue._listener.wait.call_args.args[0]
+
+    def test_wait_timeout_follows_next_due_run(self):
+        self.assertEqual(self.wait_timeout(None), 60)
+        self.assertEqual(self.wait_timeout(7.5), 7.5)
+        self.assertEqual(self.wait_timeout(3600), 60)
+        self.assertEqual(self.wait_timeout(0), 5)
+
+    def listener(self, connection):
+        return ClaimableRunListener(
+            connect=MagicMock(return_value=connection),
+            check_seconds=0.01,
+        )
+
+    def test_listener_subscribes_then_wakes_for_matching_notification(self):
+        connection = MagicMock()
+        connection.notifies = []
+        cursor = connection.cursor.return_value.__enter__.return_value
+        listener = self.listener(connection)
+
+        self.assertTrue(listener.wait(1, phases=frozenset({RunPhase.PLANNING})))
+        self.assertTrue(connection.autocommit)
+        cursor.execute.assert_called_once_with(f"LISTEN {AGENT_RUNS_CHANNEL};")
+
+        def deliver():
+            connection.notifies.append(MagicMock(payload="planning"))
+
+        connection.poll.side_effect = deliver
+        with patch(
+            "backend.services.agent_worker_service.select.select",
+            return_value=([connection], [], []),
+        ):
+            self.assertTrue(listener.wait(1, phases=frozenset({RunPhase.PLANNING})))
+        self.assertEqual(connection.notifies, [])
+
+    def test_listener_ignores_other_phases_until_timeout(self):
+        connection = MagicMock()
+        connection.notifies = [MagicMock(payload="deployment")]
+        listener = self.listener(connection)
+        listener._conn = connection
+
+        with patch(
+            "backend.services.agent_worker_service.select.select",
+            return_value=([], [], []),
+        ) as select_call:
+            woke = listener.wait(0.05, phases=frozenset({RunPhase.PLANNING}))
+
+        self.assertFalse(woke)
+        self.assertTrue(select_call.called)
+
+    def test_listener_stops_when_asked(self):
+        connection = MagicMock()
+        connection.notifies = []
+        listener = self.listener(connection)
+        listener._conn = connection
+
+        with patch(
+            "backend.services.agent_worker_service.select.select",
+        ) as select_call:
+            self.assertFalse(listener.wait(60, should_stop=lambda: True))
+
+        select_call.assert_not_called()
+
+    def test_listener_falls_back_to_sleeping_without_a_connection(self):
+        listener = ClaimableRunListener(
+            connect=MagicMock(side_effect=psycopg2.OperationalError("down")),
+            check_seconds=0.01,
+        )
+
+        with patch("backend.services.agent_worker_service.time.sleep") as sleep:
+            self.assertFalse(listener.wait(0.05))
+
+        self.assertTrue(sleep.called)
+        self.assertIsNone(listener._conn)
+
+
 class CodexThreadPersistenceTests(unittest.TestCase):
+    @patch("backend.services.agent_worker_service._refresh_board_card")
     @patch("backend.services.agent_worker_service._insert_event")
     @patch("backend.services.agent_worker_service._lock_owned_run")
     @patch("backend.services.agent_worker_service.put_db_conn")
@@ -478,6 +610,7 @@ class CodexThreadPersistenceTests(unittest.TestCase):
         put_db_conn,
         lock_owned_run,
         insert_event,
+        refresh_board_card,
     ):
         connection = MagicMock()
         cursor = connection.cursor.return_value.__enter__.return_value
@@ -495,6 +628,7 @@ class CodexThreadPersistenceTests(unittest.TestCase):
             ("thr_remihub_123", claim.card_id, "thr_remihub_123"),
         )
         insert_event.assert_called_once()
+        refresh_board_card.assert_called_once_with(cursor, claim.card_id)
         connection.commit.assert_called_once_with()
         put_db_conn.assert_called_once_with(connection)
 
@@ -526,6 +660,7 @@ class CodexThreadPersistenceTests(unittest.TestCase):
 
 
 class ImplementationWorkspacePersistenceTests(unittest.TestCase):
+    @patch("backend.services.agent_worker_service._refresh_board_card")
     @patch("backend.services.agent_worker_service._insert_event")
     @patch("backend.services.agent_worker_service._lock_owned_run")
     @patch("backend.services.agent_worker_service.put_db_conn")
@@ -536,6 +671,7 @@ class ImplementationWorkspacePersistenceTests(unittest.TestCase):
         put_db_conn,
         lock_owned_run,
         insert_event,
+        refresh_board_card,
     ):
         connection = MagicMock()
         cursor = connection.cursor.return_value.__enter__.return_value
@@ -554,6 +690,7 @@ class ImplementationWorkspacePersistenceTests(unittest.TestCase):
         self.assertIn("SET feature_branch = %s", sql)
         self.assertEqual(parameters[2], claim.card_id)
         insert_event.assert_called_once()
+        refresh_board_card.assert_called_once_with(cursor, claim.card_id)
         connection.commit.assert_called_once_with()
         put_db_conn.assert_called_once_with(connection)
 
@@ -918,6 +1055,10 @@ class RunCompletionTests(unittest.TestCase):
         self.assertEqual(card_update_parameters, ("deployment_queued", claim.card_id))
         insert_event.assert_called_once()
         self.assertEqual(insert_event.call_args.kwargs["event_type"], "run.qa_succeeded")
+        self.assertEqual(
+            cursor.execute.call_args_list[2].args,
+            ("SELECT pg_notify(%s, %s)", ("agent_runs_claimable", "deployment")),
+        )
         insert_notification.assert_not_called()
         connection.commit.assert_called_once_with()
         put_db_conn.assert_called_once_with(connection)
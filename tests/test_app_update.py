@@ -0,0 +1,319 @@
+import contextlib
+import hashlib
+import importlib.util
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import app_update
+from backend.services import app_update_patches
+
+
+APK_BYTES = bytes(range(256)) * 64
+APK_SHA256 = hashlib.sha256(APK_BYTES).hexdigest()
+
+app = FastAPI()
+app.include_router(app_update.router)
+client = TestClient(app)
+
+
+def release(**overrides):
+    row = {
+        "id": 71,
+        "platform": "android",
+        "version_code": 66,
+        "version_name": "0.8.12",
+        "apk_filename": "remihub-v66-0.8.12.apk",
+        "apk_relative_path": "releases/android/remihub-v66-0.8.12.apk",
+        "apk_sha256": APK_SHA256,
+        "file_size_bytes": len(APK_BYTES),
+        "created_at": None,
+        "is_active": True,
+    }
+    row.update(overrides)
+    return row
+
+
+class LatestAppUpdateTests(unittest.TestCase):
+    @patch("backend.routers.app_update.get_release_patch")
+    @patch("backend.routers.app_update.get_latest_app_release", return_value=release())
+    def test_latest_advertises_a_patch_for_the_callers_version(self, _latest, get_release_patch):
+        get_release_patch.return_value = {
+            "id": 9,
+            "format": "bsdiff4",
+            "patch_sha256": "b" * 64,
+            "patch_size_bytes": 1200,
+            "from_version_code": 65,
+            "from_apk_sha256": "a" * 64,
+        }
+
+        response = client.get(
+            "/app-update/latest",
+            params={"platform": "android", "current_version_code": 65},
+        )
+
+        get_release_patch.assert_called_once_with(71, 65)
+        data = response.json()["data"]
+        self.assertEqual(data["download_url"], "/app-update/download/71")
+        self.assertEqual(data["patch"]["download_url"], "/app-update/patch/9")
+        self.assertEqual(data["patch"]["from_apk_sha256"], "a" * 64)
+
+    @patch("backend.routers.app_update.get_release_patch")
+    @patch("backend.routers.app_update.get_latest_app_release", return_value=release())
+    def test_clients_without_a_version_or_already_current_get_the_full_apk(self, _latest, get_release_patch):
+        for params in ({}, {"current_version_code": 66}):
+            response = client.get("/app-update/latest", params={"platform": "android", **params})
+
+            self.assertIsNone(response.json()["data"]["patch"])
+        get_release_patch.assert_not_called()
+
+
+class DownloadAppReleaseTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.releases_dir = Path(self.temporary_directory.name)
+        apk = self.releases_dir / "releases" / "android" / "remihub-v66-0.8.12.apk"
+        apk.parent.mkdir(parents=True)
+        apk.write_bytes(APK_BYTES)
+        resolver = patch(
+            "backend.routers.app_update.resolve_release_file_path",
+            side_effect=lambda relative: self.releases_dir / relative,
+        )
+        resolver.start()
+        self.addCleanup(resolver.stop)
+
+    @patch("backend.routers.app_update.get_app_release_by_id", return_value=release())
+    def test_interrupted_download_resumes_with_a_range_request(self, _release):
+        full = client.get("/app-update/download/71")
+        self.assertEqual(full.headers["etag"], f'"{APK_SHA256}"')
+        self.assertEqual(full.headers["accept-ranges"], "bytes")
+
+        resumed = client.get(
+            "/app-update/download/71",
+            headers={"Range": "bytes=4096-", "If-Range": full.headers["etag"]},
+        )
+
+        self.assertEqual(resumed.status_code, 206)
+        self.assertEqual(resumed.headers["content-range"], f"bytes 4096-{len(APK_BYTES) - 1}/{len(APK_BYTES)}")
+        self.assertEqual(full.content[:4096] + resumed.content, APK_BYTES)
+
+    @patch("backend.routers.app_update.get_app_release_by_id", return_value=release())
+    def test_stale_validator_restarts_the_download(self, _release):
+        response = client.get(
+            "/app-update/download/71",
+            headers={"Range": "bytes=4096-", "If-Range": '"stale"'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, APK_BYTES)
+
+    @patch(
+        "backend.routers.app_update.get_app_release_by_id",
+        return_value=release(file_size_bytes=len(APK_BYTES) + 1),
+    )
+    def test_file_that_differs_from_the_published_size_is_not_served(self, _release):
+        self.assertEqual(client.get("/app-update/download/71").status_code, 409)
+
+    @patch("backend.routers.app_update.get_release_patch_by_id")
+    def test_patch_download_uses_the_patch_hash(self, get_release_patch_by_id):
+        patch_file = self.releases_dir / "releases" / "android" / "patches" / "v66.from-v65.bsdiff4"
+        patch_file.parent.mkdir()
+        patch_file.write_bytes(b"BSDIFF40patch")
+        get_release_patch_by_id.return_value = {
+            "id": 9,
+            "patch_filename": patch_file.name,
+            "patch_relative_path": "releases/android/patches/v66.from-v65.bsdiff4",
+            "patch_sha256": "b" * 64,
+            "patch_size_bytes": len(b"BSDIFF40patch"),
+        }
+
+        response = client.get("/app-update/patch/9")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["etag"], f'"{"b" * 64}"')
+        self.assertEqual(response.content, b"BSDIFF40patch")
+
+
+class SqliteCursor:
+    """Runs the service's psycopg2-style SQL against SQLite."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def execute(self, sql, params=()):
+        self.cursor.execute(sql.replace("%s", "?"), params)
+
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+    def close(self):
+        self.cursor.close()
+
+
+class SqliteConnection:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def cursor(self):
+        return contextlib.closing(SqliteCursor(self.connection.cursor()))
+
+    def commit(self):
+        self.connection.commit()
+
+    def rollback(self):
+        self.connection.rollback()
+
+
+class PatchCandidateWindowTests(unittest.TestCase):
+    def setUp(self):
+        self.database = sqlite3.connect(":memory:")
+        self.addCleanup(self.database.close)
+        self.database.executescript(
+            """
+            CREATE TABLE app_release (
+                id integer PRIMARY KEY,
+                platform text,
+                version_code integer,
+                apk_filename text,
+                apk_relative_path text,
+                apk_sha256 text,
+                file_size_bytes integer,
+                is_active boolean,
+                created_at text
+            );
+            CREATE TABLE app_release_patch (
+                id integer PRIMARY KEY,
+                release_id integer,
+                from_release_id integer,
+                patch_format text,
+                outcome text,
+                patch_filename text,
+                patch_relative_path text,
+                patch_sha256 text,
+                patch_size_bytes integer
+            );
+            CREATE UNIQUE INDEX app_release_patch_pair_uidx
+                ON app_release_patch (release_id, from_release_id, patch_format);
+            """
+        )
+        for version_code in range(1, 8):
+            self.database.execute(
+                "INSERT INTO app_release VALUES (?, 'android', ?, ?, ?, ?, 1000, ?, ?)",
+                (
+                    version_code,
+                    version_code,
+                    f"remihub-v{version_code}.apk",
+                    f"releases/android/remihub-v{version_code}.apk",
+                    f"{version_code:064x}",
+                    version_code == 7,
+                    f"2026-01-0{version_code}",
+                ),
+            )
+        connection = SqliteConnection(self.database)
+        for patcher in (
+            patch.object(app_update_patches, "get_db_conn", return_value=connection),
+            patch.object(app_update_patches, "put_db_conn"),
+            patch.object(app_update_patches, "resolve_release_file_path", side_effect=Path),
+            patch.object(app_update_patches, "_sha256_file", side_effect=lambda path: f"{int(path.stem.split('v')[-1]):064x}"),
+            patch.object(Path, "is_file", return_value=True),
+            patch.object(Path, "unlink"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def run_generation(self, patch_sizes):
+        built = iter(patch_sizes)
+        with patch.object(
+            app_update_patches,
+            "build_release_patch",
+            side_effect=lambda *_args: {"patch_sha256": "c" * 64, "patch_size_bytes": next(built)},
+        ):
+            return app_update_patches.generate_release_patches("android", sources=3)
+
+    def test_rerun_stays_within_the_most_recent_releases(self):
+        first = self.run_generation([100, 900, 200])
+        second = self.run_generation([])
+
+        self.assertEqual(
+            [(result["from_version_code"], result["status"]) for result in first],
+            [(6, "created"), (5, "skipped"), (4, "created")],
+        )
+        self.assertEqual(second, [])
+        self.assertEqual(
+            self.database.execute(
+                "SELECT from_release_id, outcome, patch_filename IS NULL FROM app_release_patch ORDER BY from_release_id"
+            ).fetchall(),
+            [(4, "published", 0), (5, "not_worth_it", 1), (6, "published", 0)],
+        )
+
+
+class GenerateReleasePatchesTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.releases_dir = Path(self.temporary_directory.name)
+        resolver = patch.object(
+            app_update_patches,
+            "resolve_release_file_path",
+            side_effect=lambda relative: self.releases_dir / relative,
+        )
+        resolver.start()
+        self.addCleanup(resolver.stop)
+
+    def write_release(self, version_code: int, content: bytes) -> dict:
+        relative = f"releases/android/remihub-v{version_code}.apk"
+        path = self.releases_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        return {
+            "id": version_code,
+            "version_code": version_code,
+            "apk_filename": path.name,
+            "apk_relative_path": relative,
+            "apk_sha256": hashlib.sha256(content).hexdigest(),
+            "file_size_bytes": len(content),
+        }
+
+    def test_source_that_no_longer_matches_its_hash_is_skipped(self):
+        target = self.write_release(66, APK_BYTES)
+        source = {**self.write_release(65, APK_BYTES[:-1]), "apk_sha256": "0" * 64}
+
+        with (
+            patch.object(app_update_patches, "_patch_candidates", return_value=(target, [source])),
+            patch.object(app_update_patches, "build_release_patch") as build_release_patch,
+            patch.object(app_update_patches, "_record_patch") as record_patch,
+        ):
+            results = app_update_patches.generate_release_patches("android")
+
+        self.assertEqual(results[0]["status"], "skipped")
+        build_release_patch.assert_not_called()
+        record_patch.assert_not_called()
+
+    @unittest.skipUnless(importlib.util.find_spec("bsdiff4"), "bsdiff4 is not installed")
+    def test_small_change_is_published_as_a_verified_patch(self):
+        target = self.write_release(66, APK_BYTES[:8000] + b"new resources" + APK_BYTES[8000:])
+        source = self.write_release(65, APK_BYTES)
+
+        with (
+            patch.object(app_update_patches, "_patch_candidates", return_value=(target, [source])),
+            patch.object(app_update_patches, "_record_patch") as record_patch,
+        ):
+            results = app_update_patches.generate_release_patches("android")
+
+        self.assertEqual(results[0]["status"], "created")
+        self.assertLess(results[0]["patch_size_bytes"], target["file_size_bytes"])
+        self.assertTrue((self.releases_dir / results[0]["patch_relative_path"]).is_file())
+        record_patch.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
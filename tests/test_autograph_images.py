@@ -0,0 +1,137 @@
+import asyncio
+import hashlib
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+from starlette.datastructures import Headers
+
+from backend.services import autograph_images
+
+
+def png_bytes(width=2000, height=1000) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 30, 30)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def upload(contents: bytes, content_type="image/png") -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(contents),
+        filename="autograph.png",
+        headers=Headers({"content-type": content_type}),
+    )
+
+
+class AutographImageTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.temporary_directory.name)
+        self.patches = [
+            patch.object(autograph_images, "AUTOGRAPH_IMAGE_DIR", self.root),
+            patch.object(autograph_images, "UPLOAD_CHUNK_BYTES", 1024),
+        ]
+        for active_patch in self.patches:
+            active_patch.start()
+
+    def tearDown(self):
+        for active_patch in reversed(self.patches):
+            active_patch.stop()
+        self.temporary_directory.cleanup()
+
+    def store(self, contents: bytes) -> str:
+        with patch.object(autograph_images, "schedule_image_derivatives"):
+            result = asyncio.run(autograph_images.upload_autograph_image(upload(contents)))
+        return result["filename"]
+
+    def test_upload_is_stored_under_content_hash_and_deduplicated(self):
+        contents = png_bytes()
+
+        first = self.store(contents)
+        second = self.store(contents)
+
+        self.assertEqual(first, f"{hashlib.sha256(contents).hexdigest()}.png")
+        self.assertEqual(first, second)
+        self.assertEqual([path.name for path in self.root.iterdir()], [first])
+
+    def test_oversized_upload_is_rejected_without_leaving_temp_files(self):
+        with patch.object(autograph_images, "MAX_IMAGE_SIZE_BYTES", 4096):
+            with self.assertRaises(HTTPException) as raised:
+                self.store(b"x" * 5000)
+
+        self.assertEqual(raised.exception.status_code, 400)
+        self.assertEqual(list(self.root.iterdir()), [])
+
+    def test_derivatives_are_bounded_webp_files(self):
+        filename = self.store(png_bytes())
+
+        written = autograph_images.generate_image_derivatives(filename)
+
+        self.assertEqual(len(written), 2)
+        with Image.open(autograph_images.derivative_path(filename, "thumb")) as thumb:
+            self.assertEqual(thumb.format, "WEBP")
+            self.assertEqual(thumb.size, (320, 160))
+
+    def test_served_derivative_has_immutable_cache_headers_and_etag(self):
+        filename = self.store(png_bytes())
+        autograph_images.generate_image_derivatives(filename)
+
+        response = autograph_images.get_autograph_image(filename, size="thumb")
+
+        self.assertEqual(Path(response.path), autograph_images.derivative_path(filename, "thumb"))
+        self.assertEqual(response.headers["cache-control"], autograph_images.IMMUTABLE_CACHE_CONTROL)
+
+        cached = autograph_images.get_autograph_image(
+            filename,
+            size="thumb",
+            if_none_match=response.headers["etag"],
+        )
+        self.assertEqual(cached.status_code, 304)
+
+    def test_missing_derivative_falls_back_to_original_and_is_scheduled(self):
+        filename = self.store(png_bytes())
+
+        with patch.object(autograph_images, "schedule_image_derivatives") as schedule:
+            response = autograph_images.get_autograph_image(filename, size="medium")
+
+        schedule.assert_called_once_with(filename)
+        self.assertEqual(Path(response.path), self.root / filename)
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+    def test_failed_derivative_is_not_rescheduled_until_retry_after(self):
+        filename = self.store(png_bytes())
+        (self.root / filename).write_bytes(b"not an image")
+        self.addCleanup(autograph_images._derivative_retry_after.clear)
+        self.addCleanup(autograph_images._derivatives_pending.clear)
+
+        with self.assertLogs("autograph_images", "ERROR"):
+            autograph_images.schedule_image_derivatives(filename).result(timeout=5)
+
+        with patch.object(autograph_images._derivative_executor, "submit") as submit:
+            for _ in range(3):
+                response = autograph_images.get_autograph_image(filename, size="thumb")
+            submit.assert_not_called()
+
+            with patch.object(
+                autograph_images.time,
+                "monotonic",
+                return_value=autograph_images._derivative_retry_after[filename],
+            ):
+                autograph_images.get_autograph_image(filename, size="thumb")
+            submit.assert_called_once()
+
+        self.assertEqual(Path(response.path), self.root / filename)
+
+    def test_unsafe_filenames_are_not_served(self):
+        with self.assertRaises(HTTPException) as raised:
+            autograph_images.get_autograph_image("../secrets.png")
+
+        self.assertEqual(raised.exception.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
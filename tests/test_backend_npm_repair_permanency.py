@@ -553,15 +553,19 @@ Path({str(marker)!r}).write_text('ran')
 if sys.argv[1:3] == ['ci', '--ignore-scripts']:
     if not (Path(os.environ['NPM_CONFIG_CACHE']) / 'dependency-token').is_file():
         raise SystemExit('prepared cache was not supplied')
-    Path('node_modules').mkdir(exist_ok=True)
+    Path('node_modules/fixture-dependency').mkdir(parents=True, exist_ok=True)
+    Path('node_modules/fixture-dependency/index.js').write_text('module.exports = 1;')
 elif sys.argv[1:] == ['run', 'lint']:
     pass
 elif sys.argv[1:] == ['run', 'build']:
+    if not Path('node_modules/fixture-dependency/index.js').is_file():
+        raise SystemExit('installed dependencies were not linked')
     counter = Path({str(counter)!r})
     value = int(counter.read_text()) + 1 if counter.exists() else 1
     counter.write_text(str(value))
     Path('dist').mkdir(exist_ok=True)
-    output = str(value) if {mismatched!r} else 'stable'
+    # Builds run concurrently, so the injected difference is per staging tree.
+    output = os.getcwd() if {mismatched!r} else 'stable'
     Path('dist/index.html').write_text(output)
 else:
     raise SystemExit('unexpected npm arguments: ' + repr(sys.argv[1:]))
@@ -608,6 +612,52 @@ else:
             2,
         )
 
+    def test_same_lockfile_reuses_installed_dependencies(self):
+        builder, candidate, _ = self._builder_fixture()
+        first = self._build(builder, candidate)
+        second = self._build(builder, candidate)
+
+        def install_count(evidence):
+            return sum(
+                command["command"].endswith("ci --ignore-scripts")
+                for command in evidence.commands
+            )
+
+        self.assertEqual(install_count(first), 1)
+        self.assertEqual(install_count(second), 0)
+        self.assertIn(
+            "reuse installed node_modules",
+            [command["command"] for command in second.commands],
+        )
+        self.assertTrue(second.reproducibility["concurrent_builds"])
+        installed = next(
+            (self.root / "artifacts" / ".node-modules").glob("*/node_modules")
+        )
+        self.assertFalse(
+            (installed / "fixture-dependency" / "index.js").stat().st_mode & 0o222
+        )
+
+    def test_changed_installed_dependencies_are_reinstalled(self):
+        builder, candidate, _ = self._builder_fixture()
+        self._build(builder, candidate)
+        installed = next(
+            (self.root / "artifacts" / ".node-modules").glob("*/node_modules")
+        )
+        dependency = installed / "fixture-dependency" / "index.js"
+        dependency.chmod(0o644)
+        dependency.write_text("module.exports = 2;", encoding="utf-8")
+
+        evidence = self._build(builder, candidate)
+
+        self.assertIn(
+            f"{builder.npm_binary} ci --ignore-scripts",
+            [command["command"] for command in evidence.commands],
+        )
+        self.assertEqual(
+            (installed / "fixture-dependency" / "index.js").read_text(encoding="utf-8"),
+            "module.exports = 1;",
+        )
+
     def test_injected_artifact_difference_fails_closed(self):
         builder, candidate, _ = self._builder_fixture(mismatched=True)
         with self.assertRaisesRegex(
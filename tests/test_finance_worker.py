@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from backend.tasks import finance_worker
+
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+TTL = timedelta(days=7)
+RETRY = timedelta(hours=6)
+
+
+class FakeValuationCache:
+    """Holds finance_valuation_cache rows the way the worker's queries use them."""
+
+    def __init__(self, *rows):
+        self.rows = {row["valuation_key"]: row for row in rows}
+
+    def get_cached_valuations(self):
+        return [dict(row) for row in self.rows.values()]
+
+    def store_valuation_items(self, *, provider, items, attempted_at):
+        for item in items:
+            self.rows[item["valuation_key"]] = cached_row(
+                item["valuation_key"],
+                provider=provider,
+                value=item["value"],
+                fetched_at=attempted_at,
+            )
+
+    def record_valuation_failure(self, *, valuation_keys, error, attempted_at):
+        for valuation_key in valuation_keys:
+            if valuation_key in self.rows:
+                self.rows[valuation_key].update(last_attempt_at=attempted_at, last_error=error)
+
+
+def cached_row(
+    valuation_key="home_primary",
+    *,
+    provider="zillow",
+    value="450000.00",
+    fetched_at,
+    last_attempt_at=None,
+    last_error=None,
+):
+    return {
+        "valuation_key": valuation_key,
+        "provider": provider,
+        "label": "Home",
+        "asset_category": "home",
+        "value": value,
+        "confidence": "estimate",
+        "raw_payload": {},
+        "fetched_at": fetched_at,
+        "last_attempt_at": last_attempt_at or fetched_at,
+        "last_error": last_error,
+    }
+
+
+class ValuationCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.fetch = MagicMock(return_value=[])
+        self.cache = FakeValuationCache()
+        for patcher in (
+            patch.dict(
+                finance_worker.VALUATION_PROVIDERS,
+                {
+                    "zillow": {
+                        "fetch": self.fetch,
+                        "configured_keys": lambda: ["home_primary"],
+                        "asset_category": "home",
+                    }
+                },
+                clear=True,
+            ),
+            patch.dict(finance_worker._valuation_provider_attempts, clear=True),
+            patch.object(finance_worker, "_valuation_provider_ttls", return_value={"zillow": TTL}),
+            patch.object(finance_worker, "_valuation_retry_interval", return_value=RETRY),
+            patch.object(finance_worker, "get_cached_valuations", side_effect=lambda: self.cache.get_cached_valuations()),
+            patch.object(finance_worker, "store_valuation_items", side_effect=lambda **kwargs: self.cache.store_valuation_items(**kwargs)),
+            patch.object(finance_worker, "record_valuation_failure", side_effect=lambda **kwargs: self.cache.record_valuation_failure(**kwargs)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def refresh(self):
+        with patch.object(finance_worker, "datetime", wraps=datetime) as clock:
+            clock.now.return_value = NOW
+            return finance_worker.refresh_valuation_cache()
+
+    def test_provider_is_refreshed_only_after_its_ttl(self):
+        self.cache = FakeValuationCache(cached_row(fetched_at=NOW - TTL + timedelta(hours=1)))
+        self.assertEqual(self.refresh(), [])
+
+        self.cache = FakeValuationCache(cached_row(fetched_at=NOW - TTL))
+        self.fetch.return_value = [{"valuation_key": "home_primary", "label": "Home", "value": "470000.00"}]
+
+        self.assertEqual(self.refresh(), [{"provider": "zillow", "refreshed": ["home_primary"], "failed": []}])
+        self.assertEqual(self.cache.rows["home_primary"]["fetched_at"], NOW)
+
+    def test_failure_persisted_by_an_earlier_process_delays_the_retry(self):
+        self.cache = FakeValuationCache(
+            cached_row(
+                fetched_at=NOW - TTL * 2,
+                last_attempt_at=NOW - RETRY + timedelta(minutes=5),
+                last_error="blocked",
+            )
+        )
+
+        self.assertEqual(self.refresh(), [])
+        self.fetch.assert_not_called()
+
+        self.cache.rows["home_primary"]["last_attempt_at"] = NOW - RETRY
+        finance_worker._valuation_provider_attempts.clear()
+        self.assertEqual(self.refresh(), [{"provider": "zillow", "refreshed": [], "failed": ["home_primary"]}])
+
+    def test_failed_refresh_keeps_the_last_good_value_and_flags_it_stale(self):
+        self.cache = FakeValuationCache(cached_row(fetched_at=NOW - TTL - timedelta(days=1)))
+        self.fetch.side_effect = RuntimeError("captcha")
+
+        self.assertEqual(self.refresh(), [{"provider": "zillow", "refreshed": [], "failed": ["home_primary"]}])
+        items = finance_worker.collect_cached_valuation_items(now=NOW)
+
+        self.assertEqual([item["value"] for item in items], [Decimal("450000.00")])
+        self.assertEqual(items[0]["raw_payload"]["cache"]["last_error"], "captcha")
+        self.assertTrue(items[0]["raw_payload"]["cache"]["stale"])
+        self.assertEqual(finance_worker._stale_valuation_keys(items), ["home_primary"])
+
+    def test_keys_removed_from_config_are_left_out_of_snapshots(self):
+        self.cache = FakeValuationCache(
+            cached_row(fetched_at=NOW - timedelta(days=1)),
+            cached_row("vehicle_telluride", provider="kbb", fetched_at=NOW - timedelta(days=1)),
+            cached_row("vehicle_camry", provider="kbb", fetched_at=NOW - TTL * 3),
+        )
+        kbb = {"fetch": MagicMock(), "configured_keys": lambda: ["vehicle_telluride"], "asset_category": "vehicle"}
+
+        with (
+            patch.dict(finance_worker.VALUATION_PROVIDERS, {"kbb": kbb}),
+            patch.object(finance_worker, "_valuation_provider_ttls", return_value={"zillow": TTL, "kbb": TTL}),
+        ):
+            items = finance_worker.collect_cached_valuation_items(now=NOW)
+
+        self.assertEqual(
+            [item["valuation_key"] for item in items],
+            ["home_primary", "vehicle_telluride"],
+        )
+        self.assertEqual(finance_worker._stale_valuation_keys(items), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from backend.services.race import leaderboard
+from backend.services.race.leaderboard_parser import parse_leaderboard_html, parse_track_flag
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def captured_page(name: str) -> str:
+    return (PROJECT_ROOT / name).read_bytes().decode("utf-8", errors="replace")
+
+
+def timing_row(position, car, status="Active", speed="221.5", laps="42", attrs=""):
+    cells = [f"<td>{position}</td>"] + ["<td></td>"] * 16
+    cells[1] = f'<td><img src="/media/Endplates/{car}-Red-T.png"><div class="hidden">ignored</div></td>'
+    cells[2] = f"<td><div>{status}</div></td>"
+    cells[5] = f"<td>{speed}</td>"
+    cells[14] = f"<td>{laps}</td>"
+    return f"<tr{attrs}>{''.join(cells)}</tr>"
+
+
+def timing_page(*rows, wrapper_class="") -> str:
+    return (
+        f'<div class="{wrapper_class}"><table><thead><tr><th>POS</th></tr></thead>'
+        f"<tbody>{''.join(rows)}</tbody></table></div>"
+    )
+
+
+class ParseLeaderboardHtmlTests(unittest.TestCase):
+    def test_captured_pages_yield_one_visible_table(self):
+        for name, expected_rows in (
+            ("leaderboard.html", 8),
+            ("cleaned_leaderboard.html", 34),
+            ("cached_leaderboard_test.html", 33),
+        ):
+            with self.subTest(name=name):
+                rows = parse_leaderboard_html(captured_page(name))
+
+                self.assertEqual([row["position"] for row in rows], list(range(1, expected_rows + 1)))
+
+    def test_captured_row_matches_the_rendered_cells(self):
+        rows = parse_leaderboard_html(captured_page("cleaned_leaderboard.html"))
+
+        self.assertEqual(
+            rows[0],
+            {"position": 1, "laps": 89, "speed": 223.993, "number": "10", "status": "Active"},
+        )
+
+    def test_track_flag_is_read_from_the_page_header(self):
+        self.assertEqual(parse_track_flag(captured_page("leaderboard.html")), "GREEN")
+        self.assertIsNone(parse_track_flag(captured_page("cleaned_leaderboard.html")))
+
+    def test_rows_hidden_at_the_browser_viewport_are_skipped(self):
+        html = (
+            timing_page(timing_row(1, 5), wrapper_class="lg:hidden")
+            + timing_page(timing_row(1, 7), timing_row(2, 9, attrs=' style="display: none"'), wrapper_class="hidden lg:flex")
+        )
+
+        self.assertEqual(
+            parse_leaderboard_html(html),
+            [{"position": 1, "laps": 42, "speed": 221.5, "number": "7", "status": "Active"}],
+        )
+
+    def test_unparseable_cells_fall_back_like_the_locator_path(self):
+        html = timing_page(
+            "<tr><td>POS</td></tr>",
+            timing_row("T2", "x", status="In Pit", speed="--", laps="-"),
+        )
+
+        self.assertEqual(
+            parse_leaderboard_html(html),
+            [{"position": 2, "laps": 0, "speed": 0.0, "number": "UNKNOWN", "status": "In Pit"}],
+        )
+
+
+class LeaderboardScrapeModeTests(unittest.TestCase):
+    def test_browser_snapshot_is_parsed_in_python(self):
+        page = MagicMock()
+        page.content.return_value = '<div class="section-header mt-1">YELLOW</div>' + timing_page(timing_row(1, 27))
+
+        with patch.object(leaderboard, "_get_or_create_page", return_value=page):
+            rows, track_flag = leaderboard._get_leaderboard_data_blocking()
+
+        self.assertEqual(rows[0]["number"], "27")
+        self.assertEqual(track_flag, "YELLOW")
+        page.content.assert_called_once_with()
+        page.locator.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
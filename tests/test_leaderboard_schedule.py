@@ -0,0 +1,174 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.services.race import draft, leaderboard, race_service
+from backend.services.race.leaderboard_schedule import (
+    BASE_INTERVAL_SECONDS,
+    CAUTION_INTERVAL_SECONDS,
+    MAX_INTERVAL_SECONDS,
+    MIN_INTERVAL_SECONDS,
+    LeaderboardRefreshSchedule,
+    position_change_share,
+)
+
+
+def field(*order):
+    return [{"number": number, "position": position} for position, number in enumerate(order, 1)]
+
+
+CARS = [str(number) for number in range(1, 21)]
+
+
+class LeaderboardRefreshScheduleTests(unittest.TestCase):
+    def test_position_share_counts_cars_that_moved_joined_or_left(self):
+        previous = {"3": 1, "10": 2, "27": 3}
+        current = {"10": 1, "3": 2, "27": 3, "60": 4}
+
+        self.assertEqual(position_change_share(previous, current), 3 / 4)
+
+    def test_first_scrape_uses_the_base_interval(self):
+        schedule = LeaderboardRefreshSchedule()
+
+        self.assertEqual(schedule.record_scrape(field(*CARS), "GREEN", 0.4), BASE_INTERVAL_SECONDS)
+        self.assertIsNone(schedule.change_rate)
+
+    def test_busy_field_tightens_and_settled_field_backs_off(self):
+        schedule = LeaderboardRefreshSchedule()
+        schedule.record_scrape(field(*CARS), "GREEN", 0.4)
+
+        shuffled = CARS[5:] + CARS[:5]
+        self.assertEqual(schedule.record_scrape(field(*shuffled), "GREEN", 0.4), MIN_INTERVAL_SECONDS)
+
+        intervals = [schedule.record_scrape(field(*shuffled), "GREEN", 0.4) for _ in range(12)]
+        self.assertEqual(intervals, sorted(intervals))
+        self.assertEqual(intervals[-1], MAX_INTERVAL_SECONDS)
+
+    def test_caution_backs_off_and_the_restart_tightens(self):
+        schedule = LeaderboardRefreshSchedule()
+        schedule.record_scrape(field(*CARS), "GREEN", 0.4)
+
+        self.assertEqual(schedule.record_scrape(field(*CARS), "YELLOW", 0.4), CAUTION_INTERVAL_SECONDS)
+        self.assertEqual(schedule.record_scrape(field(*CARS), "GREEN", 0.4), MIN_INTERVAL_SECONDS)
+        self.assertEqual(schedule.record_scrape(field(*CARS), "WHITE", 0.4), MIN_INTERVAL_SECONDS)
+        self.assertEqual(schedule.record_scrape(field(*CARS), "CHECKERED", 0.4), MAX_INTERVAL_SECONDS)
+
+    def test_failures_back_off_until_a_scrape_succeeds(self):
+        schedule = LeaderboardRefreshSchedule()
+
+        intervals = [schedule.record_failure(30.0) for _ in range(3)]
+
+        self.assertEqual(intervals, [30, MAX_INTERVAL_SECONDS, MAX_INTERVAL_SECONDS])
+        schedule.record_scrape(field(*CARS), "GREEN", 0.5)
+        self.assertEqual(
+            {key: value for key, value in schedule.snapshot().items() if key != "lastScrapeAt"},
+            {
+                "intervalSeconds": BASE_INTERVAL_SECONDS,
+                "effectiveIntervalSeconds": BASE_INTERVAL_SECONDS + 0.5,
+                "changeRate": None,
+                "trackFlag": "GREEN",
+                "lastScrapeMs": 500.0,
+                "consecutiveFailures": 0,
+                "scrapes": 1,
+                "failures": 3,
+            },
+        )
+
+
+class RaceStatusCacheTests(unittest.TestCase):
+    def setUp(self):
+        for patcher in (
+            patch.object(leaderboard, "_race_active", None),
+            patch.object(leaderboard, "_race_active_checked_at", 0.0),
+            patch.object(leaderboard, "_race_status_generation", 0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_status_is_read_once_until_it_is_changed(self):
+        connection = MagicMock()
+        with (
+            patch.object(leaderboard, "_load_race_active", side_effect=[True, False]) as load,
+            patch.object(draft, "get_db_conn", return_value=connection),
+            patch.object(draft, "put_db_conn"),
+        ):
+            self.assertTrue(leaderboard.should_fetch_leaderboard())
+            self.assertTrue(leaderboard.should_fetch_leaderboard())
+            self.assertEqual(load.call_count, 1)
+
+            draft.set_race_draft_status("RACE_COMPLETED")
+
+            self.assertFalse(leaderboard.should_fetch_leaderboard())
+        self.assertEqual(load.call_count, 2)
+        connection.commit.assert_called_once_with()
+
+    def test_answer_read_across_a_status_change_is_not_cached(self):
+        def load_while_status_changes():
+            leaderboard.invalidate_race_status()
+            return True
+
+        with patch.object(leaderboard, "_load_race_active", side_effect=load_while_status_changes) as load:
+            self.assertTrue(leaderboard.should_fetch_leaderboard())
+            self.assertTrue(leaderboard.should_fetch_leaderboard())
+
+        self.assertEqual(load.call_count, 2)
+
+    def test_database_errors_are_not_cached(self):
+        with patch.object(leaderboard, "_load_race_active", side_effect=[RuntimeError("down"), True]):
+            self.assertFalse(leaderboard.should_fetch_leaderboard())
+            self.assertTrue(leaderboard.should_fetch_leaderboard())
+
+
+class UpdateLeaderboardLoopTests(unittest.TestCase):
+    def run_loop(self, scrapes, race_active=True, cycles=3):
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+            if len(delays) == cycles:
+                raise asyncio.CancelledError
+
+        with (
+            patch.object(race_service, "should_fetch_leaderboard", return_value=race_active),
+            patch.object(race_service, "update_leaderboard_and_standings", AsyncMock(side_effect=scrapes)),
+            patch.object(race_service.asyncio, "sleep", sleep),
+            patch("builtins.print"),
+        ):
+            with self.assertRaises(asyncio.CancelledError):
+                asyncio.run(race_service.update_leaderboard_loop())
+        return delays
+
+    def test_loop_sleeps_for_the_scheduled_interval(self):
+        delays = self.run_loop(
+            [
+                (field(*CARS), "GREEN"),
+                RuntimeError("timeout"),
+                (field(*CARS), "YELLOW"),
+            ]
+        )
+
+        self.assertEqual(delays, [BASE_INTERVAL_SECONDS, 30, CAUTION_INTERVAL_SECONDS])
+        status = race_service._leaderboard_schedule.snapshot()
+        self.assertEqual((status["scrapes"], status["failures"]), (2, 1))
+
+    def test_idle_loop_polls_the_cached_status(self):
+        self.assertEqual(self.run_loop([], race_active=False, cycles=2), [race_service.LEADERBOARD_UPDATE_DELAY] * 2)
+
+
+class LeaderboardScrapeFailureTests(unittest.TestCase):
+    def test_failed_scrape_raises_instead_of_clearing_the_leaderboard(self):
+        with (
+            patch.object(leaderboard, "_get_leaderboard_data_blocking", side_effect=RuntimeError("timeout")),
+            patch.object(leaderboard, "_reset_browser") as reset_browser,
+            patch.object(leaderboard, "get_db_conn") as get_db_conn,
+            patch("builtins.print"),
+        ):
+            with self.assertRaises(RuntimeError):
+                asyncio.run(leaderboard.save_leaderboard_to_db())
+
+        reset_browser.assert_called_once_with()
+        get_db_conn.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
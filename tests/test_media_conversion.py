@@ -0,0 +1,191 @@
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from backend.services import media_conversion_service
+from backend.tasks import media_conversion
+
+
+FAKE_FFMPEG = """#!/bin/sh
+for last; do :; done
+printf 'out_time_us=30000000\\nspeed=2.0x\\nprogress=continue\\n'
+printf 'out_time_us=60000000\\nspeed=2.0x\\nprogress=continue\\n'
+printf 'fake ffmpeg log line\\n' >&2
+if [ -n "$FAKE_FFMPEG_FAIL" ]; then
+    printf 'fatal remux error\\n' >&2
+    exit 1
+fi
+printf 'matroska' > "$last"
+printf 'out_time_us=120000000\\nspeed=2.0x\\nprogress=end\\n'
+"""
+
+FAKE_FFPROBE = """#!/bin/sh
+echo 120.0
+"""
+
+
+class FfmpegProgressParserTests(unittest.TestCase):
+    def feed_block(self, parser, lines):
+        snapshots = [parser.feed(line) for line in lines]
+        return [snapshot for snapshot in snapshots if snapshot is not None]
+
+    def test_block_produces_percent_and_eta(self):
+        parser = media_conversion.FfmpegProgressParser(duration_seconds=100)
+
+        snapshots = self.feed_block(
+            parser,
+            ["frame=10\n", "out_time_us=25000000\n", "speed=1.5x\n", "progress=continue\n"],
+        )
+
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0].percent, 25.0)
+        self.assertEqual(snapshots[0].eta_seconds, 50.0)
+        self.assertFalse(snapshots[0].done)
+
+    def test_end_block_reports_complete(self):
+        parser = media_conversion.FfmpegProgressParser(duration_seconds=100)
+
+        snapshots = self.feed_block(parser, ["out_time_us=99000000\n", "progress=end\n"])
+
+        self.assertEqual(snapshots[0].percent, 100.0)
+        self.assertEqual(snapshots[0].eta_seconds, 0.0)
+        self.assertTrue(snapshots[0].done)
+
+    def test_unknown_duration_and_speed_are_tolerated(self):
+        parser = media_conversion.FfmpegProgressParser(duration_seconds=None)
+
+        snapshots = self.feed_block(
+            parser,
+            ["out_time_us=N/A\n", "speed=N/A\n", "progress=continue\n"],
+        )
+
+        self.assertIsNone(snapshots[0].percent)
+        self.assertIsNone(snapshots[0].eta_seconds)
+        self.assertIsNone(snapshots[0].speed)
+
+
+class ConvertMp4ToMkvTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.temporary_directory.name)
+        bin_dir = self.root / "bin"
+        bin_dir.mkdir()
+        for name, script in (("ffmpeg", FAKE_FFMPEG), ("ffprobe", FAKE_FFPROBE)):
+            path = bin_dir / name
+            path.write_text(script, encoding="utf-8")
+            path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+        self.path_patch = patch.dict(
+            os.environ,
+            {"PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"},
+        )
+        self.path_patch.start()
+
+        self.source = self.root / "Movies" / "Example (2020).mp4"
+        self.source.parent.mkdir()
+        self.source.write_bytes(b"mp4")
+
+    def tearDown(self):
+        self.path_patch.stop()
+        self.temporary_directory.cleanup()
+
+    def test_streams_progress_and_moves_output_into_place(self):
+        updates = []
+
+        result = media_conversion.convert_mp4_to_mkv(
+            self.source,
+            delete_source=True,
+            on_progress=updates.append,
+        )
+
+        self.assertEqual(result.status, "converted")
+        self.assertEqual(self.source.with_suffix(".mkv").read_text(), "matroska")
+        self.assertFalse(self.source.exists())
+        self.assertEqual([update.percent for update in updates], [25.0, 50.0, 100.0])
+        self.assertEqual(updates[0].eta_seconds, 45.0)
+        self.assertTrue(updates[-1].done)
+
+    def test_failure_reports_stderr_tail_and_keeps_source(self):
+        with patch.dict(os.environ, {"FAKE_FFMPEG_FAIL": "1"}):
+            result = media_conversion.convert_mp4_to_mkv(
+                self.source,
+                delete_source=True,
+            )
+
+        self.assertEqual(result.status, "failed")
+        self.assertIn("fatal remux error", result.message)
+        self.assertTrue(self.source.exists())
+        self.assertFalse(self.source.with_suffix(".mkv").exists())
+        self.assertEqual(list(self.source.parent.glob(".*.remuxing.mkv")), [])
+
+
+class MediaConversionQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.temporary_directory.name).resolve()
+        self.roots_patch = patch.object(
+            media_conversion_service,
+            "MEDIA_CONVERSION_ROOTS",
+            (self.root,),
+        )
+        self.roots_patch.start()
+
+    def tearDown(self):
+        self.roots_patch.stop()
+        self.temporary_directory.cleanup()
+
+    def test_iter_mp4_files_walks_tree_and_skips_artifacts(self):
+        (self.root / "A").mkdir()
+        (self.root / "A" / "Movie.MP4").write_bytes(b"")
+        (self.root / "A" / ".Movie.remuxing.mp4").write_bytes(b"")
+        (self.root / "B.mkv").write_bytes(b"")
+        (self.root / "C.mp4").write_bytes(b"")
+
+        found = sorted(path.name for path in media_conversion.iter_mp4_files(self.root))
+
+        self.assertEqual(found, ["C.mp4", "Movie.MP4"])
+
+    def test_iter_mp4_files_yields_in_path_order(self):
+        for relative in ("b/2.mp4", "a/z/9.mp4", "B.mp4", "a/1.mp4", "a.mp4", "c/x/y/0.mp4"):
+            path = self.root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+
+        found = list(media_conversion.iter_mp4_files(self.root))
+
+        self.assertEqual(found, sorted(self.root.rglob("*.mp4")))
+
+    def test_paths_outside_configured_roots_are_rejected(self):
+        with self.assertRaises(media_conversion_service.MediaConversionPathError):
+            media_conversion_service.resolve_conversion_path("/etc/passwd.mp4")
+
+        with self.assertRaises(media_conversion_service.MediaConversionPathError):
+            media_conversion_service.resolve_conversion_path(self.root / ".." / "x.mp4")
+
+    def test_root_scan_honors_limit(self):
+        for index in range(5):
+            (self.root / f"{index}.mp4").write_bytes(b"")
+
+        sources = media_conversion_service.collect_conversion_sources(
+            media_conversion_service.MediaConversionEnqueueRequest(
+                root=str(self.root),
+                limit=3,
+            )
+        )
+
+        self.assertEqual(len(sources), 3)
+
+    def test_non_mp4_paths_are_rejected(self):
+        with self.assertRaises(media_conversion_service.MediaConversionPathError):
+            media_conversion_service.collect_conversion_sources(
+                media_conversion_service.MediaConversionEnqueueRequest(
+                    paths=[str(self.root / "movie.mkv")],
+                )
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from backend.services import media_name_parser
+from backend.services.media_name_parser import (
+    MediaNameError,
+    MediaNameParser,
+    SeriesDirectoryCache,
+)
+
+
+CORPUS_PATH = Path(__file__).resolve().parent / "fixtures" / "media_release_names.jsonl"
+
+
+def load_corpus() -> list[dict]:
+    with CORPUS_PATH.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def parse_case(parser: MediaNameParser, case: dict):
+    if case["library"] == "TV":
+        try:
+            parsed = parser.parse_tv(case["name"])
+        except MediaNameError:
+            return {"error": True}
+        return {
+            "series_dir": parsed.series_dir,
+            "season_dir": parsed.season_dir,
+            "file_name": parsed.file_name,
+        }
+
+    parsed = parser.parse_movie(case["name"])
+    return None if parsed is None else {"file_name": parsed.file_name}
+
+
+class MediaNameCorpusTests(unittest.TestCase):
+    def test_corpus_matches_recorded_library_names(self):
+        parser = MediaNameParser()
+        corpus = load_corpus()
+
+        self.assertGreaterEqual(len(corpus), 3000)
+        mismatches = [
+            (case["name"], case["expected"], actual)
+            for case in corpus
+            if (actual := parse_case(parser, case)) != case["expected"]
+        ]
+
+        self.assertEqual(mismatches, [])
+
+
+class MediaNameParserTests(unittest.TestCase):
+    def test_episode_with_year_resolution_and_title(self):
+        parsed = MediaNameParser().parse_tv(
+            "The White Princess (2017) - S01E07 - Two Kings (1080p BluRay x265 RCVR).mkv"
+        )
+
+        self.assertEqual(parsed.series_dir, "The White Princess (2017)")
+        self.assertEqual(parsed.season_dir, "Season 01")
+        self.assertEqual(
+            parsed.file_name,
+            "The White Princess (2017) - S01E07 - Two Kings.mkv",
+        )
+
+    def test_builtin_aliases_and_token_fixes(self):
+        parser = MediaNameParser()
+
+        self.assertEqual(
+            parser.parse_tv("MXC.S02E03.mkv").series,
+            "MXC Most Extreme Elimination Challenge",
+        )
+        self.assertEqual(
+            parser.parse_tv("Bbc.Planet.Earth.II.Frozen.S01E01.mkv").series,
+            "BBC Planet Earth II Frozen",
+        )
+
+    def test_configured_alias_overrides_series_name(self):
+        parser = MediaNameParser(series_aliases={"the office us": "The Office (US)"})
+
+        parsed = parser.parse_tv("The.Office.US.S03E10.720p.mkv")
+
+        self.assertEqual(parsed.file_name, "The Office (US) - S03E10.mkv")
+
+    def test_extension_is_kept_whole(self):
+        parser = MediaNameParser()
+
+        self.assertEqual(
+            parser.parse_tv("Show.S01E02.Pilot.1080p.WEBRip.ts").file_name,
+            "Show - S01E02 - Pilot.ts",
+        )
+        self.assertEqual(
+            parser.parse_tv("Show.S01E02.Pilot.1080p.WEBRip.webm").file_name,
+            "Show - S01E02 - Pilot.webm",
+        )
+
+    def test_series_named_after_a_year_keeps_its_name(self):
+        parser = MediaNameParser()
+
+        parsed = parser.parse_tv("1923 - S08E19E20 - The Return - 720p - BluRay x265-RCVR.ts")
+        self.assertEqual(parsed.series_dir, "1923")
+        self.assertEqual(parsed.file_name, "1923 - S08E19 - The Return.ts")
+
+        parsed = parser.parse_tv("1883.2024.EP03.The.Long.Night.720p.WEB-DL.avi")
+        self.assertEqual(parsed.series_dir, "1883 (2024)")
+        self.assertEqual(parsed.file_name, "1883 (2024) - S01E03 - The Long Night.avi")
+
+    def test_movie_year_follows_the_title(self):
+        parser = MediaNameParser()
+
+        self.assertEqual(
+            parser.parse_movie("2001.A.Space.Odyssey.(1968).2160p.BluRay.mkv").file_name,
+            "2001 A Space Odyssey (1968).mkv",
+        )
+        self.assertEqual(
+            parser.parse_movie("Blade Runner (1982) 1080p.mp4").file_name,
+            "Blade Runner (1982).mp4",
+        )
+        self.assertIsNone(parser.parse_movie("Barbie 2160p.mp4"))
+
+    def test_missing_episode_marker_raises(self):
+        with self.assertRaises(MediaNameError):
+            MediaNameParser().parse_tv("Some.Show.Special.mkv")
+
+    def test_movie_without_year_is_not_parsed(self):
+        self.assertIsNone(MediaNameParser().parse_movie("Some Movie.mkv"))
+
+
+class SeriesDirectoryCacheTests(unittest.TestCase):
+    def test_directory_is_created_once_and_then_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = SeriesDirectoryCache()
+            season_dir = Path(temp_dir) / "TV" / "Show" / "Season 01"
+
+            self.assertTrue(cache.ensure(season_dir))
+
+            with patch.object(media_name_parser.os, "makedirs") as makedirs:
+                self.assertFalse(cache.ensure(season_dir))
+                self.assertFalse(cache.ensure(season_dir))
+
+            self.assertTrue(season_dir.is_dir())
+            makedirs.assert_not_called()
+
+    def test_invalidated_directory_is_recreated(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = SeriesDirectoryCache()
+            season_dir = Path(temp_dir) / "Season 01"
+            cache.ensure(season_dir)
+            season_dir.rmdir()
+
+            cache.invalidate(season_dir)
+
+            self.assertTrue(cache.ensure(season_dir))
+            self.assertTrue(season_dir.is_dir())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import MagicMock
 
+from backend.core.agent_deployment import AgentDeploymentError
 from backend.core.agent_deployment import GitBackendDeploymentManager
 from backend.core.agent_deployment import _expected_migration_history
 from backend.database.migration_runner import (
@@ -31,6 +32,14 @@ class MigrationDiscoveryTests(unittest.TestCase):
                 ("0007", "service_health_current_snapshot"),
                 ("0008", "mead_foundation"),
                 ("0009", "fitness_foundation"),
+                ("0010", "finance_valuation_cache"),
+                ("0011", "media_conversion_jobs"),
+                ("0012", "plex_ingested_downloads"),
+                ("0013", "race_draft_schedule"),
+                ("0014", "service_health_history"),
+                ("0015", "agent_claimable_run_indexes"),
+                ("0016", "agent_card_board"),
+                ("0017", "app_release_patches"),
             ],
         )
 
@@ -49,6 +58,14 @@ class MigrationDiscoveryTests(unittest.TestCase):
                 ("0007", "service_health_current_snapshot"),
                 ("0008", "mead_foundation"),
                 ("0009", "fitness_foundation"),
+                ("0010", "finance_valuation_cache"),
+                ("0011", "media_conversion_jobs"),
+                ("0012", "plex_ingested_downloads"),
+                ("0013", "race_draft_schedule"),
+                ("0014", "service_health_history"),
+                ("0015", "agent_claimable_run_indexes"),
+                ("0016", "agent_card_board"),
+                ("0017", "app_release_patches"),
             ],
         )
         self.assertTrue(all(len(item["checksum"]) == 64 for item in history))
@@ -130,6 +147,118 @@ class MigrationDiscoveryTests(unittest.TestCase):
         )
         GitBackendDeploymentManager._validate_migration_pair(up, down)
 
+    def test_finance_valuation_cache_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0010_finance_valuation_cache.up.sql"
+        down = MIGRATIONS_DIR / "0010_finance_valuation_cache.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+    def test_media_conversion_jobs_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0011_media_conversion_jobs.up.sql"
+        down = MIGRATIONS_DIR / "0011_media_conversion_jobs.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+    def test_plex_ingested_downloads_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0012_plex_ingested_downloads.up.sql"
+        down = MIGRATIONS_DIR / "0012_plex_ingested_downloads.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+    def test_race_draft_schedule_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0013_race_draft_schedule.up.sql"
+        down = MIGRATIONS_DIR / "0013_race_draft_schedule.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+    def test_service_health_history_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0014_service_health_history.up.sql"
+        down = MIGRATIONS_DIR / "0014_service_health_history.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+    def test_agent_claimable_run_indexes_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0015_agent_claimable_run_indexes.up.sql"
+        down = MIGRATIONS_DIR / "0015_agent_claimable_run_indexes.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+    def test_agent_card_board_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0016_agent_card_board.up.sql"
+        down = MIGRATIONS_DIR / "0016_agent_card_board.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+    def test_app_release_patch_migration_passes_deployment_policy(self):
+        up = MIGRATIONS_DIR / "0017_app_release_patches.up.sql"
+        down = MIGRATIONS_DIR / "0017_app_release_patches.down.sql"
+
+        GitBackendDeploymentManager._validate_migration_sql(
+            up,
+            direction="up",
+        )
+        GitBackendDeploymentManager._validate_migration_sql(
+            down,
+            direction="down",
+        )
+        GitBackendDeploymentManager._validate_migration_pair(up, down)
+
     def test_service_health_migration_is_current_state_only(self):
         up = (
             MIGRATIONS_DIR / "0007_service_health_current_snapshot.up.sql"
@@ -185,6 +314,21 @@ class MigrationDiscoveryTests(unittest.TestCase):
             with self.assertRaisesRegex(RuntimeError, "missing its up SQL"):
                 discover_migrations(migrations_dir)
 
+    def test_schema_qualified_index_drop_must_match_its_table_schema(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            up = Path(temp_dir) / "0001_index.up.sql"
+            down = Path(temp_dir) / "0001_index.down.sql"
+            up.write_text(
+                "CREATE INDEX widgets_name_idx ON agent.widgets (name);\n",
+                encoding="utf-8",
+            )
+            down.write_text("DROP INDEX agent.widgets_name_idx;\n", encoding="utf-8")
+            GitBackendDeploymentManager._validate_migration_pair(up, down)
+
+            down.write_text("DROP INDEX public.widgets_name_idx;\n", encoding="utf-8")
+            with self.assertRaisesRegex(AgentDeploymentError, "not created"):
+                GitBackendDeploymentManager._validate_migration_pair(up, down)
+
     def test_sha256_file_streams_file_content(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             path = Path(temp_dir) / "migration.sql"
@@ -0,0 +1,276 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from backend.core import inotify
+
+_LOG_DIRECTORY = tempfile.TemporaryDirectory()
+
+# The monitor configures a rotating log file at import time.
+with patch(
+    "backend.core.runtime_paths.ensure_log_directory",
+    return_value=Path(_LOG_DIRECTORY.name),
+):
+    from backend.tasks import plex_dl_monitor
+
+
+class InotifyWatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.temporary_directory.name)
+        self.watcher = inotify.InotifyWatcher(plex_dl_monitor.WATCH_MASK)
+        self.watcher.add_tree(self.root)
+
+    def tearDown(self):
+        self.watcher.close()
+        self.temporary_directory.cleanup()
+
+    def drain(self):
+        events = []
+        while batch := self.watcher.read_events(timeout=0.2):
+            events.extend(batch)
+        return events
+
+    def test_close_write_in_new_subdirectory_is_reported(self):
+        package = self.root / "Package"
+        package.mkdir()
+        self.drain()
+
+        (package / "Show.S01E01.mkv").write_bytes(b"episode")
+
+        events = self.drain()
+        self.assertTrue(
+            any(
+                event.path == package / "Show.S01E01.mkv"
+                and event.mask & inotify.IN_CLOSE_WRITE
+                for event in events
+            )
+        )
+
+    def test_rename_into_place_is_reported(self):
+        partial = self.root / "Movie.2020.mkv.part"
+        partial.write_bytes(b"movie")
+        self.drain()
+
+        partial.rename(self.root / "Movie.2020.mkv")
+
+        events = self.drain()
+        self.assertTrue(
+            any(
+                event.path == self.root / "Movie.2020.mkv"
+                and event.mask & inotify.IN_MOVED_TO
+                for event in events
+            )
+        )
+
+
+class CollectEventPathsTests(unittest.TestCase):
+    def test_events_are_grouped_by_library_and_partials_ignored(self):
+        sources = {"TV": Path("/downloads/TV"), "Movies": Path("/downloads/Movies")}
+        pending = {"TV": set(), "Movies": set()}
+        events = [
+            inotify.InotifyEvent(Path("/downloads/TV/a/Show.S01E01.mkv"), inotify.IN_CLOSE_WRITE, 0),
+            inotify.InotifyEvent(Path("/downloads/Movies/Movie.2020.mkv.encrypted"), inotify.IN_DELETE, 0),
+            inotify.InotifyEvent(Path("/downloads/Movies/Other.mkv"), inotify.IN_MOVED_FROM, 0),
+            inotify.InotifyEvent(Path("/elsewhere/file.mkv"), inotify.IN_CLOSE_WRITE, 0),
+        ]
+
+        overflowed = plex_dl_monitor.collect_event_paths(events, sources, pending)
+
+        self.assertFalse(overflowed)
+        self.assertEqual(pending["TV"], {Path("/downloads/TV/a/Show.S01E01.mkv")})
+        self.assertEqual(pending["Movies"], {Path("/downloads/Movies/Movie.2020.mkv")})
+
+    def test_overflow_requests_reconcile(self):
+        pending = {"TV": set()}
+        events = [inotify.InotifyEvent(Path("."), inotify.IN_Q_OVERFLOW, 0)]
+
+        self.assertTrue(
+            plex_dl_monitor.collect_event_paths(events, {"TV": Path("/tv")}, pending)
+        )
+
+
+class IngestDownloadsTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.temporary_directory.name)
+        self.src = self.root / "downloads" / "TV"
+        self.media = self.root / "media"
+        self.src.mkdir(parents=True)
+        self.media.mkdir()
+        self.recorded = []
+        self.processed_keys = set()
+        self.patches = [
+            patch.object(plex_dl_monitor, "BASE_DIR", self.root),
+            patch.object(
+                plex_dl_monitor,
+                "get_processed_download_keys",
+                side_effect=self.processed_download_keys,
+            ),
+            patch.object(
+                plex_dl_monitor,
+                "record_processed_downloads",
+                side_effect=self.recorded.extend,
+            ),
+        ]
+        for active_patch in self.patches:
+            active_patch.start()
+
+    def tearDown(self):
+        for active_patch in reversed(self.patches):
+            active_patch.stop()
+        self.temporary_directory.cleanup()
+
+    def processed_download_keys(self, keys):
+        recorded = {
+            (record["source_path"], record["source_size"], record["source_mtime_ns"])
+            for record in self.recorded
+            if record["status"] != "failed"
+        }
+        return (self.processed_keys | recorded) & set(keys)
+
+    def download(self, relative: str) -> Path:
+        path = self.src / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"video")
+        return path
+
+    def test_batch_renames_into_season_dirs_and_records_outcomes(self):
+        first = self.download("Pack/Show.S01E01.Pilot.1080p.mkv")
+        second = self.download("Pack/Show.S01E02.Second.1080p.mkv")
+
+        with patch.object(plex_dl_monitor.os, "rename", wraps=os.rename) as rename:
+            moved = plex_dl_monitor.ingest_downloads(
+                [first, second],
+                src=self.src,
+                dest=self.media,
+                library="TV",
+            )
+
+        season_dir = self.media / "TV" / "Show" / "Season 01"
+        self.assertTrue(moved)
+        self.assertEqual(rename.call_count, 2)
+        self.assertEqual(
+            sorted(path.name for path in season_dir.iterdir()),
+            ["Show - S01E01 - Pilot.mkv", "Show - S01E02 - Second.mkv"],
+        )
+        self.assertFalse((self.src / "Pack").exists())
+        self.assertEqual([record["status"] for record in self.recorded], ["moved", "moved"])
+
+    def test_already_recorded_and_incomplete_items_are_skipped(self):
+        done = self.download("Show.S01E01.Pilot.1080p.mkv")
+        decrypting = self.download("Show.S01E02.Second.1080p.mkv")
+        Path(f"{decrypting}.encrypted").write_bytes(b"")
+        stat_result = done.stat()
+        self.processed_keys = {(str(done), stat_result.st_size, stat_result.st_mtime_ns)}
+
+        moved = plex_dl_monitor.ingest_downloads(
+            [done, decrypting],
+            src=self.src,
+            dest=self.media,
+            library="TV",
+        )
+
+        self.assertFalse(moved)
+        self.assertTrue(done.exists())
+        self.assertTrue(decrypting.exists())
+        self.assertEqual(self.recorded, [])
+
+    def test_unparseable_movie_is_recorded_as_skipped(self):
+        movie_src = self.root / "downloads" / "Movies"
+        movie_src.mkdir()
+        movie = movie_src / "No Year Here.mkv"
+        movie.write_bytes(b"video")
+
+        moved = plex_dl_monitor.ingest_downloads(
+            [movie],
+            src=movie_src,
+            dest=self.media,
+            library="Movies",
+        )
+
+        self.assertFalse(moved)
+        self.assertTrue(movie.exists())
+        self.assertEqual(self.recorded[0]["status"], "skipped")
+
+    def test_reconcile_scan_ignores_partial_downloads(self):
+        ready = self.download("Pack/Show.S01E01.mkv")
+        self.download("Pack/Show.S01E02.mkv.part")
+
+        self.assertEqual(plex_dl_monitor.scan_download_tree(self.src), [ready])
+
+    def test_failed_move_is_retried_on_the_next_ingest(self):
+        episode = self.download("Show.S01E01.Pilot.1080p.mkv")
+
+        def ingest():
+            return plex_dl_monitor.ingest_downloads(
+                [episode],
+                src=self.src,
+                dest=self.media,
+                library="TV",
+            )
+
+        with patch.object(plex_dl_monitor, "move_download", side_effect=OSError("No space left on device")):
+            self.assertFalse(ingest())
+        self.assertTrue(ingest())
+
+        self.assertEqual([record["status"] for record in self.recorded], ["failed", "moved"])
+        self.assertTrue((self.media / "TV" / "Show" / "Season 01" / "Show - S01E01 - Pilot.mkv").is_file())
+
+    def test_downloads_queued_during_maintenance_are_ingested_after_it(self):
+        first = self.download("Show.S01E01.Pilot.1080p.mkv")
+        pending = {"TV": {first}, "Movies": set()}
+        ingested = []
+        flag = self.root / "maintenance.flg"
+        flag.touch()
+
+        self.assertFalse(plex_dl_monitor.drain_pending(pending, lambda *batch: ingested.append(batch)))
+        second = self.download("Show.S01E02.Second.1080p.mkv")
+        pending["TV"].add(second)
+        flag.unlink()
+
+        self.assertTrue(plex_dl_monitor.drain_pending(pending, lambda *batch: ingested.append(batch)))
+        self.assertEqual(ingested, [("TV", {first, second})])
+        self.assertEqual(pending, {"TV": set(), "Movies": set()})
+
+
+class ProcessedDownloadKeysTests(unittest.TestCase):
+    @patch("backend.database.database.put_db_conn")
+    @patch("backend.database.database.get_db_conn")
+    def test_failed_moves_do_not_count_as_processed(self, get_db_conn, put_db_conn):
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [("/downloads/TV/a.mkv", 5, 7)]
+        get_db_conn.return_value = connection
+
+        keys = plex_dl_monitor.get_processed_download_keys([("/downloads/TV/a.mkv", 5, 7)])
+
+        self.assertEqual(keys, {("/downloads/TV/a.mkv", 5, 7)})
+        self.assertIn("status <> 'failed'", cursor.execute.call_args.args[0])
+        put_db_conn.assert_called_once_with(connection)
+
+
+class PruneProcessedDownloadsTests(unittest.TestCase):
+    @patch("backend.database.database.put_db_conn")
+    @patch("backend.database.database.get_db_conn")
+    def test_only_records_for_departed_sources_expire(self, get_db_conn, put_db_conn):
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 4
+        get_db_conn.return_value = connection
+        now = datetime(2026, 3, 31, tzinfo=timezone.utc)
+
+        self.assertEqual(plex_dl_monitor.prune_processed_downloads(now), 4)
+
+        sql, parameters = cursor.execute.call_args.args
+        self.assertIn("status IN ('moved', 'quarantined')", sql)
+        self.assertEqual(parameters, (datetime(2026, 3, 1, tzinfo=timezone.utc),))
+        connection.commit.assert_called_once_with()
+        put_db_conn.assert_called_once_with(connection)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from backend.models.health_models import HealthStatus
+from backend.services import process_presence, service_health_service
+from backend.services.process_presence import ProcessIdentity, ProcessLookup, ProcessPresenceIndex
+
+
+MARKER = "JDownloader.jar"
+
+
+class ProcessPresenceIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        root = Path(self.temporary_directory.name)
+        self.proc_root = root / "proc"
+        self.cgroup_root = root / "cgroup"
+        self.cache_path = root / "runtime" / "process-presence.json"
+        self.proc_root.mkdir()
+        self.cgroup_root.mkdir()
+        (self.proc_root / "self").mkdir()
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def add_process(self, pid: int, cmdline: str, start_time: int = 1000, cgroup: str | None = None):
+        directory = self.proc_root / str(pid)
+        directory.mkdir(exist_ok=True)
+        (directory / "cmdline").write_text(cmdline.replace(" ", "\0"), encoding="utf-8")
+        fields = ["S", "1"] + ["0"] * 17 + [str(start_time)] + ["0"] * 10
+        (directory / "stat").write_text(f"{pid} (java (x)) {' '.join(fields)}\n", encoding="utf-8")
+        if cgroup is not None:
+            (directory / "cgroup").write_text(f"0::{cgroup}\n", encoding="utf-8")
+
+    def remove_process(self, pid: int):
+        for path in (self.proc_root / str(pid)).iterdir():
+            path.unlink()
+        (self.proc_root / str(pid)).rmdir()
+
+    def index(self) -> ProcessPresenceIndex:
+        return ProcessPresenceIndex(
+            proc_root=self.proc_root,
+            cgroup_root=self.cgroup_root,
+            cache_path=self.cache_path,
+        )
+
+    def test_main_pid_is_used_without_scanning(self):
+        self.add_process(42, f"java -jar /opt/jdownloader/{MARKER}")
+        index = self.index()
+        index.note_main_pid("jdownloader", 42)
+
+        with patch.object(process_presence.os, "listdir") as listdir:
+            lookup = index.locate("jdownloader", MARKER)
+
+        listdir.assert_not_called()
+        self.assertEqual(lookup.identity, ProcessIdentity(pid=42, start_time=1000))
+        self.assertEqual(lookup.source, "systemd_main_pid")
+
+    def test_launcher_main_pid_resolves_through_service_cgroup(self):
+        cgroup = "/user.slice/user-1000.slice/user@1000.service/app.slice/jdownloader.service"
+        self.add_process(40, "/bin/sh /opt/jdownloader/start.sh", cgroup=cgroup)
+        self.add_process(41, f"java -jar {MARKER}", start_time=1200, cgroup=cgroup)
+        procs = self.cgroup_root / cgroup.lstrip("/")
+        procs.mkdir(parents=True)
+        (procs / "cgroup.procs").write_text("40\n41\n", encoding="utf-8")
+        index = self.index()
+        index.note_main_pid("jdownloader", 40)
+
+        lookup = index.locate("jdownloader", MARKER)
+
+        self.assertEqual(lookup.identity.pid, 41)
+        self.assertEqual(lookup.source, "systemd_main_pid")
+
+    def test_cached_pid_survives_runs_and_skips_scan(self):
+        self.add_process(7, "bash")
+        self.add_process(42, f"java -jar {MARKER}")
+        first = self.index().locate("jdownloader", MARKER)
+        self.assertEqual(first.source, "proc_scan")
+        self.assertEqual(json.loads(self.cache_path.read_text())["jdownloader"]["pid"], 42)
+
+        with patch.object(process_presence.os, "listdir") as listdir:
+            second = self.index().locate("jdownloader", MARKER)
+
+        listdir.assert_not_called()
+        self.assertEqual(second.identity, first.identity)
+        self.assertEqual(second.source, "cached_pid")
+
+    def test_recycled_pid_falls_back_to_scan(self):
+        self.add_process(42, f"java -jar {MARKER}")
+        index = self.index()
+        index.locate("jdownloader", MARKER)
+        self.remove_process(42)
+        self.add_process(42, f"java -jar {MARKER}", start_time=5000)
+        self.add_process(43, "bash")
+
+        lookup = index.locate("jdownloader", MARKER)
+
+        self.assertEqual(lookup.source, "proc_scan")
+        self.assertEqual(lookup.identity.start_time, 5000)
+
+    def test_missing_process_clears_cache(self):
+        self.add_process(42, f"java -jar {MARKER}")
+        index = self.index()
+        index.locate("jdownloader", MARKER)
+        self.remove_process(42)
+
+        lookup = index.locate("jdownloader", MARKER)
+
+        self.assertFalse(lookup.present)
+        self.assertEqual(json.loads(self.cache_path.read_text()), {})
+
+    def test_unreadable_cache_is_ignored(self):
+        self.cache_path.parent.mkdir(parents=True)
+        self.cache_path.write_text("not json", encoding="utf-8")
+        self.add_process(42, f"java -jar {MARKER}")
+
+        lookup = self.index().locate("jdownloader", MARKER)
+
+        self.assertEqual(lookup.identity.pid, 42)
+
+
+class JDownloaderProcessCheckTests(unittest.TestCase):
+    def test_present_process_observes_the_expected_value(self):
+        lookup = ProcessLookup(ProcessIdentity(pid=4242, start_time=1000), source="proc_scan")
+        with patch.object(service_health_service.process_presence, "locate", return_value=lookup):
+            check = service_health_service.inspect_jdownloader_process()
+
+        self.assertEqual(check.status, HealthStatus.HEALTHY)
+        self.assertEqual(check.observed, check.expected)
+        self.assertIn("pid 4242", check.message)
+        self.assertIn("proc_scan", check.message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -165,6 +165,14 @@ class RaceApiAuthorizationTests(unittest.TestCase):
                     "updatedAt": "2026-08-06T00:00:00",
                 },
             ),
+            patch(
+                "backend.routers.race.race_service.get_leaderboard_refresh_status",
+                return_value={
+                    "success": True,
+                    "raceActive": True,
+                    "intervalSeconds": 5.0,
+                },
+            ),
             patch(
                 "backend.routers.race.race_service.get_starting_grid_status",
                 return_value=[
@@ -194,6 +202,7 @@ class RaceApiAuthorizationTests(unittest.TestCase):
                 "recent": race.get_recent_picks(pool_id=1, limit=5),
                 "status": race.draft_status(pool_id=1),
                 "leaderboard": race.get_leaderboard(pool_id=1),
+                "refresh": race.get_leaderboard_refresh_status(),
                 "grid": race.get_grid_status(pool_id=1),
                 "archives": race.get_archives(),
                 "entries": race.get_archive_entries(archive_id=1),
@@ -210,6 +219,7 @@ class RaceApiAuthorizationTests(unittest.TestCase):
         self.assertEqual(responses["recent"][0]["pick_number"], 1)
         self.assertEqual(responses["status"]["status"], "DRAFT_ACTIVE")
         self.assertTrue(responses["leaderboard"]["success"])
+        self.assertEqual(responses["refresh"]["intervalSeconds"], 5.0)
         self.assertEqual(responses["grid"][0]["starting_position"], 1)
         self.assertTrue(responses["archives"]["success"])
         self.assertEqual(responses["archives"]["archives"][0]["year"], 2026)
@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from psycopg2 import pool
+
+
+class OfflineThreadedConnectionPool:
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    def getconn(self):
+        raise RuntimeError("database access is disabled during draft tests")
+
+    def putconn(self, _connection):
+        return None
+
+
+pool.ThreadedConnectionPool = OfflineThreadedConnectionPool
+
+from backend.services.race import draft, draft_events
+
+
+class FakeDraftDatabase:
+    """In-memory draft tables with a row lock on indy_pool_draft_status."""
+
+    def __init__(self, participants, grid, *, lock_hold_seconds=0.0, scheduled=True):
+        self.order = list(participants)
+        self.grid = dict(grid)
+        self.schedule = draft.snake_schedule(self.order, len(self.grid)) if scheduled else []
+        self.status = {"current_pick": 1, "total_picks": 0, "event_status": "DRAFT_ACTIVE"}
+        self.assignments = []
+        self.status_lock = threading.Lock()
+        self.lock_hold_seconds = lock_hold_seconds
+        self.opened = []
+
+    def connect(self):
+        connection = FakeConnection(self)
+        self.opened.append(connection)
+        return connection
+
+
+class FakeConnection:
+    def __init__(self, database):
+        self.database = database
+        self.holds_lock = False
+        self.statements = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def _release(self):
+        if self.holds_lock:
+            self.holds_lock = False
+            self.database.status_lock.release()
+
+    def commit(self):
+        self._release()
+
+    def rollback(self):
+        self._release()
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.database = connection.database
+        self.result = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        return None
+
+    def execute(self, sql, params=()):
+        self.connection.statements.append(sql)
+        database = self.database
+
+        if "FOR UPDATE" in sql:
+            database.status_lock.acquire()
+            self.connection.holds_lock = True
+            # Widen the race window for competing pickers.
+            time.sleep(database.lock_hold_seconds)
+            total_picks = database.status["total_picks"]
+            self.result = (
+                database.status["current_pick"],
+                total_picks,
+                database.schedule[total_picks:total_picks + 2],
+                len(database.order),
+                len(database.grid),
+            )
+        elif "FROM indy_pool_draft_order" in sql and "unnest" not in sql:
+            self.result = (list(database.order), len(database.grid))
+        elif sql.startswith("DELETE FROM indy_pool_draft_schedule"):
+            database.schedule = []
+        elif "INSERT INTO indy_pool_draft_schedule" in sql:
+            database.schedule = list(params[1])
+        elif sql.lstrip().startswith("INSERT INTO indy_pool_assignments"):
+            participant, pool_id, pick_number, car_number, _ = params
+            taken = {assignment["car_number"] for assignment in database.assignments}
+            if car_number not in database.grid or car_number in taken:
+                self.result = None
+                return
+            database.assignments.append(
+                {
+                    "participant": participant,
+                    "car_number": car_number,
+                    "pick_number": pick_number,
+                }
+            )
+            self.result = (database.grid[car_number],)
+        elif sql.lstrip().startswith("UPDATE indy_pool_draft_status"):
+            current_pick, total_picks, complete, _pool_id = params
+            database.status["current_pick"] = current_pick
+            database.status["total_picks"] = total_picks
+            if complete:
+                database.status["event_status"] = "PRE_RACE"
+        else:
+            raise AssertionError(f"unexpected statement: {sql}")
+
+    def fetchone(self):
+        return self.result
+
+
+class SnakeOrderTests(unittest.TestCase):
+    def test_schedule_matches_pick_by_pick_advancement(self):
+        for participants in range(1, 8):
+            order = [f"P{position}" for position in range(1, participants + 1)]
+            current_pick, total_picks = 1, 0
+            simulated = []
+            for _ in range(33):
+                simulated.append(order[current_pick - 1])
+                current_pick, total_picks = draft.advance_snake_pick(current_pick, total_picks, participants)
+
+            with self.subTest(participants=participants):
+                self.assertEqual(draft.snake_schedule(order, 33), simulated)
+
+    def test_positions_snake_and_repeat_at_the_turn(self):
+        current_pick, total_picks = 1, 0
+        positions = [current_pick]
+        for _ in range(8):
+            current_pick, total_picks = draft.advance_snake_pick(current_pick, total_picks, 3)
+            positions.append(current_pick)
+
+        self.assertEqual(positions, [1, 2, 3, 3, 2, 1, 1, 2, 3])
+
+
+class MakePickTests(unittest.TestCase):
+    def setUp(self):
+        self.participants = ["Ann", "Bob", "Cat"]
+        self.grid = {str(number): f"Driver {number}" for number in range(1, 10)}
+        self.database = None
+        self.patches = [
+            patch.object(draft, "get_db_conn", side_effect=lambda: self.database.connect()),
+            patch.object(draft, "put_db_conn"),
+            patch.object(draft, "seed_leaderboard"),
+            patch.object(draft, "save_pool_standings_to_db"),
+            patch.object(draft, "publish_draft_events"),
+        ]
+        self.get_db_conn, _, self.seed, self.standings, self.publish = [
+            active_patch.start() for active_patch in self.patches
+        ]
+
+    def tearDown(self):
+        for active_patch in reversed(self.patches):
+            active_patch.stop()
+
+    def pick_concurrently(self, car_numbers):
+        results = []
+        threads = [
+            threading.Thread(target=lambda car=car: results.append(draft.make_pick(1, car)))
+            for car in car_numbers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_pick_uses_one_connection_and_three_statements(self):
+        self.database = FakeDraftDatabase(self.participants, self.grid)
+
+        self.assertTrue(draft.make_pick(1, "4"))
+
+        self.assertEqual(len(self.database.opened), 1)
+        self.assertEqual(len(self.database.opened[0].statements), 3)
+        self.assertEqual(self.database.assignments[0]["participant"], "Ann")
+        self.assertEqual(
+            self.database.status,
+            {"current_pick": 2, "total_picks": 1, "event_status": "DRAFT_ACTIVE"},
+        )
+
+    def test_concurrent_picks_of_one_car_succeed_once(self):
+        self.database = FakeDraftDatabase(self.participants, self.grid, lock_hold_seconds=0.01)
+
+        results = self.pick_concurrently(["7"] * 6)
+
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(len(self.database.assignments), 1)
+        self.assertEqual(self.database.status["total_picks"], 1)
+        self.assertFalse(self.database.status_lock.locked())
+
+    def test_concurrent_picks_follow_snake_order_without_gaps(self):
+        self.database = FakeDraftDatabase(self.participants, self.grid, lock_hold_seconds=0.005)
+
+        results = self.pick_concurrently(list(self.grid))
+
+        ordered = sorted(self.database.assignments, key=lambda assignment: assignment["pick_number"])
+        self.assertTrue(all(results))
+        self.assertEqual([assignment["pick_number"] for assignment in ordered], list(range(1, 10)))
+        self.assertEqual(
+            [assignment["participant"] for assignment in ordered],
+            ["Ann", "Bob", "Cat", "Cat", "Bob", "Ann", "Ann", "Bob", "Cat"],
+        )
+        self.assertEqual(self.database.status["event_status"], "PRE_RACE")
+
+    def test_final_pick_seeds_leaderboard_after_commit(self):
+        self.database = FakeDraftDatabase(self.participants, {"1": "Driver 1"})
+
+        self.assertTrue(draft.make_pick(1, "1"))
+
+        self.seed.assert_called_once_with()
+        self.standings.assert_called_once_with(1)
+        self.assertFalse(self.database.status_lock.locked())
+        self.assertEqual(
+            [event_type for event_type, _ in self.publish.call_args.args[1]],
+            ["pick_made", "draft_complete"],
+        )
+
+    def test_pick_announces_next_participant(self):
+        self.database = FakeDraftDatabase(self.participants, self.grid)
+
+        draft.make_pick(1, "4")
+
+        self.publish.assert_called_once()
+        self.assertEqual(
+            self.publish.call_args.args[1][1],
+            ("on_the_clock", {"participant": "Bob", "overall_pick": 2}),
+        )
+
+    def test_unscheduled_draft_is_materialized_on_first_pick(self):
+        self.database = FakeDraftDatabase(self.participants, self.grid, scheduled=False)
+
+        self.assertTrue(draft.make_pick(1, "4"))
+
+        self.assertEqual(len(self.database.schedule), 9)
+        self.assertEqual(self.database.assignments[0]["participant"], "Ann")
+        self.assertEqual(
+            self.publish.call_args.args[1][1],
+            ("on_the_clock", {"participant": "Bob", "overall_pick": 2}),
+        )
+
+    def test_rejected_pick_publishes_nothing(self):
+        self.database = FakeDraftDatabase(self.participants, self.grid)
+
+        self.assertFalse(draft.make_pick(1, "99"))
+
+        self.publish.assert_not_called()
+        self.assertFalse(self.database.status_lock.locked())
+
+
+class PublishDraftEventsTests(unittest.TestCase):
+    def test_pick_events_share_one_draft_state_read(self):
+        state = {"event_id": 4}
+        with (
+            patch.object(draft, "get_draft_state", return_value=state) as get_draft_state,
+            patch.object(draft_events.broker, "publish") as publish,
+        ):
+            draft.publish_draft_events(1, [("pick_made", {"pick": {}}), ("on_the_clock", {"overall_pick": 2})])
+
+        get_draft_state.assert_called_once_with(1)
+        self.assertEqual(
+            [call.args for call in publish.call_args_list],
+            [
+                (1, "pick_made", {"pick": {}, "state": state}),
+                (1, "on_the_clock", {"overall_pick": 2, "state": state}),
+            ],
+        )
+
+
+class SnapshotCursor:
+    def __init__(self, results):
+        self.results = list(results)
+        self.current = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        return None
+
+    def execute(self, _sql, _params=()):
+        self.current = self.results.pop(0)
+
+    def fetchone(self):
+        return self.current
+
+    def fetchall(self):
+        return self.current
+
+
+class DraftStateTests(unittest.TestCase):
+    def test_snapshot_combines_status_grid_assignments_and_recent_picks(self):
+        status_row = ("DRAFT_ACTIVE", 3, 2, ["Ann", "Bob", "Cat"], ["Cat", "Cat"], 4)
+        grid_rows = [
+            ("9", "Driver 9", 1, "Ann", 1),
+            ("12", "Driver 12", 2, None, None),
+            ("3", "Driver 3", 3, "Bob", 2),
+            ("7", "Driver 7", 4, None, None),
+        ]
+
+        class Connection:
+            def cursor(self):
+                return SnapshotCursor([status_row, grid_rows])
+
+        with patch.object(draft, "get_db_conn", return_value=Connection()), patch.object(
+            draft, "put_db_conn"
+        ) as put_db_conn:
+            state = draft.get_draft_state(1, recent_limit=1)
+
+        put_db_conn.assert_called_once()
+        self.assertEqual(state["current_pick"], {"pick_number": 3, "participant": "Cat"})
+        self.assertEqual(state["draft_status"]["current_picker"], "Cat")
+        # Four cars on the grid: Cat picks again at the turn, then it is over.
+        self.assertEqual(state["draft_status"]["on_deck"], ["Cat"])
+        self.assertEqual([entry["takenBy"] for entry in state["grid"]], ["Ann", None, "Bob", None])
+        self.assertEqual(state["assignments"], {
+            "Ann": [{"number": "9", "name": "Driver 9"}],
+            "Bob": [{"number": "3", "name": "Driver 3"}],
+        })
+        self.assertEqual(state["recent_picks"], [
+            {"participant": "Bob", "driver_name": "Driver 3", "car_number": "3", "pick_number": 2},
+        ])
+
+    def query(self, function, *results):
+        class Connection:
+            def cursor(self):
+                return SnapshotCursor(results)
+
+        with patch.object(draft, "get_db_conn", return_value=Connection()), patch.object(
+            draft, "put_db_conn"
+        ):
+            return function()
+
+    def test_status_reads_on_deck_from_the_schedule(self):
+        status = self.query(
+            lambda: draft.get_draft_status(1),
+            ("DRAFT_ACTIVE", 2, 1, ["Ann", "Bob"], ["Bob", "Bob", "Ann"], 33),
+        )
+
+        self.assertEqual(status["current_picker"], "Bob")
+        self.assertEqual(status["on_deck"], ["Bob", "Ann"])
+
+    def test_status_falls_back_to_order_before_schedule_exists(self):
+        status = self.query(
+            lambda: draft.get_draft_status(1),
+            ("DRAFT_ACTIVE", 2, 1, ["Ann", "Bob"], [], 4),
+        )
+
+        self.assertEqual(status["current_picker"], "Bob")
+        self.assertEqual(status["on_deck"], ["Bob", "Ann"])
+
+    def test_picks_until_turn_counts_from_the_pick_on_the_clock(self):
+        result = self.query(lambda: draft.get_picks_until_turn(1, "Ann"), (4, 7))
+
+        self.assertEqual(result, {"participant": "Ann", "next_pick_number": 7, "picks_until_turn": 2})
+
+
+class DraftEventBrokerTests(unittest.TestCase):
+    def test_published_events_reach_subscribers_of_that_pool_only(self):
+        broker = draft_events.DraftEventBroker()
+
+        async def scenario():
+            watching = broker.subscribe(1)
+            other_pool = broker.subscribe(2)
+            # Picks are committed on threadpool workers.
+            await asyncio.to_thread(broker.publish, 1, "pick_made", {"pick_number": 1})
+            event = await asyncio.wait_for(watching.queue.get(), timeout=1)
+            return event, other_pool.queue.qsize()
+
+        event, other_pool_pending = asyncio.run(scenario())
+
+        self.assertEqual((event.id, event.type), (1, "pick_made"))
+        self.assertEqual(other_pool_pending, 0)
+        self.assertEqual(
+            event.to_sse(),
+            'id: 1\nevent: pick_made\ndata: {"pick_number":1}\n\n',
+        )
+
+    def test_reconnect_replays_missed_events_or_requests_resync(self):
+        broker = draft_events.DraftEventBroker(history_size=2)
+        for pick_number in range(1, 4):
+            broker.publish(1, "pick_made", {"pick_number": pick_number})
+
+        async def drain(last_event_id):
+            subscription = broker.subscribe(1, last_event_id)
+            events = []
+            while not subscription.queue.empty():
+                events.append(subscription.queue.get_nowait())
+            broker.unsubscribe(subscription)
+            return [(event.id, event.type) for event in events]
+
+        self.assertEqual(asyncio.run(drain(2)), [(3, "pick_made")])
+        self.assertEqual(asyncio.run(drain(3)), [])
+        self.assertEqual(asyncio.run(drain(0)), [(3, "resync")])
+
+    def test_stream_emits_sse_frames_and_unsubscribes(self):
+        async def scenario():
+            broker = draft_events.DraftEventBroker()
+            with patch.object(draft_events, "broker", broker):
+                disconnected = asyncio.Event()
+
+                async def is_disconnected():
+                    return disconnected.is_set()
+
+                stream = draft_events.stream_draft_events(5, None, is_disconnected)
+                frames = [await anext(stream)]
+                broker.publish(5, "draft_complete", {"total_picks": 33})
+                frames.append(await anext(stream))
+                disconnected.set()
+                await stream.aclose()
+                return frames, broker._subscribers
+
+        frames, subscribers = asyncio.run(scenario())
+
+        self.assertTrue(frames[0].startswith("retry: 3000"))
+        self.assertIn("event: draft_complete", frames[1])
+        self.assertEqual(subscribers, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,9 +35,10 @@ def snapshot() -> ServiceHealthSnapshotResponse:
 
 
 class ServiceHealthCollectorTests(unittest.TestCase):
+    @patch("backend.tasks.service_health_collector.record_history")
     @patch("backend.tasks.service_health_collector.persist_snapshot")
     @patch("backend.tasks.service_health_collector.collect_snapshot")
-    def test_run_collection_once_collects_and_persists_snapshot(self, collect, persist):
+    def test_run_collection_once_collects_and_persists_snapshot(self, collect, persist, record):
         expected = snapshot()
         collect.return_value = expected
 
@@ -45,6 +46,21 @@ class ServiceHealthCollectorTests(unittest.TestCase):
 
         self.assertEqual(result, expected)
         persist.assert_called_once_with(expected)
+        record.assert_called_once_with(expected)
+
+    @patch("backend.tasks.service_health_collector.record_history")
+    @patch("backend.tasks.service_health_collector.persist_snapshot")
+    @patch("backend.tasks.service_health_collector.collect_snapshot")
+    def test_history_failure_does_not_fail_collection(self, collect, persist, record):
+        expected = snapshot()
+        collect.return_value = expected
+        record.side_effect = RuntimeError("history unavailable")
+
+        with self.assertLogs("remihub.service_health_collector", level="ERROR"):
+            result = service_health_collector.run_collection_once()
+
+        self.assertEqual(result, expected)
+        persist.assert_called_once_with(expected)
 
     @patch("backend.tasks.service_health_collector.run_collection_once")
     def test_main_returns_zero_after_successful_persistence(self, run_once):
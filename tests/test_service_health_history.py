@@ -0,0 +1,224 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from backend.models.health_models import (
+    HealthComponent,
+    HealthComponentGroup,
+    HealthComponentKind,
+    HealthStatus,
+    HealthTransition,
+    ServiceHealthSnapshotResponse,
+)
+from backend.services import service_health_history as history
+
+
+NOW = datetime(2026, 8, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def component(component_id: str, status: HealthStatus) -> HealthComponent:
+    return HealthComponent(
+        id=component_id,
+        name=component_id,
+        group=HealthComponentGroup.CORE,
+        kind=HealthComponentKind.SYSTEMD_UNIT,
+        status=status,
+        message=f"{component_id} is {status.value}",
+        checked_at=NOW,
+    )
+
+
+def snapshot(*components: HealthComponent) -> ServiceHealthSnapshotResponse:
+    return ServiceHealthSnapshotResponse(
+        success=True,
+        checked_at=NOW,
+        overall=HealthStatus.HEALTHY,
+        components=list(components),
+    )
+
+
+def transition(
+    minutes_ago: float,
+    status: HealthStatus,
+    previous_status: HealthStatus | None,
+) -> HealthTransition:
+    return HealthTransition(
+        component_id="caddy",
+        observed_at=NOW - timedelta(minutes=minutes_ago),
+        status=status,
+        previous_status=previous_status,
+        message="changed",
+    )
+
+
+class TransitionDetectionTests(unittest.TestCase):
+    def test_only_changed_and_new_components_produce_transitions(self):
+        transitions = history.detect_transitions(
+            snapshot(
+                component("remihub", HealthStatus.HEALTHY),
+                component("caddy", HealthStatus.UNHEALTHY),
+                component("postgresql", HealthStatus.HEALTHY),
+            ),
+            {
+                "remihub": HealthStatus.HEALTHY,
+                "caddy": HealthStatus.HEALTHY,
+            },
+        )
+
+        self.assertEqual(
+            [(item.component_id, item.previous_status, item.status) for item in transitions],
+            [
+                ("caddy", HealthStatus.HEALTHY, HealthStatus.UNHEALTHY),
+                ("postgresql", None, HealthStatus.HEALTHY),
+            ],
+        )
+        self.assertTrue(all(item.observed_at == NOW for item in transitions))
+
+
+class UptimeSummaryTests(unittest.TestCase):
+    def test_baseline_before_window_sets_opening_status(self):
+        summary = history.summarize_uptime(
+            "caddy",
+            [
+                transition(600, HealthStatus.HEALTHY, None),
+                transition(30, HealthStatus.UNHEALTHY, HealthStatus.HEALTHY),
+            ],
+            NOW - timedelta(minutes=120),
+            NOW,
+        )
+
+        self.assertEqual(summary.observed_seconds, 7200)
+        self.assertEqual(summary.up_seconds, 5400)
+        self.assertEqual(summary.uptime_ratio, 0.75)
+        self.assertEqual(summary.transition_count, 1)
+        self.assertEqual(summary.recovery_count, 0)
+        self.assertIsNone(summary.mean_time_to_recovery_seconds)
+
+    def test_recoveries_measure_from_first_down_transition(self):
+        summary = history.summarize_uptime(
+            "caddy",
+            [
+                transition(100, HealthStatus.HEALTHY, None),
+                transition(90, HealthStatus.DEGRADED, HealthStatus.HEALTHY),
+                transition(85, HealthStatus.UNHEALTHY, HealthStatus.DEGRADED),
+                transition(80, HealthStatus.HEALTHY, HealthStatus.UNHEALTHY),
+                transition(20, HealthStatus.UNHEALTHY, HealthStatus.HEALTHY),
+                transition(10, HealthStatus.IDLE, HealthStatus.UNHEALTHY),
+            ],
+            NOW - timedelta(minutes=100),
+            NOW,
+        )
+
+        self.assertEqual(summary.recovery_count, 2)
+        self.assertEqual(summary.mean_time_to_recovery_seconds, 600)
+        self.assertEqual(summary.transition_count, 5)
+
+    def test_unknown_time_is_excluded_from_ratio(self):
+        summary = history.summarize_uptime(
+            "caddy",
+            [
+                transition(60, HealthStatus.HEALTHY, None),
+                transition(30, HealthStatus.UNKNOWN, HealthStatus.HEALTHY),
+            ],
+            NOW - timedelta(minutes=60),
+            NOW,
+        )
+
+        self.assertEqual(summary.seconds_by_status[HealthStatus.UNKNOWN], 1800)
+        self.assertEqual(summary.uptime_ratio, 1.0)
+
+    def test_window_before_first_observation_is_not_counted(self):
+        summary = history.summarize_uptime(
+            "caddy",
+            [transition(30, HealthStatus.HEALTHY, None)],
+            NOW - timedelta(minutes=60),
+            NOW,
+        )
+
+        self.assertEqual(summary.observed_seconds, 1800)
+        self.assertEqual(summary.uptime_ratio, 1.0)
+
+
+class HistoryPersistenceTests(unittest.TestCase):
+    def cursor(self, conn: MagicMock, last_statuses, last_checkpoint):
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = last_statuses
+        cur.fetchone.return_value = (last_checkpoint,)
+        return cur
+
+    def executed_sql(self, cur) -> list[str]:
+        return [call.args[0] for call in cur.execute.call_args_list]
+
+    @patch("backend.services.service_health_history.put_db_conn")
+    @patch("backend.services.service_health_history.get_db_conn")
+    def test_unchanged_components_write_nothing_between_checkpoints(self, get_db_conn, put_db_conn):
+        conn = MagicMock()
+        get_db_conn.return_value = conn
+        cur = self.cursor(conn, [("remihub", "healthy")], NOW - timedelta(minutes=5))
+
+        transitions = history.record_service_health_history(
+            snapshot(component("remihub", HealthStatus.HEALTHY))
+        )
+
+        self.assertEqual(transitions, [])
+        self.assertFalse(
+            any("INSERT" in sql or "DELETE" in sql for sql in self.executed_sql(cur))
+        )
+        conn.commit.assert_called_once()
+        put_db_conn.assert_called_once_with(conn)
+
+    @patch("backend.services.service_health_history.put_db_conn")
+    @patch("backend.services.service_health_history.get_db_conn")
+    def test_transition_and_due_checkpoint_are_written_with_retention(self, get_db_conn, _put_db_conn):
+        conn = MagicMock()
+        get_db_conn.return_value = conn
+        cur = self.cursor(conn, [("remihub", "healthy")], NOW - timedelta(hours=2))
+
+        transitions = history.record_service_health_history(
+            snapshot(component("remihub", HealthStatus.UNHEALTHY))
+        )
+
+        self.assertEqual(len(transitions), 1)
+        statements = self.executed_sql(cur)
+        self.assertEqual(
+            sum("INSERT INTO public.service_health_transitions" in sql for sql in statements),
+            1,
+        )
+        self.assertEqual(
+            sum("INSERT INTO public.service_health_checkpoints" in sql for sql in statements),
+            1,
+        )
+        self.assertEqual(sum("DELETE FROM" in sql for sql in statements), 3)
+        conn.commit.assert_called_once()
+
+    @patch("backend.services.service_health_history.put_db_conn")
+    @patch("backend.services.service_health_history.get_db_conn")
+    def test_db_failure_rolls_back(self, get_db_conn, _put_db_conn):
+        conn = MagicMock()
+        get_db_conn.return_value = conn
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.execute.side_effect = RuntimeError("db failed")
+
+        with self.assertRaises(RuntimeError):
+            history.record_service_health_history(snapshot(component("remihub", HealthStatus.HEALTHY)))
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+
+    @patch("backend.services.service_health_history.put_db_conn")
+    @patch("backend.services.service_health_history.get_db_conn")
+    def test_uptime_without_history_is_not_found(self, get_db_conn, _put_db_conn):
+        conn = MagicMock()
+        get_db_conn.return_value = conn
+        conn.cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+        with self.assertRaises(history.HealthComponentHistoryNotFoundError):
+            history.get_component_uptime("missing", now=NOW)
+
+    def test_uptime_window_is_bounded(self):
+        with self.assertRaises(ValueError):
+            history.get_component_uptime("caddy", days=history.MAX_UPTIME_WINDOW_DAYS + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
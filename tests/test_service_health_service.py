@@ -1257,6 +1257,95 @@ class ServiceHealthAggregationAndSafetyTests(unittest.TestCase):
         self.assertFalse(status.available)
         self.assertEqual(status.error, "systemd status unavailable: TimeoutExpired")
 
+    @patch("backend.services.service_health_service.subprocess.run")
+    def test_batched_systemd_inspection_uses_one_show_command(self, run):
+        run.return_value = Mock(
+            returncode=0,
+            stdout=(
+                "LoadState=loaded\nActiveState=active\nSubState=running\n"
+                "\n"
+                "LoadState=not-found\nActiveState=inactive\nSubState=dead\n"
+            ),
+            stderr="",
+        )
+
+        statuses = health.inspect_systemd_units(["remihub.service", "caddy.service"])
+
+        run.assert_called_once()
+        command = run.call_args.args[0]
+        self.assertEqual(command[:4], [health.SYSTEMCTL, "show", "remihub.service", "caddy.service"])
+        self.assertTrue(statuses["remihub.service"].available)
+        self.assertEqual(statuses["remihub.service"].get("SubState"), "running")
+        self.assertFalse(statuses["caddy.service"].available)
+
+    @patch("backend.services.service_health_service.inspect_systemd_unit")
+    @patch("backend.services.service_health_service.subprocess.run")
+    def test_batched_systemd_inspection_falls_back_when_blocks_do_not_match(
+        self,
+        run,
+        inspect_systemd_unit,
+    ):
+        run.return_value = Mock(returncode=0, stdout="LoadState=loaded\n", stderr="")
+        inspect_systemd_unit.side_effect = lambda unit, timeout: health.SystemdUnitStatus(
+            unit=unit,
+            available=True,
+            properties={"LoadState": "loaded"},
+        )
+
+        statuses = health.inspect_systemd_units(["remihub.service", "caddy.service"])
+
+        self.assertEqual(set(statuses), {"remihub.service", "caddy.service"})
+        self.assertEqual(inspect_systemd_unit.call_count, 2)
+
+    def test_batched_systemd_inspection_rejects_arbitrary_units(self):
+        with self.assertRaises(ValueError):
+            health.inspect_systemd_units(["remihub.service", "ssh.service"])
+
+    @patch("backend.services.service_health_service.evaluate_jdownloader_component")
+    @patch("backend.services.service_health_service.evaluate_deployment_baseline_parity_component")
+    @patch("backend.services.service_health_service.evaluate_path_component")
+    @patch("backend.services.service_health_service.inspect_systemd_unit")
+    @patch("backend.services.service_health_service.inspect_systemd_units")
+    def test_snapshot_uses_batched_statuses_and_records_timings(
+        self,
+        inspect_systemd_units,
+        inspect_systemd_unit,
+        path_component,
+        parity_component,
+        jdownloader_component,
+    ):
+        inspect_systemd_units.side_effect = lambda units: {
+            unit: health.SystemdUnitStatus(
+                unit=unit,
+                available=True,
+                properties={"LoadState": "loaded", "ActiveState": "active", "SubState": "running"},
+            )
+            for unit in units
+        }
+        path_component.side_effect = lambda definition, checked_at: self.component(
+            HealthStatus.HEALTHY
+        ).model_copy(update={"id": definition.id})
+        parity_component.return_value = self.component(HealthStatus.HEALTHY)
+        jdownloader_component.return_value = self.component(HealthStatus.HEALTHY)
+
+        snapshot = health.collect_service_health_snapshot()
+
+        inspect_systemd_units.assert_called_once()
+        inspect_systemd_unit.assert_not_called()
+        expected_ids = [
+            *(definition.id for definition in health.UNIT_DEFINITIONS),
+            *(definition.id for definition in health.PATH_DEFINITIONS),
+        ]
+        self.assertEqual(
+            [component.id for component in snapshot.components[: len(expected_ids)]],
+            expected_ids,
+        )
+        self.assertEqual(len(snapshot.components), len(expected_ids) + 2)
+        self.assertTrue(
+            all(component.evaluation_ms is not None for component in snapshot.components)
+        )
+        self.assertIsNotNone(snapshot.collection_ms)
+
 
 class ServiceHealthPersistenceTests(unittest.TestCase):
     def component(self, status: HealthStatus, checked_at: datetime | None = None) -> HealthComponent:
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from backend.database import database
+from backend.scripts.profile_startup_imports import (
+    LAZY_PACKAGES,
+    parse_importtime,
+    profile_imports,
+    summarize_imports,
+)
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     soupsieve
+import time:       400 |        500 |   bs4
+import time:        50 |         50 |   requests
+import time:       300 |        850 | backend.tasks.field_status_watcher
+"""
+
+
+class ImportTimeReportTests(unittest.TestCase):
+    def test_packages_are_charged_where_another_package_entered_them(self):
+        records = parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual([record.depth for record in records], [2, 1, 1, 0])
+        self.assertEqual(records[2].parent.name, "backend.tasks.field_status_watcher")
+        summary = summarize_imports(records, top=5)
+        self.assertEqual(
+            summary["packages"][0],
+            {
+                "package": "bs4",
+                "cumulative_ms": 0.5,
+                "imported_by": ["backend.tasks.field_status_watcher"],
+            },
+        )
+        self.assertEqual(summary["packages"][1]["package"], "soupsieve")
+        self.assertEqual(summary["backend_modules"][0]["self_ms"], 0.3)
+
+    def test_api_imports_without_database_or_heavy_libraries(self):
+        environment = {
+            "REMIHUB_DATABASE_CONFIG": "/nonexistent/remihub/database.ini",
+            "REMIHUB_CONFIG_FILE": "/nonexistent/remihub/config.ini",
+        }
+        with patch.dict(os.environ, environment):
+            probe, _records = profile_imports("backend.main", with_workers=False)
+
+        loaded = set(probe["modules"])
+        self.assertEqual([name for name in LAZY_PACKAGES if name in loaded], [])
+        self.assertNotIn("backend.tasks.finance_worker", loaded)
+
+    def test_finance_worker_imports_without_a_config_file(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            environment = {
+                "REMIHUB_DATABASE_CONFIG": "/nonexistent/remihub/database.ini",
+                "REMIHUB_CONFIG_FILE": "/nonexistent/remihub/config.ini",
+                "REMIHUB_LOG_DIR": log_dir,
+            }
+            with patch.dict(os.environ, environment):
+                probe, _records = profile_imports("backend.tasks.finance_worker", with_workers=False)
+
+        self.assertIn("backend.tasks.finance_worker", probe["modules"])
+
+
+class DatabasePoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool_class = MagicMock()
+        for patcher in (
+            patch.object(database, "db_pool", None),
+            patch.object(database.pool, "ThreadedConnectionPool", self.pool_class),
+            patch.object(
+                database,
+                "database_config",
+                return_value={
+                    "user": "remihub",
+                    "password": "secret",
+                    "host": "localhost",
+                    "port": "5432",
+                    "database": "remihub",
+                },
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_pool_is_created_once_on_first_use(self):
+        connection = database.get_db_conn()
+        database.get_db_conn()
+
+        self.pool_class.assert_called_once()
+        self.assertEqual(self.pool_class.call_args.kwargs["host"], "localhost")
+        self.assertIs(connection, self.pool_class.return_value.getconn.return_value)
+
+    def test_closing_the_pool_lets_the_next_lifespan_reopen_it(self):
+        database.init_db_pool()
+        database.close_db_pool()
+
+        self.pool_class.return_value.closeall.assert_called_once_with()
+        self.assertIsNone(database.db_pool)
+        database.put_db_conn(MagicMock())
+        self.pool_class.return_value.putconn.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import gzip
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.routing import Mount, Route
+from starlette.testclient import TestClient
+
+from backend.core.web_precompression import precompress_tree
+from backend.core.web_static import (
+    IMMUTABLE_CACHE_CONTROL,
+    INDEX_CACHE_CONTROL,
+    PrecompressedStaticFiles,
+    WebIndex,
+    accepted_encodings,
+)
+
+
+APP_JS = "export function lap(driver) { return driver.position; }\n" * 100
+INDEX_HTML = "<!doctype html><div id=root></div>" + "<link rel=preload href=/assets/app.js>" * 40
+
+
+def raw_body(client: TestClient, path: str, headers: dict[str, str]) -> tuple[object, bytes]:
+    with client.stream("GET", path, headers=headers) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class AcceptEncodingTests(unittest.TestCase):
+    def test_zero_quality_codings_are_refused(self):
+        self.assertEqual(accepted_encodings("gzip;q=0, br;q=0.5, identity"), {"br", "identity"})
+        self.assertEqual(accepted_encodings(None), set())
+
+
+class WebStaticTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.dist = Path(self.temporary_directory.name)
+        (self.dist / "assets").mkdir()
+        (self.dist / "assets" / "app-Bq3xZ9_a.js").write_text(APP_JS, encoding="utf-8")
+        (self.dist / "index.html").write_text(INDEX_HTML, encoding="utf-8")
+        precompress_tree(self.dist)
+        self.web_index = WebIndex(self.dist)
+
+        async def index(request: Request):
+            return self.web_index.response(request.headers)
+
+        app = Starlette(
+            routes=[
+                Route("/", index),
+                Mount(
+                    "/assets",
+                    PrecompressedStaticFiles(directory=str(self.dist / "assets"), immutable=True),
+                ),
+                Mount("/race", PrecompressedStaticFiles(directory=str(self.dist), html=True)),
+            ]
+        )
+        self.client = TestClient(app)
+
+    def test_hashed_asset_is_served_precompressed_and_immutable(self):
+        response, body = raw_body(self.client, "/assets/app-Bq3xZ9_a.js", {"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.headers["cache-control"], IMMUTABLE_CACHE_CONTROL)
+        self.assertEqual(response.headers["vary"], "Accept-Encoding")
+        self.assertTrue(response.headers["content-type"].startswith("text/javascript"))
+        self.assertEqual(body, (self.dist / "assets" / "app-Bq3xZ9_a.js.gz").read_bytes())
+        self.assertEqual(gzip.decompress(body).decode("utf-8"), APP_JS)
+
+    def test_identity_client_and_stale_variant_get_the_original(self):
+        response, body = raw_body(self.client, "/assets/app-Bq3xZ9_a.js", {"Accept-Encoding": "identity"})
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(body.decode("utf-8"), APP_JS)
+
+        variant = self.dist / "assets" / "app-Bq3xZ9_a.js.gz"
+        stat_result = variant.stat()
+        os.utime(variant, (stat_result.st_atime - 60, stat_result.st_mtime - 60))
+        response, body = raw_body(self.client, "/assets/app-Bq3xZ9_a.js", {"Accept-Encoding": "gzip"})
+        self.assertNotIn("content-encoding", response.headers)
+        self.assertEqual(body.decode("utf-8"), APP_JS)
+
+    def test_mutable_names_are_revalidated(self):
+        response = self.client.get("/race/", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["cache-control"], "no-cache")
+
+        revalidated = self.client.get(
+            "/race/",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+        )
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_index_is_served_from_memory_with_an_etag_per_encoding(self):
+        response, body = raw_body(self.client, "/", {"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.headers["cache-control"], INDEX_CACHE_CONTROL)
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(gzip.decompress(body).decode("utf-8"), INDEX_HTML)
+        identity = self.client.get("/", headers={"Accept-Encoding": "identity"})
+        self.assertNotEqual(identity.headers["etag"], response.headers["etag"])
+        self.assertEqual(identity.text, INDEX_HTML)
+
+        revalidated = self.client.get(
+            "/",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+        )
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b"")
+
+    def test_index_reloads_when_a_deployment_replaces_it(self):
+        first = self.client.get("/", headers={"Accept-Encoding": "identity"})
+        replacement = self.dist / "index.next.html"
+        replacement.write_text("<!doctype html><p>new release</p>", encoding="utf-8")
+        replacement.replace(self.dist / "index.html")
+
+        second = self.client.get(
+            "/",
+            headers={"Accept-Encoding": "identity", "If-None-Match": first.headers["etag"]},
+        )
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.text, "<!doctype html><p>new release</p>")
+
+    def test_missing_index_is_not_found(self):
+        (self.dist / "index.html").unlink()
+
+        self.assertEqual(self.client.get("/").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()